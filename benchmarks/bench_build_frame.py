@@ -0,0 +1,134 @@
+"""
+Benchmark column-wise DataFrame construction in the adapters.
+
+Compares ``BaseAdapter._build_frame`` with the per-row dict records it
+replaced, on a 10,000-row East Money stock list and a 10,000-row
+Tiantian fund list.
+
+Run with: python benchmarks/bench_build_frame.py
+"""
+
+from __future__ import annotations
+
+import random
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+import pandas as pd
+
+from finvista._fetchers.adapters.eastmoney import EastMoneyAdapter
+from finvista._fetchers.adapters.tiantian import TiantianAdapter
+
+REPEAT = 5
+ROWS = 10_000
+
+TYPES = ["股票型", "混合型", "债券型", "指数型", "QDII", "货币型", "ETF-场内", "联接基金", "FOF"]
+TYPE_MAP = {
+    "股票型": "stock",
+    "混合型": "mixed",
+    "债券型": "bond",
+    "指数型": "index",
+    "QDII": "qdii",
+    "货币型": "money",
+    "ETF-场内": "etf",
+    "联接基金": "linked",
+    "FOF": "fof",
+}
+
+
+def _stock_items() -> list[dict[str, Any]]:
+    """Build clist records like the stock list endpoint returns."""
+    rng = random.Random(0)
+    return [
+        {
+            "f12": f"{i:06d}",
+            "f14": f"Stock {i}",
+            "f13": rng.choice([0, 1]),
+            "f2": rng.randint(100, 100_000),
+            "f3": rng.randint(-1_000, 1_000),
+        }
+        for i in range(ROWS)
+    ]
+
+
+def _fund_items() -> list[list[str]]:
+    """Build fund list rows like the fundcode_search.js payload."""
+    rng = random.Random(0)
+    return [
+        [f"{i:06d}", f"JJ{i}", f"Fund {i}", rng.choice(TYPES), f"JIJIN{i}"]
+        for i in range(ROWS)
+    ]
+
+
+def _stock_records(items: list[dict[str, Any]]) -> pd.DataFrame:
+    """The per-row stock list parser previously used."""
+    records = []
+    for item in items:
+        records.append({
+            "symbol": item.get("f12", ""),
+            "name": item.get("f14", ""),
+            "market": "sh" if item.get("f13") == 1 else "sz",
+            "price": item.get("f2", 0) / 100 if item.get("f2") else None,
+            "change_pct": item.get("f3", 0) / 100 if item.get("f3") else None,
+        })
+    df = pd.DataFrame(records)
+    return df[df["symbol"].str.len() == 6]
+
+
+def _stock_frame(items: list[dict[str, Any]]) -> pd.DataFrame:
+    """The stock list parser on the column-wise builder."""
+
+    def get_json(*_args: Any, **_kwargs: Any) -> dict[str, Any]:
+        return {"data": {"diff": items}}
+
+    adapter = EastMoneyAdapter()
+    adapter._get_json = get_json  # type: ignore[method-assign]
+    return adapter.fetch_stock_list()
+
+
+def _fund_records(funds: list[list[str]]) -> pd.DataFrame:
+    """The per-row fund list parser previously used."""
+    records = []
+    for fund in funds:
+        if len(fund) >= 5:
+            records.append({
+                "symbol": fund[0],
+                "abbr": fund[1],
+                "name": fund[2],
+                "type_cn": fund[3],
+                "type": TYPE_MAP.get(fund[3], "other"),
+            })
+    return pd.DataFrame(records)
+
+
+def _fund_frame(funds: list[list[str]]) -> pd.DataFrame:
+    """The fund list parser on the column-wise builder."""
+    df = TiantianAdapter._build_frame(
+        [fund for fund in funds if len(fund) >= 5],
+        {"symbol": 0, "abbr": 1, "name": 2, "type_cn": 3},
+    )
+    df["type"] = df["type_cn"].map(TYPE_MAP).fillna("other")
+    return df
+
+
+def _report(label: str, func: Callable[[], object]) -> None:
+    seconds = min(timeit.repeat(func, number=1, repeat=REPEAT))
+    print(f"  {label:<12} {seconds * 1e3:9.1f} ms  {ROWS / seconds:13,.0f} rows/s")
+
+
+def main() -> None:
+    """Run the benchmarks and print timings and throughput."""
+    stocks = _stock_items()
+    print(f"stock list ({ROWS:,} rows)")
+    _report("row dicts", lambda: _stock_records(stocks))
+    _report("column-wise", lambda: _stock_frame(stocks))
+
+    funds = _fund_items()
+    print(f"fund list ({ROWS:,} rows)")
+    _report("row dicts", lambda: _fund_records(funds))
+    _report("column-wise", lambda: _fund_frame(funds))
+
+
+if __name__ == "__main__":
+    main()
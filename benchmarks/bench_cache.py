@@ -0,0 +1,73 @@
+"""
+Benchmark the per-call overhead of the ``cached`` decorator.
+
+Measures key generation on its own and the full cached path (hit and
+disabled cache) for argument shapes typical of FinVista calls.
+
+Run with: python benchmarks/bench_cache.py
+"""
+
+from __future__ import annotations
+
+import timeit
+from datetime import date
+
+from finvista._core.config import config
+from finvista._fetchers.cache import CacheManager
+
+NUMBER = 100_000
+
+CASES = {
+    "quote (10 symbols)": (
+        ([f"60{i:04d}" for i in range(10)],),
+        {},
+    ),
+    "daily (symbol, dates)": (
+        ("000001",),
+        {"start_date": date(2024, 1, 1), "end_date": "2024-06-30", "adjust": "qfq"},
+    ),
+    "quote (500 symbols)": (
+        ([f"60{i:04d}" for i in range(500)],),
+        {},
+    ),
+}
+
+
+def _report(label: str, seconds: float) -> None:
+    print(f"  {label:<24} {seconds / NUMBER * 1e6:8.2f} us/call")
+
+
+def _bench_case(manager: CacheManager, args: tuple[object, ...], kwargs: dict[str, object]) -> None:
+    """Time one argument shape through the raw, keyed and cached paths."""
+
+    @manager.cached(ttl=3600)
+    def fetch(*args: object, **kwargs: object) -> int:
+        return 1
+
+    def raw(*args: object, **kwargs: object) -> int:
+        return 1
+
+    _report("call (no cache)", timeit.timeit(lambda: raw(*args, **kwargs), number=NUMBER))
+    _report(
+        "key generation",
+        timeit.timeit(lambda: manager._make_key("fetch", args, kwargs), number=NUMBER),
+    )
+    fetch(*args, **kwargs)
+    _report("cached hit", timeit.timeit(lambda: fetch(*args, **kwargs), number=NUMBER))
+    config.cache.enabled = False
+    try:
+        _report("cache disabled", timeit.timeit(lambda: fetch(*args, **kwargs), number=NUMBER))
+    finally:
+        config.cache.enabled = True
+
+
+def main() -> None:
+    """Run the benchmarks and print per-call timings."""
+    manager = CacheManager()
+    for name, (args, kwargs) in CASES.items():
+        print(name)
+        _bench_case(manager, args, kwargs)
+
+
+if __name__ == "__main__":
+    main()
@@ -37,11 +37,16 @@ For more information, visit: https://github.com/finvista/finvista
 # =============================================================================
 from finvista._core.config import (
     config,
+    get_cache_stats,
     get_source_health,
+    reset_cache_stats,
     reset_source_circuit,
     set_cache,
+    set_output_schema,
     set_proxies,
+    set_source_hedging,
     set_source_priority,
+    set_source_routing,
     set_timeout,
 )
 
@@ -71,6 +76,16 @@ from finvista._core.exceptions import (
 from finvista._fetchers.adapters.registry import (
     register_all_sources as _register_sources,
 )
+
+# =============================================================================
+# Cache Warm-up and Snapshots
+# =============================================================================
+from finvista._fetchers.snapshot import (
+    default_warm_set,
+    load_cache_snapshot,
+    save_cache_snapshot,
+    warm_cache,
+)
 from finvista._version import __version__
 
 # =============================================================================
@@ -119,6 +134,7 @@ from finvista.markets.china.financial import (
 from finvista.markets.china.fund import (
     get_cn_fund_info,
     get_cn_fund_nav,
+    get_cn_fund_nav_batch,
     get_cn_fund_quote,
     list_cn_fund_symbols,
     search_cn_fund,
@@ -139,6 +155,7 @@ from finvista.markets.china.futures import (
 from finvista.markets.china.index import (
     get_cn_index_constituents,
     get_cn_index_daily,
+    get_cn_index_daily_batch,
     get_cn_index_quote,
     get_cn_index_weights,
     list_cn_major_indices,
@@ -200,7 +217,9 @@ from finvista.markets.china.shareholder import (
 # China Market - Stocks
 # =============================================================================
 from finvista.markets.china.stock import (
+    get_cn_market_snapshot,
     get_cn_stock_daily,
+    get_cn_stock_daily_batch,
     get_cn_stock_quote,
     list_cn_stock_symbols,
     search_cn_stock,
@@ -238,6 +257,7 @@ from finvista.markets.us.index import get_us_index_daily
 # =============================================================================
 from finvista.markets.us.stock import (
     get_us_stock_daily,
+    get_us_stock_daily_batch,
     get_us_stock_info,
     get_us_stock_quote,
     search_us_stock,
@@ -256,9 +276,18 @@ __all__ = [
     "set_proxies",
     "set_timeout",
     "set_cache",
+    "set_output_schema",
     "set_source_priority",
+    "set_source_hedging",
+    "set_source_routing",
     "get_source_health",
     "reset_source_circuit",
+    "get_cache_stats",
+    "reset_cache_stats",
+    "warm_cache",
+    "default_warm_set",
+    "save_cache_snapshot",
+    "load_cache_snapshot",
     # Exceptions
     "FinVistaError",
     "ConfigError",
@@ -276,23 +305,28 @@ __all__ = [
     "AllSourcesFailedError",
     # China Stocks
     "get_cn_stock_daily",
+    "get_cn_stock_daily_batch",
     "get_cn_stock_quote",
+    "get_cn_market_snapshot",
     "list_cn_stock_symbols",
     "search_cn_stock",
     # China Indices
     "get_cn_index_daily",
+    "get_cn_index_daily_batch",
     "get_cn_index_quote",
     "list_cn_major_indices",
     "get_cn_index_constituents",
     "get_cn_index_weights",
     # China Funds
     "get_cn_fund_nav",
+    "get_cn_fund_nav_batch",
     "get_cn_fund_quote",
     "list_cn_fund_symbols",
     "search_cn_fund",
     "get_cn_fund_info",
     # US Stocks
     "get_us_stock_daily",
+    "get_us_stock_daily_batch",
     "get_us_stock_quote",
     "get_us_stock_info",
     "search_us_stock",
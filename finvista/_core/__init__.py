@@ -1,6 +1,12 @@
 """Core infrastructure for FinVista."""
 
-from finvista._core.config import config, set_cache, set_proxies, set_timeout
+from finvista._core.config import (
+    config,
+    set_cache,
+    set_output_schema,
+    set_proxies,
+    set_timeout,
+)
 from finvista._core.exceptions import (
     AllSourcesFailedError,
     AllSourcesUnavailableError,
@@ -24,6 +30,7 @@ __all__ = [
     "set_proxies",
     "set_timeout",
     "set_cache",
+    "set_output_schema",
     # Exceptions
     "FinVistaError",
     "ConfigError",
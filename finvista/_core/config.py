@@ -23,6 +23,12 @@ from typing import Any
 
 from finvista._core.exceptions import ConfigError
 
+# Frame types data functions can return (see finvista._fetchers.frames)
+FRAME_BACKENDS = ("pandas", "pandas-arrow", "pyarrow", "polars")
+
+# Source ordering policies (see SourceManager.get_available_sources)
+ROUTING_POLICIES = ("priority", "adaptive")
+
 
 @dataclass
 class CacheConfig:
@@ -31,15 +37,32 @@ class CacheConfig:
 
     Attributes:
         enabled: Whether caching is enabled.
-        backend: Cache backend type ('memory', 'redis', 'disk').
+        backend: Cache backend type ('memory', 'redis', 'disk', 'shared'),
+            or a '+'-separated chain of tiers such as 'memory+disk'.
         ttl: Default time-to-live in seconds.
         max_size: Maximum number of cached items (for memory backend).
+        max_bytes: Maximum estimated size of cached values in bytes
+            (for memory backend, None for no limit).
+        disk_dir: Directory for the disk or shared backend (None for the
+            default ``~/.cache/finvista`` or ``/dev/shm/finvista-<uid>``).
+        disk_max_bytes: Maximum total size of the disk or shared cache
+            in bytes.
+        negative_ttl: Seconds to remember that a query returned no data
+            from every source (0 to disable).
+        spill_min_ttl: Minimum TTL in seconds for values written to the
+            lower tiers of a chained backend; shorter-lived values stay
+            in the first tier only.
     """
 
     enabled: bool = True
     backend: str = "memory"
     ttl: int = 300
     max_size: int = 1000
+    max_bytes: int | None = 512 * 1024**2
+    disk_dir: str | None = None
+    disk_max_bytes: int = 1024**3
+    negative_ttl: int = 600
+    spill_min_ttl: int = 300
 
     def validate(self) -> None:
         """Validate cache configuration."""
@@ -49,7 +72,29 @@ class CacheConfig:
             raise ConfigError(
                 "Cache max_size must be positive", config_key="cache.max_size"
             )
-        if self.backend not in ("memory", "redis", "disk"):
+        if self.max_bytes is not None and self.max_bytes < 1:
+            raise ConfigError(
+                "Cache max_bytes must be positive", config_key="cache.max_bytes"
+            )
+        if self.negative_ttl < 0:
+            raise ConfigError(
+                "Cache negative_ttl must be non-negative",
+                config_key="cache.negative_ttl",
+            )
+        if self.disk_max_bytes < 1:
+            raise ConfigError(
+                "Cache disk_max_bytes must be positive",
+                config_key="cache.disk_max_bytes",
+            )
+        if self.spill_min_ttl < 0:
+            raise ConfigError(
+                "Cache spill_min_ttl must be non-negative",
+                config_key="cache.spill_min_ttl",
+            )
+        tiers = self.backend.split("+")
+        if len(set(tiers)) != len(tiers) or any(
+            tier not in ("memory", "redis", "disk", "shared") for tier in tiers
+        ):
             raise ConfigError(
                 f"Invalid cache backend: {self.backend}", config_key="cache.backend"
             )
@@ -134,6 +179,25 @@ class FailoverConfig:
         circuit_timeout: Seconds before circuit attempts to close.
         success_threshold: Consecutive successes to close circuit.
         max_retries_per_source: Max retries for each source before switching.
+        routing: Default source order for data types without their own
+            policy: 'priority' (static priority) or 'adaptive' (EWMA of
+            response time and error rate, see ``set_source_routing``).
+        routing_tolerance: Adaptive scores are compared in steps of this
+            many seconds; sources in the same step keep priority order.
+        error_penalty: Seconds added to a source's adaptive score per
+            unit of its EWMA error rate.
+        routing_window: Seconds after a source's last request before its
+            statistics are considered stale and it is ranked by priority
+            again, so that a recovered source is tried again.
+        hedging: Default for data types without their own setting:
+            whether to race the next source when one is slow (see
+            ``set_source_hedging``).
+        hedge_quantile: Response time quantile of a source after which
+            the next source is started in parallel.
+        hedge_min_samples: Response times needed before the quantile is
+            used; until then ``hedge_delay`` is.
+        hedge_delay: Seconds to wait before hedging a source with too few
+            response time samples.
     """
 
     enabled: bool = True
@@ -141,6 +205,14 @@ class FailoverConfig:
     circuit_timeout: float = 60.0
     success_threshold: int = 3
     max_retries_per_source: int = 2
+    routing: str = "priority"
+    routing_tolerance: float = 0.5
+    error_penalty: float = 5.0
+    routing_window: float = 300.0
+    hedging: bool = False
+    hedge_quantile: float = 0.95
+    hedge_min_samples: int = 20
+    hedge_delay: float = 1.0
 
     def validate(self) -> None:
         """Validate failover configuration."""
@@ -159,6 +231,86 @@ class FailoverConfig:
                 "success_threshold must be positive",
                 config_key="failover.success_threshold",
             )
+        if self.routing not in ROUTING_POLICIES:
+            raise ConfigError(
+                f"Invalid routing: {self.routing}. Must be 'priority' or 'adaptive'.",
+                config_key="failover.routing",
+            )
+        if self.routing_tolerance <= 0:
+            raise ConfigError(
+                "routing_tolerance must be positive",
+                config_key="failover.routing_tolerance",
+            )
+        if self.error_penalty < 0:
+            raise ConfigError(
+                "error_penalty must be non-negative",
+                config_key="failover.error_penalty",
+            )
+        if self.routing_window <= 0:
+            raise ConfigError(
+                "routing_window must be positive",
+                config_key="failover.routing_window",
+            )
+        if not 0 < self.hedge_quantile < 1:
+            raise ConfigError(
+                "hedge_quantile must be between 0 and 1",
+                config_key="failover.hedge_quantile",
+            )
+        if self.hedge_min_samples < 1:
+            raise ConfigError(
+                "hedge_min_samples must be positive",
+                config_key="failover.hedge_min_samples",
+            )
+        if self.hedge_delay <= 0:
+            raise ConfigError(
+                "hedge_delay must be positive",
+                config_key="failover.hedge_delay",
+            )
+
+
+@dataclass
+class OutputConfig:
+    """
+    Output schema settings for returned DataFrames.
+
+    Column dtypes are looked up per data type in the schema registry
+    (``finvista._fetchers.schema``); these settings pick the concrete
+    dtypes used for date and float columns.
+
+    Attributes:
+        date_dtype: dtype of date columns: 'object' (``datetime.date``
+            values, as returned by the sources), 'datetime64[ns]', or
+            'datetime64[D]' (day dates; stored at pandas' coarsest
+            resolution, seconds).
+        float_dtype: dtype of price and other float columns ('float64'
+            or 'float32').
+        backend: Frame type returned by data functions: 'pandas',
+            'pandas-arrow' (``pd.ArrowDtype`` columns), 'pyarrow' (a
+            ``pyarrow.Table``) or 'polars'.
+    """
+
+    date_dtype: str = "object"
+    float_dtype: str = "float64"
+    backend: str = "pandas"
+
+    def validate(self) -> None:
+        """Validate output configuration."""
+        if self.date_dtype not in ("object", "datetime64[ns]", "datetime64[D]"):
+            raise ConfigError(
+                f"Invalid date_dtype: {self.date_dtype}. "
+                "Must be 'object', 'datetime64[ns]', or 'datetime64[D]'.",
+                config_key="output.date_dtype",
+            )
+        if self.float_dtype not in ("float64", "float32"):
+            raise ConfigError(
+                f"Invalid float_dtype: {self.float_dtype}. Must be 'float64' or 'float32'.",
+                config_key="output.float_dtype",
+            )
+        if self.backend not in FRAME_BACKENDS:
+            raise ConfigError(
+                f"Invalid backend: {self.backend}. Must be one of {FRAME_BACKENDS}.",
+                config_key="output.backend",
+            )
 
 
 @dataclass
@@ -167,13 +319,14 @@ class FinVistaConfig:
     Main configuration container for FinVista.
 
     This class holds all configuration settings organized into
-    logical groups (cache, http, log, failover).
+    logical groups (cache, http, log, failover, output).
 
     Attributes:
         cache: Cache-related settings.
         http: HTTP client settings.
         log: Logging settings.
         failover: Data source failover settings.
+        output: Output schema settings.
         data_source_priority: Default priority order for data sources.
         return_format: Default return format ('dataframe', 'dict', 'json').
         show_progress: Whether to show progress bars for long operations.
@@ -183,6 +336,7 @@ class FinVistaConfig:
     http: HttpConfig = field(default_factory=HttpConfig)
     log: LogConfig = field(default_factory=LogConfig)
     failover: FailoverConfig = field(default_factory=FailoverConfig)
+    output: OutputConfig = field(default_factory=OutputConfig)
 
     data_source_priority: list[str] = field(
         default_factory=lambda: ["eastmoney", "sina", "tencent"]
@@ -196,6 +350,7 @@ class FinVistaConfig:
         self.http.validate()
         self.log.validate()
         self.failover.validate()
+        self.output.validate()
 
         if self.return_format not in ("dataframe", "dict", "json"):
             raise ConfigError(
@@ -230,6 +385,8 @@ class ConfigManager:
     _config: FinVistaConfig
     _local: threading.local
     _source_priorities: dict[str, list[str]]
+    _source_routing: dict[str, str]
+    _source_hedging: dict[str, bool]
 
     def __new__(cls) -> ConfigManager:
         if cls._instance is None:
@@ -239,6 +396,8 @@ class ConfigManager:
                     instance._config = FinVistaConfig()
                     instance._local = threading.local()
                     instance._source_priorities = {}
+                    instance._source_routing = {}
+                    instance._source_hedging = {}
                     cls._instance = instance
         return cls._instance
 
@@ -272,6 +431,11 @@ class ConfigManager:
         """Get failover configuration."""
         return self.config.failover
 
+    @property
+    def output(self) -> OutputConfig:
+        """Get output schema configuration."""
+        return self.config.output
+
     def set(self, **kwargs: Any) -> None:
         """
         Update configuration settings.
@@ -308,6 +472,8 @@ class ConfigManager:
         """Reset all configuration to defaults."""
         self._config = FinVistaConfig()
         self._source_priorities = {}
+        self._source_routing = {}
+        self._source_hedging = {}
 
     @contextmanager
     def context(self, **kwargs: Any) -> Generator[FinVistaConfig, None, None]:
@@ -375,6 +541,58 @@ class ConfigManager:
         """
         self._source_priorities[data_type] = sources.copy()
 
+    def get_source_routing(self, data_type: str) -> str:
+        """
+        Get the source routing policy for a specific data type.
+
+        Args:
+            data_type: The data type (e.g., 'cn_stock_daily').
+
+        Returns:
+            'priority' or 'adaptive'.
+        """
+        return self._source_routing.get(data_type, self.config.failover.routing)
+
+    def set_source_routing(self, data_type: str, policy: str) -> None:
+        """
+        Set the source routing policy for a specific data type.
+
+        Args:
+            data_type: The data type (e.g., 'cn_stock_daily').
+            policy: 'priority' or 'adaptive'.
+
+        Raises:
+            ConfigError: If the policy is unknown.
+        """
+        if policy not in ROUTING_POLICIES:
+            raise ConfigError(
+                f"Invalid routing policy: {policy}. Must be 'priority' or 'adaptive'.",
+                config_key="failover.routing",
+            )
+        self._source_routing[data_type] = policy
+
+    def get_source_hedging(self, data_type: str) -> bool:
+        """
+        Check whether requests for a data type are hedged.
+
+        Args:
+            data_type: The data type (e.g., 'cn_stock_quote').
+
+        Returns:
+            True if a slow source is raced against the next one.
+        """
+        return self._source_hedging.get(data_type, self.config.failover.hedging)
+
+    def set_source_hedging(self, data_type: str, enabled: bool) -> None:
+        """
+        Enable or disable hedged requests for a specific data type.
+
+        Args:
+            data_type: The data type (e.g., 'cn_stock_quote').
+            enabled: Whether to hedge requests.
+        """
+        self._source_hedging[data_type] = enabled
+
 
 # Global configuration instance
 config = ConfigManager()
@@ -422,6 +640,8 @@ def set_cache(
     ttl: int | None = None,
     backend: str | None = None,
     max_size: int | None = None,
+    max_bytes: int | None = None,
+    disk_dir: str | None = None,
 ) -> None:
     """
     Configure caching behavior.
@@ -429,12 +649,22 @@ def set_cache(
     Args:
         enabled: Whether to enable caching.
         ttl: Cache time-to-live in seconds.
-        backend: Cache backend ('memory', 'redis', 'disk').
+        backend: Cache backend ('memory', 'redis', 'disk', 'shared'), or
+            a chain of tiers such as 'memory+disk'.
         max_size: Maximum cached items (for memory backend).
+        max_bytes: Maximum estimated size of cached values in bytes
+            (for memory backend).
+        disk_dir: Directory for the disk or shared backend.
 
     Example:
         >>> import finvista as fv
         >>> fv.set_cache(enabled=True, ttl=600)
+        >>> # Persist cached data across restarts
+        >>> fv.set_cache(backend="disk", disk_dir="/var/cache/finvista")
+        >>> # Share one memory-mapped copy between worker processes
+        >>> fv.set_cache(backend="shared")
+        >>> # Memory first, long-lived entries also written to disk
+        >>> fv.set_cache(backend="memory+disk")
     """
     config.config.cache.enabled = enabled
     if ttl is not None:
@@ -443,10 +673,64 @@ def set_cache(
         config.config.cache.backend = backend
     if max_size is not None:
         config.config.cache.max_size = max_size
+    if max_bytes is not None:
+        config.config.cache.max_bytes = max_bytes
+    if disk_dir is not None:
+        config.config.cache.disk_dir = disk_dir
 
     config.config.cache.validate()
 
 
+def set_output_schema(
+    date_dtype: str | None = None,
+    float_dtype: str | None = None,
+    backend: str | None = None,
+) -> None:
+    """
+    Configure the dtypes and frame type of returned data.
+
+    Every data type has a registered schema of date, integer and float
+    columns; results are converted to it before they are returned and
+    cached. Volumes are always int64 (float64 if values are missing).
+
+    Args:
+        date_dtype: 'object' for ``datetime.date`` values (default),
+            'datetime64[ns]', or 'datetime64[D]' for compact day dates.
+        float_dtype: 'float64' (default) or 'float32' for prices and
+            other float columns.
+        backend: Frame type returned by data functions: 'pandas'
+            (default), 'pandas-arrow', 'pyarrow' or 'polars'. Results
+            are cached as pandas and converted when returned; a single
+            call can override this with ``output=``.
+
+    Raises:
+        ConfigError: If a setting is invalid.
+        ImportError: If the backend's library is not installed.
+
+    Example:
+        >>> import finvista as fv
+        >>> fv.set_output_schema(date_dtype="datetime64[ns]")
+        >>> df = fv.get_cn_stock_daily("000001")
+        >>> df[df["date"] >= "2024-01-01"]
+        >>> # Halve the memory of wide price frames
+        >>> fv.set_output_schema(float_dtype="float32")
+        >>> # Return pyarrow Tables
+        >>> fv.set_output_schema(backend="pyarrow")
+    """
+    # Import here to avoid circular imports
+    from finvista._fetchers.frames import require_backend
+
+    current = config.config.output
+    output = OutputConfig(
+        date_dtype=date_dtype if date_dtype is not None else current.date_dtype,
+        float_dtype=float_dtype if float_dtype is not None else current.float_dtype,
+        backend=backend if backend is not None else current.backend,
+    )
+    output.validate()
+    require_backend(output.backend)
+    config.config.output = output
+
+
 def get_source_health() -> dict[str, dict[str, Any]]:
     """
     Get health status of all data sources.
@@ -463,6 +747,34 @@ def get_source_health() -> dict[str, dict[str, Any]]:
     return source_manager.get_health_report()
 
 
+def get_cache_stats() -> dict[str, dict[str, Any]]:
+    """
+    Get cache statistics for each cached function.
+
+    Returns:
+        Dictionary mapping qualified function names (``module.qualname``)
+        to hits, misses, stale serves, evictions, memory usage, average
+        fetch time and time saved.
+
+    Example:
+        >>> import finvista as fv
+        >>> stats = fv.get_cache_stats()
+        >>> stats["finvista.markets.china.fund.get_cn_fund_nav"]["hit_ratio"]
+    """
+    # Import here to avoid circular imports
+    from finvista._fetchers.cache import cache_manager
+
+    return cache_manager.get_stats()
+
+
+def reset_cache_stats() -> None:
+    """Reset the per-function cache statistics."""
+    # Import here to avoid circular imports
+    from finvista._fetchers.cache import cache_manager
+
+    cache_manager.reset_stats()
+
+
 def reset_source_circuit(data_type: str, source_name: str) -> None:
     """
     Reset the circuit breaker for a specific data source.
@@ -490,3 +802,55 @@ def set_source_priority(data_type: str, sources: list[str]) -> None:
         >>> fv.set_source_priority("cn_stock_daily", ["sina", "eastmoney", "tencent"])
     """
     config.set_source_priority(data_type, sources)
+
+
+def set_source_routing(data_type: str, policy: str) -> None:
+    """
+    Set how the data sources of a data type are ordered.
+
+    With 'priority' (the default) sources are tried in their static
+    priority order. With 'adaptive' the sources whose circuit is closed
+    are ranked by an exponentially weighted moving average of their
+    response time plus a penalty for their recent error rate, with the
+    static priority breaking ties. A source that slows down therefore
+    loses its traffic before its circuit opens.
+
+    Args:
+        data_type: The data type (e.g., 'cn_stock_daily').
+        policy: 'priority' or 'adaptive'.
+
+    Raises:
+        ConfigError: If the policy is unknown.
+
+    Example:
+        >>> import finvista as fv
+        >>> fv.set_source_routing("cn_stock_daily", "adaptive")
+        >>> # Make adaptive routing the default for all data types
+        >>> fv.config.set(failover={"routing": "adaptive"})
+    """
+    config.set_source_routing(data_type, policy)
+
+
+def set_source_hedging(data_type: str, enabled: bool = True) -> None:
+    """
+    Race a backup source when the current one is slow.
+
+    With hedging, a request that has not been answered within the
+    source's usual response time (its 95th percentile, by default) is
+    sent to the next available source as well, and whichever answers
+    first is returned. The hedge only starts if the backup's rate limit
+    has a token free, and both requests count in the circuit breaker
+    statistics. A source that fails is still followed by the next one
+    at once.
+
+    Args:
+        data_type: The data type (e.g., 'cn_stock_quote').
+        enabled: Whether to hedge requests.
+
+    Example:
+        >>> import finvista as fv
+        >>> fv.set_source_hedging("cn_stock_quote")
+        >>> # Hedge after 300 ms until enough response times are known
+        >>> fv.config.set(failover={"hedge_delay": 0.3})
+    """
+    config.set_source_hedging(data_type, enabled)
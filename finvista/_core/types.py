@@ -65,6 +65,9 @@ SourceName = Literal["eastmoney", "sina", "tencent", "yahoo", "fred", "alphavant
 # Return format types
 ReturnFormat = Literal["dataframe", "dict", "json"]
 
+# Frame types returned by data functions (``output=``)
+FrameBackend = Literal["pandas", "pandas-arrow", "pyarrow", "polars"]
+
 
 # =============================================================================
 # Enums
@@ -288,6 +291,24 @@ class CacheBackend(Protocol):
         ...
 
 
+class TTLPolicy(Protocol):
+    """
+    Protocol for dynamic cache TTL policies.
+
+    A TTL policy is called when a value is stored and returns how many
+    seconds it should stay cached, e.g. until the next trading session.
+    """
+
+    def __call__(self) -> int:
+        """
+        Compute the TTL for a value stored now.
+
+        Returns:
+            Time-to-live in seconds.
+        """
+        ...
+
+
 # =============================================================================
 # Callback Type Aliases
 # =============================================================================
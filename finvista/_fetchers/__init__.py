@@ -6,23 +6,75 @@ sources, including HTTP clients, caching, rate limiting, and automatic
 failover between data sources.
 """
 
-from finvista._fetchers.cache import MemoryCache, cache_manager, cached
+from finvista._fetchers.async_http_client import AsyncHttpClient, async_http_client
+from finvista._fetchers.batch import BatchResult, fetch_batch
+from finvista._fetchers.cache import MemoryCache, acached, cache_manager, cached
+from finvista._fetchers.cache_metrics import CacheMetrics
+from finvista._fetchers.disk_cache import DiskCache
+from finvista._fetchers.frames import frame_output, pandas_frames, to_backend
 from finvista._fetchers.http_client import HttpClient, http_client
-from finvista._fetchers.rate_limiter import RateLimiter, rate_limiter
-from finvista._fetchers.source_manager import SourceManager, source_manager
+from finvista._fetchers.panel import Panel, build_panel
+from finvista._fetchers.range_cache import RangeCache, range_cache, range_cached
+from finvista._fetchers.rate_limiter import (
+    AsyncRateLimiter,
+    RateLimiter,
+    async_rate_limiter,
+    rate_limiter,
+)
+from finvista._fetchers.schema import apply_schema, get_schema, register_schema
+from finvista._fetchers.shared_cache import SharedMemoryCache
+from finvista._fetchers.source_manager import (
+    AsyncSourceManager,
+    SourceManager,
+    async_source_manager,
+    source_manager,
+)
+from finvista._fetchers.tiered_cache import TieredCache
+from finvista._fetchers.ttl import MARKET_SESSIONS, MarketSessions, SessionTTL
 
 __all__ = [
     # HTTP Client
     "HttpClient",
     "http_client",
+    "AsyncHttpClient",
+    "async_http_client",
     # Cache
     "MemoryCache",
+    "DiskCache",
+    "SharedMemoryCache",
+    "TieredCache",
     "cached",
+    "acached",
     "cache_manager",
+    "CacheMetrics",
+    "RangeCache",
+    "range_cache",
+    "range_cached",
+    # TTL Policies
+    "SessionTTL",
+    "MarketSessions",
+    "MARKET_SESSIONS",
     # Rate Limiter
     "RateLimiter",
     "rate_limiter",
+    "AsyncRateLimiter",
+    "async_rate_limiter",
+    # Batch Fetching
+    "BatchResult",
+    "fetch_batch",
+    "Panel",
+    "build_panel",
+    # Output Schemas
+    "apply_schema",
+    "get_schema",
+    "register_schema",
+    # Frame Backends
+    "frame_output",
+    "pandas_frames",
+    "to_backend",
     # Source Manager
     "SourceManager",
     "source_manager",
+    "AsyncSourceManager",
+    "async_source_manager",
 ]
@@ -9,15 +9,55 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
+from datetime import date
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from finvista._fetchers.async_http_client import async_http_client
 from finvista._fetchers.http_client import http_client
 
 logger = logging.getLogger(__name__)
 
 
+def _convert_column(values: list[Any], dtype: str) -> Any:
+    """
+    Convert a column of raw values to the given ``_build_frame`` dtype.
+
+    Args:
+        values: Raw values of one column.
+        dtype: "float64", "int64", "date", "datetime" or "str".
+
+    Returns:
+        NumPy array (or list of strings) for the column.
+    """
+    if dtype in ("float64", "int64"):
+        try:
+            array = np.asarray(values, dtype="float64")
+        except (TypeError, ValueError):
+            # Placeholders such as "-" or "" mixed with numbers
+            array = pd.to_numeric(
+                pd.Series(values, dtype=object), errors="coerce"
+            ).to_numpy(dtype="float64", na_value=np.nan)
+        if dtype == "int64" and np.isfinite(array).all() and (array % 1 == 0).all():
+            return array.astype("int64")
+        return array
+    if dtype == "date":
+        dates = pd.to_datetime(
+            pd.Series(values, dtype=object).str[:10], format="%Y-%m-%d", errors="coerce"
+        )
+        return dates.dt.date.to_numpy()
+    if dtype == "datetime":
+        return pd.to_datetime(
+            pd.Series(values, dtype=object), format="ISO8601", errors="coerce"
+        ).to_numpy()
+    if dtype == "str":
+        return ["" if value is None else str(value) for value in values]
+    raise ValueError(f"Unsupported column dtype: {dtype}")
+
+
 class BaseAdapter(ABC):
     """
     Abstract base class for data source adapters.
@@ -28,6 +68,9 @@ class BaseAdapter(ABC):
     Attributes:
         name: Unique identifier for this adapter.
         base_url: Base URL for API requests.
+        QUOTE_BATCH_SIZE: Maximum number of symbols per real-time quote
+            request (None for no limit). Longer symbol lists are split
+            into chunks that are fetched concurrently.
 
     Example:
         >>> class MyAdapter(BaseAdapter):
@@ -41,10 +84,12 @@ class BaseAdapter(ABC):
 
     name: str = ""
     base_url: str = ""
+    QUOTE_BATCH_SIZE: int | None = None
 
     def __init__(self) -> None:
         """Initialize the adapter."""
         self._http = http_client
+        self._ahttp = async_http_client
 
     @property
     def http(self) -> Any:
@@ -135,6 +180,54 @@ class BaseAdapter(ABC):
         url = self._build_url(endpoint)
         return self._http.get_text(url, params=params, headers=headers, encoding=encoding, **kwargs)
 
+    async def _aget_json(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Make an async GET request and parse JSON response.
+
+        Args:
+            endpoint: API endpoint.
+            params: Query parameters.
+            headers: Additional headers.
+            **kwargs: Additional request options.
+
+        Returns:
+            Parsed JSON data.
+        """
+        url = self._build_url(endpoint)
+        return await self._ahttp.get_json(url, params=params, headers=headers, **kwargs)
+
+    async def _aget_text(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        encoding: str | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Make an async GET request and return text response.
+
+        Args:
+            endpoint: API endpoint.
+            params: Query parameters.
+            headers: Additional headers.
+            encoding: Response encoding.
+            **kwargs: Additional request options.
+
+        Returns:
+            Response text.
+        """
+        url = self._build_url(endpoint)
+        return await self._ahttp.get_text(
+            url, params=params, headers=headers, encoding=encoding, **kwargs
+        )
+
     @abstractmethod
     def is_available(self) -> bool:
         """
@@ -145,6 +238,87 @@ class BaseAdapter(ABC):
         """
         pass
 
+    @staticmethod
+    def _build_frame(
+        rows: Iterable[Any],
+        columns: Mapping[str, Any],
+        dtypes: Mapping[str, str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Build a DataFrame column by column from parsed rows.
+
+        Each column is gathered in one pass over the rows and converted
+        once with an explicit dtype, instead of allocating a dict per row
+        and letting ``pd.DataFrame`` infer types from the records.
+
+        Args:
+            rows: Parsed rows, either mappings (e.g. JSON records, read
+                with ``row.get(key)``) or sequences (e.g. split text, read
+                by position; missing positions are None).
+            columns: Output column name to row key or position, in order.
+            dtypes: Conversion per output column:
+                - "float64": Numbers; "-", "" and None become NaN
+                - "int64": As "float64", but int64 if all values are whole
+                - "date": ``datetime.date`` from the first 10 characters
+                - "datetime": datetime64 from ISO 8601 strings
+                - "str": Strings, with None as ""
+                Other columns keep pandas' inference.
+
+        Returns:
+            DataFrame with one column per entry of ``columns``.
+
+        Example:
+            >>> df = self._build_frame(
+            ...     data["data"]["diff"],
+            ...     {"symbol": "f12", "price": "f2"},
+            ...     dtypes={"price": "float64"},
+            ... )
+        """
+        rows = rows if isinstance(rows, list) else list(rows)
+        if rows and isinstance(rows[0], Mapping):
+            data = {name: [row.get(key) for row in rows] for name, key in columns.items()}
+        else:
+            data = {
+                name: [row[key] if key < len(row) else None for row in rows]
+                for name, key in columns.items()
+            }
+
+        for name, dtype in (dtypes or {}).items():
+            data[name] = _convert_column(data[name], dtype)
+
+        return pd.DataFrame(data)
+
+    @staticmethod
+    def _filter_date_range(
+        df: pd.DataFrame,
+        start_date: str | date | None,
+        end_date: str | date | None,
+    ) -> pd.DataFrame:
+        """
+        Filter a frame to a date range and sort it by date.
+
+        The 'date' column must be datetime64; comparing it is vectorized,
+        unlike comparing ``datetime.date`` objects. It is converted to
+        ``datetime.date`` values after filtering.
+
+        Args:
+            df: DataFrame with a datetime64 'date' column.
+            start_date: First date to keep (None for no lower bound).
+            end_date: Last date to keep (None for no upper bound).
+
+        Returns:
+            Filtered DataFrame sorted by date with a fresh index.
+        """
+        mask = np.ones(len(df), dtype=bool)
+        if start_date:
+            mask &= (df["date"] >= pd.Timestamp(start_date)).to_numpy()
+        if end_date:
+            mask &= (df["date"] <= pd.Timestamp(end_date)).to_numpy()
+
+        df = df[mask].sort_values("date", kind="stable").reset_index(drop=True)
+        df["date"] = df["date"].dt.date
+        return df
+
     def _to_dataframe(self, data: list[dict[str, Any]], columns: list[str] | None = None) -> pd.DataFrame:
         """
         Convert data to DataFrame with optional column selection.
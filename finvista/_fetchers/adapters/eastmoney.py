@@ -7,18 +7,28 @@ popular financial data sources in China.
 
 from __future__ import annotations
 
+import io
 import logging
+from collections.abc import Collection, Sequence
 from datetime import date, datetime
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from finvista._core.exceptions import DataNotFoundError
 from finvista._fetchers.adapters.base import BaseAdapter
+from finvista._fetchers.chunking import afetch_chunked, fetch_chunked, fetch_pages
 
 logger = logging.getLogger(__name__)
 
 
+def _scale(df: pd.DataFrame, columns: Sequence[str], factor: float) -> None:
+    """Divide fixed-point fields in place, treating 0 as missing."""
+    values = df[list(columns)]
+    df[list(columns)] = values.where(values != 0) / factor
+
+
 class EastMoneyAdapter(BaseAdapter):
     """
     Adapter for East Money (东方财富) data source.
@@ -51,6 +61,72 @@ class EastMoneyAdapter(BaseAdapter):
         "hfq": "2",  # Backward adjust
     }
 
+    # Column types of clist quote tables (futures, convertibles, options)
+    _QUOTE_DTYPES = dict.fromkeys(
+        ("price", "change_pct", "open", "high", "low", "pre_close", "amount"), "float64"
+    ) | {"volume": "int64"}
+
+    # Daily kline (stocks and indices), real-time quote and listing endpoints
+    KLINE_URL = "https://push2his.eastmoney.com/api/qt/stock/kline/get"
+    ULIST_URL = "https://push2.eastmoney.com/api/qt/ulist/get"
+    CLIST_URL = "https://push2.eastmoney.com/api/qt/clist/get"
+
+    # clist filters of the A-share boards
+    MARKET_FILTERS = {
+        "all": "m:0+t:6,m:0+t:80,m:1+t:2,m:1+t:23",
+        "sh": "m:1+t:2,m:1+t:23",
+        "sz": "m:0+t:6,m:0+t:80",
+        "main": "m:0+t:6,m:1+t:2",
+        "gem": "m:0+t:80",  # ChiNext
+        "star": "m:1+t:23",  # STAR Market
+    }
+
+    # Rows requested per clist page of the market snapshot (a whole board
+    # fits in one page unless the server caps the page size)
+    SNAPSHOT_PAGE_SIZE = 10000
+
+    # Snapshot columns and their clist fields (fltt=2 gives decimal values)
+    SNAPSHOT_FIELDS = {
+        "symbol": "f12",
+        "name": "f14",
+        "market": "f13",
+        "price": "f2",
+        "change": "f4",
+        "change_pct": "f3",
+        "open": "f17",
+        "high": "f15",
+        "low": "f16",
+        "pre_close": "f18",
+        "volume": "f5",
+        "amount": "f6",
+        "amplitude": "f7",
+        "turnover": "f8",
+        "volume_ratio": "f10",
+        "pe": "f9",
+        "pb": "f23",
+        "market_cap": "f20",
+        "float_market_cap": "f21",
+        "time": "f124",
+    }
+
+    # Secids per ulist request, keeping the URL well under 8 KB
+    QUOTE_BATCH_SIZE = 500
+
+    # Fields of a kline row requested with fields2=f51..f61, in order
+    KLINE_COLUMNS = (
+        "date",
+        "open",
+        "close",
+        "high",
+        "low",
+        "volume",
+        "amount",
+        "amplitude",
+        "change_pct",
+        "change",
+        "turnover",
+    )
+
     def is_available(self) -> bool:
         """Check if East Money API is available."""
         try:
@@ -118,6 +194,46 @@ class EastMoneyAdapter(BaseAdapter):
             DataNotFoundError: When no data is found.
             DataParsingError: When data cannot be parsed.
         """
+        params = self._kline_params(
+            self._get_secid(symbol), self.ADJUST_MAP.get(adjust, "0"), start_date, end_date
+        )
+        data = self._get_json(self.KLINE_URL, params=params)
+        return self._parse_stock_daily(data, symbol, params)
+
+    async def afetch_stock_daily(
+        self,
+        symbol: str,
+        start_date: str | date | None = None,
+        end_date: str | date | None = None,
+        adjust: str = "none",
+        **kwargs: Any,
+    ) -> pd.DataFrame:
+        """Async version of ``fetch_stock_daily``."""
+        params = self._kline_params(
+            self._get_secid(symbol), self.ADJUST_MAP.get(adjust, "0"), start_date, end_date
+        )
+        data = await self._aget_json(self.KLINE_URL, params=params)
+        return self._parse_stock_daily(data, symbol, params)
+
+    @staticmethod
+    def _kline_params(
+        secid: str,
+        fqt: str,
+        start_date: str | date | None,
+        end_date: str | date | None,
+    ) -> dict[str, Any]:
+        """
+        Build query parameters for the daily kline API.
+
+        Args:
+            secid: Security ID in format 'market.symbol'.
+            fqt: Adjustment code (see ``ADJUST_MAP``).
+            start_date: Start date, None for the earliest available.
+            end_date: End date, None for today.
+
+        Returns:
+            Query parameters.
+        """
         # Format dates
         if start_date is None:
             start_date = "19900101"
@@ -133,10 +249,7 @@ class EastMoneyAdapter(BaseAdapter):
         else:
             end_date = end_date.replace("-", "")
 
-        secid = self._get_secid(symbol)
-        fqt = self.ADJUST_MAP.get(adjust, "0")
-
-        params = {
+        return {
             "secid": secid,
             "fields1": "f1,f2,f3,f4,f5,f6",
             "fields2": "f51,f52,f53,f54,f55,f56,f57,f58,f59,f60,f61",
@@ -146,43 +259,79 @@ class EastMoneyAdapter(BaseAdapter):
             "end": end_date,
         }
 
-        data = self._get_json(
-            "https://push2his.eastmoney.com/api/qt/stock/kline/get",
-            params=params,
-        )
+    @staticmethod
+    def _parse_klines(
+        klines: list[str],
+        columns: Sequence[str],
+        int_columns: Collection[str] = ("volume",),
+    ) -> pd.DataFrame:
+        """
+        Parse kline rows into a typed DataFrame in one pass.
+
+        Kline rows are comma-separated strings whose first field is the
+        date or datetime. The rows are joined and parsed as CSV, so each
+        column is converted as a whole instead of with one ``float()``
+        call per value. The multithreaded pyarrow reader is used when
+        pyarrow is installed, pandas' C parser otherwise (and for rows
+        with differing field counts, which pyarrow rejects).
 
+        Args:
+            klines: Kline rows from the API.
+            columns: Names of the leading fields. The first must be "date"
+                or "datetime"; fields beyond ``columns`` are ignored.
+            int_columns: Columns converted to int64 when they have no
+                missing values.
+
+        Returns:
+            DataFrame with float64 value columns and "date" as
+            ``datetime.date`` objects (or "datetime" as datetime64).
+            "-" and missing trailing fields become NaN.
+        """
+        text = "\n".join(klines)
+        # Read only the fields present, so rows all shorter than
+        # ``columns`` do not fail; the missing columns are added below
+        width = min(len(columns), 1 + max(kline.count(",") for kline in klines))
+        options: dict[str, Any] = {
+            "header": None,
+            "names": list(columns[:width]),
+            "usecols": range(width),
+            "na_values": ["-", ""],
+            "keep_default_na": False,
+        }
+        try:
+            df = pd.read_csv(io.BytesIO(text.encode()), engine="pyarrow", **options)
+        except (ImportError, ValueError):
+            df = pd.read_csv(io.StringIO(text), **options)
+        if width < len(columns):
+            df = df.reindex(columns=list(columns))
+
+        values = list(columns[1:])
+        df[values] = df[values].astype("float64")
+        for column in int_columns:
+            if column in df.columns and not df[column].hasnans:
+                df[column] = df[column].astype("int64")
+
+        time_column = columns[0]
+        timestamps = pd.to_datetime(df[time_column], format="ISO8601").dt.as_unit("us")
+        df[time_column] = timestamps if time_column == "datetime" else timestamps.dt.date
+
+        return df
+
+    def _parse_stock_daily(
+        self, data: dict[str, Any], symbol: str, params: dict[str, Any]
+    ) -> pd.DataFrame:
+        """Parse a daily kline response for a stock."""
         if not data.get("data") or not data["data"].get("klines"):
             raise DataNotFoundError(
                 f"No data found for symbol {symbol}",
-                query_params={"symbol": symbol, "start_date": start_date, "end_date": end_date},
+                query_params={
+                    "symbol": symbol,
+                    "start_date": params["beg"],
+                    "end_date": params["end"],
+                },
             )
 
-        klines = data["data"]["klines"]
-        records = []
-
-        for line in klines:
-            parts = line.split(",")
-            if len(parts) >= 11:
-                records.append(
-                    {
-                        "date": parts[0],
-                        "open": float(parts[1]),
-                        "close": float(parts[2]),
-                        "high": float(parts[3]),
-                        "low": float(parts[4]),
-                        "volume": int(float(parts[5])),
-                        "amount": float(parts[6]),
-                        "amplitude": float(parts[7]) if parts[7] != "-" else None,
-                        "change_pct": float(parts[8]) if parts[8] != "-" else None,
-                        "change": float(parts[9]) if parts[9] != "-" else None,
-                        "turnover": float(parts[10]) if parts[10] != "-" else None,
-                    }
-                )
-
-        df = pd.DataFrame(records)
-        df["date"] = pd.to_datetime(df["date"]).dt.date
-
-        return df
+        return self._parse_klines(data["data"]["klines"], self.KLINE_COLUMNS)
 
     def fetch_stock_quote(
         self,
@@ -201,41 +350,70 @@ class EastMoneyAdapter(BaseAdapter):
         if isinstance(symbols, str):
             symbols = [symbols]
 
-        secids = [self._get_secid(s) for s in symbols]
-        secids_str = ",".join(secids)
+        return fetch_chunked(
+            self.name, self._fetch_stock_quote_chunk, symbols, self.QUOTE_BATCH_SIZE
+        )
 
-        params = {
-            "secids": secids_str,
-            "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18",
-        }
+    async def afetch_stock_quote(
+        self,
+        symbols: list[str] | str,
+        **kwargs: Any,
+    ) -> pd.DataFrame:
+        """Async version of ``fetch_stock_quote``."""
+        if isinstance(symbols, str):
+            symbols = [symbols]
 
-        data = self._get_json(
-            "https://push2.eastmoney.com/api/qt/ulist/get",
-            params=params,
+        return await afetch_chunked(
+            self.name, self._afetch_stock_quote_chunk, symbols, self.QUOTE_BATCH_SIZE
         )
 
+    def _fetch_stock_quote_chunk(self, symbols: list[str]) -> pd.DataFrame:
+        """Fetch quotes for at most ``QUOTE_BATCH_SIZE`` symbols."""
+        data = self._get_json(self.ULIST_URL, params=self._stock_quote_params(symbols))
+        return self._parse_stock_quote(data, symbols)
+
+    async def _afetch_stock_quote_chunk(self, symbols: list[str]) -> pd.DataFrame:
+        """Async version of ``_fetch_stock_quote_chunk``."""
+        data = await self._aget_json(self.ULIST_URL, params=self._stock_quote_params(symbols))
+        return self._parse_stock_quote(data, symbols)
+
+    def _stock_quote_params(self, symbols: list[str]) -> dict[str, Any]:
+        """Build query parameters for the real-time quote API."""
+        secids = [self._get_secid(s) for s in symbols]
+        return {
+            "secids": ",".join(secids),
+            "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18",
+        }
+
+    @staticmethod
+    def _parse_stock_quote(data: dict[str, Any], symbols: list[str]) -> pd.DataFrame:
+        """Parse a real-time quote response."""
         if not data.get("data") or not data["data"].get("diff"):
             raise DataNotFoundError(f"No quote data found for symbols: {symbols}")
 
-        records = []
-        for item in data["data"]["diff"]:
-            records.append(
-                {
-                    "symbol": item.get("f12", ""),
-                    "name": item.get("f14", ""),
-                    "price": item.get("f2", 0) / 100 if item.get("f2") else None,
-                    "change": item.get("f4", 0) / 100 if item.get("f4") else None,
-                    "change_pct": item.get("f3", 0) / 100 if item.get("f3") else None,
-                    "open": item.get("f17", 0) / 100 if item.get("f17") else None,
-                    "high": item.get("f15", 0) / 100 if item.get("f15") else None,
-                    "low": item.get("f16", 0) / 100 if item.get("f16") else None,
-                    "pre_close": item.get("f18", 0) / 100 if item.get("f18") else None,
-                    "volume": item.get("f5", 0),
-                    "amount": item.get("f6", 0),
-                }
-            )
+        prices = ("price", "change", "change_pct", "open", "high", "low", "pre_close")
+        df = EastMoneyAdapter._build_frame(
+            data["data"]["diff"],
+            {
+                "symbol": "f12",
+                "name": "f14",
+                "price": "f2",
+                "change": "f4",
+                "change_pct": "f3",
+                "open": "f17",
+                "high": "f15",
+                "low": "f16",
+                "pre_close": "f18",
+                "volume": "f5",
+                "amount": "f6",
+            },
+            dtypes=dict.fromkeys(prices, "float64") | {"volume": "int64", "amount": "float64"},
+        )
+        _scale(df, prices, 100)
+        # Volume is reported in lots of 100 shares
+        df["volume"] = df["volume"] * 100
 
-        return pd.DataFrame(records)
+        return df
 
     def fetch_stock_list(
         self,
@@ -251,27 +429,14 @@ class EastMoneyAdapter(BaseAdapter):
         Returns:
             DataFrame with stock information.
         """
-        # Market filter string
-        market_filter = {
-            "all": "m:0+t:6,m:0+t:80,m:1+t:2,m:1+t:23",
-            "sh": "m:1+t:2,m:1+t:23",
-            "sz": "m:0+t:6,m:0+t:80",
-            "main": "m:0+t:6,m:1+t:2",
-            "gem": "m:0+t:80",  # ChiNext
-            "star": "m:1+t:23",  # STAR Market
-        }.get(market, "m:0+t:6,m:0+t:80,m:1+t:2,m:1+t:23")
-
         params = {
             "pn": 1,
             "pz": 10000,
-            "fs": market_filter,
+            "fs": self.MARKET_FILTERS.get(market, self.MARKET_FILTERS["all"]),
             "fields": "f1,f2,f3,f4,f12,f13,f14",
         }
 
-        data = self._get_json(
-            "https://push2.eastmoney.com/api/qt/clist/get",
-            params=params,
-        )
+        data = self._get_json(self.CLIST_URL, params=params)
 
         if not data.get("data") or not data["data"].get("diff"):
             return pd.DataFrame()
@@ -283,24 +448,99 @@ class EastMoneyAdapter(BaseAdapter):
         else:
             items = diff_data
 
-        records = []
-        for item in items:
-            market_code = item.get("f13", 0)
-            records.append(
-                {
-                    "symbol": item.get("f12", ""),
-                    "name": item.get("f14", ""),
-                    "market": "sh" if market_code == 1 else "sz",
-                    "price": item.get("f2", 0) / 100 if item.get("f2") else None,
-                    "change_pct": item.get("f3", 0) / 100 if item.get("f3") else None,
-                }
-            )
-
-        df = pd.DataFrame(records)
+        df = self._build_frame(
+            items,
+            {"symbol": "f12", "name": "f14", "market": "f13", "price": "f2", "change_pct": "f3"},
+            dtypes={"symbol": "str", "price": "float64", "change_pct": "float64"},
+        )
+        df["market"] = np.where(df["market"] == 1, "sh", "sz")
+        _scale(df, ("price", "change_pct"), 100)
         df = df[df["symbol"].str.len() == 6]  # Filter valid symbols
 
         return df
 
+    def fetch_market_snapshot(
+        self,
+        market: str = "all",
+        **kwargs: Any,
+    ) -> pd.DataFrame:
+        """
+        Fetch real-time quotes of a whole A-share board.
+
+        The clist listing is read sorted by code, normally in a single
+        request. Should the server cap the page size below
+        ``SNAPSHOT_PAGE_SIZE``, the size of the first page and its total
+        count tell how many pages remain, and those are fetched
+        concurrently within the rate limit.
+
+        Args:
+            market: Market filter ('all', 'sh', 'sz', 'main', 'gem', 'star').
+
+        Returns:
+            DataFrame with one row per stock, sorted by symbol.
+
+        Raises:
+            DataNotFoundError: When the listing is empty.
+        """
+        fs = self.MARKET_FILTERS.get(market, self.MARKET_FILTERS["all"])
+        data = self._snapshot_page(fs, 1)
+        if not data.get("data") or not data["data"].get("diff"):
+            raise DataNotFoundError(f"No snapshot data found for market: {market}")
+
+        rows = self._clist_rows(data)
+        total = int(data["data"].get("total") or len(rows))
+        pages = -(-total // len(rows))
+        if pages > 1:
+            for page in fetch_pages(
+                self.name, lambda pn: self._snapshot_page(fs, pn), range(2, pages + 1)
+            ):
+                rows.extend(self._clist_rows(page))
+
+        return self._parse_market_snapshot(rows)
+
+    def _snapshot_page(self, fs: str, page: int) -> dict[str, Any]:
+        """Fetch one clist page of the market snapshot."""
+        params = {
+            "pn": page,
+            "pz": self.SNAPSHOT_PAGE_SIZE,
+            "po": 0,
+            "np": 1,
+            "fltt": 2,
+            "invt": 2,
+            "fid": "f12",
+            "fs": fs,
+            "fields": ",".join(self.SNAPSHOT_FIELDS.values()),
+        }
+        return self._get_json(self.CLIST_URL, params=params)
+
+    @staticmethod
+    def _clist_rows(data: dict[str, Any]) -> list[Any]:
+        """Get the records of a clist response (diff is a list or a dict)."""
+        diff = (data.get("data") or {}).get("diff") or []
+        return list(diff.values()) if isinstance(diff, dict) else list(diff)
+
+    @staticmethod
+    def _parse_market_snapshot(rows: list[Any]) -> pd.DataFrame:
+        """Parse clist records into the market snapshot frame."""
+        numbers = list(EastMoneyAdapter.SNAPSHOT_FIELDS)[3:-1]
+        df = EastMoneyAdapter._build_frame(
+            rows,
+            EastMoneyAdapter.SNAPSHOT_FIELDS,
+            dtypes=dict.fromkeys(numbers, "float64") | {"symbol": "str", "name": "str"},
+        )
+        df["market"] = np.where(df["market"] == 1, "sh", "sz")
+        # Volume is reported in lots of 100 shares
+        df["volume"] = (df["volume"] * 100).fillna(0).astype("int64")
+        seconds = pd.to_numeric(df["time"], errors="coerce").where(lambda t: t > 0)
+        df["time"] = (
+            pd.to_datetime(seconds, unit="s", utc=True)
+            .dt.tz_convert("Asia/Shanghai")
+            .dt.tz_localize(None)
+        )
+        # Rows can shift between pages while the listing is read
+        df = df.drop_duplicates("symbol").sort_values("symbol", kind="stable")
+        return df.reset_index(drop=True)
+
     def fetch_index_daily(
         self,
         symbol: str,
@@ -319,69 +559,38 @@ class EastMoneyAdapter(BaseAdapter):
         Returns:
             DataFrame with index daily data.
         """
-        # Index market codes are different
+        params = self._kline_params(self._get_index_secid(symbol), "1", start_date, end_date)
+        data = self._get_json(self.KLINE_URL, params=params)
+        return self._parse_index_daily(data, symbol)
+
+    async def afetch_index_daily(
+        self,
+        symbol: str,
+        start_date: str | date | None = None,
+        end_date: str | date | None = None,
+        **kwargs: Any,
+    ) -> pd.DataFrame:
+        """Async version of ``fetch_index_daily``."""
+        params = self._kline_params(self._get_index_secid(symbol), "1", start_date, end_date)
+        data = await self._aget_json(self.KLINE_URL, params=params)
+        return self._parse_index_daily(data, symbol)
+
+    @staticmethod
+    def _get_index_secid(symbol: str) -> str:
+        """Get secid for an index symbol (index market codes are different)."""
         if symbol.startswith("0"):
-            secid = f"1.{symbol}"  # Shanghai index
+            return f"1.{symbol}"  # Shanghai index
         elif symbol.startswith("3"):
-            secid = f"0.{symbol}"  # Shenzhen index
-        else:
-            secid = f"1.{symbol}"
-
-        # Format dates
-        if start_date is None:
-            start_date = "19900101"
-        elif isinstance(start_date, (date, datetime)):
-            start_date = start_date.strftime("%Y%m%d")
-        else:
-            start_date = start_date.replace("-", "")
-
-        if end_date is None:
-            end_date = datetime.now().strftime("%Y%m%d")
-        elif isinstance(end_date, (date, datetime)):
-            end_date = end_date.strftime("%Y%m%d")
-        else:
-            end_date = end_date.replace("-", "")
-
-        params = {
-            "secid": secid,
-            "fields1": "f1,f2,f3,f4,f5,f6",
-            "fields2": "f51,f52,f53,f54,f55,f56,f57,f58,f59,f60,f61",
-            "klt": "101",
-            "fqt": "1",
-            "beg": start_date,
-            "end": end_date,
-        }
-
-        data = self._get_json(
-            "https://push2his.eastmoney.com/api/qt/stock/kline/get",
-            params=params,
-        )
+            return f"0.{symbol}"  # Shenzhen index
+        return f"1.{symbol}"
 
+    @classmethod
+    def _parse_index_daily(cls, data: dict[str, Any], symbol: str) -> pd.DataFrame:
+        """Parse a daily kline response for an index."""
         if not data.get("data") or not data["data"].get("klines"):
             raise DataNotFoundError(f"No index data found for {symbol}")
 
-        klines = data["data"]["klines"]
-        records = []
-
-        for line in klines:
-            parts = line.split(",")
-            if len(parts) >= 7:
-                records.append(
-                    {
-                        "date": parts[0],
-                        "open": float(parts[1]),
-                        "close": float(parts[2]),
-                        "high": float(parts[3]),
-                        "low": float(parts[4]),
-                        "volume": int(float(parts[5])),
-                        "amount": float(parts[6]),
-                    }
-                )
-
-        df = pd.DataFrame(records)
-        df["date"] = pd.to_datetime(df["date"]).dt.date
-
-        return df
+        return cls._parse_klines(data["data"]["klines"], cls.KLINE_COLUMNS[:7])
 
 
     def fetch_hk_index_daily(
@@ -449,26 +658,9 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("data") or not data["data"].get("klines"):
             raise DataNotFoundError(f"No HK index data found for {symbol}")
 
-        klines = data["data"]["klines"]
-        records = []
-
-        for line in klines:
-            parts = line.split(",")
-            if len(parts) >= 7:
-                records.append(
-                    {
-                        "date": parts[0],
-                        "open": float(parts[1]),
-                        "close": float(parts[2]),
-                        "high": float(parts[3]),
-                        "low": float(parts[4]),
-                        "volume": int(float(parts[5])) if parts[5] != "-" else 0,
-                        "amount": float(parts[6]) if parts[6] != "-" else 0,
-                    }
-                )
-
-        df = pd.DataFrame(records)
-        df["date"] = pd.to_datetime(df["date"]).dt.date
+        df = self._parse_klines(data["data"]["klines"], self.KLINE_COLUMNS[:7], int_columns=())
+        df[["volume", "amount"]] = df[["volume", "amount"]].fillna(0)
+        df["volume"] = df["volume"].astype("int64")
 
         return df
 
@@ -513,24 +705,22 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("result") or not data["result"].get("data"):
             raise DataNotFoundError(f"No income statement data found for {symbol}")
 
-        records = []
-        for item in data["result"]["data"]:
-            records.append({
-                "report_date": item.get("REPORT_DATE", "")[:10],
-                "revenue": item.get("TOTAL_OPERATE_INCOME"),
-                "operating_cost": item.get("TOTAL_OPERATE_COST"),
-                "operating_profit": item.get("OPERATE_PROFIT"),
-                "total_profit": item.get("TOTAL_PROFIT"),
-                "net_profit": item.get("NETPROFIT"),
-                "net_profit_excl_nr": item.get("DEDUCT_PARENT_NETPROFIT"),
-                "eps": item.get("BASIC_EPS"),
-                "eps_diluted": item.get("DILUTED_EPS"),
-            })
-
-        df = pd.DataFrame(records)
-        if not df.empty:
-            df["report_date"] = pd.to_datetime(df["report_date"]).dt.date
-        return df
+        columns = {
+            "report_date": "REPORT_DATE",
+            "revenue": "TOTAL_OPERATE_INCOME",
+            "operating_cost": "TOTAL_OPERATE_COST",
+            "operating_profit": "OPERATE_PROFIT",
+            "total_profit": "TOTAL_PROFIT",
+            "net_profit": "NETPROFIT",
+            "net_profit_excl_nr": "DEDUCT_PARENT_NETPROFIT",
+            "eps": "BASIC_EPS",
+            "eps_diluted": "DILUTED_EPS",
+        }
+        return self._build_frame(
+            data["result"]["data"],
+            columns,
+            dtypes=dict.fromkeys(columns, "float64") | {"report_date": "date"},
+        )
 
     def fetch_balance_sheet(
         self,
@@ -568,27 +758,25 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("result") or not data["result"].get("data"):
             raise DataNotFoundError(f"No balance sheet data found for {symbol}")
 
-        records = []
-        for item in data["result"]["data"]:
-            records.append({
-                "report_date": item.get("REPORT_DATE", "")[:10],
-                "total_assets": item.get("TOTAL_ASSETS"),
-                "total_liab": item.get("TOTAL_LIABILITIES"),
-                "total_equity": item.get("TOTAL_EQUITY"),
-                "total_current_assets": item.get("TOTAL_CURRENT_ASSETS"),
-                "total_noncurrent_assets": item.get("TOTAL_NONCURRENT_ASSETS"),
-                "total_current_liab": item.get("TOTAL_CURRENT_LIAB"),
-                "total_noncurrent_liab": item.get("TOTAL_NONCURRENT_LIAB"),
-                "cash": item.get("MONETARYFUNDS"),
-                "accounts_recv": item.get("ACCOUNTS_RECE"),
-                "inventory": item.get("INVENTORY"),
-                "fixed_assets": item.get("FIXED_ASSET"),
-            })
-
-        df = pd.DataFrame(records)
-        if not df.empty:
-            df["report_date"] = pd.to_datetime(df["report_date"]).dt.date
-        return df
+        columns = {
+            "report_date": "REPORT_DATE",
+            "total_assets": "TOTAL_ASSETS",
+            "total_liab": "TOTAL_LIABILITIES",
+            "total_equity": "TOTAL_EQUITY",
+            "total_current_assets": "TOTAL_CURRENT_ASSETS",
+            "total_noncurrent_assets": "TOTAL_NONCURRENT_ASSETS",
+            "total_current_liab": "TOTAL_CURRENT_LIAB",
+            "total_noncurrent_liab": "TOTAL_NONCURRENT_LIAB",
+            "cash": "MONETARYFUNDS",
+            "accounts_recv": "ACCOUNTS_RECE",
+            "inventory": "INVENTORY",
+            "fixed_assets": "FIXED_ASSET",
+        }
+        return self._build_frame(
+            data["result"]["data"],
+            columns,
+            dtypes=dict.fromkeys(columns, "float64") | {"report_date": "date"},
+        )
 
     def fetch_cash_flow(
         self,
@@ -626,21 +814,19 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("result") or not data["result"].get("data"):
             raise DataNotFoundError(f"No cash flow data found for {symbol}")
 
-        records = []
-        for item in data["result"]["data"]:
-            records.append({
-                "report_date": item.get("REPORT_DATE", "")[:10],
-                "operating_cashflow": item.get("NETCASH_OPERATE"),
-                "investing_cashflow": item.get("NETCASH_INVEST"),
-                "financing_cashflow": item.get("NETCASH_FINANCE"),
-                "net_cash_change": item.get("CASH_EQUIVALENT_INCREASE"),
-                "cash_end": item.get("END_CASH_EQUIVALENT"),
-            })
-
-        df = pd.DataFrame(records)
-        if not df.empty:
-            df["report_date"] = pd.to_datetime(df["report_date"]).dt.date
-        return df
+        columns = {
+            "report_date": "REPORT_DATE",
+            "operating_cashflow": "NETCASH_OPERATE",
+            "investing_cashflow": "NETCASH_INVEST",
+            "financing_cashflow": "NETCASH_FINANCE",
+            "net_cash_change": "CASH_EQUIVALENT_INCREASE",
+            "cash_end": "END_CASH_EQUIVALENT",
+        }
+        return self._build_frame(
+            data["result"]["data"],
+            columns,
+            dtypes=dict.fromkeys(columns, "float64") | {"report_date": "date"},
+        )
 
     def fetch_performance_forecast(
         self,
@@ -676,24 +862,30 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("result") or not data["result"].get("data"):
             return pd.DataFrame()
 
-        records = []
-        for item in data["result"]["data"]:
-            records.append({
-                "symbol": item.get("SECURITY_CODE", ""),
-                "name": item.get("SECURITY_NAME_ABBR", ""),
-                "notice_date": item.get("NOTICE_DATE", "")[:10],
-                "report_date": item.get("REPORT_DATE", "")[:10] if item.get("REPORT_DATE") else "",
-                "forecast_type": item.get("PREDICT_FINANCE_CODE", ""),
-                "net_profit_min": item.get("PREDICT_NETPROFIT_MIN"),
-                "net_profit_max": item.get("PREDICT_NETPROFIT_MAX"),
-                "change_pct_min": item.get("ADD_AMP_MIN"),
-                "change_pct_max": item.get("ADD_AMP_MAX"),
-                "forecast_content": item.get("PREDICT_CONTENT", ""),
-            })
-
-        df = pd.DataFrame(records)
-        if not df.empty and "notice_date" in df.columns:
-            df["notice_date"] = pd.to_datetime(df["notice_date"]).dt.date
+        df = self._build_frame(
+            data["result"]["data"],
+            {
+                "symbol": "SECURITY_CODE",
+                "name": "SECURITY_NAME_ABBR",
+                "notice_date": "NOTICE_DATE",
+                "report_date": "REPORT_DATE",
+                "forecast_type": "PREDICT_FINANCE_CODE",
+                "net_profit_min": "PREDICT_NETPROFIT_MIN",
+                "net_profit_max": "PREDICT_NETPROFIT_MAX",
+                "change_pct_min": "ADD_AMP_MIN",
+                "change_pct_max": "ADD_AMP_MAX",
+                "forecast_content": "PREDICT_CONTENT",
+            },
+            dtypes={
+                "notice_date": "date",
+                "report_date": "str",
+                "net_profit_min": "float64",
+                "net_profit_max": "float64",
+                "change_pct_min": "float64",
+                "change_pct_max": "float64",
+            },
+        )
+        df["report_date"] = df["report_date"].str[:10]
         return df
 
     def fetch_dividend_history(
@@ -730,21 +922,24 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("result") or not data["result"].get("data"):
             return pd.DataFrame()
 
-        records = []
-        for item in data["result"]["data"]:
-            ex_date = item.get("EX_DIVIDEND_DATE")
-            records.append({
-                "symbol": symbol,
-                "report_date": item.get("REPORT_DATE", "")[:10] if item.get("REPORT_DATE") else "",
-                "plan": item.get("IMPL_PLAN_PROFILE", ""),
-                "dividend_per_share": item.get("BONUS_IT_RATIO"),
-                "bonus_shares_ratio": item.get("TRANS_IT_RATIO"),
-                "ex_dividend_date": ex_date[:10] if ex_date else "",
-                "record_date": item.get("EQUITY_RECORD_DATE", "")[:10] if item.get("EQUITY_RECORD_DATE") else "",
-                "pay_date": item.get("PAY_CASH_DATE", "")[:10] if item.get("PAY_CASH_DATE") else "",
-            })
-
-        df = pd.DataFrame(records)
+        dates = ("report_date", "ex_dividend_date", "record_date", "pay_date")
+        df = self._build_frame(
+            data["result"]["data"],
+            {
+                "report_date": "REPORT_DATE",
+                "plan": "IMPL_PLAN_PROFILE",
+                "dividend_per_share": "BONUS_IT_RATIO",
+                "bonus_shares_ratio": "TRANS_IT_RATIO",
+                "ex_dividend_date": "EX_DIVIDEND_DATE",
+                "record_date": "EQUITY_RECORD_DATE",
+                "pay_date": "PAY_CASH_DATE",
+            },
+            dtypes=dict.fromkeys(dates, "str")
+            | {"dividend_per_share": "float64", "bonus_shares_ratio": "float64"},
+        )
+        for column in dates:
+            df[column] = df[column].str[:10]
+        df.insert(0, "symbol", symbol)
         return df
 
     # =========================================================================
@@ -785,30 +980,23 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("data") or not data["data"].get("klines"):
             raise DataNotFoundError(f"No money flow data found for {symbol}")
 
-        records = []
-        for line in data["data"]["klines"]:
-            parts = line.split(",")
-            if len(parts) >= 13:
-                records.append({
-                    "date": parts[0],
-                    "main_net_inflow": float(parts[1]) if parts[1] != "-" else 0,
-                    "small_net_inflow": float(parts[2]) if parts[2] != "-" else 0,
-                    "medium_net_inflow": float(parts[3]) if parts[3] != "-" else 0,
-                    "large_net_inflow": float(parts[4]) if parts[4] != "-" else 0,
-                    "super_large_net_inflow": float(parts[5]) if parts[5] != "-" else 0,
-                    "main_net_inflow_pct": float(parts[6]) if parts[6] != "-" else 0,
-                    "small_net_inflow_pct": float(parts[7]) if parts[7] != "-" else 0,
-                    "medium_net_inflow_pct": float(parts[8]) if parts[8] != "-" else 0,
-                    "large_net_inflow_pct": float(parts[9]) if parts[9] != "-" else 0,
-                    "super_large_net_inflow_pct": float(parts[10]) if parts[10] != "-" else 0,
-                    "close": float(parts[11]) if parts[11] != "-" else 0,
-                    "change_pct": float(parts[12]) if parts[12] != "-" else 0,
-                })
-
-        df = pd.DataFrame(records)
-        if not df.empty:
-            df["date"] = pd.to_datetime(df["date"]).dt.date
-        return df
+        columns = (
+            "date",
+            "main_net_inflow",
+            "small_net_inflow",
+            "medium_net_inflow",
+            "large_net_inflow",
+            "super_large_net_inflow",
+            "main_net_inflow_pct",
+            "small_net_inflow_pct",
+            "medium_net_inflow_pct",
+            "large_net_inflow_pct",
+            "super_large_net_inflow_pct",
+            "close",
+            "change_pct",
+        )
+        df = self._parse_klines(data["data"]["klines"], columns, int_columns=())
+        return df.fillna(dict.fromkeys(columns[1:], 0.0))
 
     def fetch_stock_moneyflow_realtime(
         self,
@@ -894,22 +1082,23 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("data") or not data["data"].get("diff"):
             return pd.DataFrame()
 
-        records = []
-        for item in data["data"]["diff"]:
-            records.append({
-                "code": item.get("f12", ""),
-                "name": item.get("f14", ""),
-                "price": item.get("f2"),
-                "change_pct": item.get("f3"),
-                "main_net_inflow": item.get("f62"),
-                "main_net_inflow_pct": item.get("f184"),
-                "super_large_net_inflow": item.get("f66"),
-                "large_net_inflow": item.get("f72"),
-                "medium_net_inflow": item.get("f78"),
-                "small_net_inflow": item.get("f84"),
-            })
-
-        return pd.DataFrame(records)
+        columns = {
+            "code": "f12",
+            "name": "f14",
+            "price": "f2",
+            "change_pct": "f3",
+            "main_net_inflow": "f62",
+            "main_net_inflow_pct": "f184",
+            "super_large_net_inflow": "f66",
+            "large_net_inflow": "f72",
+            "medium_net_inflow": "f78",
+            "small_net_inflow": "f84",
+        }
+        return self._build_frame(
+            data["data"]["diff"],
+            columns,
+            dtypes=dict.fromkeys(list(columns)[2:], "float64"),
+        )
 
     # =========================================================================
     # Minute Data Methods
@@ -960,24 +1149,9 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("data") or not data["data"].get("klines"):
             raise DataNotFoundError(f"No minute data found for {symbol}")
 
-        records = []
-        for line in data["data"]["klines"]:
-            parts = line.split(",")
-            if len(parts) >= 7:
-                records.append({
-                    "datetime": parts[0],
-                    "open": float(parts[1]),
-                    "close": float(parts[2]),
-                    "high": float(parts[3]),
-                    "low": float(parts[4]),
-                    "volume": int(float(parts[5])),
-                    "amount": float(parts[6]),
-                })
-
-        df = pd.DataFrame(records)
-        if not df.empty:
-            df["datetime"] = pd.to_datetime(df["datetime"])
-        return df
+        return self._parse_klines(
+            data["data"]["klines"], ("datetime", *self.KLINE_COLUMNS[1:7])
+        )
 
     # =========================================================================
     # Futures Data Methods
@@ -1027,25 +1201,26 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("data") or not data["data"].get("diff"):
             return pd.DataFrame()
 
-        records = []
-        for item in data["data"]["diff"]:
-            market_code = item.get("f13", 0)
-            exchange_name = {113: "SHFE", 114: "DCE", 115: "CZCE", 8: "CFFEX", 142: "INE"}.get(market_code, "")
-            records.append({
-                "symbol": item.get("f12", ""),
-                "name": item.get("f14", ""),
-                "exchange": exchange_name,
-                "price": item.get("f2"),
-                "change_pct": item.get("f3"),
-                "open": item.get("f17"),
-                "high": item.get("f15"),
-                "low": item.get("f16"),
-                "pre_close": item.get("f18"),
-                "volume": item.get("f5"),
-                "amount": item.get("f6"),
-            })
-
-        return pd.DataFrame(records)
+        exchanges = {113: "SHFE", 114: "DCE", 115: "CZCE", 8: "CFFEX", 142: "INE"}
+        df = self._build_frame(
+            data["data"]["diff"],
+            {
+                "symbol": "f12",
+                "name": "f14",
+                "exchange": "f13",
+                "price": "f2",
+                "change_pct": "f3",
+                "open": "f17",
+                "high": "f15",
+                "low": "f16",
+                "pre_close": "f18",
+                "volume": "f5",
+                "amount": "f6",
+            },
+            dtypes=self._QUOTE_DTYPES,
+        )
+        df["exchange"] = df["exchange"].map(exchanges).fillna("")
+        return df
 
     def fetch_futures_daily(
         self,
@@ -1113,25 +1288,9 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("data") or not data["data"].get("klines"):
             raise DataNotFoundError(f"No futures data found for {symbol}")
 
-        records = []
-        for line in data["data"]["klines"]:
-            parts = line.split(",")
-            if len(parts) >= 7:
-                records.append({
-                    "date": parts[0],
-                    "open": float(parts[1]),
-                    "close": float(parts[2]),
-                    "high": float(parts[3]),
-                    "low": float(parts[4]),
-                    "volume": int(float(parts[5])),
-                    "amount": float(parts[6]),
-                    "open_interest": float(parts[7]) if len(parts) > 7 and parts[7] != "-" else None,
-                })
-
-        df = pd.DataFrame(records)
-        if not df.empty:
-            df["date"] = pd.to_datetime(df["date"]).dt.date
-        return df
+        return self._parse_klines(
+            data["data"]["klines"], (*self.KLINE_COLUMNS[:7], "open_interest")
+        )
 
     def fetch_futures_positions(
         self,
@@ -1175,23 +1334,27 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("result") or not data["result"].get("data"):
             return pd.DataFrame()
 
-        records = []
-        for item in data["result"]["data"]:
-            records.append({
-                "date": item.get("TRADE_DATE", "")[:10],
-                "contract": item.get("CONTRACT_CODE", ""),
-                "rank": item.get("RANK"),
-                "member_name": item.get("PARTICIPATOR_NAME", ""),
-                "long_volume": item.get("CJ_VOLUME"),
-                "long_change": item.get("CJ_VOLUME_CHG"),
-                "short_volume": item.get("CD_VOLUME"),
-                "short_change": item.get("CD_VOLUME_CHG"),
-            })
-
-        df = pd.DataFrame(records)
-        if not df.empty and "date" in df.columns:
-            df["date"] = pd.to_datetime(df["date"]).dt.date
-        return df
+        return self._build_frame(
+            data["result"]["data"],
+            {
+                "date": "TRADE_DATE",
+                "contract": "CONTRACT_CODE",
+                "rank": "RANK",
+                "member_name": "PARTICIPATOR_NAME",
+                "long_volume": "CJ_VOLUME",
+                "long_change": "CJ_VOLUME_CHG",
+                "short_volume": "CD_VOLUME",
+                "short_change": "CD_VOLUME_CHG",
+            },
+            dtypes={
+                "date": "date",
+                "rank": "int64",
+                "long_volume": "int64",
+                "long_change": "int64",
+                "short_volume": "int64",
+                "short_change": "int64",
+            },
+        )
 
     # =========================================================================
     # Convertible Bond Data Methods
@@ -1227,22 +1390,22 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("data") or not data["data"].get("diff"):
             return pd.DataFrame()
 
-        records = []
-        for item in data["data"]["diff"]:
-            records.append({
-                "symbol": item.get("f12", ""),
-                "name": item.get("f14", ""),
-                "price": item.get("f2"),
-                "change_pct": item.get("f3"),
-                "open": item.get("f17"),
-                "high": item.get("f15"),
-                "low": item.get("f16"),
-                "pre_close": item.get("f18"),
-                "volume": item.get("f5"),
-                "amount": item.get("f6"),
-            })
-
-        return pd.DataFrame(records)
+        return self._build_frame(
+            data["data"]["diff"],
+            {
+                "symbol": "f12",
+                "name": "f14",
+                "price": "f2",
+                "change_pct": "f3",
+                "open": "f17",
+                "high": "f15",
+                "low": "f16",
+                "pre_close": "f18",
+                "volume": "f5",
+                "amount": "f6",
+            },
+            dtypes=self._QUOTE_DTYPES,
+        )
 
     def fetch_convertible_daily(
         self,
@@ -1301,24 +1464,7 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("data") or not data["data"].get("klines"):
             raise DataNotFoundError(f"No convertible bond data found for {symbol}")
 
-        records = []
-        for line in data["data"]["klines"]:
-            parts = line.split(",")
-            if len(parts) >= 7:
-                records.append({
-                    "date": parts[0],
-                    "open": float(parts[1]),
-                    "close": float(parts[2]),
-                    "high": float(parts[3]),
-                    "low": float(parts[4]),
-                    "volume": int(float(parts[5])),
-                    "amount": float(parts[6]),
-                })
-
-        df = pd.DataFrame(records)
-        if not df.empty:
-            df["date"] = pd.to_datetime(df["date"]).dt.date
-        return df
+        return self._parse_klines(data["data"]["klines"], self.KLINE_COLUMNS[:7])
 
     def fetch_convertible_info(
         self,
@@ -1412,25 +1558,30 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("result") or not data["result"].get("data"):
             return pd.DataFrame()
 
-        records = []
-        for item in data["result"]["data"]:
-            records.append({
-                "date": item.get("TRADE_DATE", "")[:10],
-                "symbol": item.get("SECURITY_CODE", ""),
-                "name": item.get("SECURITY_NAME_ABBR", ""),
-                "close": item.get("CLOSE_PRICE"),
-                "change_pct": item.get("CHANGE_RATE"),
-                "turnover_rate": item.get("TURNOVERRATE"),
-                "reason": item.get("EXPLANATION", ""),
-                "buy_amount": item.get("BUY_TOTAL_AMT"),
-                "sell_amount": item.get("SELL_TOTAL_AMT"),
-                "net_amount": item.get("NET_BUY_AMT"),
-            })
-
-        df = pd.DataFrame(records)
-        if not df.empty and "date" in df.columns:
-            df["date"] = pd.to_datetime(df["date"]).dt.date
-        return df
+        return self._build_frame(
+            data["result"]["data"],
+            {
+                "date": "TRADE_DATE",
+                "symbol": "SECURITY_CODE",
+                "name": "SECURITY_NAME_ABBR",
+                "close": "CLOSE_PRICE",
+                "change_pct": "CHANGE_RATE",
+                "turnover_rate": "TURNOVERRATE",
+                "reason": "EXPLANATION",
+                "buy_amount": "BUY_TOTAL_AMT",
+                "sell_amount": "SELL_TOTAL_AMT",
+                "net_amount": "NET_BUY_AMT",
+            },
+            dtypes={
+                "date": "date",
+                "close": "float64",
+                "change_pct": "float64",
+                "turnover_rate": "float64",
+                "buy_amount": "float64",
+                "sell_amount": "float64",
+                "net_amount": "float64",
+            },
+        )
 
     def fetch_lhb_detail(
         self,
@@ -1466,21 +1617,30 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("result") or not data["result"].get("data"):
             return pd.DataFrame()
 
-        records = []
-        for item in data["result"]["data"]:
-            records.append({
-                "date": item.get("TRADE_DATE", "")[:10],
-                "symbol": item.get("SECURITY_CODE", ""),
-                "rank": item.get("RANK"),
-                "trader_name": item.get("OPERATEDEPT_NAME", ""),
-                "buy_amount": item.get("BUY_AMT"),
-                "sell_amount": item.get("SELL_AMT"),
-                "net_amount": item.get("NET_AMT"),
-                "buy_pct": item.get("BUY_RATE"),
-                "sell_pct": item.get("SELL_RATE"),
-            })
-
-        df = pd.DataFrame(records)
+        df = self._build_frame(
+            data["result"]["data"],
+            {
+                "date": "TRADE_DATE",
+                "symbol": "SECURITY_CODE",
+                "rank": "RANK",
+                "trader_name": "OPERATEDEPT_NAME",
+                "buy_amount": "BUY_AMT",
+                "sell_amount": "SELL_AMT",
+                "net_amount": "NET_AMT",
+                "buy_pct": "BUY_RATE",
+                "sell_pct": "SELL_RATE",
+            },
+            dtypes={
+                "date": "str",
+                "rank": "int64",
+                "buy_amount": "float64",
+                "sell_amount": "float64",
+                "net_amount": "float64",
+                "buy_pct": "float64",
+                "sell_pct": "float64",
+            },
+        )
+        df["date"] = df["date"].str[:10]
         return df
 
     def fetch_lhb_institution(
@@ -1517,24 +1677,28 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("result") or not data["result"].get("data"):
             return pd.DataFrame()
 
-        records = []
-        for item in data["result"]["data"]:
-            records.append({
-                "date": item.get("TRADE_DATE", "")[:10],
-                "symbol": item.get("SECURITY_CODE", ""),
-                "name": item.get("SECURITY_NAME_ABBR", ""),
-                "close": item.get("CLOSE_PRICE"),
-                "change_pct": item.get("CHANGE_RATE"),
-                "institution_buy": item.get("BUY_AMT"),
-                "institution_sell": item.get("SELL_AMT"),
-                "institution_net": item.get("NET_BUY_AMT"),
-                "reason": item.get("EXPLANATION", ""),
-            })
-
-        df = pd.DataFrame(records)
-        if not df.empty and "date" in df.columns:
-            df["date"] = pd.to_datetime(df["date"]).dt.date
-        return df
+        return self._build_frame(
+            data["result"]["data"],
+            {
+                "date": "TRADE_DATE",
+                "symbol": "SECURITY_CODE",
+                "name": "SECURITY_NAME_ABBR",
+                "close": "CLOSE_PRICE",
+                "change_pct": "CHANGE_RATE",
+                "institution_buy": "BUY_AMT",
+                "institution_sell": "SELL_AMT",
+                "institution_net": "NET_BUY_AMT",
+                "reason": "EXPLANATION",
+            },
+            dtypes={
+                "date": "date",
+                "close": "float64",
+                "change_pct": "float64",
+                "institution_buy": "float64",
+                "institution_sell": "float64",
+                "institution_net": "float64",
+            },
+        )
 
     # =========================================================================
     # Option Data Methods
@@ -1574,22 +1738,22 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("data") or not data["data"].get("diff"):
             return pd.DataFrame()
 
-        records = []
-        for item in data["data"]["diff"]:
-            records.append({
-                "symbol": item.get("f12", ""),
-                "name": item.get("f14", ""),
-                "price": item.get("f2"),
-                "change_pct": item.get("f3"),
-                "open": item.get("f17"),
-                "high": item.get("f15"),
-                "low": item.get("f16"),
-                "pre_close": item.get("f18"),
-                "volume": item.get("f5"),
-                "amount": item.get("f6"),
-            })
-
-        return pd.DataFrame(records)
+        return self._build_frame(
+            data["data"]["diff"],
+            {
+                "symbol": "f12",
+                "name": "f14",
+                "price": "f2",
+                "change_pct": "f3",
+                "open": "f17",
+                "high": "f15",
+                "low": "f16",
+                "pre_close": "f18",
+                "volume": "f5",
+                "amount": "f6",
+            },
+            dtypes=self._QUOTE_DTYPES,
+        )
 
     def fetch_option_daily(
         self,
@@ -1644,24 +1808,7 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("data") or not data["data"].get("klines"):
             raise DataNotFoundError(f"No option data found for {symbol}")
 
-        records = []
-        for line in data["data"]["klines"]:
-            parts = line.split(",")
-            if len(parts) >= 7:
-                records.append({
-                    "date": parts[0],
-                    "open": float(parts[1]),
-                    "close": float(parts[2]),
-                    "high": float(parts[3]),
-                    "low": float(parts[4]),
-                    "volume": int(float(parts[5])),
-                    "amount": float(parts[6]),
-                })
-
-        df = pd.DataFrame(records)
-        if not df.empty:
-            df["date"] = pd.to_datetime(df["date"]).dt.date
-        return df
+        return self._parse_klines(data["data"]["klines"], self.KLINE_COLUMNS[:7])
 
     # =========================================================================
     # Shareholder Data Methods
@@ -1703,23 +1850,27 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("result") or not data["result"].get("data"):
             raise DataNotFoundError(f"No shareholder data found for {symbol}")
 
-        records = []
-        for item in data["result"]["data"]:
-            records.append({
-                "report_date": item.get("HOLD_DATE", "")[:10],
-                "rank": item.get("RANK"),
-                "holder_name": item.get("HOLDER_NAME", ""),
-                "holder_type": item.get("HOLDER_TYPE", ""),
-                "shares": item.get("HOLD_NUM"),
-                "shares_pct": item.get("HOLD_RATIO"),
-                "change": item.get("HOLD_NUM_CHANGE"),
-                "change_pct": item.get("HOLD_RATIO_CHANGE"),
-            })
-
-        df = pd.DataFrame(records)
-        if not df.empty and "report_date" in df.columns:
-            df["report_date"] = pd.to_datetime(df["report_date"]).dt.date
-        return df
+        return self._build_frame(
+            data["result"]["data"],
+            {
+                "report_date": "HOLD_DATE",
+                "rank": "RANK",
+                "holder_name": "HOLDER_NAME",
+                "holder_type": "HOLDER_TYPE",
+                "shares": "HOLD_NUM",
+                "shares_pct": "HOLD_RATIO",
+                "change": "HOLD_NUM_CHANGE",
+                "change_pct": "HOLD_RATIO_CHANGE",
+            },
+            dtypes={
+                "report_date": "date",
+                "rank": "int64",
+                "shares": "float64",
+                "shares_pct": "float64",
+                "change": "float64",
+                "change_pct": "float64",
+            },
+        )
 
     def fetch_stock_pledge(
         self,
@@ -1753,20 +1904,23 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("result") or not data["result"].get("data"):
             return pd.DataFrame()
 
-        records = []
-        for item in data["result"]["data"]:
-            records.append({
-                "symbol": symbol,
-                "pledge_date": item.get("PLEDGE_DATE", "")[:10] if item.get("PLEDGE_DATE") else "",
-                "holder_name": item.get("HOLDER_NAME", ""),
-                "pledgee": item.get("PLEDGE_ORG", ""),
-                "shares": item.get("PLEDGE_NUM"),
-                "shares_pct": item.get("PLEDGE_RATIO"),
-                "start_date": item.get("PLEDGE_START_DATE", "")[:10] if item.get("PLEDGE_START_DATE") else "",
-                "end_date": item.get("PLEDGE_END_DATE", "")[:10] if item.get("PLEDGE_END_DATE") else "",
-            })
-
-        df = pd.DataFrame(records)
+        dates = ("pledge_date", "start_date", "end_date")
+        df = self._build_frame(
+            data["result"]["data"],
+            {
+                "pledge_date": "PLEDGE_DATE",
+                "holder_name": "HOLDER_NAME",
+                "pledgee": "PLEDGE_ORG",
+                "shares": "PLEDGE_NUM",
+                "shares_pct": "PLEDGE_RATIO",
+                "start_date": "PLEDGE_START_DATE",
+                "end_date": "PLEDGE_END_DATE",
+            },
+            dtypes=dict.fromkeys(dates, "str") | {"shares": "float64", "shares_pct": "float64"},
+        )
+        for column in dates:
+            df[column] = df[column].str[:10]
+        df.insert(0, "symbol", symbol)
         return df
 
     def fetch_stock_unlock(
@@ -1803,22 +1957,24 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("result") or not data["result"].get("data"):
             return pd.DataFrame()
 
-        records = []
-        for item in data["result"]["data"]:
-            records.append({
-                "unlock_date": item.get("FREE_DATE", "")[:10],
-                "symbol": item.get("SECURITY_CODE", ""),
-                "name": item.get("SECURITY_NAME_ABBR", ""),
-                "unlock_shares": item.get("LIFT_NUM"),
-                "unlock_ratio": item.get("LIFT_RATIO"),
-                "unlock_value": item.get("LIFT_MARKET_CAP"),
-                "lock_type": item.get("LIMIT_SALE_TYPE", ""),
-            })
-
-        df = pd.DataFrame(records)
-        if not df.empty and "unlock_date" in df.columns:
-            df["unlock_date"] = pd.to_datetime(df["unlock_date"]).dt.date
-        return df
+        return self._build_frame(
+            data["result"]["data"],
+            {
+                "unlock_date": "FREE_DATE",
+                "symbol": "SECURITY_CODE",
+                "name": "SECURITY_NAME_ABBR",
+                "unlock_shares": "LIFT_NUM",
+                "unlock_ratio": "LIFT_RATIO",
+                "unlock_value": "LIFT_MARKET_CAP",
+                "lock_type": "LIMIT_SALE_TYPE",
+            },
+            dtypes={
+                "unlock_date": "date",
+                "unlock_shares": "float64",
+                "unlock_ratio": "float64",
+                "unlock_value": "float64",
+            },
+        )
 
     # =========================================================================
     # Index Enhanced Methods
@@ -1856,17 +2012,18 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("result") or not data["result"].get("data"):
             raise DataNotFoundError(f"No constituents found for index {symbol}")
 
-        records = []
-        for item in data["result"]["data"]:
-            records.append({
-                "index_code": symbol,
-                "symbol": item.get("SECURITY_CODE", ""),
-                "name": item.get("SECURITY_NAME_ABBR", ""),
-                "close": item.get("CLOSE_PRICE"),
-                "change_pct": item.get("CHANGE_RATE"),
-            })
-
-        return pd.DataFrame(records)
+        df = self._build_frame(
+            data["result"]["data"],
+            {
+                "symbol": "SECURITY_CODE",
+                "name": "SECURITY_NAME_ABBR",
+                "close": "CLOSE_PRICE",
+                "change_pct": "CHANGE_RATE",
+            },
+            dtypes={"close": "float64", "change_pct": "float64"},
+        )
+        df.insert(0, "index_code", symbol)
+        return df
 
     def fetch_index_weights(
         self,
@@ -1900,16 +2057,13 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("result") or not data["result"].get("data"):
             raise DataNotFoundError(f"No weight data found for index {symbol}")
 
-        records = []
-        for item in data["result"]["data"]:
-            records.append({
-                "index_code": symbol,
-                "symbol": item.get("SECURITY_CODE", ""),
-                "name": item.get("SECURITY_NAME_ABBR", ""),
-                "weight": item.get("WEIGHT"),
-            })
-
-        return pd.DataFrame(records)
+        df = self._build_frame(
+            data["result"]["data"],
+            {"symbol": "SECURITY_CODE", "name": "SECURITY_NAME_ABBR", "weight": "WEIGHT"},
+            dtypes={"weight": "float64"},
+        )
+        df.insert(0, "index_code", symbol)
+        return df
 
     # =========================================================================
     # ETF Enhanced Methods
@@ -1949,19 +2103,22 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("result") or not data["result"].get("data"):
             return pd.DataFrame()
 
-        records = []
-        for item in data["result"]["data"]:
-            records.append({
-                "date": item.get("TRADE_DATE", "")[:10],
-                "symbol": symbol,
-                "shares": item.get("FUND_SHARE"),
-                "shares_change": item.get("FUND_SHARE_CHANGE"),
-                "shares_change_pct": item.get("FUND_SHARE_CHANGE_RATE"),
-            })
-
-        df = pd.DataFrame(records)
-        if not df.empty and "date" in df.columns:
-            df["date"] = pd.to_datetime(df["date"]).dt.date
+        df = self._build_frame(
+            data["result"]["data"],
+            {
+                "date": "TRADE_DATE",
+                "shares": "FUND_SHARE",
+                "shares_change": "FUND_SHARE_CHANGE",
+                "shares_change_pct": "FUND_SHARE_CHANGE_RATE",
+            },
+            dtypes={
+                "date": "date",
+                "shares": "float64",
+                "shares_change": "float64",
+                "shares_change_pct": "float64",
+            },
+        )
+        df.insert(1, "symbol", symbol)
         return df
 
     def fetch_etf_premium_discount(
@@ -1996,19 +2153,17 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("result") or not data["result"].get("data"):
             return pd.DataFrame()
 
-        records = []
-        for item in data["result"]["data"]:
-            records.append({
-                "date": item.get("TRADE_DATE", "")[:10],
-                "symbol": symbol,
-                "price": item.get("CLOSE_PRICE"),
-                "nav": item.get("NAV"),
-                "premium_rate": item.get("PREMIUM_RATE"),
-            })
-
-        df = pd.DataFrame(records)
-        if not df.empty and "date" in df.columns:
-            df["date"] = pd.to_datetime(df["date"]).dt.date
+        df = self._build_frame(
+            data["result"]["data"],
+            {
+                "date": "TRADE_DATE",
+                "price": "CLOSE_PRICE",
+                "nav": "NAV",
+                "premium_rate": "PREMIUM_RATE",
+            },
+            dtypes={"date": "date", "price": "float64", "nav": "float64", "premium_rate": "float64"},
+        )
+        df.insert(1, "symbol", symbol)
         return df
 
     # =========================================================================
@@ -2137,23 +2292,9 @@ class EastMoneyAdapter(BaseAdapter):
         if not data.get("data") or not data["data"].get("klines"):
             raise DataNotFoundError(f"No historical exchange rate data for {base}/{target}")
 
-        records = []
-        for line in data["data"]["klines"]:
-            parts = line.split(",")
-            if len(parts) >= 5:
-                records.append({
-                    "date": parts[0],
-                    "base": base.upper(),
-                    "target": target.upper(),
-                    "open": float(parts[1]),
-                    "close": float(parts[2]),
-                    "high": float(parts[3]),
-                    "low": float(parts[4]),
-                })
-
-        df = pd.DataFrame(records)
-        if not df.empty:
-            df["date"] = pd.to_datetime(df["date"]).dt.date
+        df = self._parse_klines(data["data"]["klines"], self.KLINE_COLUMNS[:5])
+        df.insert(1, "base", base.upper())
+        df.insert(2, "target", target.upper())
         return df
 
 
@@ -9,11 +9,12 @@ from __future__ import annotations
 
 import logging
 
-from finvista._fetchers.source_manager import source_manager
+from finvista._fetchers.source_manager import async_source_manager, source_manager
 
 logger = logging.getLogger(__name__)
 
 _registered = False
+_async_registered = False
 
 
 def register_all_sources() -> None:
@@ -80,6 +81,18 @@ def register_all_sources() -> None:
         fetcher=eastmoney_adapter.fetch_stock_quote,
         priority=2,
     )
+    # Sina skips symbols it cannot quote; ask the next source for those only
+    source_manager.register_batch("cn_stock_quote")
+
+    # =========================================================================
+    # China Market Snapshot (Real-time, whole board)
+    # =========================================================================
+    source_manager.register(
+        data_type="cn_market_snapshot",
+        name="eastmoney",
+        fetcher=eastmoney_adapter.fetch_market_snapshot,
+        priority=0,
+    )
 
     # =========================================================================
     # China Stock List
@@ -383,6 +396,43 @@ def register_all_sources() -> None:
     logger.debug("Data source registration complete")
 
 
+def register_async_sources() -> None:
+    """
+    Register async fetchers with the async source manager.
+
+    Only data types served by ``finvista.aio`` have async fetchers. Their
+    priority follows the sync registrations, so the sync sources are
+    registered first.
+    """
+    global _async_registered
+
+    if _async_registered:
+        return
+
+    register_all_sources()
+
+    from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
+    from finvista._fetchers.adapters.sina import sina_adapter
+    from finvista._fetchers.adapters.tiantian import tiantian_adapter
+    from finvista._fetchers.adapters.yahoo import yahoo_adapter
+
+    async_sources = [
+        ("cn_stock_daily", "eastmoney", eastmoney_adapter.afetch_stock_daily),
+        ("cn_stock_daily", "sina", sina_adapter.afetch_stock_daily),
+        ("cn_stock_quote", "sina", sina_adapter.afetch_stock_quote),
+        ("cn_stock_quote", "eastmoney", eastmoney_adapter.afetch_stock_quote),
+        ("cn_index_daily", "eastmoney", eastmoney_adapter.afetch_index_daily),
+        ("cn_fund_nav", "tiantian", tiantian_adapter.afetch_fund_nav),
+        ("us_stock_daily", "yahoo", yahoo_adapter.afetch_stock_daily),
+        ("us_stock_quote", "yahoo", yahoo_adapter.afetch_stock_quote),
+    ]
+    for data_type, name, fetcher in async_sources:
+        async_source_manager.register(data_type=data_type, name=name, fetcher=fetcher)
+
+    _async_registered = True
+    logger.debug("Async data source registration complete")
+
+
 def get_registered_sources() -> dict[str, list[str]]:
     """
     Get all registered data sources.
@@ -397,6 +447,7 @@ def get_registered_sources() -> dict[str, list[str]]:
     for data_type in [
         "cn_stock_daily",
         "cn_stock_quote",
+        "cn_market_snapshot",
         "cn_stock_list",
         "cn_index_daily",
         "cn_index_quote",
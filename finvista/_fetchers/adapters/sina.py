@@ -9,13 +9,14 @@ from __future__ import annotations
 
 import logging
 import re
-from datetime import date, datetime
+from datetime import date
 from typing import Any
 
 import pandas as pd
 
 from finvista._core.exceptions import DataNotFoundError, DataParsingError
 from finvista._fetchers.adapters.base import BaseAdapter
+from finvista._fetchers.chunking import afetch_chunked, fetch_chunked
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +44,12 @@ class SinaAdapter(BaseAdapter):
         "sz": "sz",  # Shenzhen
     }
 
+    # Quote requests are rejected without a Sina referer
+    HEADERS = {"Referer": "https://finance.sina.com.cn"}
+
+    # Symbols per hq.sinajs.cn/list= request
+    QUOTE_BATCH_SIZE = 800
+
     def is_available(self) -> bool:
         """Check if Sina API is available."""
         try:
@@ -103,16 +110,46 @@ class SinaAdapter(BaseAdapter):
         if isinstance(symbols, str):
             symbols = [symbols]
 
-        sina_symbols = [self._get_sina_symbol(s) for s in symbols]
-        symbols_str = ",".join(sina_symbols)
+        return fetch_chunked(
+            self.name, self._fetch_stock_quote_chunk, symbols, self.QUOTE_BATCH_SIZE
+        )
+
+    async def afetch_stock_quote(
+        self,
+        symbols: list[str] | str,
+        **kwargs: Any,
+    ) -> pd.DataFrame:
+        """Async version of ``fetch_stock_quote``."""
+        if isinstance(symbols, str):
+            symbols = [symbols]
+
+        return await afetch_chunked(
+            self.name, self._afetch_stock_quote_chunk, symbols, self.QUOTE_BATCH_SIZE
+        )
 
+    def _fetch_stock_quote_chunk(self, symbols: list[str]) -> pd.DataFrame:
+        """Fetch quotes for at most ``QUOTE_BATCH_SIZE`` symbols."""
         response = self._get_text(
-            f"https://hq.sinajs.cn/list={symbols_str}",
-            headers={"Referer": "https://finance.sina.com.cn"},
-            encoding="gbk",
+            self._stock_quote_url(symbols), headers=self.HEADERS, encoding="gbk"
         )
+        return self._parse_stock_quote(response, symbols)
 
-        records = []
+    async def _afetch_stock_quote_chunk(self, symbols: list[str]) -> pd.DataFrame:
+        """Async version of ``_fetch_stock_quote_chunk``."""
+        response = await self._aget_text(
+            self._stock_quote_url(symbols), headers=self.HEADERS, encoding="gbk"
+        )
+        return self._parse_stock_quote(response, symbols)
+
+    def _stock_quote_url(self, symbols: list[str]) -> str:
+        """Build the real-time quote URL for a list of symbols."""
+        sina_symbols = [self._get_sina_symbol(s) for s in symbols]
+        return f"https://hq.sinajs.cn/list={','.join(sina_symbols)}"
+
+    @staticmethod
+    def _parse_stock_quote(response: str, symbols: list[str]) -> pd.DataFrame:
+        """Parse a real-time quote response."""
+        rows = []
         pattern = r'var hq_str_(\w+)="([^"]*)"'
 
         for match in re.finditer(pattern, response):
@@ -126,35 +163,45 @@ class SinaAdapter(BaseAdapter):
             if len(parts) < 32:
                 continue
 
-            # Extract symbol without prefix
-            symbol = sina_symbol[2:]
-
-            try:
-                records.append({
-                    "symbol": symbol,
-                    "name": parts[0],
-                    "open": float(parts[1]) if parts[1] else None,
-                    "pre_close": float(parts[2]) if parts[2] else None,
-                    "price": float(parts[3]) if parts[3] else None,
-                    "high": float(parts[4]) if parts[4] else None,
-                    "low": float(parts[5]) if parts[5] else None,
-                    "volume": int(float(parts[8])) if parts[8] else 0,
-                    "amount": float(parts[9]) if parts[9] else 0,
-                    "change": float(parts[3]) - float(parts[2]) if parts[3] and parts[2] else None,
-                    "change_pct": round(
-                        (float(parts[3]) - float(parts[2])) / float(parts[2]) * 100, 2
-                    ) if parts[3] and parts[2] and float(parts[2]) != 0 else None,
-                    "date": parts[30] if len(parts) > 30 else None,
-                    "time": parts[31] if len(parts) > 31 else None,
-                })
-            except (ValueError, IndexError) as e:
-                logger.warning(f"Failed to parse quote for {symbol}: {e}")
-                continue
+            # Symbol without prefix, followed by the quote fields
+            rows.append([sina_symbol[2:], *parts])
 
-        if not records:
+        if not rows:
             raise DataNotFoundError(f"No quote data found for symbols: {symbols}")
 
-        return pd.DataFrame(records)
+        df = SinaAdapter._build_frame(
+            rows,
+            {
+                "symbol": 0,
+                "name": 1,
+                "open": 2,
+                "pre_close": 3,
+                "price": 4,
+                "high": 5,
+                "low": 6,
+                "volume": 9,
+                "amount": 10,
+                "date": 31,
+                "time": 32,
+            },
+            dtypes=dict.fromkeys(("open", "pre_close", "price", "high", "low", "volume", "amount"), "float64"),
+        )
+        # Entries whose price does not parse are skipped, so failover can
+        # ask another source for them
+        invalid = df["price"].isna()
+        for symbol in df.loc[invalid, "symbol"]:
+            logger.warning(f"Failed to parse quote for {symbol}: invalid price")
+        if invalid.any():
+            df = df[~invalid].reset_index(drop=True)
+            if df.empty:
+                raise DataNotFoundError(f"No quote data found for symbols: {symbols}")
+
+        df["volume"] = df["volume"].fillna(0).astype("int64")
+        df["amount"] = df["amount"].fillna(0.0)
+        change = df["price"] - df["pre_close"]
+        df.insert(9, "change", change)
+        df.insert(10, "change_pct", (change / df["pre_close"].where(df["pre_close"] != 0) * 100).round(2))
+        return df
 
     def fetch_stock_daily(
         self,
@@ -176,9 +223,26 @@ class SinaAdapter(BaseAdapter):
         Returns:
             DataFrame with daily OHLCV data.
         """
-        sina_symbol = self._get_sina_symbol(symbol)
+        url, params = self._stock_daily_request(symbol)
+        response = self._get_text(url, params=params)
+        return self._parse_stock_daily(response, symbol, start_date, end_date)
 
-        # Use the historical data API
+    async def afetch_stock_daily(
+        self,
+        symbol: str,
+        start_date: str | date | None = None,
+        end_date: str | date | None = None,
+        adjust: str = "none",
+        **kwargs: Any,
+    ) -> pd.DataFrame:
+        """Async version of ``fetch_stock_daily``."""
+        url, params = self._stock_daily_request(symbol)
+        response = await self._aget_text(url, params=params)
+        return self._parse_stock_daily(response, symbol, start_date, end_date)
+
+    def _stock_daily_request(self, symbol: str) -> tuple[str, dict[str, Any]]:
+        """Build the URL and query parameters of the historical data API."""
+        sina_symbol = self._get_sina_symbol(symbol)
         url = f"https://quotes.sina.cn/cn/api/jsonp.php/var%20_{sina_symbol}=/CN_MarketDataService.getKLineData"
         params = {
             "symbol": sina_symbol,
@@ -186,9 +250,16 @@ class SinaAdapter(BaseAdapter):
             "ma": "no",
             "datalen": "1000",
         }
+        return url, params
 
-        response = self._get_text(url, params=params)
-
+    @staticmethod
+    def _parse_stock_daily(
+        response: str,
+        symbol: str,
+        start_date: str | date | None,
+        end_date: str | date | None,
+    ) -> pd.DataFrame:
+        """Parse a historical data response and filter it by date range."""
         # Parse JSONP response
         match = re.search(r'\[.*\]', response)
         if not match:
@@ -203,36 +274,14 @@ class SinaAdapter(BaseAdapter):
         if not data:
             raise DataNotFoundError(f"No data found for {symbol}")
 
-        records = []
-        for item in data:
-            try:
-                records.append({
-                    "date": item.get("day"),
-                    "open": float(item.get("open", 0)),
-                    "high": float(item.get("high", 0)),
-                    "low": float(item.get("low", 0)),
-                    "close": float(item.get("close", 0)),
-                    "volume": int(float(item.get("volume", 0))),
-                })
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Failed to parse record: {e}")
-                continue
-
-        df = pd.DataFrame(records)
-        df["date"] = pd.to_datetime(df["date"]).dt.date
-
-        # Filter by date range
-        if start_date:
-            if isinstance(start_date, str):
-                start_date = datetime.strptime(start_date.replace("-", ""), "%Y%m%d").date()
-            df = df[df["date"] >= start_date]
-
-        if end_date:
-            if isinstance(end_date, str):
-                end_date = datetime.strptime(end_date.replace("-", ""), "%Y%m%d").date()
-            df = df[df["date"] <= end_date]
+        df = SinaAdapter._build_frame(
+            data,
+            {"date": "day", "open": "open", "high": "high", "low": "low", "close": "close", "volume": "volume"},
+            dtypes=dict.fromkeys(("open", "high", "low", "close"), "float64")
+            | {"date": "datetime", "volume": "int64"},
+        )
 
-        return df.sort_values("date").reset_index(drop=True)
+        return SinaAdapter._filter_date_range(df, start_date, end_date)
 
     def fetch_index_quote(
         self,
@@ -270,7 +319,7 @@ class SinaAdapter(BaseAdapter):
             encoding="gbk",
         )
 
-        records = []
+        rows = []
         pattern = r'var hq_str_(\w+)="([^"]*)"'
 
         for match in re.finditer(pattern, response):
@@ -284,26 +333,19 @@ class SinaAdapter(BaseAdapter):
             if len(parts) < 9:
                 continue
 
-            symbol = sina_symbol[2:]
-
-            try:
-                records.append({
-                    "symbol": symbol,
-                    "name": parts[0],
-                    "price": float(parts[1]) if parts[1] else None,
-                    "change": float(parts[2]) if parts[2] else None,
-                    "change_pct": float(parts[3]) if parts[3] else None,
-                    "volume": int(float(parts[4])) if parts[4] else 0,
-                    "amount": float(parts[5]) if parts[5] else 0,
-                })
-            except (ValueError, IndexError) as e:
-                logger.warning(f"Failed to parse index {symbol}: {e}")
-                continue
+            rows.append([sina_symbol[2:], *parts])
 
-        if not records:
+        if not rows:
             raise DataNotFoundError("No index data found")
 
-        return pd.DataFrame(records)
+        df = self._build_frame(
+            rows,
+            {"symbol": 0, "name": 1, "price": 2, "change": 3, "change_pct": 4, "volume": 5, "amount": 6},
+            dtypes=dict.fromkeys(("price", "change", "change_pct", "volume", "amount"), "float64"),
+        )
+        df["volume"] = df["volume"].fillna(0).astype("int64")
+        df["amount"] = df["amount"].fillna(0.0)
+        return df
 
 
     def fetch_us_index_daily(
@@ -349,36 +391,15 @@ class SinaAdapter(BaseAdapter):
         if not data:
             raise DataNotFoundError(f"No data found for US index {symbol}")
 
-        records = []
-        for item in data:
-            try:
-                records.append({
-                    "date": item.get("d"),
-                    "open": float(item.get("o", 0)),
-                    "high": float(item.get("h", 0)),
-                    "low": float(item.get("l", 0)),
-                    "close": float(item.get("c", 0)),
-                    "volume": int(float(item.get("v", 0))) if item.get("v") else 0,
-                })
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Failed to parse record: {e}")
-                continue
-
-        df = pd.DataFrame(records)
-        df["date"] = pd.to_datetime(df["date"]).dt.date
-
-        # Filter by date range
-        if start_date:
-            if isinstance(start_date, str):
-                start_date = datetime.strptime(start_date.replace("-", ""), "%Y%m%d").date()
-            df = df[df["date"] >= start_date]
-
-        if end_date:
-            if isinstance(end_date, str):
-                end_date = datetime.strptime(end_date.replace("-", ""), "%Y%m%d").date()
-            df = df[df["date"] <= end_date]
+        df = self._build_frame(
+            data,
+            {"date": "d", "open": "o", "high": "h", "low": "l", "close": "c", "volume": "v"},
+            dtypes=dict.fromkeys(("open", "high", "low", "close", "volume"), "float64")
+            | {"date": "datetime"},
+        )
+        df["volume"] = df["volume"].fillna(0).astype("int64")
 
-        return df.sort_values("date").reset_index(drop=True)
+        return SinaAdapter._filter_date_range(df, start_date, end_date)
 
 
 # Global adapter instance
@@ -16,6 +16,7 @@ import pandas as pd
 
 from finvista._core.exceptions import DataNotFoundError
 from finvista._fetchers.adapters.base import BaseAdapter
+from finvista._fetchers.chunking import fetch_chunked
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +38,9 @@ class TencentAdapter(BaseAdapter):
     name = "tencent"
     base_url = "https://qt.gtimg.cn"
 
+    # Symbols per qt.gtimg.cn/q= request
+    QUOTE_BATCH_SIZE = 300
+
     def is_available(self) -> bool:
         """Check if Tencent API is available."""
         try:
@@ -80,6 +84,12 @@ class TencentAdapter(BaseAdapter):
         if isinstance(symbols, str):
             symbols = [symbols]
 
+        return fetch_chunked(
+            self.name, self._fetch_stock_quote_chunk, symbols, self.QUOTE_BATCH_SIZE
+        )
+
+    def _fetch_stock_quote_chunk(self, symbols: list[str]) -> pd.DataFrame:
+        """Fetch quotes for at most ``QUOTE_BATCH_SIZE`` symbols."""
         tencent_symbols = [self._get_tencent_symbol(s) for s in symbols]
         symbols_str = ",".join(tencent_symbols)
 
@@ -88,11 +98,10 @@ class TencentAdapter(BaseAdapter):
             encoding="gbk",
         )
 
-        records = []
+        rows = []
         pattern = r'v_(\w+)="([^"]*)"'
 
         for match in re.finditer(pattern, response):
-            tencent_symbol = match.group(1)
             data_str = match.group(2)
 
             if not data_str:
@@ -102,35 +111,37 @@ class TencentAdapter(BaseAdapter):
             if len(parts) < 45:
                 continue
 
-            symbol = parts[2] if len(parts) > 2 else tencent_symbol[2:]
+            rows.append(parts)
 
-            try:
-                records.append({
-                    "symbol": symbol,
-                    "name": parts[1],
-                    "price": float(parts[3]) if parts[3] else None,
-                    "pre_close": float(parts[4]) if parts[4] else None,
-                    "open": float(parts[5]) if parts[5] else None,
-                    "volume": int(float(parts[6]) * 100) if parts[6] else 0,  # In lots
-                    "amount": float(parts[37]) * 10000 if len(parts) > 37 and parts[37] else 0,
-                    "high": float(parts[33]) if len(parts) > 33 and parts[33] else None,
-                    "low": float(parts[34]) if len(parts) > 34 and parts[34] else None,
-                    "change": float(parts[31]) if len(parts) > 31 and parts[31] else None,
-                    "change_pct": float(parts[32]) if len(parts) > 32 and parts[32] else None,
-                    "turnover": float(parts[38]) if len(parts) > 38 and parts[38] else None,
-                    "pe": float(parts[39]) if len(parts) > 39 and parts[39] else None,
-                    "pb": float(parts[46]) if len(parts) > 46 and parts[46] else None,
-                    "market_cap": float(parts[45]) if len(parts) > 45 and parts[45] else None,
-                    "time": parts[30] if len(parts) > 30 else None,
-                })
-            except (ValueError, IndexError) as e:
-                logger.warning(f"Failed to parse quote for {symbol}: {e}")
-                continue
-
-        if not records:
+        if not rows:
             raise DataNotFoundError(f"No quote data found for symbols: {symbols}")
 
-        return pd.DataFrame(records)
+        columns = {
+            "symbol": 2,
+            "name": 1,
+            "price": 3,
+            "pre_close": 4,
+            "open": 5,
+            "volume": 6,  # In lots
+            "amount": 37,  # In 10,000 CNY
+            "high": 33,
+            "low": 34,
+            "change": 31,
+            "change_pct": 32,
+            "turnover": 38,
+            "pe": 39,
+            "pb": 46,
+            "market_cap": 45,
+            "time": 30,
+        }
+        df = self._build_frame(
+            rows,
+            columns,
+            dtypes=dict.fromkeys(list(columns)[2:-1], "float64"),
+        )
+        df["volume"] = (df["volume"] * 100).fillna(0).astype("int64")
+        df["amount"] = (df["amount"] * 10000).fillna(0.0)
+        return df
 
     def fetch_stock_daily(
         self,
@@ -165,7 +176,7 @@ class TencentAdapter(BaseAdapter):
             years = 10
 
         # Tencent provides data in yearly chunks
-        all_records = []
+        all_rows = []
 
         for year_offset in range(years):
             year = datetime.now().year - year_offset
@@ -190,38 +201,22 @@ class TencentAdapter(BaseAdapter):
                 stock_data = data.get("data", {}).get(tencent_symbol, {})
                 klines = stock_data.get("day", []) or stock_data.get("qfqday", [])
 
-                for item in klines:
-                    if len(item) >= 6:
-                        all_records.append({
-                            "date": item[0],
-                            "open": float(item[1]),
-                            "close": float(item[2]),
-                            "high": float(item[3]),
-                            "low": float(item[4]),
-                            "volume": int(float(item[5])),
-                        })
+                all_rows.extend(item for item in klines if len(item) >= 6)
             except Exception as e:
                 logger.warning(f"Failed to fetch data for year {year}: {e}")
                 continue
 
-        if not all_records:
+        if not all_rows:
             raise DataNotFoundError(f"No data found for {symbol}")
 
-        df = pd.DataFrame(all_records)
-        df["date"] = pd.to_datetime(df["date"]).dt.date
-
-        # Filter by date range
-        if start_date:
-            if isinstance(start_date, str):
-                start_date = datetime.strptime(start_date.replace("-", ""), "%Y%m%d").date()
-            df = df[df["date"] >= start_date]
-
-        if end_date:
-            if isinstance(end_date, str):
-                end_date = datetime.strptime(end_date.replace("-", ""), "%Y%m%d").date()
-            df = df[df["date"] <= end_date]
+        df = self._build_frame(
+            all_rows,
+            {"date": 0, "open": 1, "close": 2, "high": 3, "low": 4, "volume": 5},
+            dtypes=dict.fromkeys(("open", "close", "high", "low"), "float64")
+            | {"date": "datetime", "volume": "int64"},
+        )
 
-        return df.drop_duplicates("date").sort_values("date").reset_index(drop=True)
+        return self._filter_date_range(df.drop_duplicates("date"), start_date, end_date)
 
     def fetch_stock_list(
         self,
@@ -240,7 +235,7 @@ class TencentAdapter(BaseAdapter):
         Returns:
             DataFrame with stock information.
         """
-        records = []
+        rows = []
 
         # Fetch from different markets
         markets_to_fetch = []
@@ -272,20 +267,19 @@ class TencentAdapter(BaseAdapter):
                     for item in items:
                         parts = item.split("~")
                         if len(parts) >= 3:
-                            records.append({
-                                "symbol": parts[1],
-                                "name": parts[2],
-                                "market": market_name,
-                                "price": float(parts[3]) if len(parts) > 3 and parts[3] else None,
-                            })
+                            rows.append((market_name, *parts))
             except Exception as e:
                 logger.warning(f"Failed to fetch {market_name} stocks: {e}")
                 continue
 
-        if not records:
+        if not rows:
             raise DataNotFoundError("No stock list found")
 
-        df = pd.DataFrame(records)
+        df = self._build_frame(
+            rows,
+            {"symbol": 2, "name": 3, "market": 0, "price": 4},
+            dtypes={"symbol": "str", "price": "float64"},
+        )
         df = df[df["symbol"].str.len() == 6]
 
         return df
@@ -65,7 +65,46 @@ class TiantianAdapter(BaseAdapter):
         Returns:
             DataFrame with NAV history.
         """
-        # Format dates
+        start_str, end_str = self._fund_nav_dates(start_date, end_date)
+        url, params, headers = self._fund_nav_request(symbol, start_str, end_str)
+
+        try:
+            data = self._get_json(url, params=params, headers=headers)
+        except Exception as e:
+            logger.warning(f"Failed to fetch fund NAV from API: {e}")
+            # Fallback to web scraping
+            return self._fetch_fund_nav_fallback(symbol, start_str, end_str)
+
+        return self._parse_fund_nav(data, symbol)
+
+    async def afetch_fund_nav(
+        self,
+        symbol: str,
+        start_date: str | date | None = None,
+        end_date: str | date | None = None,
+        **kwargs: Any,
+    ) -> pd.DataFrame:
+        """Async version of ``fetch_fund_nav``."""
+        start_str, end_str = self._fund_nav_dates(start_date, end_date)
+        url, params, headers = self._fund_nav_request(symbol, start_str, end_str)
+
+        try:
+            data = await self._aget_json(url, params=params, headers=headers)
+        except Exception as e:
+            logger.warning(f"Failed to fetch fund NAV from API: {e}")
+            # Fallback to web scraping
+            url, params = self._fund_nav_fallback_request(symbol, start_str, end_str)
+            response = await self._aget_text(url, params=params, encoding="utf-8")
+            return self._parse_fund_nav_fallback(response, symbol)
+
+        return self._parse_fund_nav(data, symbol)
+
+    @staticmethod
+    def _fund_nav_dates(
+        start_date: str | date | None,
+        end_date: str | date | None,
+    ) -> tuple[str, str]:
+        """Format the NAV date range as YYYY-MM-DD strings."""
         if start_date is None:
             start_str = "2000-01-01"
         elif isinstance(start_date, (date, datetime)):
@@ -80,53 +119,43 @@ class TiantianAdapter(BaseAdapter):
         else:
             end_str = end_date
 
-        # Fetch data from API
+        return start_str, end_str
+
+    @staticmethod
+    def _fund_nav_request(
+        symbol: str, start_date: str, end_date: str
+    ) -> tuple[str, dict[str, Any], dict[str, str]]:
+        """Build the URL, query parameters and headers of the NAV API."""
         # Note: API has a pageSize limit around 100-500
         url = "https://api.fund.eastmoney.com/f10/lsjz"
         params = {
             "fundCode": symbol,
             "pageIndex": 1,
             "pageSize": 100,
-            "startDate": start_str,
-            "endDate": end_str,
+            "startDate": start_date,
+            "endDate": end_date,
         }
         headers = {
             "Referer": f"https://fundf10.eastmoney.com/jjjz_{symbol}.html",
         }
+        return url, params, headers
 
-        try:
-            data = self._get_json(url, params=params, headers=headers)
-        except Exception as e:
-            logger.warning(f"Failed to fetch fund NAV from API: {e}")
-            # Fallback to web scraping
-            return self._fetch_fund_nav_fallback(symbol, start_str, end_str)
-
+    @staticmethod
+    def _parse_fund_nav(data: dict[str, Any], symbol: str) -> pd.DataFrame:
+        """Parse a NAV API response."""
         if not data.get("Data") or not data["Data"].get("LSJZList"):
             raise DataNotFoundError(f"No NAV data found for fund {symbol}")
 
-        records = []
-        for item in data["Data"]["LSJZList"]:
-            try:
-                nav = float(item.get("DWJZ", 0)) if item.get("DWJZ") else None
-                acc_nav = float(item.get("LJJZ", 0)) if item.get("LJJZ") else None
-                daily_return = item.get("JZZZL", "")
-                daily_return = float(daily_return) if daily_return and daily_return != "" else None
-
-                records.append({
-                    "date": item.get("FSRQ"),
-                    "nav": nav,  # Unit NAV (单位净值)
-                    "acc_nav": acc_nav,  # Accumulated NAV (累计净值)
-                    "daily_return": daily_return,  # Daily return %
-                })
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Failed to parse NAV record: {e}")
-                continue
-
-        if not records:
-            raise DataNotFoundError(f"No NAV data found for fund {symbol}")
-
-        df = pd.DataFrame(records)
-        df["date"] = pd.to_datetime(df["date"]).dt.date
+        df = TiantianAdapter._build_frame(
+            data["Data"]["LSJZList"],
+            {
+                "date": "FSRQ",
+                "nav": "DWJZ",  # Unit NAV (单位净值)
+                "acc_nav": "LJJZ",  # Accumulated NAV (累计净值)
+                "daily_return": "JZZZL",  # Daily return %
+            },
+            dtypes={"date": "date", "nav": "float64", "acc_nav": "float64", "daily_return": "float64"},
+        )
         df = df.sort_values("date").reset_index(drop=True)
 
         return df
@@ -138,6 +167,15 @@ class TiantianAdapter(BaseAdapter):
         end_date: str,
     ) -> pd.DataFrame:
         """Fallback method to fetch NAV by scraping."""
+        url, params = self._fund_nav_fallback_request(symbol, start_date, end_date)
+        response = self._get_text(url, params=params, encoding="utf-8")
+        return self._parse_fund_nav_fallback(response, symbol)
+
+    @staticmethod
+    def _fund_nav_fallback_request(
+        symbol: str, start_date: str, end_date: str
+    ) -> tuple[str, dict[str, Any]]:
+        """Build the URL and query parameters of the NAV page endpoint."""
         # Use the alternative endpoint
         url = "https://fund.eastmoney.com/f10/F10DataApi.aspx"
         params = {
@@ -148,38 +186,34 @@ class TiantianAdapter(BaseAdapter):
             "sdate": start_date,
             "edate": end_date,
         }
+        return url, params
 
-        response = self._get_text(url, params=params, encoding="utf-8")
-
-        # Parse the HTML table
-        records = []
+    @staticmethod
+    def _parse_fund_nav_fallback(response: str, symbol: str) -> pd.DataFrame:
+        """Parse the HTML table returned by the NAV page endpoint."""
         pattern = r'<td[^>]*>([^<]*)</td>'
         matches = re.findall(pattern, response)
 
         # Data comes in groups of 7 columns
         # Date, NAV, Acc NAV, Daily Return, Buy Status, Sell Status, Dividend
-        for i in range(0, len(matches) - 6, 7):
-            try:
-                date_str = matches[i].strip()
-                nav = float(matches[i + 1]) if matches[i + 1] else None
-                acc_nav = float(matches[i + 2]) if matches[i + 2] else None
-                daily_return_str = matches[i + 3].replace("%", "").strip()
-                daily_return = float(daily_return_str) if daily_return_str else None
-
-                records.append({
-                    "date": date_str,
-                    "nav": nav,
-                    "acc_nav": acc_nav,
-                    "daily_return": daily_return,
-                })
-            except (ValueError, IndexError):
-                continue
+        rows = [
+            (
+                matches[i].strip(),
+                matches[i + 1],
+                matches[i + 2],
+                matches[i + 3].replace("%", "").strip(),
+            )
+            for i in range(0, len(matches) - 6, 7)
+        ]
 
-        if not records:
+        if not rows:
             raise DataNotFoundError(f"No NAV data found for fund {symbol}")
 
-        df = pd.DataFrame(records)
-        df["date"] = pd.to_datetime(df["date"]).dt.date
+        df = TiantianAdapter._build_frame(
+            rows,
+            {"date": 0, "nav": 1, "acc_nav": 2, "daily_return": 3},
+            dtypes={"date": "date", "nav": "float64", "acc_nav": "float64", "daily_return": "float64"},
+        )
         df = df.sort_values("date").reset_index(drop=True)
 
         return df
@@ -283,21 +317,16 @@ class TiantianAdapter(BaseAdapter):
             "FOF": "fof",
         }
 
-        records = []
-        for fund in funds:
-            if len(fund) >= 5:
-                fund_type_cn = fund[3]
-                fund_type_en = type_map.get(fund_type_cn, "other")
-
-                records.append({
-                    "symbol": fund[0],
-                    "abbr": fund[1],  # Pinyin abbreviation
-                    "name": fund[2],
-                    "type_cn": fund_type_cn,
-                    "type": fund_type_en,
-                })
-
-        df = pd.DataFrame(records)
+        df = self._build_frame(
+            [fund for fund in funds if len(fund) >= 5],
+            {
+                "symbol": 0,
+                "abbr": 1,  # Pinyin abbreviation
+                "name": 2,
+                "type_cn": 3,
+            },
+        )
+        df["type"] = df["type_cn"].map(type_map).fillna("other")
 
         # Filter by type if specified
         if fund_type != "all":
@@ -322,7 +351,7 @@ class TiantianAdapter(BaseAdapter):
         if isinstance(symbols, str):
             symbols = [symbols]
 
-        records = []
+        rows = []
         for symbol in symbols:
             try:
                 url = f"https://fundgz.1234567.com.cn/js/{symbol}.js"
@@ -336,22 +365,33 @@ class TiantianAdapter(BaseAdapter):
                 import json
                 data = json.loads(match.group(1))
 
-                records.append({
-                    "symbol": data.get("fundcode", symbol),
-                    "name": data.get("name", ""),
-                    "nav": float(data.get("dwjz", 0)) if data.get("dwjz") else None,
-                    "estimated_nav": float(data.get("gsz", 0)) if data.get("gsz") else None,
-                    "estimated_return": float(data.get("gszzl", 0)) if data.get("gszzl") else None,
-                    "update_time": data.get("gztime", ""),
-                })
+                data.setdefault("fundcode", symbol)
+                rows.append(data)
             except Exception as e:
                 logger.warning(f"Failed to fetch quote for fund {symbol}: {e}")
                 continue
 
-        if not records:
+        if not rows:
             raise DataNotFoundError(f"No quote data found for funds: {symbols}")
 
-        return pd.DataFrame(records)
+        return self._build_frame(
+            rows,
+            {
+                "symbol": "fundcode",
+                "name": "name",
+                "nav": "dwjz",
+                "estimated_nav": "gsz",
+                "estimated_return": "gszzl",
+                "update_time": "gztime",
+            },
+            dtypes={
+                "name": "str",
+                "nav": "float64",
+                "estimated_nav": "float64",
+                "estimated_return": "float64",
+                "update_time": "str",
+            },
+        )
 
 
 # Global adapter instance
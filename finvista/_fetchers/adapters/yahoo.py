@@ -15,6 +15,7 @@ import pandas as pd
 
 from finvista._core.exceptions import DataNotFoundError
 from finvista._fetchers.adapters.base import BaseAdapter
+from finvista._fetchers.chunking import afetch_chunked, fetch_chunked
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +38,11 @@ class YahooAdapter(BaseAdapter):
     name = "yahoo"
     base_url = "https://query1.finance.yahoo.com"
 
+    QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+
+    # Symbols per quote request
+    QUOTE_BATCH_SIZE = 200
+
     def is_available(self) -> bool:
         """Check if Yahoo Finance API is available."""
         try:
@@ -81,6 +87,37 @@ class YahooAdapter(BaseAdapter):
         Returns:
             DataFrame with daily OHLCV data.
         """
+        url, params = self._stock_daily_request(symbol, start_date, end_date)
+        try:
+            data = self._get_json(url, params=params)
+        except Exception as e:
+            raise DataNotFoundError(f"Failed to fetch data for {symbol}: {e}") from e
+
+        return self._parse_stock_daily(data, symbol)
+
+    async def afetch_stock_daily(
+        self,
+        symbol: str,
+        start_date: str | date | None = None,
+        end_date: str | date | None = None,
+        **kwargs: Any,
+    ) -> pd.DataFrame:
+        """Async version of ``fetch_stock_daily``."""
+        url, params = self._stock_daily_request(symbol, start_date, end_date)
+        try:
+            data = await self._aget_json(url, params=params)
+        except Exception as e:
+            raise DataNotFoundError(f"Failed to fetch data for {symbol}: {e}") from e
+
+        return self._parse_stock_daily(data, symbol)
+
+    @staticmethod
+    def _stock_daily_request(
+        symbol: str,
+        start_date: str | date | None,
+        end_date: str | date | None,
+    ) -> tuple[str, dict[str, Any]]:
+        """Build the URL and query parameters of the chart API."""
         # Format dates to timestamps
         if start_date is None:
             start_ts = int((datetime.now() - timedelta(days=365)).timestamp())
@@ -106,12 +143,11 @@ class YahooAdapter(BaseAdapter):
             "interval": "1d",
             "events": "history",
         }
+        return url, params
 
-        try:
-            data = self._get_json(url, params=params)
-        except Exception as e:
-            raise DataNotFoundError(f"Failed to fetch data for {symbol}: {e}") from e
-
+    @staticmethod
+    def _parse_stock_daily(data: dict[str, Any], symbol: str) -> pd.DataFrame:
+        """Parse a chart API response."""
         if not data.get("chart") or not data["chart"].get("result"):
             raise DataNotFoundError(f"No data found for symbol {symbol}")
 
@@ -124,26 +160,22 @@ class YahooAdapter(BaseAdapter):
         if not timestamps:
             raise DataNotFoundError(f"No data found for symbol {symbol}")
 
-        records = []
-        for i, ts in enumerate(timestamps):
-            try:
-                dt = datetime.fromtimestamp(ts)
-                records.append({
-                    "date": dt.date(),
-                    "open": quote.get("open", [None])[i],
-                    "high": quote.get("high", [None])[i],
-                    "low": quote.get("low", [None])[i],
-                    "close": quote.get("close", [None])[i],
-                    "volume": quote.get("volume", [None])[i],
-                    "adj_close": adjclose[0].get("adjclose", [None])[i] if adjclose else None,
-                })
-            except (IndexError, TypeError):
-                continue
-
-        if not records:
-            raise DataNotFoundError(f"No data found for symbol {symbol}")
-
-        df = pd.DataFrame(records)
+        # Values come as parallel arrays; rows past the shortest one are dropped
+        missing = [None] * len(timestamps)
+        rows = list(zip(
+            timestamps,
+            *(quote.get(field) or missing for field in ("open", "high", "low", "close", "volume")),
+            (adjclose[0].get("adjclose") or missing) if adjclose else missing,
+            strict=False,
+        ))
+
+        df = YahooAdapter._build_frame(
+            rows,
+            {"date": 0, "open": 1, "high": 2, "low": 3, "close": 4, "volume": 5, "adj_close": 6},
+            dtypes=dict.fromkeys(("open", "high", "low", "close", "adj_close"), "float64")
+            | {"volume": "int64"},
+        )
+        df["date"] = [datetime.fromtimestamp(ts).date() for ts in df["date"]]
         df = df.dropna(subset=["close"])
 
         return df.sort_values("date").reset_index(drop=True)
@@ -165,42 +197,70 @@ class YahooAdapter(BaseAdapter):
         if isinstance(symbols, str):
             symbols = [symbols]
 
-        symbols_str = ",".join(symbols)
+        return fetch_chunked(
+            self.name, self._fetch_stock_quote_chunk, symbols, self.QUOTE_BATCH_SIZE
+        )
 
-        url = "https://query1.finance.yahoo.com/v7/finance/quote"
-        params = {
-            "symbols": symbols_str,
-        }
+    async def afetch_stock_quote(
+        self,
+        symbols: list[str] | str,
+        **kwargs: Any,
+    ) -> pd.DataFrame:
+        """Async version of ``fetch_stock_quote``."""
+        if isinstance(symbols, str):
+            symbols = [symbols]
+
+        return await afetch_chunked(
+            self.name, self._afetch_stock_quote_chunk, symbols, self.QUOTE_BATCH_SIZE
+        )
 
+    def _fetch_stock_quote_chunk(self, symbols: list[str]) -> pd.DataFrame:
+        """Fetch quotes for at most ``QUOTE_BATCH_SIZE`` symbols."""
         try:
-            data = self._get_json(url, params=params)
+            data = self._get_json(self.QUOTE_URL, params={"symbols": ",".join(symbols)})
         except Exception as e:
             raise DataNotFoundError(f"Failed to fetch quotes: {e}") from e
 
+        return self._parse_stock_quote(data, symbols)
+
+    async def _afetch_stock_quote_chunk(self, symbols: list[str]) -> pd.DataFrame:
+        """Async version of ``_fetch_stock_quote_chunk``."""
+        try:
+            data = await self._aget_json(self.QUOTE_URL, params={"symbols": ",".join(symbols)})
+        except Exception as e:
+            raise DataNotFoundError(f"Failed to fetch quotes: {e}") from e
+
+        return self._parse_stock_quote(data, symbols)
+
+    @staticmethod
+    def _parse_stock_quote(data: dict[str, Any], symbols: list[str]) -> pd.DataFrame:
+        """Parse a quote API response."""
         if not data.get("quoteResponse") or not data["quoteResponse"].get("result"):
             raise DataNotFoundError(f"No quote data found for symbols: {symbols}")
 
-        records = []
-        for item in data["quoteResponse"]["result"]:
-            records.append({
-                "symbol": item.get("symbol", ""),
-                "name": item.get("shortName", ""),
-                "price": item.get("regularMarketPrice"),
-                "change": item.get("regularMarketChange"),
-                "change_pct": item.get("regularMarketChangePercent"),
-                "open": item.get("regularMarketOpen"),
-                "high": item.get("regularMarketDayHigh"),
-                "low": item.get("regularMarketDayLow"),
-                "pre_close": item.get("regularMarketPreviousClose"),
-                "volume": item.get("regularMarketVolume"),
-                "market_cap": item.get("marketCap"),
-                "pe": item.get("trailingPE"),
-                "eps": item.get("epsTrailingTwelveMonths"),
-                "dividend_yield": item.get("dividendYield"),
-                "market_state": item.get("marketState"),
-            })
-
-        return pd.DataFrame(records)
+        columns = {
+            "symbol": "symbol",
+            "name": "shortName",
+            "price": "regularMarketPrice",
+            "change": "regularMarketChange",
+            "change_pct": "regularMarketChangePercent",
+            "open": "regularMarketOpen",
+            "high": "regularMarketDayHigh",
+            "low": "regularMarketDayLow",
+            "pre_close": "regularMarketPreviousClose",
+            "volume": "regularMarketVolume",
+            "market_cap": "marketCap",
+            "pe": "trailingPE",
+            "eps": "epsTrailingTwelveMonths",
+            "dividend_yield": "dividendYield",
+            "market_state": "marketState",
+        }
+        return YahooAdapter._build_frame(
+            data["quoteResponse"]["result"],
+            columns,
+            dtypes=dict.fromkeys(list(columns)[2:-1], "float64")
+            | {"symbol": "str", "name": "str", "volume": "int64"},
+        )
 
     def fetch_stock_info(
         self,
@@ -309,16 +369,19 @@ class YahooAdapter(BaseAdapter):
         if not quotes:
             return pd.DataFrame()
 
-        records = []
-        for item in quotes:
-            records.append({
-                "symbol": item.get("symbol", ""),
-                "name": item.get("shortname", "") or item.get("longname", ""),
-                "type": item.get("typeDisp", ""),
-                "exchange": item.get("exchange", ""),
-            })
-
-        return pd.DataFrame(records)
+        df = self._build_frame(
+            quotes,
+            {
+                "symbol": "symbol",
+                "name": "shortname",
+                "long_name": "longname",
+                "type": "typeDisp",
+                "exchange": "exchange",
+            },
+            dtypes=dict.fromkeys(("symbol", "name", "long_name", "type", "exchange"), "str"),
+        )
+        df["name"] = df["name"].where(df["name"] != "", df.pop("long_name"))
+        return df
 
 
 # Global adapter instance
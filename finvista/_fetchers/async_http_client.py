@@ -0,0 +1,345 @@
+"""
+Asyncio HTTP client for FinVista.
+
+This module provides the asyncio counterpart of ``HttpClient``, built on
+``httpx.AsyncClient``. It shares the global HTTP configuration (timeout,
+retries, proxies, SSL verification, User-Agent) and maps failures to the
+same exceptions, so async and sync fetchers behave alike.
+
+Example:
+    >>> from finvista._fetchers.async_http_client import async_http_client
+    >>> data = await async_http_client.get_json("https://api.example.com/data.json")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+import httpx
+
+from finvista._core.config import config
+from finvista._core.exceptions import (
+    APIError,
+    DataParsingError,
+    NetworkError,
+    RateLimitError,
+)
+
+logger = logging.getLogger(__name__)
+
+# Server errors retried with backoff, as in the sync client
+_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+
+class AsyncHttpClient:
+    """
+    Asyncio HTTP client with retry logic, proxy support, and error handling.
+
+    One ``httpx.AsyncClient`` (and its connection pool) is kept per event
+    loop and created lazily on first use, so many concurrent requests
+    share pooled connections without a thread per request.
+
+    Example:
+        >>> client = AsyncHttpClient()
+        >>> response = await client.get("https://api.example.com/data")
+        >>> data = await client.get_json("https://api.example.com/data.json")
+        >>> await client.aclose()
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        """
+        Initialize the async HTTP client.
+
+        Args:
+            transport: Optional httpx transport, mainly for testing with
+                ``httpx.MockTransport``.
+        """
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Get or create the httpx client for the running event loop.
+
+        Connections cannot be shared across event loops, so a new client
+        is created when the client is used from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._client = self._create_client()
+            self._loop = loop
+        return self._client
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """
+        Create and configure a new httpx client.
+
+        Returns:
+            Configured AsyncClient.
+        """
+        http_config = config.http
+
+        kwargs: dict[str, Any] = {}
+        if self._transport is not None:
+            kwargs["transport"] = self._transport
+        elif http_config.proxies:
+            kwargs["mounts"] = {
+                f"{scheme}://": httpx.AsyncHTTPTransport(
+                    proxy=httpx.Proxy(url), verify=http_config.verify_ssl
+                )
+                for scheme, url in http_config.proxies.items()
+            }
+
+        return httpx.AsyncClient(
+            timeout=http_config.timeout,
+            verify=http_config.verify_ssl,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            headers={
+                "User-Agent": http_config.user_agent,
+                "Accept": "application/json, text/html, text/plain, */*",
+                "Accept-Language": "en-US,en;q=0.9,zh-CN;q=0.8,zh;q=0.7",
+                "Accept-Encoding": "gzip, deflate",
+            },
+            **kwargs,
+        )
+
+    async def get(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: int | None = None,
+    ) -> httpx.Response:
+        """
+        Send a GET request.
+
+        Args:
+            url: The URL to request.
+            params: Optional query parameters.
+            headers: Optional additional headers.
+            timeout: Optional timeout override.
+
+        Returns:
+            The Response object.
+
+        Raises:
+            NetworkError: On connection or timeout errors.
+            RateLimitError: When rate limited (HTTP 429).
+            APIError: On HTTP errors.
+        """
+        return await self._request("GET", url, params=params, headers=headers, timeout=timeout)
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        timeout: int | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send an HTTP request with retries and error handling.
+
+        Connection errors, timeouts and HTTP 5xx responses are retried up
+        to ``config.http.max_retries`` times, waiting
+        ``retry_delay * retry_backoff ** attempt`` seconds in between.
+
+        Args:
+            method: HTTP method (GET, POST, etc.).
+            url: The URL to request.
+            timeout: Optional timeout override.
+            **kwargs: Additional arguments passed to httpx.
+
+        Returns:
+            The Response object.
+
+        Raises:
+            NetworkError: On connection or timeout errors.
+            RateLimitError: When rate limited (HTTP 429).
+            APIError: On HTTP errors.
+        """
+        http_config = config.http
+        timeout = timeout or http_config.timeout
+
+        attempt = 0
+        while True:
+            start_time = time.time()
+            try:
+                response = await self.client.request(method, url, timeout=timeout, **kwargs)
+            except httpx.TimeoutException as e:
+                if attempt < http_config.max_retries:
+                    attempt += 1
+                    await asyncio.sleep(self._retry_delay(attempt))
+                    continue
+                logger.warning(f"Request timeout for {url}: {e}")
+                raise NetworkError(
+                    f"Request timeout after {timeout}s",
+                    url=url,
+                    original_error=e,
+                ) from e
+            except httpx.TransportError as e:
+                if attempt < http_config.max_retries:
+                    attempt += 1
+                    await asyncio.sleep(self._retry_delay(attempt))
+                    continue
+                logger.warning(f"Connection error for {url}: {e}")
+                raise NetworkError(
+                    f"Connection error: {e}",
+                    url=url,
+                    original_error=e,
+                ) from e
+            except httpx.HTTPError as e:
+                logger.warning(f"Request error for {url}: {e}")
+                raise NetworkError(
+                    f"Request failed: {e}",
+                    url=url,
+                    original_error=e,
+                ) from e
+
+            elapsed = time.time() - start_time
+            logger.debug(
+                f"{method} {url} completed in {elapsed:.2f}s with status {response.status_code}"
+            )
+
+            if response.status_code in _RETRY_STATUSES and attempt < http_config.max_retries:
+                attempt += 1
+                await asyncio.sleep(self._retry_delay(attempt))
+                continue
+
+            # Handle rate limiting
+            if response.status_code == 429:
+                retry_after = response.headers.get("Retry-After")
+                retry_seconds = int(retry_after) if retry_after else None
+                raise RateLimitError(
+                    f"Rate limit exceeded for {url}",
+                    retry_after=retry_seconds,
+                )
+
+            # Handle other errors
+            if response.status_code >= 400:
+                raise APIError(
+                    f"HTTP {response.status_code} error from {url}",
+                    status_code=response.status_code,
+                    response_body=response.text[:500] if response.text else None,
+                )
+
+            return response
+
+    @staticmethod
+    def _retry_delay(attempt: int) -> float:
+        """Get the delay in seconds before a retry attempt (1-based)."""
+        http_config = config.http
+        return float(http_config.retry_delay * http_config.retry_backoff ** (attempt - 1))
+
+    async def get_json(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Send a GET request and parse JSON response.
+
+        Args:
+            url: The URL to request.
+            params: Optional query parameters.
+            headers: Optional additional headers.
+            **kwargs: Additional arguments passed to ``get``.
+
+        Returns:
+            Parsed JSON as a dictionary.
+
+        Raises:
+            DataParsingError: When JSON parsing fails.
+        """
+        response = await self.get(url, params=params, headers=headers, **kwargs)
+        try:
+            return response.json()  # type: ignore[no-any-return]
+        except ValueError as e:
+            raise DataParsingError(
+                f"Failed to parse JSON from {url}",
+                raw_data=response.text[:200] if response.text else None,
+            ) from e
+
+    async def get_text(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        encoding: str | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Send a GET request and return text response.
+
+        Args:
+            url: The URL to request.
+            params: Optional query parameters.
+            headers: Optional additional headers.
+            encoding: Optional encoding override.
+            **kwargs: Additional arguments passed to ``get``.
+
+        Returns:
+            Response text content.
+        """
+        response = await self.get(url, params=params, headers=headers, **kwargs)
+        if encoding:
+            response.encoding = encoding
+        return str(response.text)
+
+    async def get_content(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> bytes:
+        """
+        Send a GET request and return raw bytes.
+
+        Args:
+            url: The URL to request.
+            params: Optional query parameters.
+            headers: Optional additional headers.
+            **kwargs: Additional arguments passed to ``get``.
+
+        Returns:
+            Response content as bytes.
+        """
+        response = await self.get(url, params=params, headers=headers, **kwargs)
+        return bytes(response.content)
+
+    def reset_client(self) -> None:
+        """
+        Drop the current client so new configuration takes effect.
+
+        The old client's connections are released when it is garbage
+        collected; call ``aclose`` instead from within the event loop to
+        close them right away.
+        """
+        self._client = None
+        self._loop = None
+
+    async def aclose(self) -> None:
+        """Close the httpx client and its connections."""
+        client, self._client, self._loop = self._client, None, None
+        if client is not None:
+            await client.aclose()
+
+    async def __aenter__(self) -> AsyncHttpClient:
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        await self.aclose()
+
+
+# Global async HTTP client instance
+async_http_client = AsyncHttpClient()
@@ -0,0 +1,199 @@
+"""
+Batch fetching for FinVista.
+
+This module runs one data function over many symbols on a bounded
+thread pool. Every call still goes through the function's cache,
+failover and per-source rate limiting, so the pool size only bounds how
+many requests wait on the network at once; the token buckets decide how
+fast they are sent.
+
+Example:
+    >>> from finvista._fetchers.batch import fetch_batch
+    >>> result = fetch_batch(
+    ...     get_cn_stock_daily, ["000001", "600519"], output="dict", start_date="2024-01-01"
+    ... )
+    >>> result.errors
+    {}
+    >>> df = result.to_long()
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Literal
+
+import pandas as pd
+
+from finvista._core.config import config
+from finvista._core.exceptions import ValidationError
+from finvista._fetchers.context import with_config
+from finvista._fetchers.frames import pandas_frames, to_backend
+from finvista._fetchers.panel import Panel, build_panel
+
+logger = logging.getLogger(__name__)
+
+# Default number of concurrent fetches in a batch
+DEFAULT_BATCH_WORKERS = 8
+
+BatchOutput = Literal["long", "dict", "panel"]
+
+
+class BatchResult(dict[str, pd.DataFrame]):
+    """
+    Result of a batch fetch: a dict of DataFrames by symbol plus errors.
+
+    Symbols whose fetch failed are absent from the dict and listed in
+    ``errors`` instead. Iteration follows the order of the requested
+    symbols.
+
+    Attributes:
+        errors: Exception raised for each failed symbol.
+
+    Example:
+        >>> result = fv.get_cn_stock_daily_batch(symbols, output="dict")
+        >>> result["600519"].tail()
+        >>> result.errors
+        {'000000': ValidationError(...)}
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty result."""
+        super().__init__()
+        self.errors: dict[str, Exception] = {}
+
+    def to_long(self) -> pd.DataFrame:
+        """
+        Combine the frames into one long-format DataFrame.
+
+        Returns:
+            DataFrame with a leading 'symbol' column. Its attrs hold the
+            'errors' (symbol to message) and the 'sources' used per symbol.
+        """
+        frames = [df.assign(symbol=symbol) for symbol, df in self.items() if not df.empty]
+        if frames:
+            long = pd.concat(frames, ignore_index=True)
+            long = long[["symbol", *(c for c in long.columns if c != "symbol")]]
+        else:
+            long = pd.DataFrame(columns=["symbol"])
+
+        long.attrs = {
+            "errors": {symbol: str(error) for symbol, error in self.errors.items()},
+            "sources": {
+                symbol: df.attrs["source"] for symbol, df in self.items() if "source" in df.attrs
+            },
+        }
+        return long
+
+    def to_panel(self, fields: Sequence[str] | None = None) -> Panel:
+        """
+        Write the frames into a date x symbol panel.
+
+        Args:
+            fields: Columns to include. If None, every numeric column.
+
+        Returns:
+            Panel on the union of the frames' dates, carrying ``errors``.
+        """
+        return build_panel(self, fields=fields, errors=dict(self.errors))
+
+
+def _unique(symbols: Iterable[str]) -> list[str]:
+    """Drop duplicate symbols, keeping the first occurrence."""
+    return list(dict.fromkeys(symbols))
+
+
+def _fetch_one(
+    func: Callable[..., pd.DataFrame], symbol: str, kwargs: dict[str, Any]
+) -> pd.DataFrame:
+    """Call the data function for one symbol, getting a pandas DataFrame."""
+    with pandas_frames():
+        return func(symbol, **kwargs)
+
+
+def fetch_batch(
+    func: Callable[..., pd.DataFrame],
+    symbols: Iterable[str],
+    max_workers: int = DEFAULT_BATCH_WORKERS,
+    output: BatchOutput = "long",
+    **kwargs: Any,
+) -> pd.DataFrame | BatchResult | Panel:
+    """
+    Call a per-symbol data function for many symbols concurrently.
+
+    A failing symbol is recorded in the result's errors and does not
+    stop the others. Results are combined as pandas DataFrames; the
+    long frame and the frames of a BatchResult are then converted to
+    the configured frame backend (``config.output.backend``), while a
+    Panel is always pandas.
+
+    Args:
+        func: Data function taking the symbol as first argument, e.g.
+            ``get_cn_stock_daily``.
+        symbols: Symbols to fetch (duplicates are fetched once).
+        max_workers: Maximum number of concurrent fetches.
+        output: 'long' for one DataFrame with a 'symbol' column (errors
+            in ``df.attrs["errors"]``), 'dict' for a ``BatchResult``,
+            'panel' for a ``Panel`` of the numeric columns.
+        **kwargs: Arguments passed to every call.
+
+    Returns:
+        Long-format DataFrame, BatchResult or Panel, depending on ``output``.
+
+    Raises:
+        ValidationError: If ``max_workers`` or ``output`` is invalid.
+    """
+    if output not in ("long", "dict", "panel"):
+        raise ValidationError(
+            f"Invalid output: {output}. Must be 'long', 'dict', or 'panel'.",
+            param_name="output",
+            param_value=output,
+        )
+    if max_workers < 1:
+        raise ValidationError(
+            "max_workers must be at least 1",
+            param_name="max_workers",
+            param_value=max_workers,
+        )
+
+    unique = [symbols] if isinstance(symbols, str) else _unique(symbols)
+    frames: dict[str, pd.DataFrame] = {}
+    errors: dict[str, Exception] = {}
+    # Worker threads do not see this thread's config overrides
+    local_config = getattr(config._local, "config", None)
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, max(len(unique), 1)),
+        thread_name_prefix="finvista-batch",
+    ) as executor:
+        futures = {
+            executor.submit(with_config, local_config, _fetch_one, func, symbol, kwargs): symbol
+            for symbol in unique
+        }
+        for future in as_completed(futures):
+            symbol = futures[future]
+            try:
+                frames[symbol] = future.result()
+            except Exception as e:
+                logger.warning(f"Batch fetch of {func.__name__} failed for {symbol}: {e}")
+                errors[symbol] = e
+
+    # Keep the requested order rather than completion order
+    result = BatchResult()
+    for symbol in unique:
+        if symbol in frames:
+            result[symbol] = frames[symbol]
+        elif symbol in errors:
+            result.errors[symbol] = errors[symbol]
+
+    logger.info(
+        f"Batch {func.__name__}: {len(result)} succeeded, {len(result.errors)} failed"
+    )
+    if output == "panel":
+        return result.to_panel()
+    if output == "dict":
+        for symbol, df in result.items():
+            result[symbol] = to_backend(df)
+        return result
+    return to_backend(result.to_long())  # type: ignore[no-any-return]
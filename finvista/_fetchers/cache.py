@@ -2,8 +2,9 @@
 Cache management for FinVista.
 
 This module provides caching functionality to reduce redundant API calls
-and improve performance. It supports multiple backends (memory, disk, redis)
-and includes a decorator for easy function caching.
+and improve performance. It supports multiple backends (memory, disk,
+shared, redis), which can be chained into tiers, and includes a
+decorator for easy function caching.
 
 Example:
     >>> from finvista._fetchers.cache import cached
@@ -14,50 +15,266 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
-import json
 import logging
+import sys
+import threading
 import time
 from collections import OrderedDict
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from datetime import time as dt_time
+from enum import Enum
 from functools import wraps
+from pathlib import Path
 from typing import Any, ParamSpec, TypeVar
 
-from finvista._core.config import config
-from finvista._core.types import CacheBackend
+import numpy as np
+import pandas as pd
+
+from finvista._core.config import OutputConfig, config
+from finvista._core.types import CacheBackend, TTLPolicy
+from finvista._fetchers.cache_metrics import CacheMetrics
+from finvista._fetchers.disk_cache import DiskCache
+from finvista._fetchers.shared_cache import SharedMemoryCache
+from finvista._fetchers.tiered_cache import TieredCache
 
 logger = logging.getLogger(__name__)
 
 P = ParamSpec("P")
 T = TypeVar("T")
 
+# Prefix of marker keys recording that a stale-while-revalidate entry is fresh
+_FRESH_PREFIX = "fresh:"
+
+# Prefix of keys remembering queries that returned no data
+_NOT_FOUND_PREFIX = "notfound:"
+
+# Number of background threads used to refresh stale entries
+_REVALIDATE_WORKERS = 4
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the memory footprint of a cached value in bytes.
+
+    DataFrames and Series use ``memory_usage(deep=True)`` so that object
+    columns (strings, dates) are counted; containers are summed one
+    level deep; anything else falls back to ``sys.getsizeof``.
+
+    Args:
+        value: The value to measure.
+
+    Returns:
+        Estimated size in bytes.
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(sys.getsizeof(v) for v in value)
+    return size
+
+
+class UncacheableArgumentError(TypeError):
+    """Raised when a call argument cannot be turned into a cache key."""
+
+
+# Argument types used as-is in cache keys (their repr is unambiguous)
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None), bytes})
+
+
+class _StrList(str):
+    """
+    Canonical form of a list of strings (e.g. symbols), joined by commas.
+
+    ``repr`` of one joined string is far cheaper than of a tuple of many
+    short strings. The distinct ``repr`` keeps it from colliding with a
+    plain string argument.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "L" + str.__repr__(self)
+
+
+def _canonical_arg(arg: Any) -> Any:
+    """
+    Reduce an argument to a small, hashable canonical form for cache keys.
+
+    Scalars are used as-is, enums by value, date-likes as ISO strings (so
+    ``date(2024, 1, 1)`` and ``"2024-01-01"`` share an entry), sequences
+    as tuples (lists of strings as one joined string) and sets and dicts
+    in sorted order. Large or opaque objects
+    such as DataFrames are never serialized; they make the call
+    uncacheable instead.
+
+    Args:
+        arg: The argument to canonicalize.
+
+    Returns:
+        A tuple/scalar structure with a deterministic ``repr``.
+
+    Raises:
+        UncacheableArgumentError: If the argument has no canonical form.
+    """
+    arg_type = type(arg)
+    if arg_type in _SCALAR_TYPES:
+        return arg
+    if arg_type is list or arg_type is tuple:
+        # Fast path for symbol lists, unless a separator makes joining ambiguous
+        try:
+            joined = ",".join(arg)
+        except TypeError:
+            joined = None
+        if joined is not None and joined.count(",") == len(arg) - 1:
+            return _StrList(joined)
+        return tuple(_canonical_arg(item) for item in arg)
+    if isinstance(arg, Enum):
+        return _canonical_arg(arg.value)
+    if isinstance(arg, np.generic):
+        return arg.item()
+    if isinstance(arg, datetime):
+        if arg.tzinfo is None and arg.time() == dt_time(0):
+            return arg.date().isoformat()
+        return arg.isoformat()
+    if isinstance(arg, date):
+        return arg.isoformat()
+    for base in (str, int, float, bytes):
+        # Subclasses of builtin scalars reduce to the builtin value
+        if isinstance(arg, base):
+            return base(arg)
+    if isinstance(arg, (list, tuple)):
+        return tuple(_canonical_arg(item) for item in arg)
+    if isinstance(arg, (set, frozenset)):
+        return tuple(sorted((_canonical_arg(item) for item in arg), key=repr))
+    if isinstance(arg, dict):
+        return tuple(
+            sorted(((repr(k), _canonical_arg(v)) for k, v in arg.items()), key=lambda kv: kv[0])
+        )
+    raise UncacheableArgumentError(
+        f"Argument of type {type(arg).__name__} cannot be used in a cache key"
+    )
+
+
+# pandas >= 3 always uses Copy-on-Write; pandas 2 has it as an opt-in mode
+_PANDAS_ALWAYS_COW = int(pd.__version__.split(".")[0]) >= 3
+
+
+def _copy_on_write_enabled() -> bool:
+    """Check whether pandas Copy-on-Write semantics are active."""
+    if _PANDAS_ALWAYS_COW:
+        return True
+    return pd.get_option("mode.copy_on_write") is True
+
+
+def _read_only_copy(value: pd.DataFrame | pd.Series) -> pd.DataFrame | pd.Series:
+    """
+    Shallow copy of a DataFrame or Series whose shared arrays are read-only.
+
+    Object-backed columns (object, string, categorical) are copied
+    instead, as pandas 2 routines such as ``memory_usage(deep=True)``
+    reject read-only object arrays. Copying them only copies references.
+    """
+    if isinstance(value, pd.Series):
+        if value.dtype.kind == "O":
+            return value.copy()
+        shallow = value.copy(deep=False)
+    else:
+        shallow = value.copy(deep=False)
+        for i, dtype in enumerate(shallow.dtypes):
+            if dtype.kind == "O":
+                shallow.isetitem(i, shallow.iloc[:, i].copy())
+
+    for block in shallow._mgr.blocks:
+        values = block.values
+        # Extension arrays keep their data (and mask) in numpy arrays
+        for array in (
+            values,
+            getattr(values, "_ndarray", None),
+            getattr(values, "_data", None),
+            getattr(values, "_mask", None),
+        ):
+            if isinstance(array, np.ndarray) and array.dtype.kind != "O":
+                array.flags.writeable = False
+    return shallow
+
+
+def _protect(value: T) -> T:
+    """
+    Return a cached value in a form callers cannot use to mutate the cache.
+
+    DataFrames and Series are returned as shallow copies. Under pandas
+    Copy-on-Write these share memory with the cached object until the
+    caller modifies them, at which point only the caller's copy changes.
+    Without Copy-on-Write (pandas 2 default) the shared arrays are made
+    read-only instead (see ``_read_only_copy``), so in-place writes raise
+    rather than reach the cache; adding or replacing columns still works.
+    ``attrs`` are always copied.
+
+    Args:
+        value: The cached value.
+
+    Returns:
+        A safe view of the value (other types are returned unchanged).
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        if _copy_on_write_enabled():
+            return value.copy(deep=False)  # type: ignore[return-value]
+        return _read_only_copy(value)  # type: ignore[return-value]
+    return value
+
 
 class MemoryCache:
     """
-    In-memory LRU cache implementation.
+    Thread-safe in-memory LRU cache with a byte budget.
 
     This cache stores values in memory with optional TTL (time-to-live)
-    and automatically evicts least recently used items when full.
+    and evicts least recently used items when either the entry limit or
+    the byte budget would be exceeded. Entry sizes are estimated with
+    ``estimate_size``, so a 30-year daily frame weighs far more than a
+    one-row quote.
 
     Attributes:
         max_size: Maximum number of items to cache.
+        max_bytes: Maximum estimated total size in bytes (None for no limit).
 
     Example:
-        >>> cache = MemoryCache(max_size=100)
+        >>> cache = MemoryCache(max_size=100, max_bytes=64 * 1024**2)
         >>> cache.set("key", "value", ttl=60)
         >>> cache.get("key")
         'value'
     """
 
-    def __init__(self, max_size: int = 1000) -> None:
+    def __init__(
+        self,
+        max_size: int = 1000,
+        max_bytes: int | None = None,
+        on_evict: Callable[[str], None] | None = None,
+    ) -> None:
         """
         Initialize the memory cache.
 
         Args:
             max_size: Maximum number of items to store.
+            max_bytes: Maximum estimated total size in bytes (None for no limit).
+            on_evict: Optional callback receiving each key evicted to
+                respect the limits (not called for expiry or deletes).
         """
-        self._cache: OrderedDict[str, tuple[Any, float | None]] = OrderedDict()
+        # key -> (value, expire_at, size_in_bytes)
+        self._cache: OrderedDict[str, tuple[Any, float | None, int]] = OrderedDict()
         self._max_size = max_size
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.on_evict = on_evict
 
     def get(self, key: str) -> Any | None:
         """
@@ -69,21 +286,37 @@ class MemoryCache:
         Returns:
             The cached value, or None if not found or expired.
         """
-        if key not in self._cache:
-            return None
+        entry = self.get_entry(key)
+        return None if entry is None else entry[0]
 
-        value, expire_at = self._cache[key]
+    def get_entry(self, key: str) -> tuple[Any, float | None] | None:
+        """
+        Retrieve a value together with its expiry time.
 
-        # Check expiration
-        if expire_at is not None and time.time() > expire_at:
-            del self._cache[key]
-            logger.debug(f"Cache key expired: {key}")
-            return None
+        Args:
+            key: The cache key.
+
+        Returns:
+            A (value, expire_at) tuple, or None if not found or expired.
+            ``expire_at`` is a ``time.time()`` timestamp or None.
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
 
-        # Move to end (most recently used)
-        self._cache.move_to_end(key)
+            value, expire_at, _ = entry
+
+            # Check expiration
+            if expire_at is not None and time.time() > expire_at:
+                self._remove(key)
+                logger.debug(f"Cache key expired: {key}")
+                return None
+
+            # Move to end (most recently used)
+            self._cache.move_to_end(key)
         logger.debug(f"Cache hit: {key}")
-        return value
+        return value, expire_at
 
     def set(self, key: str, value: Any, ttl: int | None = None) -> None:
         """
@@ -95,16 +328,71 @@ class MemoryCache:
             ttl: Time-to-live in seconds (None for no expiration).
         """
         expire_at = time.time() + ttl if ttl else None
+        # Measure outside the lock; deep memory usage can be slow
+        size = estimate_size(value)
+
+        if self._max_bytes is not None and size > self._max_bytes:
+            logger.debug(f"Cache skipped: {key} ({size} bytes exceeds budget)")
+            with self._lock:
+                self._remove(key)
+            return
+
+        evicted: list[str] = []
+        with self._lock:
+            self._remove(key)
+
+            # Evict least recently used items until the new one fits
+            while self._cache and (
+                len(self._cache) >= self._max_size
+                or (self._max_bytes is not None and self._bytes + size > self._max_bytes)
+            ):
+                oldest_key = next(iter(self._cache))
+                self._remove(oldest_key)
+                evicted.append(oldest_key)
+                logger.debug(f"Cache evicted: {oldest_key}")
+
+            self._cache[key] = (value, expire_at, size)
+            self._bytes += size
+        self._notify_evicted(evicted)
+        logger.debug(f"Cache set: {key} (ttl={ttl}s, {size} bytes)")
+
+    def set_limits(self, max_size: int, max_bytes: int | None) -> None:
+        """
+        Change the cache limits, evicting entries that no longer fit.
+
+        Args:
+            max_size: Maximum number of items to store.
+            max_bytes: Maximum estimated total size in bytes (None for no limit).
+        """
+        evicted: list[str] = []
+        with self._lock:
+            self._max_size = max_size
+            self._max_bytes = max_bytes
+            while self._cache and (
+                len(self._cache) > max_size
+                or (max_bytes is not None and self._bytes > max_bytes)
+            ):
+                oldest_key = next(iter(self._cache))
+                self._remove(oldest_key)
+                evicted.append(oldest_key)
+        self._notify_evicted(evicted)
+
+    def _notify_evicted(self, keys: list[str]) -> None:
+        """Report evicted keys to the ``on_evict`` callback."""
+        if self.on_evict is not None:
+            for key in keys:
+                self.on_evict(key)
 
-        # Evict oldest items if at capacity
-        while len(self._cache) >= self._max_size:
-            oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
-            logger.debug(f"Cache evicted: {oldest_key}")
+    @property
+    def limits(self) -> tuple[int, int | None]:
+        """Get the (max_size, max_bytes) limits."""
+        return self._max_size, self._max_bytes
 
-        self._cache[key] = (value, expire_at)
-        self._cache.move_to_end(key)
-        logger.debug(f"Cache set: {key} (ttl={ttl}s)")
+    def _remove(self, key: str) -> None:
+        """Remove a key and update the byte count. Caller must hold the lock."""
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
 
     def delete(self, key: str) -> None:
         """
@@ -113,15 +401,33 @@ class MemoryCache:
         Args:
             key: The cache key.
         """
-        if key in self._cache:
-            del self._cache[key]
-            logger.debug(f"Cache deleted: {key}")
+        with self._lock:
+            if key in self._cache:
+                self._remove(key)
+                logger.debug(f"Cache deleted: {key}")
 
     def clear(self) -> None:
         """Clear all cached values."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+            self._bytes = 0
         logger.debug("Cache cleared")
 
+    def items(self) -> list[tuple[str, Any, float | None]]:
+        """
+        Get all non-expired entries, least recently used first.
+
+        Returns:
+            List of (key, value, expire_at) tuples.
+        """
+        current_time = time.time()
+        with self._lock:
+            return [
+                (key, value, expire_at)
+                for key, (value, expire_at, _) in self._cache.items()
+                if expire_at is None or expire_at > current_time
+            ]
+
     def __len__(self) -> int:
         """Return the number of cached items."""
         return len(self._cache)
@@ -130,34 +436,186 @@ class MemoryCache:
         """Check if a key exists and is not expired."""
         return self.get(key) is not None
 
+    @property
+    def bytes(self) -> int:
+        """Get the estimated total size of cached values in bytes."""
+        return self._bytes
+
     def stats(self) -> dict[str, Any]:
         """
         Get cache statistics.
 
         Returns:
-            Dictionary with cache statistics.
+            Dictionary with cache statistics, including the estimated
+            size of each entry from least to most recently used.
         """
-        # Count non-expired items
         current_time = time.time()
+        with self._lock:
+            entries = [
+                {
+                    "key": key,
+                    "bytes": size,
+                    "expires_in": (
+                        round(expire_at - current_time, 1) if expire_at is not None else None
+                    ),
+                }
+                for key, (_, expire_at, size) in self._cache.items()
+            ]
+            total_bytes = self._bytes
+
+        # Count non-expired items
         valid_count = sum(
-            1
-            for _, (__, expire_at) in self._cache.items()
-            if expire_at is None or current_time <= expire_at
+            1 for e in entries if e["expires_in"] is None or e["expires_in"] >= 0
         )
 
         return {
-            "size": len(self._cache),
+            "size": len(entries),
             "valid_items": valid_count,
             "max_size": self._max_size,
+            "bytes": total_bytes,
+            "max_bytes": self._max_bytes,
+            "entries": entries,
         }
 
 
+class _InFlightCall:
+    """State of a single in-flight call shared by concurrent callers."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Request coalescing for concurrent identical calls.
+
+    When several threads call ``do`` with the same key at the same time,
+    only the first one runs the function; the others wait for it and
+    share its result or its exception.
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> flight.do("quote:600519", lambda: fetch_quote("600519"))
+    """
+
+    def __init__(self) -> None:
+        """Initialize the single-flight group."""
+        self._calls: dict[str, _InFlightCall] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, func: Callable[[], T]) -> T:
+        """
+        Run ``func`` once for all concurrent callers with the same key.
+
+        Args:
+            key: Key identifying identical calls.
+            func: The function to execute.
+
+        Returns:
+            The result of ``func``, shared by all waiting callers.
+
+        Raises:
+            Exception: The exception raised by ``func``, re-raised in
+                every waiting caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = _InFlightCall()
+                self._calls[key] = call
+
+        if not leader:
+            logger.debug(f"Waiting for in-flight call: {key}")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[no-any-return]
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result  # type: ignore[no-any-return]
+
+    def in_flight(self) -> int:
+        """Return the number of calls currently in flight."""
+        with self._lock:
+            return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """
+    Request coalescing for concurrent identical coroutine calls.
+
+    The first caller starts the coroutine as a task and every concurrent
+    caller with the same key (on the same event loop) awaits that task.
+    Callers wait through ``asyncio.shield``, so a cancelled caller does
+    not cancel the fetch the others are waiting for.
+
+    Example:
+        >>> flight = AsyncSingleFlight()
+        >>> await flight.do("quote:600519", lambda: afetch_quote("600519"))
+    """
+
+    def __init__(self) -> None:
+        """Initialize the single-flight group."""
+        self._calls: dict[tuple[int, str], asyncio.Task[Any]] = {}
+        self._lock = threading.Lock()
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``func`` once for all concurrent callers with the same key.
+
+        Args:
+            key: Key identifying identical calls.
+            func: Coroutine function to execute.
+
+        Returns:
+            The result of ``func``, shared by all waiting callers.
+
+        Raises:
+            Exception: The exception raised by ``func``, re-raised in
+                every waiting caller.
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        with self._lock:
+            task = self._calls.get(flight_key)
+            if task is None:
+                task = loop.create_task(func())  # type: ignore[arg-type]
+                self._calls[flight_key] = task
+                task.add_done_callback(lambda t: self._forget(flight_key, t))
+            else:
+                logger.debug(f"Waiting for in-flight call: {key}")
+        return await asyncio.shield(task)  # type: ignore[no-any-return]
+
+    def _forget(self, flight_key: tuple[int, str], task: asyncio.Task[Any]) -> None:
+        """Remove a finished call."""
+        with self._lock:
+            if self._calls.get(flight_key) is task:
+                del self._calls[flight_key]
+
+    def in_flight(self) -> int:
+        """Return the number of calls currently in flight."""
+        with self._lock:
+            return len(self._calls)
+
+
 class CacheManager:
     """
     Cache manager supporting multiple backends.
 
     This class provides a unified interface for caching with support
-    for different backends (memory, disk, redis) based on configuration.
+    for different backends (memory, disk, shared, redis) and chains of
+    them (e.g. 'memory+disk') based on configuration.
 
     Example:
         >>> manager = CacheManager()
@@ -168,23 +626,113 @@ class CacheManager:
 
     def __init__(self) -> None:
         """Initialize the cache manager."""
+        self.metrics = CacheMetrics()
         self._backends: dict[str, CacheBackend] = {
-            "memory": MemoryCache(max_size=config.cache.max_size),
+            "memory": MemoryCache(
+                max_size=config.cache.max_size,
+                max_bytes=config.cache.max_bytes,
+                on_evict=self.metrics.record_eviction,
+            ),
         }
+        self._flight = SingleFlight()
+        self._aflight = AsyncSingleFlight()
+        self._background: set[asyncio.Task[Any]] = set()
+        self._refreshing: set[str] = set()
+        self._refresh_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
 
     @property
     def backend(self) -> CacheBackend:
         """
         Get the current cache backend.
 
+        The disk and shared backends are created lazily on first use so
+        that importing the library never touches the filesystem, and are
+        recreated when ``cache.disk_dir`` or ``cache.disk_max_bytes``
+        change. A chained backend such as 'memory+disk' is wrapped in a
+        ``TieredCache`` over the single backends. Memory
+        limits are applied to the existing memory backend when changed.
+
         Returns:
             The configured cache backend.
         """
         backend_name = config.cache.backend
+        if "+" in backend_name:
+            return self._get_tiered_backend(backend_name)
+        return self._get_tier(backend_name)
+
+    def _get_tier(self, backend_name: str) -> CacheBackend:
+        """
+        Get a single (non-chained) backend by name.
+
+        Args:
+            backend_name: Backend name ('memory', 'disk', 'shared', ...).
+
+        Returns:
+            The cache backend.
+        """
+        if backend_name in ("disk", "shared"):
+            return self._get_disk_backend(backend_name)
         if backend_name not in self._backends:
             logger.warning(f"Unknown cache backend: {backend_name}, using memory")
             backend_name = "memory"
-        return self._backends[backend_name]
+        backend = self._backends[backend_name]
+        if isinstance(backend, MemoryCache):
+            cache_config = config.cache
+            limits = (cache_config.max_size, cache_config.max_bytes)
+            if backend.limits != limits:
+                backend.set_limits(*limits)
+        return backend
+
+    def _get_tiered_backend(self, backend_name: str) -> TieredCache:
+        """
+        Get or create the tiered backend for a chain such as 'memory+disk'.
+
+        The chain reuses the single backends, so switching between
+        'memory' and 'memory+disk' keeps the entries of both.
+
+        Args:
+            backend_name: '+'-separated tier names, fastest first.
+
+        Returns:
+            The tiered cache backend.
+        """
+        tiers = [self._get_tier(name) for name in backend_name.split("+")]
+        tiered = self._backends.get(backend_name)
+        if (
+            not isinstance(tiered, TieredCache)
+            or len(tiered.tiers) != len(tiers)
+            or any(a is not b for a, b in zip(tiered.tiers, tiers, strict=True))
+        ):
+            tiered = TieredCache(tiers, spill_min_ttl=config.cache.spill_min_ttl)
+            self._backends[backend_name] = tiered
+        tiered.spill_min_ttl = config.cache.spill_min_ttl
+        return tiered
+
+    def _get_disk_backend(self, name: str = "disk") -> DiskCache:
+        """
+        Get or create a file-based backend for the current configuration.
+
+        Args:
+            name: Backend name ('disk' or 'shared').
+
+        Returns:
+            The disk or shared-memory cache backend.
+        """
+        cache_config = config.cache
+        backend_cls = SharedMemoryCache if name == "shared" else DiskCache
+        disk = self._backends.get(name)
+        if (
+            type(disk) is not backend_cls
+            or (cache_config.disk_dir and disk.directory != Path(cache_config.disk_dir))
+            or disk.max_bytes != cache_config.disk_max_bytes
+        ):
+            disk = backend_cls(
+                directory=cache_config.disk_dir,
+                max_bytes=cache_config.disk_max_bytes,
+            )
+            self._backends[name] = disk
+        return disk
 
     def get(self, key: str) -> Any | None:
         """
@@ -227,53 +775,318 @@ class CacheManager:
         """Clear all cached values."""
         self.backend.clear()
 
-    def _make_key(self, func_name: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+    def export_entries(self) -> list[tuple[str, Any, float | None]]:
         """
-        Generate a cache key from function name and arguments.
+        Export the entries held by the memory backend.
+
+        Returns:
+            List of (key, value, expire_at) tuples, least recently used
+            first.
+        """
+        memory = self._backends["memory"]
+        return memory.items()  # type: ignore[attr-defined,no-any-return]
+
+    def import_entries(self, entries: list[tuple[str, Any, float | None]]) -> int:
+        """
+        Store exported entries in the current backend, keeping their expiry.
 
         Args:
-            func_name: The function name.
-            args: Positional arguments.
-            kwargs: Keyword arguments.
+            entries: (key, value, expire_at) tuples as returned by
+                ``export_entries``.
 
         Returns:
-            A unique cache key string.
+            Number of entries imported (expired ones are skipped).
         """
-        key_data = {
-            "func": func_name,
-            "args": [self._serialize_arg(arg) for arg in args],
-            "kwargs": {k: self._serialize_arg(v) for k, v in sorted(kwargs.items())},
+        backend = self.backend
+        current_time = time.time()
+        imported = 0
+        for key, value, expire_at in entries:
+            if expire_at is None:
+                ttl = None
+            else:
+                remaining = expire_at - current_time
+                if remaining <= 0:
+                    continue
+                ttl = max(1, int(remaining))
+            backend.set(key, value, ttl)
+            imported += 1
+        return imported
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get per-function cache statistics.
+
+        Memory usage (``entries`` and ``bytes``) covers values held by
+        the memory backend; values only on disk are not counted.
+
+        Returns:
+            Dictionary mapping qualified names (``module.qualname``) of
+            decorated functions to their hits, misses, stale serves,
+            evictions, memory usage, average fetch time and the fetch
+            time saved by cache hits.
+        """
+        memory = self._backends["memory"]
+        sizes = {e["key"]: e["bytes"] for e in memory.stats()["entries"]}  # type: ignore[attr-defined]
+        self.metrics.prune(set(sizes))
+        return self.metrics.report(sizes)
+
+    def reset_stats(self) -> None:
+        """Reset the per-function cache statistics."""
+        self.metrics.reset()
+
+    def _record_fetch(
+        self, name: str, key: str, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """Call a cached function, recording its latency or failure."""
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self.metrics.record_error(name)
+            raise
+        self._record_success(name, key, time.perf_counter() - start)
+        return result
+
+    async def _arecord_fetch(
+        self, name: str, key: str, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """Await a cached coroutine function, recording its latency or failure."""
+        start = time.perf_counter()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception:
+            self.metrics.record_error(name)
+            raise
+        self._record_success(name, key, time.perf_counter() - start)
+        return result
+
+    def _record_success(self, name: str, key: str, elapsed: float) -> None:
+        """Record a successful fetch, pruning key ownership when needed."""
+        self.metrics.record_fetch(name, elapsed, key)
+        if self.metrics.needs_pruning():
+            memory = self._backends["memory"]
+            self.metrics.prune({e["key"] for e in memory.stats()["entries"]})  # type: ignore[attr-defined]
+
+    def get_not_found(self, data_type: str, params: dict[str, Any]) -> dict[str, Any] | None:
+        """
+        Look up a remembered "not found" outcome.
+
+        Args:
+            data_type: The data type (e.g., 'cn_stock_daily').
+            params: The query parameters.
+
+        Returns:
+            The remembered outcome (error type, message and attempted
+            sources), or None if the query is not known to be empty.
+        """
+        if not config.cache.negative_ttl:
+            return None
+        try:
+            key = _NOT_FOUND_PREFIX + self._make_key(data_type, (), params)
+        except UncacheableArgumentError:
+            return None
+        return self.get(key)  # type: ignore[no-any-return]
+
+    def set_not_found(
+        self,
+        data_type: str,
+        params: dict[str, Any],
+        error: Exception,
+        attempted_sources: list[str],
+    ) -> None:
+        """
+        Remember that a query returned no data from any source.
+
+        The outcome is kept for ``config.cache.negative_ttl`` seconds, so
+        repeated lookups of delisted or invalid symbols skip the network.
+
+        Args:
+            data_type: The data type (e.g., 'cn_stock_daily').
+            params: The query parameters.
+            error: The DataNotFoundError or SymbolNotFoundError raised.
+            attempted_sources: Sources that reported no data.
+        """
+        negative_ttl = config.cache.negative_ttl
+        if not negative_ttl:
+            return
+        outcome = {
+            "error": type(error).__name__,
+            "message": getattr(error, "message", str(error)),
+            "attempted_sources": list(attempted_sources),
         }
-        key_str = json.dumps(key_data, sort_keys=True, default=str)
-        return hashlib.md5(key_str.encode()).hexdigest()
+        try:
+            key = _NOT_FOUND_PREFIX + self._make_key(data_type, (), params)
+        except UncacheableArgumentError:
+            return
+        self.set(key, outcome, negative_ttl)
 
-    def _serialize_arg(self, arg: Any) -> Any:
+    @staticmethod
+    def _resolve_ttl(ttl: int | TTLPolicy | None) -> int:
         """
-        Serialize an argument for cache key generation.
+        Resolve a TTL setting to seconds.
 
         Args:
-            arg: The argument to serialize.
+            ttl: Fixed TTL, TTL policy, or None for the configured default.
 
         Returns:
-            A JSON-serializable representation.
+            Time-to-live in seconds.
         """
-        if hasattr(arg, "to_dict"):
-            return arg.to_dict()
-        if hasattr(arg, "__dict__"):
-            return str(arg)
-        return arg
+        if ttl is None:
+            return config.cache.ttl
+        if callable(ttl):
+            return int(ttl())
+        return ttl
+
+    def _store_result(
+        self, key: str, value: Any, ttl: int, stale_ttl: int | None
+    ) -> None:
+        """
+        Store a function result, with a freshness marker for SWR entries.
+
+        For stale-while-revalidate entries the value itself is kept for
+        ``ttl + stale_ttl`` seconds, while a small marker key expires
+        after ``ttl`` seconds and tells fresh values from stale ones.
+        """
+        if not stale_ttl:
+            self.set(key, value, ttl)
+            return
+        self.set(key, value, ttl + stale_ttl)
+        self.set(_FRESH_PREFIX + key, True, ttl)
+
+    def _revalidate(
+        self,
+        key: str,
+        refresh: Callable[[], Any],
+        ttl: int,
+        stale_ttl: int,
+    ) -> None:
+        """
+        Refresh a stale entry in a background worker.
+
+        At most one refresh per key is scheduled at a time. If the refresh
+        fails, the stale value keeps being served until it reaches its
+        maximum staleness.
+        """
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=_REVALIDATE_WORKERS,
+                    thread_name_prefix="finvista-revalidate",
+                )
+            executor = self._executor
+
+        def run() -> None:
+            try:
+                self._store_result(key, refresh(), ttl, stale_ttl)
+                logger.debug(f"Revalidated stale cache entry: {key}")
+            except Exception as e:
+                logger.warning(f"Background refresh failed for {key}: {e}")
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
+
+        executor.submit(run)
+
+    def _arevalidate(
+        self,
+        key: str,
+        refresh: Callable[[], Awaitable[Any]],
+        ttl: int,
+        stale_ttl: int,
+    ) -> None:
+        """
+        Refresh a stale entry in a background task on the running loop.
+
+        Async counterpart of ``_revalidate``, sharing its one-refresh-per-key
+        bookkeeping.
+        """
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        async def run() -> None:
+            try:
+                self._store_result(key, await refresh(), ttl, stale_ttl)
+                logger.debug(f"Revalidated stale cache entry: {key}")
+            except Exception as e:
+                logger.warning(f"Background refresh failed for {key}: {e}")
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
+
+        # Keep a reference so the task is not garbage collected mid-flight
+        task = asyncio.get_running_loop().create_task(run())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def _make_key(self, func_name: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+        """
+        Generate a cache key from function name and arguments.
+
+        Arguments are reduced to a canonical tuple (see ``_canonical_arg``)
+        whose ``repr`` is hashed with BLAKE2b. The key is stable across
+        processes, which the disk and shared backends rely on. A
+        non-default output schema (``config.output``) is part of the key,
+        so results converted to different dtypes are cached separately.
+
+        Args:
+            func_name: The function name.
+            args: Positional arguments.
+            kwargs: Keyword arguments.
+
+        Returns:
+            A unique cache key string.
+
+        Raises:
+            UncacheableArgumentError: If an argument has no canonical form.
+        """
+        key_data: tuple[Any, ...] = (
+            func_name,
+            tuple(_canonical_arg(arg) for arg in args),
+            tuple((k, _canonical_arg(kwargs[k])) for k in sorted(kwargs)),
+        )
+        # Results are cached before conversion to the frame backend, so
+        # only the dtype settings change what is stored
+        output, default = config.output, OutputConfig()
+        schema = (output.date_dtype, output.float_dtype)
+        if schema != (default.date_dtype, default.float_dtype):
+            key_data += (("output", *schema),)
+        return hashlib.blake2b(repr(key_data).encode(), digest_size=16).hexdigest()
 
     def cached(
         self,
-        ttl: int | None = None,
+        ttl: int | TTLPolicy | None = None,
         key_prefix: str = "",
+        stale_ttl: int | None = None,
     ) -> Callable[[Callable[P, T]], Callable[P, T]]:
         """
         Decorator for caching function results.
 
+        Concurrent calls with identical arguments on a cold key are
+        coalesced: one caller runs the function and the others wait for
+        and share its result (or exception).
+
+        DataFrame and Series results are returned as copy-on-write views
+        (see ``_protect``), so callers may modify what they receive, e.g.
+        ``df["ma"] = ...``, without affecting the cached value or other
+        callers, and without paying for a full copy. Without pandas
+        Copy-on-Write, in-place edits of the shared values raise instead.
+
+        With ``stale_ttl`` set, the decorator uses stale-while-revalidate:
+        once a value is older than ``ttl`` it is still returned immediately
+        while a background worker refreshes it, for at most ``stale_ttl``
+        more seconds. After that, callers block on a fresh fetch again.
+
         Args:
-            ttl: Cache time-to-live in seconds.
+            ttl: Cache time-to-live in seconds, or a TTL policy such as
+                ``SessionTTL`` called each time a result is stored.
             key_prefix: Optional prefix for cache keys.
+            stale_ttl: Maximum seconds an expired value may still be served
+                while it is refreshed in the background (None to disable).
 
         Returns:
             A decorator function.
@@ -282,9 +1095,23 @@ class CacheManager:
             >>> @cache_manager.cached(ttl=60)
             ... def fetch_data(symbol: str) -> pd.DataFrame:
             ...     return api.get(symbol)
+
+            >>> # Cache daily bars until the next A-share session opens
+            >>> @cache_manager.cached(ttl=SessionTTL("cn"))
+            ... def fetch_daily(symbol: str) -> pd.DataFrame:
+            ...     return api.get(symbol)
+
+            >>> # Serve the list for up to an hour past expiry while refreshing
+            >>> @cache_manager.cached(ttl=3600, stale_ttl=3600)
+            ... def list_symbols() -> pd.DataFrame:
+            ...     return api.list()
         """
 
         def decorator(func: Callable[P, T]) -> Callable[P, T]:
+            # Qualified so that same-named functions in different modules
+            # never share cache entries
+            func_name = f"{func.__module__}.{func.__qualname__}"
+
             @wraps(func)
             def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
                 # Check if caching is enabled
@@ -292,21 +1119,135 @@ class CacheManager:
                     return func(*args, **kwargs)
 
                 # Generate cache key
-                cache_key = key_prefix + self._make_key(func.__name__, args, kwargs)
+                try:
+                    cache_key = key_prefix + self._make_key(func_name, args, kwargs)
+                except UncacheableArgumentError as e:
+                    logger.debug(f"Not caching {func_name}: {e}")
+                    self.metrics.record_bypass(func_name)
+                    return func(*args, **kwargs)
 
                 # Try to get from cache
                 cached_value = self.get(cache_key)
                 if cached_value is not None:
                     logger.debug(f"Cache hit for {func.__name__}")
-                    return cached_value  # type: ignore[no-any-return]
+                    stale = bool(stale_ttl) and self.get(_FRESH_PREFIX + cache_key) is None
+                    self.metrics.record_hit(func_name, stale=stale)
+                    if stale:
+                        # Serve the stale value and refresh it in the background
+                        logger.debug(f"Serving stale value for {func.__name__}")
+                        self._revalidate(
+                            cache_key,
+                            lambda: self._record_fetch(
+                                func_name, cache_key, func, *args, **kwargs
+                            ),
+                            self._resolve_ttl(ttl),
+                            stale_ttl or 0,
+                        )
+                    return _protect(cached_value)  # type: ignore[no-any-return]
+
+                self.metrics.record_miss(func_name)
+
+                def fetch() -> T:
+                    # Another caller may have filled the cache just before
+                    # this call became the leader
+                    cached_value = self.get(cache_key)
+                    if cached_value is not None:
+                        return cached_value  # type: ignore[no-any-return]
+
+                    result = self._record_fetch(func_name, cache_key, func, *args, **kwargs)
+                    cache_ttl = self._resolve_ttl(ttl)
+                    self._store_result(cache_key, result, cache_ttl, stale_ttl)
+                    logger.debug(f"Cached result for {func.__name__} (ttl={cache_ttl}s)")
+                    return result
+
+                # Concurrent identical calls share one fetch; each caller
+                # gets its own view of the result that is now cached
+                return _protect(self._flight.do(cache_key, fetch))
+
+            return wrapper
+
+        return decorator
+
+    def acached(
+        self,
+        ttl: int | TTLPolicy | None = None,
+        key_prefix: str = "",
+        stale_ttl: int | None = None,
+    ) -> Callable[
+        [Callable[P, Awaitable[T]]], Callable[P, Coroutine[Any, Any, T]]
+    ]:
+        """
+        Decorator for caching coroutine function results.
+
+        Async counterpart of ``cached`` with the same options, storage and
+        statistics. Concurrent identical calls on a cold key share one
+        task, and stale values are refreshed in a background task.
+
+        Args:
+            ttl: Cache time-to-live in seconds, or a TTL policy.
+            key_prefix: Optional prefix for cache keys.
+            stale_ttl: Maximum seconds an expired value may still be served
+                while it is refreshed in the background (None to disable).
+
+        Returns:
+            A decorator function.
+
+        Example:
+            >>> @cache_manager.acached(ttl=SessionTTL("cn"))
+            ... async def fetch_daily(symbol: str) -> pd.DataFrame:
+            ...     return await api.get(symbol)
+        """
 
-                # Execute function and cache result
-                result = func(*args, **kwargs)
-                cache_ttl = ttl if ttl is not None else config.cache.ttl
-                self.set(cache_key, result, cache_ttl)
-                logger.debug(f"Cached result for {func.__name__} (ttl={cache_ttl}s)")
+        def decorator(
+            func: Callable[P, Awaitable[T]],
+        ) -> Callable[P, Coroutine[Any, Any, T]]:
+            func_name = f"{func.__module__}.{func.__qualname__}"
 
-                return result
+            @wraps(func)
+            async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+                if not config.cache.enabled:
+                    return await func(*args, **kwargs)
+
+                try:
+                    cache_key = key_prefix + self._make_key(func_name, args, kwargs)
+                except UncacheableArgumentError as e:
+                    logger.debug(f"Not caching {func_name}: {e}")
+                    self.metrics.record_bypass(func_name)
+                    return await func(*args, **kwargs)
+
+                cached_value = self.get(cache_key)
+                if cached_value is not None:
+                    logger.debug(f"Cache hit for {func.__name__}")
+                    stale = bool(stale_ttl) and self.get(_FRESH_PREFIX + cache_key) is None
+                    self.metrics.record_hit(func_name, stale=stale)
+                    if stale:
+                        logger.debug(f"Serving stale value for {func.__name__}")
+                        self._arevalidate(
+                            cache_key,
+                            lambda: self._arecord_fetch(
+                                func_name, cache_key, func, *args, **kwargs
+                            ),
+                            self._resolve_ttl(ttl),
+                            stale_ttl or 0,
+                        )
+                    return _protect(cached_value)  # type: ignore[no-any-return]
+
+                self.metrics.record_miss(func_name)
+
+                async def fetch() -> T:
+                    cached_value = self.get(cache_key)
+                    if cached_value is not None:
+                        return cached_value  # type: ignore[no-any-return]
+
+                    result = await self._arecord_fetch(
+                        func_name, cache_key, func, *args, **kwargs
+                    )
+                    cache_ttl = self._resolve_ttl(ttl)
+                    self._store_result(cache_key, result, cache_ttl, stale_ttl)
+                    logger.debug(f"Cached result for {func.__name__} (ttl={cache_ttl}s)")
+                    return result
+
+                return _protect(await self._aflight.do(cache_key, fetch))
 
             return wrapper
 
@@ -316,5 +1257,6 @@ class CacheManager:
 # Global cache manager instance
 cache_manager = CacheManager()
 
-# Convenience decorator
+# Convenience decorators
 cached = cache_manager.cached
+acached = cache_manager.acached
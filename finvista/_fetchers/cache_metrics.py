@@ -0,0 +1,207 @@
+"""
+Cache instrumentation for FinVista.
+
+This module keeps per-function counters for the ``cached`` decorator:
+hits, misses, stale serves, evictions, fetch latency and the time saved
+by serving from cache. They are meant for tuning TTLs from real usage.
+Functions are keyed by qualified name (``module.qualname``), so the
+sync and async variants of a data function are counted apart.
+
+Example:
+    >>> import finvista as fv
+    >>> stats = fv.get_cache_stats()
+    >>> stats["finvista.markets.china.fund.get_cn_fund_nav"]["hit_ratio"]
+    0.93
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class FunctionCacheStats:
+    """
+    Cache counters for one decorated function.
+
+    Attributes:
+        hits: Calls served from cache (including stale serves).
+        stale_hits: Calls served a stale value while it was refreshed.
+        misses: Calls that found no cached value.
+        bypasses: Calls not cached (uncacheable arguments).
+        fetches: Calls of the underlying function, including refreshes.
+        errors: Fetches that raised an exception.
+        evictions: Entries evicted from memory to respect its limits.
+        fetch_time: Total seconds spent in successful fetches.
+    """
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    bypasses: int = 0
+    fetches: int = 0
+    errors: int = 0
+    evictions: int = 0
+    fetch_time: float = 0.0
+
+    @property
+    def avg_fetch_time(self) -> float:
+        """Average duration of a successful fetch in seconds."""
+        successes = self.fetches - self.errors
+        return self.fetch_time / successes if successes > 0 else 0.0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CacheMetrics:
+    """
+    Thread-safe registry of per-function cache counters.
+
+    Cache keys are hashes, so the registry also remembers which function
+    owns each key in order to attribute evictions and memory usage.
+
+    Example:
+        >>> metrics = CacheMetrics()
+        >>> metrics.record_hit("get_cn_stock_quote")
+        >>> metrics.report()["get_cn_stock_quote"]["hits"]
+        1
+    """
+
+    # Owner entries beyond this are pruned against the live keys
+    _MAX_TRACKED_KEYS = 100_000
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self._stats: dict[str, FunctionCacheStats] = {}
+        self._owners: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, name: str) -> FunctionCacheStats:
+        """Get the counters for a function. Caller must hold the lock."""
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = FunctionCacheStats()
+        return stats
+
+    def record_hit(self, name: str, stale: bool = False) -> None:
+        """
+        Record a call served from cache.
+
+        Args:
+            name: Function name.
+            stale: Whether the value was stale and is being refreshed.
+        """
+        with self._lock:
+            stats = self._get(name)
+            stats.hits += 1
+            if stale:
+                stats.stale_hits += 1
+
+    def record_miss(self, name: str) -> None:
+        """Record a call that found no cached value."""
+        with self._lock:
+            self._get(name).misses += 1
+
+    def record_bypass(self, name: str) -> None:
+        """Record a call that could not be cached."""
+        with self._lock:
+            self._get(name).bypasses += 1
+
+    def record_fetch(self, name: str, elapsed: float, key: str | None = None) -> None:
+        """
+        Record a successful call of the underlying function.
+
+        Args:
+            name: Function name.
+            elapsed: Duration of the call in seconds.
+            key: Cache key the result was stored under.
+        """
+        with self._lock:
+            stats = self._get(name)
+            stats.fetches += 1
+            stats.fetch_time += elapsed
+            if key is not None:
+                self._owners[key] = name
+
+    def record_error(self, name: str) -> None:
+        """Record a call of the underlying function that raised."""
+        with self._lock:
+            stats = self._get(name)
+            stats.fetches += 1
+            stats.errors += 1
+
+    def record_eviction(self, key: str) -> None:
+        """
+        Record that a key was evicted from memory.
+
+        Args:
+            key: The evicted cache key.
+        """
+        with self._lock:
+            name = self._owners.pop(key, None)
+            if name is not None:
+                self._get(name).evictions += 1
+
+    def needs_pruning(self) -> bool:
+        """Check whether the key ownership map should be pruned."""
+        return len(self._owners) > self._MAX_TRACKED_KEYS
+
+    def prune(self, live_keys: set[str]) -> None:
+        """
+        Forget owners of keys that are no longer cached.
+
+        Args:
+            live_keys: Keys currently held by the cache.
+        """
+        with self._lock:
+            self._owners = {k: v for k, v in self._owners.items() if k in live_keys}
+
+    def report(self, entry_sizes: dict[str, int] | None = None) -> dict[str, dict[str, Any]]:
+        """
+        Build a report of the counters.
+
+        Args:
+            entry_sizes: Estimated size in bytes of each cached key, used
+                to attribute memory usage to functions.
+
+        Returns:
+            Dictionary mapping function names to their statistics.
+        """
+        with self._lock:
+            held: dict[str, list[int]] = {}
+            for key, size in (entry_sizes or {}).items():
+                name = self._owners.get(key)
+                if name is not None:
+                    totals = held.setdefault(name, [0, 0])
+                    totals[0] += 1
+                    totals[1] += size
+
+            report: dict[str, dict[str, Any]] = {}
+            for name, stats in sorted(self._stats.items()):
+                entries, held_bytes = held.get(name, [0, 0])
+                report[name] = {
+                    "hits": stats.hits,
+                    "stale_hits": stats.stale_hits,
+                    "misses": stats.misses,
+                    "bypasses": stats.bypasses,
+                    "hit_ratio": round(stats.hit_ratio, 4),
+                    "fetches": stats.fetches,
+                    "errors": stats.errors,
+                    "evictions": stats.evictions,
+                    "entries": entries,
+                    "bytes": held_bytes,
+                    "avg_fetch_time": round(stats.avg_fetch_time, 4),
+                    "time_saved": round(stats.hits * stats.avg_fetch_time, 3),
+                }
+            return report
+
+    def reset(self) -> None:
+        """Reset all counters (key ownership is kept)."""
+        with self._lock:
+            self._stats.clear()
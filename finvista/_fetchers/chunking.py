@@ -0,0 +1,248 @@
+"""
+Chunked dispatch of multi-symbol and paginated requests for FinVista.
+
+Quote endpoints take their symbols in the URL, which limits how many
+fit in one request. Adapters declare their limit as
+``QUOTE_BATCH_SIZE``; this module splits longer symbol lists into
+chunks of that size, fetches the chunks concurrently and concatenates
+the results in the order of the chunks. ``fetch_pages`` does the same
+for the remaining pages of a paginated listing.
+
+Every chunk after the first takes a token from the source's rate
+limiter; the first one is covered by the token the source manager takes
+for the call, or takes its own when the adapter was called directly
+(an explicit ``source=``). A failed chunk is logged and skipped, so its symbols are
+missing from the result (and listed in its ``missing_symbols`` attr)
+and failover can ask the next source for them. Only when every chunk
+fails is the first error raised.
+
+Example:
+    >>> from finvista._fetchers.chunking import fetch_chunked, fetch_pages
+    >>> df = fetch_chunked("sina", fetch_quotes, symbols, batch_size=800)
+    >>> pages = fetch_pages("eastmoney", fetch_page, range(2, 55))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+import pandas as pd
+
+from finvista._core.config import config
+from finvista._fetchers.context import is_rate_limit_paid, with_config
+from finvista._fetchers.rate_limiter import async_rate_limiter, rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# Default number of chunks fetched at once
+DEFAULT_CHUNK_WORKERS = 8
+
+T = TypeVar("T")
+K = TypeVar("K")
+
+
+def split_chunks(symbols: Sequence[str], size: int | None) -> list[list[str]]:
+    """
+    Split symbols into consecutive chunks of at most ``size``.
+
+    Args:
+        symbols: Symbols to split.
+        size: Maximum chunk size (None for a single chunk).
+
+    Returns:
+        List of chunks in the order of ``symbols``.
+    """
+    if not size or len(symbols) <= size:
+        return [list(symbols)]
+    return [list(symbols[i : i + size]) for i in range(0, len(symbols), size)]
+
+
+def _combine(
+    source: str,
+    chunks: list[list[str]],
+    results: Sequence[pd.DataFrame | BaseException],
+) -> pd.DataFrame:
+    """
+    Concatenate chunk results in order, raising if every chunk failed.
+
+    The symbols of failed chunks are listed in the result's
+    ``missing_symbols`` attr.
+    """
+    frames = []
+    errors = []
+    missing: list[str] = []
+    for chunk, result in zip(chunks, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.warning(f"Chunk of {len(chunk)} symbols from '{source}' failed: {result}")
+            errors.append(result)
+            missing.extend(chunk)
+        else:
+            frames.append(result)
+
+    if not frames:
+        raise errors[0]
+    df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+    if missing:
+        df.attrs["missing_symbols"] = missing
+    return df
+
+
+def fetch_chunked(
+    source: str,
+    fetch: Callable[[list[str]], pd.DataFrame],
+    symbols: Sequence[str],
+    batch_size: int | None,
+    max_workers: int = DEFAULT_CHUNK_WORKERS,
+) -> pd.DataFrame:
+    """
+    Fetch a symbol list in chunks of at most ``batch_size`` concurrently.
+
+    Args:
+        source: Source name, used for rate limiting.
+        fetch: Function fetching one chunk of symbols.
+        symbols: Symbols to fetch.
+        batch_size: Maximum number of symbols per request (None for no
+            limit).
+        max_workers: Maximum number of chunks fetched at once.
+
+    Returns:
+        DataFrame of all chunks in the order of ``symbols``.
+
+    Raises:
+        Exception: The first chunk's error if every chunk failed.
+    """
+    chunks = split_chunks(symbols, batch_size)
+    if len(chunks) == 1:
+        return fetch(chunks[0])
+
+    logger.debug(f"Fetching {len(symbols)} symbols from '{source}' in {len(chunks)} chunks")
+    paid = is_rate_limit_paid(source)
+    results = _dispatch(source, fetch, chunks, max_workers, first_is_paid=paid)
+    return _combine(source, chunks, results)
+
+
+def fetch_pages(
+    source: str,
+    fetch: Callable[[int], T],
+    pages: Iterable[int],
+    max_workers: int = DEFAULT_CHUNK_WORKERS,
+) -> list[T]:
+    """
+    Fetch pages of a paginated listing concurrently.
+
+    Meant for the pages after the first one, whose response tells how
+    many pages there are: every page takes a token from the source's
+    rate limiter. Unlike quote chunks, a failed page fails the call, as
+    a listing with a page missing would be silently incomplete.
+
+    Args:
+        source: Source name, used for rate limiting.
+        fetch: Function fetching one page by number.
+        pages: Page numbers to fetch.
+        max_workers: Maximum number of pages fetched at once.
+
+    Returns:
+        The result of each page, in the order of ``pages``.
+
+    Raises:
+        Exception: The error of the first failed page.
+    """
+    results = _dispatch(source, fetch, list(pages), max_workers, first_is_paid=False)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results  # type: ignore[return-value]
+
+
+def _dispatch(
+    source: str,
+    fetch: Callable[[K], T],
+    items: list[K],
+    max_workers: int,
+    first_is_paid: bool,
+) -> list[T | Exception]:
+    """
+    Call ``fetch`` for every item on a thread pool, within the rate limit.
+
+    Args:
+        source: Source name, used for rate limiting.
+        fetch: Function called with each item.
+        items: Items to fetch.
+        max_workers: Maximum number of concurrent calls.
+        first_is_paid: Whether a rate limit token was already taken for
+            the first item.
+
+    Returns:
+        The result or exception of each item, in the order of ``items``.
+    """
+    if not items:
+        return []
+    # Worker threads do not see this thread's config overrides
+    local_config = getattr(config._local, "config", None)
+
+    def fetch_item(index: int) -> T:
+        if index or not first_is_paid:
+            rate_limiter.acquire(source)
+        return fetch(items[index])
+
+    results: list[T | Exception] = []
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(items)),
+        thread_name_prefix="finvista-chunk",
+    ) as executor:
+        futures = [
+            executor.submit(with_config, local_config, fetch_item, i)
+            for i in range(len(items))
+        ]
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+    return results
+
+
+async def afetch_chunked(
+    source: str,
+    fetch: Callable[[list[str]], Awaitable[pd.DataFrame]],
+    symbols: Sequence[str],
+    batch_size: int | None,
+) -> pd.DataFrame:
+    """
+    Async version of ``fetch_chunked``.
+
+    All chunks are started at once; the async rate limiter spaces them.
+
+    Args:
+        source: Source name, used for rate limiting.
+        fetch: Coroutine function fetching one chunk of symbols.
+        symbols: Symbols to fetch.
+        batch_size: Maximum number of symbols per request (None for no
+            limit).
+
+    Returns:
+        DataFrame of all chunks in the order of ``symbols``.
+
+    Raises:
+        Exception: The first chunk's error if every chunk failed.
+    """
+    chunks = split_chunks(symbols, batch_size)
+    if len(chunks) == 1:
+        return await fetch(chunks[0])
+
+    logger.debug(f"Fetching {len(symbols)} symbols from '{source}' in {len(chunks)} chunks")
+    paid = is_rate_limit_paid(source)
+
+    async def fetch_chunk(index: int) -> pd.DataFrame:
+        if index or not paid:
+            await async_rate_limiter.acquire(source)
+        return await fetch(chunks[index])
+
+    results = await asyncio.gather(
+        *(fetch_chunk(i) for i in range(len(chunks))), return_exceptions=True
+    )
+    return _combine(source, chunks, list(results))
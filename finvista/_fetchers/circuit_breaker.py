@@ -57,6 +57,9 @@ class CircuitStats:
         last_success_time: Timestamp of last success.
         last_state_change: Timestamp of last state change.
         avg_response_time: Exponential moving average of response times.
+        total_hedges: Requests started as a hedge against a slow source.
+        total_discarded: Requests whose response was not used because
+            another source answered first.
     """
 
     failure_count: int = 0
@@ -67,6 +70,8 @@ class CircuitStats:
     last_success_time: float | None = None
     last_state_change: float = field(default_factory=time.time)
     avg_response_time: float = 0.0
+    total_hedges: int = 0
+    total_discarded: int = 0
 
 
 class CircuitBreaker:
@@ -263,6 +268,21 @@ class CircuitBreaker:
                         f"Circuit '{self.name}' opened after {self._stats.failure_count} failures"
                     )
 
+    def record_hedge(self) -> None:
+        """Record a request started as a hedge against a slower source."""
+        with self._lock:
+            self._stats.total_hedges += 1
+
+    def record_discarded(self) -> None:
+        """
+        Record a request whose response was not used.
+
+        The request lost a hedged race; it was cancelled or its result
+        was ignored. Its success or failure is recorded separately.
+        """
+        with self._lock:
+            self._stats.total_discarded += 1
+
     def reset(self) -> None:
         """Reset the circuit breaker to closed state."""
         with self._lock:
@@ -288,6 +308,8 @@ class CircuitBreaker:
                 "total_failures": self._stats.total_failures,
                 "total_successes": self._stats.total_successes,
                 "avg_response_time": round(self._stats.avg_response_time, 3),
+                "total_hedges": self._stats.total_hedges,
+                "total_discarded": self._stats.total_discarded,
                 "last_failure_time": self._stats.last_failure_time,
                 "last_success_time": self._stats.last_success_time,
             }
@@ -0,0 +1,70 @@
+"""
+Per-call context shared by the fetcher modules of FinVista.
+
+Work that fans out to worker threads loses the caller's thread-local
+config overrides (``config.context()``); ``with_config`` carries them
+over. ``rate_limit_paid`` records that the source manager already took a
+rate limit token for the source being called, so helpers that split a
+call into several requests know whether the first one is covered.
+
+Example:
+    >>> from finvista._fetchers.context import with_config, is_rate_limit_paid
+    >>> local_config = getattr(config._local, "config", None)
+    >>> executor.submit(with_config, local_config, fetch, symbol)
+    >>> is_rate_limit_paid("eastmoney")
+    False
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from finvista._core.config import config
+
+# Source whose rate limit token was taken for the current call
+_paid_source: ContextVar[str | None] = ContextVar("finvista_paid_source", default=None)
+
+
+def with_config(
+    local_config: Any, func: Callable[..., Any], *args: Any
+) -> Any:
+    """Call a function in a worker thread with the caller's config overrides."""
+    if local_config is None:
+        return func(*args)
+    config._local.config = local_config
+    try:
+        return func(*args)
+    finally:
+        del config._local.config
+
+
+@contextmanager
+def rate_limit_paid(source: str) -> Iterator[None]:
+    """
+    Mark a rate limit token as taken for calls to ``source`` in this block.
+
+    Args:
+        source: Name of the source the token was taken for.
+    """
+    token = _paid_source.set(source)
+    try:
+        yield
+    finally:
+        _paid_source.reset(token)
+
+
+def is_rate_limit_paid(source: str) -> bool:
+    """
+    Check whether a rate limit token was taken for the current call.
+
+    Args:
+        source: Name of the source being called.
+
+    Returns:
+        True inside a source manager call to ``source``, False otherwise
+        (e.g. when an adapter is called directly for an explicit source).
+    """
+    return _paid_source.get() == source
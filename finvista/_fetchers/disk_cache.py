@@ -0,0 +1,403 @@
+"""
+Persistent on-disk cache backend for FinVista.
+
+This module stores cached values as files in a local directory so that
+they survive process restarts. DataFrames are written as Parquet (with
+``DataFrame.attrs`` preserved), everything else is pickled. Writes are
+atomic (write to a temporary file, then rename), which makes a single
+cache directory safe to share between several worker processes.
+
+Example:
+    >>> from finvista._fetchers.disk_cache import DiskCache
+    >>> cache = DiskCache("/tmp/finvista-cache", max_bytes=512 * 1024**2)
+    >>> cache.set("key", df, ttl=3600)
+    >>> cache.get("key")
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Schema metadata key used to store finvista's own metadata in Parquet files
+_META_KEY = b"finvista"
+
+# Leftover temporary files older than this are removed during eviction
+_STALE_TMP_SECONDS = 3600.0
+
+# Seconds between full directory rescans used to refresh the size estimate
+_RESCAN_INTERVAL = 60.0
+
+
+def default_cache_dir() -> Path:
+    """
+    Get the default directory for the disk cache.
+
+    Returns:
+        ``$XDG_CACHE_HOME/finvista`` or ``~/.cache/finvista``.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(base) / "finvista"
+
+
+def _has_pyarrow() -> bool:
+    """Check whether pyarrow is installed."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class DiskCache:
+    """
+    Persistent file-based cache with TTL and a size budget.
+
+    Each key is stored in its own file named after a hash of the key.
+    When the total size of the directory exceeds ``max_bytes``, the
+    least recently used files (by modification time, which is refreshed
+    on every hit) are removed.
+
+    Subclasses can store DataFrames in another columnar format by
+    overriding ``_frame_suffix``, ``_dump_frame`` and ``_read_frame``.
+
+    Attributes:
+        directory: Directory where cache files are stored.
+        max_bytes: Maximum total size of the cache directory in bytes.
+
+    Example:
+        >>> cache = DiskCache(max_bytes=1024**3)
+        >>> cache.set("key", {"a": 1}, ttl=60)
+        >>> cache.get("key")
+        {'a': 1}
+    """
+
+    # File suffix and format name used for DataFrames
+    _frame_suffix = ".parquet"
+    _frame_format = "parquet"
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] | None = None,
+        max_bytes: int = 1024**3,
+    ) -> None:
+        """
+        Initialize the disk cache.
+
+        Args:
+            directory: Cache directory. Defaults to ``default_cache_dir()``.
+            max_bytes: Maximum total size of cached files in bytes.
+        """
+        self.directory = Path(directory) if directory else default_cache_dir()
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._use_parquet = _has_pyarrow()
+        self._approx_bytes: int | None = None
+        self._last_scan = 0.0
+
+    def _path_for(self, key: str, suffix: str) -> Path:
+        """
+        Get the file path for a key.
+
+        Args:
+            key: The cache key.
+            suffix: File suffix (the frame suffix or '.pkl').
+
+        Returns:
+            Path of the cache file.
+        """
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        return self.directory / digest[:2] / f"{digest}{suffix}"
+
+    def get(self, key: str) -> Any | None:
+        """
+        Retrieve a value from the cache.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached value, or None if not found or expired.
+        """
+        entry = self.get_entry(key)
+        return None if entry is None else entry[0]
+
+    def get_entry(self, key: str) -> tuple[Any, float | None] | None:
+        """
+        Retrieve a value together with its expiry time.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            A (value, expire_at) tuple, or None if not found or expired.
+            ``expire_at`` is a ``time.time()`` timestamp or None.
+        """
+        for suffix in (self._frame_suffix, ".pkl"):
+            path = self._path_for(key, suffix)
+            try:
+                if suffix == self._frame_suffix:
+                    value, expire_at = self._read_frame(path)
+                else:
+                    value, expire_at = self._read_pickle(path)
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                # Corrupted or concurrently removed file - treat as a miss
+                logger.debug(f"Disk cache read failed for {key}: {e}")
+                self._unlink(path)
+                return None
+
+            if expire_at is not None and time.time() > expire_at:
+                self._unlink(path)
+                logger.debug(f"Disk cache key expired: {key}")
+                return None
+
+            # Refresh mtime so that eviction is least-recently-used
+            with contextlib.suppress(OSError):
+                os.utime(path)
+            logger.debug(f"Disk cache hit: {key}")
+            return value, expire_at
+
+        return None
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: The cache key.
+            value: The value to cache.
+            ttl: Time-to-live in seconds (None for no expiration).
+        """
+        expire_at = time.time() + ttl if ttl else None
+
+        written: Path | None = None
+        if self._use_parquet and isinstance(value, pd.DataFrame):
+            path = self._path_for(key, self._frame_suffix)
+            try:
+                self._write_atomic(path, lambda f: self._dump_frame(f, key, value, expire_at))
+                written = path
+            except Exception as e:
+                # Some frames (mixed object columns etc.) can't be stored as Arrow data
+                logger.debug(
+                    f"{self._frame_format} write failed for {key}, falling back to pickle: {e}"
+                )
+
+        if written is None:
+            path = self._path_for(key, ".pkl")
+            try:
+                self._write_atomic(
+                    path,
+                    lambda f: pickle.dump(
+                        {"key": key, "expire_at": expire_at, "value": value},
+                        f,
+                        protocol=pickle.HIGHEST_PROTOCOL,
+                    ),
+                )
+            except Exception as e:
+                logger.warning(f"Disk cache write failed for {key}: {e}")
+                return
+            written = path
+
+        # Drop a stale copy stored in the other format
+        other = ".pkl" if written.suffix == self._frame_suffix else self._frame_suffix
+        self._unlink(self._path_for(key, other))
+
+        logger.debug(f"Disk cache set: {key} (ttl={ttl}s)")
+        self._account(written)
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a value from the cache.
+
+        Args:
+            key: The cache key.
+        """
+        for suffix in (self._frame_suffix, ".pkl"):
+            self._unlink(self._path_for(key, suffix))
+        logger.debug(f"Disk cache deleted: {key}")
+
+    def clear(self) -> None:
+        """Clear all cached values."""
+        for path in self._iter_files(include_tmp=True):
+            self._unlink(path)
+        with self._lock:
+            self._approx_bytes = 0
+        logger.debug("Disk cache cleared")
+
+    def __len__(self) -> int:
+        """Return the number of cached files."""
+        return sum(1 for _ in self._iter_files())
+
+    def __contains__(self, key: str) -> bool:
+        """Check if a key exists and is not expired."""
+        return self.get(key) is not None
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cache statistics.
+        """
+        files = 0
+        total = 0
+        for path in self._iter_files():
+            try:
+                total += path.stat().st_size
+                files += 1
+            except OSError:
+                continue
+        return {
+            "size": files,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "directory": str(self.directory),
+            "format": self._frame_format if self._use_parquet else "pickle",
+        }
+
+    # -------------------------------------------------------------------------
+    # Serialization
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _dump_frame(
+        f: Any, key: str, df: pd.DataFrame, expire_at: float | None
+    ) -> None:
+        """Write a DataFrame to an open file as Parquet with metadata."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(df, preserve_index=True)
+        meta = dict(table.schema.metadata or {})
+        meta[_META_KEY] = json.dumps(
+            {"key": key, "expire_at": expire_at, "attrs": df.attrs}, default=str
+        ).encode()
+        pq.write_table(table.replace_schema_metadata(meta), f)
+
+    @staticmethod
+    def _read_frame(path: Path) -> tuple[pd.DataFrame, float | None]:
+        """Read a Parquet cache file, checking expiry before loading data."""
+        import pyarrow.parquet as pq
+
+        schema = pq.read_schema(path)
+        meta = json.loads((schema.metadata or {}).get(_META_KEY, b"{}"))
+        expire_at = meta.get("expire_at")
+        if expire_at is not None and time.time() > expire_at:
+            return pd.DataFrame(), expire_at
+
+        df = pq.read_table(path).to_pandas()
+        df.attrs.update(meta.get("attrs") or {})
+        return df, expire_at
+
+    @staticmethod
+    def _read_pickle(path: Path) -> tuple[Any, float | None]:
+        """Read a pickled cache file."""
+        with open(path, "rb") as f:
+            payload = pickle.load(f)
+        return payload["value"], payload["expire_at"]
+
+    def _write_atomic(self, path: Path, writer: Any) -> None:
+        """
+        Write a file atomically.
+
+        The data is written to a temporary file in the same directory
+        and then renamed over the target, so concurrent readers in other
+        processes see either the old or the new file, never a partial one.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                writer(f)
+            os.replace(tmp_name, path)
+        except BaseException:
+            self._unlink(Path(tmp_name))
+            raise
+
+    # -------------------------------------------------------------------------
+    # Size budget
+    # -------------------------------------------------------------------------
+
+    def _iter_files(self, include_tmp: bool = False) -> Any:
+        """Iterate over cache files in the directory."""
+        if not self.directory.exists():
+            return
+        for sub in self.directory.iterdir():
+            if not sub.is_dir():
+                continue
+            for path in sub.iterdir():
+                if path.suffix in (self._frame_suffix, ".pkl") or (
+                    include_tmp and path.suffix == ".tmp"
+                ):
+                    yield path
+
+    def _account(self, written: Path) -> None:
+        """Update the size estimate after a write and evict if over budget."""
+        try:
+            size = written.stat().st_size
+        except OSError:
+            size = 0
+
+        with self._lock:
+            stale = time.time() - self._last_scan > _RESCAN_INTERVAL
+            if self._approx_bytes is None or stale:
+                need_scan = True
+            else:
+                self._approx_bytes += size
+                need_scan = self._approx_bytes > self.max_bytes
+
+        if need_scan:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used files until under the size budget."""
+        entries: list[tuple[float, int, Path]] = []
+        now = time.time()
+        for path in self._iter_files(include_tmp=True):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            if path.suffix == ".tmp":
+                # Leftover from a writer that crashed mid-write
+                if now - st.st_mtime > _STALE_TMP_SECONDS:
+                    self._unlink(path)
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        if total > self.max_bytes:
+            # Evict down to 90% of the budget to avoid evicting on every write
+            target = int(self.max_bytes * 0.9)
+            entries.sort(key=lambda e: e[0])
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                self._unlink(path)
+                total -= size
+                logger.debug(f"Disk cache evicted: {path.name}")
+
+        with self._lock:
+            self._approx_bytes = total
+            self._last_scan = now
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        """Remove a file, ignoring errors (it may already be gone)."""
+        with contextlib.suppress(OSError):
+            path.unlink()
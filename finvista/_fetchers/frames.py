@@ -0,0 +1,196 @@
+"""
+Output frame backends for FinVista.
+
+Data functions build, convert and cache pandas DataFrames. This module
+converts a result to the frame type the caller asked for once, when it
+leaves the public function:
+
+- pandas: NumPy-backed ``pandas.DataFrame`` (default, returned as is)
+- pandas-arrow: ``pandas.DataFrame`` with ``pd.ArrowDtype`` columns
+- pyarrow: ``pyarrow.Table``; ``df.attrs`` are stored as JSON in the
+  schema metadata under ``b"finvista"``
+- polars: ``polars.DataFrame`` (``df.attrs`` are dropped)
+
+The backend is picked per call with ``output=`` or globally with
+``fv.set_output_schema(backend=...)``. Cached values stay pandas, so a
+cache hit costs one conversion and frames of different backends never
+share cache entries.
+
+Example:
+    >>> import finvista as fv
+    >>> table = fv.get_cn_stock_daily("000001", output="pyarrow")
+    >>> fv.set_output_schema(backend="polars")
+    >>> df = fv.list_cn_stock_symbols()
+"""
+
+from __future__ import annotations
+
+import inspect
+import json
+import logging
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, TypeVar, cast
+
+import pandas as pd
+
+from finvista._core.config import FRAME_BACKENDS, config
+from finvista._core.exceptions import ValidationError
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Schema metadata key holding the DataFrame attrs of pyarrow results
+_META_KEY = b"finvista"
+
+_local = threading.local()
+
+
+def require_backend(backend: str) -> None:
+    """
+    Check that the libraries a frame backend needs are installed.
+
+    Args:
+        backend: Frame backend name.
+
+    Raises:
+        ImportError: If pyarrow (or polars for 'polars') is missing.
+    """
+    if backend == "pandas":
+        return
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            f"The '{backend}' output backend requires pyarrow. "
+            "Install it with: pip install finvista[arrow]"
+        ) from e
+    if backend == "polars":
+        try:
+            import polars  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "The 'polars' output backend requires polars. "
+                "Install it with: pip install finvista[polars]"
+            ) from e
+
+
+def _validate_backend(backend: str) -> None:
+    """Check that a frame backend name is known."""
+    if backend not in FRAME_BACKENDS:
+        raise ValidationError(
+            f"Invalid output: {backend}. Must be one of {FRAME_BACKENDS}",
+            param_name="output",
+            param_value=backend,
+        )
+
+
+def _to_table(df: pd.DataFrame) -> Any:
+    """Convert a DataFrame to a pyarrow Table, keeping attrs as metadata."""
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if not df.attrs:
+        return table
+    meta = dict(table.schema.metadata or {})
+    meta[_META_KEY] = json.dumps(df.attrs, default=str).encode()
+    return table.replace_schema_metadata(meta)
+
+
+def to_backend(data: Any, backend: str | None = None) -> Any:
+    """
+    Convert a DataFrame to a frame backend.
+
+    Values that are not DataFrames are returned unchanged.
+
+    Args:
+        data: Result of a data function.
+        backend: 'pandas', 'pandas-arrow', 'pyarrow' or 'polars'. If
+            None, uses ``config.output.backend``.
+
+    Returns:
+        The DataFrame, pyarrow Table or polars DataFrame.
+
+    Raises:
+        ValidationError: If the backend is unknown.
+        ImportError: If the backend's library is not installed.
+    """
+    if backend is None:
+        if getattr(_local, "pandas", False):
+            return data
+        backend = config.output.backend
+    _validate_backend(backend)
+    if backend == "pandas" or not isinstance(data, pd.DataFrame):
+        return data
+
+    require_backend(backend)
+    table = _to_table(data)
+    if backend == "pyarrow":
+        return table
+    if backend == "polars":
+        import polars as pl
+
+        return pl.from_arrow(table)
+
+    result = table.to_pandas(types_mapper=pd.ArrowDtype)
+    result.attrs = dict(data.attrs)
+    return result
+
+
+@contextmanager
+def pandas_frames() -> Iterator[None]:
+    """
+    Make data functions in this thread return pandas DataFrames.
+
+    Calls without an explicit ``output=`` skip the configured backend,
+    for internal callers that combine results with pandas first.
+
+    Example:
+        >>> with pandas_frames():
+        ...     df = get_cn_stock_daily("000001")
+    """
+    previous = getattr(_local, "pandas", False)
+    _local.pandas = True
+    try:
+        yield
+    finally:
+        _local.pandas = previous
+
+
+def frame_output(func: F) -> F:
+    """
+    Decorator converting a data function's result to a frame backend.
+
+    Handles the keyword-only ``output`` argument of the public data
+    functions: it is validated and removed before the call, so caches
+    below this decorator never see it, and the returned DataFrame is
+    converted with ``to_backend``. Works for plain and coroutine functions.
+
+    Args:
+        func: Data function returning a pandas DataFrame.
+
+    Returns:
+        The wrapped function.
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            output = kwargs.pop("output", None)
+            if output is not None:
+                _validate_backend(output)
+            return to_backend(await func(*args, **kwargs), output)
+
+        return cast(F, async_wrapper)
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        output = kwargs.pop("output", None)
+        if output is not None:
+            _validate_backend(output)
+        return to_backend(func(*args, **kwargs), output)
+
+    return cast(F, wrapper)
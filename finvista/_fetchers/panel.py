@@ -0,0 +1,246 @@
+"""
+Wide panel results for FinVista.
+
+This module provides ``Panel``, a date x symbol matrix per field backed
+by a single preallocated NumPy array. Per-symbol frames from a batch
+fetch are written straight into the array on a shared trading-date
+index, so building a factor matrix needs no concatenation or pivoting.
+
+Example:
+    >>> import finvista as fv
+    >>> panel = fv.get_cn_stock_daily_batch(symbols, output="panel")
+    >>> panel.close.pct_change()
+    >>> panel.to_numpy().shape
+    (6, 242, 300)
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from finvista._core.exceptions import ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+class Panel:
+    """
+    Date x symbol matrices of numeric fields sharing one array.
+
+    Values are stored as float64 in an array of shape
+    ``(fields, dates, symbols)``; missing observations (a symbol not
+    trading on a date, or a field absent from its source) are NaN.
+    Field frames returned by ``panel[field]`` or ``panel.<field>`` wrap a
+    slice of that array without copying it.
+
+    Attributes:
+        fields: Field names along the first axis.
+        dates: Sorted trading dates along the second axis.
+        symbols: Symbols along the third axis.
+        errors: Exception raised for each failed symbol, if built from a
+            batch fetch.
+
+    Example:
+        >>> panel = fv.get_cn_stock_daily_batch(symbols, output="panel")
+        >>> panel.close            # DataFrame, dates x symbols
+        >>> panel.to_numpy("volume")
+        >>> panel.errors
+        {}
+    """
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        fields: Sequence[str],
+        dates: pd.DatetimeIndex,
+        symbols: Sequence[str],
+        errors: dict[str, Exception] | None = None,
+    ) -> None:
+        """
+        Initialize a panel around an existing array.
+
+        Args:
+            values: Array of shape ``(len(fields), len(dates), len(symbols))``.
+            fields: Field names.
+            dates: Trading dates.
+            symbols: Symbols.
+            errors: Exceptions for symbols that could not be fetched.
+
+        Raises:
+            ValidationError: If the array shape does not match the labels.
+        """
+        shape = (len(fields), len(dates), len(symbols))
+        if values.shape != shape:
+            raise ValidationError(
+                f"Panel values have shape {values.shape}, expected {shape}",
+                param_name="values",
+            )
+        self._values = values
+        self.fields = list(fields)
+        self.dates = pd.DatetimeIndex(dates, name="date")
+        self.symbols = pd.Index(symbols, name="symbol")
+        self.errors: dict[str, Exception] = errors or {}
+        self._field_pos = {field: i for i, field in enumerate(self.fields)}
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        """Shape of the underlying array: (fields, dates, symbols)."""
+        return self._values.shape  # type: ignore[return-value]
+
+    def __getitem__(self, field: str) -> pd.DataFrame:
+        """
+        Get one field as a dates x symbols DataFrame.
+
+        The frame is a view of the panel's array, not a copy.
+
+        Args:
+            field: Field name, e.g. "close".
+
+        Returns:
+            DataFrame indexed by date with one column per symbol.
+
+        Raises:
+            KeyError: If the field is not in the panel.
+        """
+        return pd.DataFrame(
+            self._values[self._field_pos[field]],
+            index=self.dates,
+            columns=self.symbols,
+            copy=False,
+        )
+
+    def __getattr__(self, name: str) -> pd.DataFrame:
+        """Access fields as attributes, e.g. ``panel.close``."""
+        if not name.startswith("_") and name in self.__dict__.get("_field_pos", {}):
+            return self[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __contains__(self, field: object) -> bool:
+        """Check whether a field is in the panel."""
+        return field in self._field_pos
+
+    def __repr__(self) -> str:
+        """Summarize the panel dimensions."""
+        if len(self.dates):
+            span = f"{self.dates[0].date()} to {self.dates[-1].date()}"
+        else:
+            span = "no dates"
+        return (
+            f"<Panel: {len(self.fields)} fields x {len(self.dates)} dates "
+            f"x {len(self.symbols)} symbols, {span}>"
+        )
+
+    def to_numpy(self, field: str | None = None) -> np.ndarray:
+        """
+        Get the underlying array without copying.
+
+        Args:
+            field: Field to return. If None, returns the full
+                ``(fields, dates, symbols)`` array.
+
+        Returns:
+            A 3D array, or a 2D ``(dates, symbols)`` view for one field.
+
+        Raises:
+            KeyError: If the field is not in the panel.
+        """
+        if field is None:
+            return self._values
+        return self._values[self._field_pos[field]]  # type: ignore[no-any-return]
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Convert to a wide DataFrame with (field, symbol) MultiIndex columns.
+
+        Unlike the field accessors this copies the data once.
+
+        Returns:
+            DataFrame indexed by date.
+        """
+        n_fields, n_dates, n_symbols = self.shape
+        wide = self._values.transpose(1, 0, 2).reshape(n_dates, n_fields * n_symbols)
+        columns = pd.MultiIndex.from_product(
+            [self.fields, self.symbols], names=["field", "symbol"]
+        )
+        return pd.DataFrame(wide, index=self.dates, columns=columns)
+
+
+def _numeric_fields(frames: Mapping[str, pd.DataFrame]) -> list[str]:
+    """Get the numeric columns of the frames, in first-seen order."""
+    fields: dict[str, None] = {}
+    for df in frames.values():
+        for column, dtype in df.dtypes.items():
+            if (
+                column != "date"
+                and pd.api.types.is_numeric_dtype(dtype)
+                and not pd.api.types.is_bool_dtype(dtype)
+            ):
+                fields[str(column)] = None
+    return list(fields)
+
+
+def build_panel(
+    frames: Mapping[str, pd.DataFrame],
+    fields: Sequence[str] | None = None,
+    errors: dict[str, Exception] | None = None,
+) -> Panel:
+    """
+    Write per-symbol frames into a preallocated panel.
+
+    The date index is the sorted union of every frame's 'date' column.
+    Each frame's values are written into its symbol's column of the
+    array with one positional assignment per field, so no intermediate
+    long or pivoted frame is created.
+
+    Args:
+        frames: DataFrames with a 'date' column, keyed by symbol. Symbols
+            keep the mapping's order.
+        fields: Columns to include. If None, every numeric column found
+            in any frame.
+        errors: Exceptions for symbols that could not be fetched.
+
+    Returns:
+        Panel of float64 values with NaN for missing observations.
+
+    Raises:
+        ValidationError: If a non-empty frame has no 'date' column.
+    """
+    symbols = list(frames)
+    fields = list(fields) if fields is not None else _numeric_fields(frames)
+
+    positions: dict[str, np.ndarray] = {}
+    for symbol, df in frames.items():
+        if df.empty:
+            continue
+        if "date" not in df.columns:
+            raise ValidationError(
+                f"DataFrame for {symbol} has no 'date' column",
+                param_name="frames",
+            )
+        positions[symbol] = pd.to_datetime(df["date"]).to_numpy("datetime64[ns]")
+
+    if positions:
+        dates = np.unique(np.concatenate(list(positions.values())))
+    else:
+        dates = np.array([], dtype="datetime64[ns]")
+
+    values = np.full((len(fields), len(dates), len(symbols)), np.nan)
+    for j, symbol in enumerate(symbols):
+        if symbol not in positions:
+            continue
+        df = frames[symbol]
+        rows = np.searchsorted(dates, positions[symbol])
+        for i, field in enumerate(fields):
+            if field in df.columns:
+                column: Any = pd.to_numeric(df[field], errors="coerce")
+                values[i, rows, j] = column.to_numpy(dtype="float64", na_value=np.nan)
+
+    logger.debug(
+        f"Built panel of {len(fields)} fields x {len(dates)} dates x {len(symbols)} symbols"
+    )
+    return Panel(values, fields, pd.DatetimeIndex(dates), symbols, errors=errors)
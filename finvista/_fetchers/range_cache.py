@@ -0,0 +1,387 @@
+"""
+Date-range aware caching for FinVista.
+
+The plain ``cached`` decorator keys on the exact call arguments, so
+asking for 2024-01-01..2024-06-30 after 2024-01-01..2024-06-29 is a
+full miss. The ``range_cached`` decorator in this module instead keeps
+one merged, date-sorted series per set of non-date arguments (symbol,
+adjust, source, ...), fetches only the edges that are missing from the
+cached coverage and slices the answer locally.
+
+Open-ended requests (``start_date=None``) bypass the range cache, as
+every source returns a different amount of history for them. A series
+only ever holds data of one source: an edge served by another source
+(e.g. after failover) replaces the series instead of being merged.
+"Today" is the current date of the series' market, so a bar of a
+session still trading in another timezone is never marked as covered.
+
+Example:
+    >>> from finvista._fetchers.range_cache import range_cached
+    >>> @range_cached(market="cn")
+    ... def get_daily(symbol, start_date=None, end_date=None):
+    ...     return fetch_from_api(symbol, start_date, end_date)
+"""
+
+from __future__ import annotations
+
+import inspect
+import logging
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from functools import wraps
+from typing import Any, ParamSpec
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+from finvista._core.config import config
+from finvista._core.exceptions import (
+    AllSourcesFailedError,
+    ConfigError,
+    DataNotFoundError,
+)
+from finvista._fetchers.cache import (
+    CacheManager,
+    UncacheableArgumentError,
+    _protect,
+    cache_manager,
+)
+from finvista._fetchers.ttl import MARKET_SESSIONS
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+
+# Attribute holding the covered date range on cached series
+_RANGE_ATTR = "_cached_range"
+
+
+def _to_timestamp(value: Any) -> pd.Timestamp:
+    """
+    Convert a date-like value to a normalized Timestamp.
+
+    Raises:
+        ValueError: If the value cannot be parsed as a date.
+    """
+    if isinstance(value, (date, datetime)):
+        return pd.Timestamp(value).normalize()
+    text = str(value).strip().replace("/", "-")
+    if text.isdigit() and len(text) == 8:
+        text = f"{text[:4]}-{text[4:6]}-{text[6:]}"
+    return pd.Timestamp(text).normalize()
+
+
+def _market_today(market: str) -> pd.Timestamp:
+    """Get the current date in a market's timezone as a naive Timestamp."""
+    zone = ZoneInfo(MARKET_SESSIONS[market].timezone)
+    return pd.Timestamp(datetime.now(zone).date())
+
+
+def _is_not_found(error: Exception) -> bool:
+    """Check whether an error means "no data in this range"."""
+    if isinstance(error, DataNotFoundError):
+        return True
+    return isinstance(error, AllSourcesFailedError) and isinstance(
+        error.last_error, DataNotFoundError
+    )
+
+
+class RangeCache:
+    """
+    Incremental date-range cache built on top of a CacheManager.
+
+    Each series is stored as a single DataFrame in the configured cache
+    backend, with the covered date range kept in ``DataFrame.attrs``.
+    Only the current (possibly incomplete) trading day of the series'
+    market is never marked as covered, so a daily refresh fetches just
+    the newest bar.
+
+    To detect history rewrites (e.g. forward-adjusted prices after an
+    ex-dividend date), the tail fetch re-requests the last cached bar
+    and compares it; if it changed, the whole series is refetched.
+
+    Example:
+        >>> range_cache = RangeCache(cache_manager)
+        >>> @range_cache.cached()
+        ... def get_daily(symbol, start_date=None, end_date=None): ...
+    """
+
+    def __init__(self, manager: CacheManager) -> None:
+        """
+        Initialize the range cache.
+
+        Args:
+            manager: Cache manager used to store merged series.
+        """
+        self._manager = manager
+
+    def cached(
+        self,
+        ttl: int | None = 86400,
+        date_column: str = "date",
+        start_param: str = "start_date",
+        end_param: str = "end_date",
+        market: str = "cn",
+    ) -> Callable[[Callable[P, pd.DataFrame]], Callable[P, pd.DataFrame]]:
+        """
+        Decorator for range-aware caching of time series functions.
+
+        Args:
+            ttl: Lifetime of a merged series in seconds. After it expires
+                the series is rebuilt from scratch on the next call.
+            date_column: Name of the date column in returned frames.
+            start_param: Name of the start date parameter.
+            end_param: Name of the end date parameter.
+            market: Market code ('cn', 'hk' or 'us') whose timezone
+                decides which day is still trading.
+
+        Returns:
+            A decorator function.
+
+        Raises:
+            ConfigError: If the market is unknown.
+        """
+        if market not in MARKET_SESSIONS:
+            raise ConfigError(
+                f"Unknown market for range cache: {market}. "
+                f"Must be one of {sorted(MARKET_SESSIONS)}"
+            )
+
+        def decorator(func: Callable[P, pd.DataFrame]) -> Callable[P, pd.DataFrame]:
+            signature = inspect.signature(func)
+            func_name = f"{func.__module__}.{func.__qualname__}"
+
+            @wraps(func)
+            def wrapper(*args: P.args, **kwargs: P.kwargs) -> pd.DataFrame:
+                if not config.cache.enabled:
+                    return func(*args, **kwargs)
+
+                try:
+                    bound = signature.bind(*args, **kwargs)
+                except TypeError:
+                    return func(*args, **kwargs)
+                bound.apply_defaults()
+                params = dict(bound.arguments)
+                start_value = params.pop(start_param, None)
+                end_value = params.pop(end_param, None)
+                if start_value is None:
+                    # The source decides how much history to return, so
+                    # the result says nothing about coverage
+                    return func(*args, **kwargs)
+
+                today = _market_today(market)
+                try:
+                    start = _to_timestamp(start_value)
+                    end = today if end_value is None else _to_timestamp(end_value)
+                except (ValueError, TypeError):
+                    # Let the function report invalid dates itself
+                    return func(*args, **kwargs)
+                if start > end:
+                    return func(*args, **kwargs)
+
+                def fetch(lo: pd.Timestamp, hi: pd.Timestamp) -> pd.DataFrame:
+                    call = dict(params)
+                    call[start_param] = lo.strftime("%Y-%m-%d")
+                    call[end_param] = hi.strftime("%Y-%m-%d")
+                    return func(**call)  # type: ignore[call-arg]
+
+                try:
+                    key = "range:" + self._manager._make_key(func_name, (), params)
+                except UncacheableArgumentError:
+                    return func(*args, **kwargs)
+                return self._get(key, start, end, fetch, ttl, date_column, today)
+
+            return wrapper
+
+        return decorator
+
+    def _get(
+        self,
+        key: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        fetch: Callable[[pd.Timestamp, pd.Timestamp], pd.DataFrame],
+        ttl: int | None,
+        date_column: str,
+        today: pd.Timestamp,
+    ) -> pd.DataFrame:
+        """
+        Serve a date range from the cached series, fetching missing edges.
+
+        Args:
+            key: Cache key of the series.
+            start: Requested start date.
+            end: Requested end date.
+            fetch: Function fetching a given date range from the source.
+            ttl: Lifetime of the merged series in seconds.
+            date_column: Name of the date column.
+            today: Current date in the market's timezone.
+
+        Returns:
+            DataFrame covering the requested range.
+        """
+        # Today's bar can still change, so never mark it as covered
+        settled = today - timedelta(days=1)
+
+        series = self._manager.get(key)
+        if not isinstance(series, pd.DataFrame) or _RANGE_ATTR not in series.attrs:
+            data = fetch(start, end)
+            if date_column not in data.columns:
+                return data
+            return self._store(key, data, start, min(end, settled), ttl, date_column)
+
+        covered_start = pd.Timestamp(series.attrs[_RANGE_ATTR][0])
+        covered_end = pd.Timestamp(series.attrs[_RANGE_ATTR][1])
+        if covered_start <= start and end <= covered_end:
+            logger.debug(f"Range cache hit: {key}")
+            return self._slice(series, start, end, date_column)
+
+        parts = [series]
+        if start < covered_start:
+            front = self._fetch_edge(fetch, start, covered_start - timedelta(days=1))
+            if front is not None:
+                parts.insert(0, front)
+
+        rewritten = False
+        if end > covered_end:
+            # Re-request the last settled bar so that rewrites of history
+            # (e.g. forward adjustment after a dividend) are noticed
+            dates = pd.to_datetime(series[date_column])
+            settled_dates = dates[dates <= covered_end]
+            anchor = settled_dates.iloc[-1] if len(settled_dates) else None
+            tail_start = anchor if anchor is not None else covered_end + timedelta(days=1)
+            tail = self._fetch_edge(fetch, tail_start, end)
+            if tail is not None:
+                rewritten = anchor is not None and not self._overlap_matches(
+                    series, tail, anchor, date_column
+                )
+                parts.append(tail)
+
+        # Sources differ in adjustment and history depth; never mix them
+        mixed = any(
+            part.attrs.get("source") != series.attrs.get("source") for part in parts
+        )
+        if rewritten or mixed:
+            reason = "changed" if rewritten else "served by another source"
+            logger.info(f"Cached history {reason} for {key}, refetching full range")
+            full_start = min(start, covered_start)
+            data = fetch(full_start, end)
+            data = self._store(key, data, full_start, min(end, settled), ttl, date_column)
+            return self._slice(data, start, end, date_column)
+
+        non_empty = [p for p in parts if len(p)]
+        merged = pd.concat(non_empty, ignore_index=True) if non_empty else series.copy()
+        attrs: dict[str, Any] = {}
+        for part in parts:
+            attrs.update(part.attrs)
+        merged.attrs = attrs
+
+        series = self._store(
+            key,
+            merged,
+            min(start, covered_start),
+            max(covered_end, min(end, settled)),
+            ttl,
+            date_column,
+        )
+        logger.debug(f"Range cache extended: {key}")
+        return self._slice(series, start, end, date_column)
+
+    @staticmethod
+    def _fetch_edge(
+        fetch: Callable[[pd.Timestamp, pd.Timestamp], pd.DataFrame],
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+    ) -> pd.DataFrame | None:
+        """Fetch a missing edge, treating "no data" as an empty result."""
+        if start > end:
+            return None
+        try:
+            return fetch(start, end)
+        except Exception as e:
+            if _is_not_found(e):
+                return None
+            raise
+
+    @staticmethod
+    def _overlap_matches(
+        series: pd.DataFrame,
+        tail: pd.DataFrame,
+        bar_date: pd.Timestamp,
+        date_column: str,
+    ) -> bool:
+        """Check that the re-fetched last bar equals the cached one."""
+        if date_column not in tail.columns or not len(tail):
+            return True
+        old = series[pd.to_datetime(series[date_column]) == bar_date]
+        new = tail[pd.to_datetime(tail[date_column]) == bar_date]
+        if old.empty or new.empty:
+            return True
+        numeric = [c for c in old.select_dtypes("number").columns if c in new.columns]
+        if not numeric:
+            return True
+        return bool(
+            np.allclose(
+                old[numeric].to_numpy(dtype=float)[-1],
+                new[numeric].to_numpy(dtype=float)[-1],
+                equal_nan=True,
+            )
+        )
+
+    def _store(
+        self,
+        key: str,
+        data: pd.DataFrame,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        ttl: int | None,
+        date_column: str,
+    ) -> pd.DataFrame:
+        """Normalize and store a merged series with its covered range."""
+        attrs = {k: v for k, v in data.attrs.items() if k != _RANGE_ATTR}
+        if date_column in data.columns and len(data):
+            order = pd.to_datetime(data[date_column])
+            data = (
+                data.assign(_order=order)
+                .drop_duplicates(subset="_order", keep="last")
+                .sort_values("_order", kind="stable")
+                .drop(columns="_order")
+                .reset_index(drop=True)
+            )
+        else:
+            data = data.copy(deep=False)
+        data.attrs = attrs
+        if end >= start:
+            # Detach the cached series from the frame handed to the caller
+            stored = _protect(data)
+            stored.attrs = {
+                **attrs,
+                _RANGE_ATTR: [start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")],
+            }
+            self._manager.set(key, stored, ttl)
+        return data
+
+    @staticmethod
+    def _slice(
+        data: pd.DataFrame,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        date_column: str,
+    ) -> pd.DataFrame:
+        """Return the rows of a series within [start, end]."""
+        attrs = {k: v for k, v in data.attrs.items() if k != _RANGE_ATTR}
+        if date_column not in data.columns or not len(data):
+            result = data.copy()
+        else:
+            dates = pd.to_datetime(data[date_column])
+            result = data[(dates >= start) & (dates <= end)].reset_index(drop=True)
+        result.attrs = attrs
+        return result
+
+
+# Global range cache instance
+range_cache = RangeCache(cache_manager)
+
+# Convenience decorator
+range_cached = range_cache.cached
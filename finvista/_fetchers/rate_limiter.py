@@ -9,10 +9,12 @@ Example:
     >>> from finvista._fetchers.rate_limiter import rate_limiter
     >>> rate_limiter.set_limit("eastmoney", requests_per_second=5)
     >>> rate_limiter.acquire("eastmoney")  # Blocks if rate limit exceeded
+    >>> await async_rate_limiter.acquire("eastmoney")  # Sleeps without blocking the loop
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import threading
 import time
@@ -118,6 +120,31 @@ class TokenBucket:
                 finally:
                     self._lock.acquire()
 
+    def reserve(self, tokens: int = 1, timeout: float | None = None) -> float | None:
+        """
+        Reserve tokens without blocking.
+
+        The tokens are taken immediately, possibly leaving the bucket in
+        debt, and the caller waits out the returned delay itself. Later
+        callers (blocking or not) queue behind the debt, so reservations
+        are served in order.
+
+        Args:
+            tokens: Number of tokens to reserve.
+            timeout: Maximum acceptable wait (None for no limit).
+
+        Returns:
+            Seconds to wait before using the tokens, or None if the wait
+            would exceed ``timeout`` (nothing is reserved then).
+        """
+        with self._lock:
+            self._refill()
+            wait_time = max(0.0, (tokens - self._tokens) / self.rate)
+            if timeout is not None and wait_time > timeout:
+                return None
+            self._tokens -= tokens
+            return wait_time
+
     @property
     def available(self) -> float:
         """Get the number of available tokens."""
@@ -246,6 +273,30 @@ class RateLimiter:
 
         return result
 
+    def reserve(
+        self,
+        source: str,
+        tokens: int = 1,
+        timeout: float | None = None,
+    ) -> float | None:
+        """
+        Reserve permission to make a request without blocking.
+
+        Used by the asyncio rate limiter, which waits out the returned
+        delay with ``asyncio.sleep`` instead of blocking a thread. Sync
+        and async callers draw from the same bucket per source.
+
+        Args:
+            source: The data source name.
+            tokens: Number of tokens to reserve (usually 1).
+            timeout: Maximum acceptable wait.
+
+        Returns:
+            Seconds to wait before making the request, or None if the wait
+            would exceed ``timeout``.
+        """
+        return self._get_bucket(source).reserve(tokens, timeout)
+
     def get_available(self, source: str) -> float:
         """
         Get the number of available tokens for a source.
@@ -298,5 +349,61 @@ class RateLimiter:
                 self._buckets.clear()
 
 
+class AsyncRateLimiter:
+    """
+    Asyncio counterpart of ``RateLimiter``.
+
+    Waiting happens with ``asyncio.sleep``, so thousands of pending
+    requests cost no threads. Limits and token buckets are those of the
+    wrapped sync limiter, so ``rate_limiter.set_limit`` applies to both
+    and sync and async requests to a source share one budget.
+
+    Example:
+        >>> limiter = AsyncRateLimiter()
+        >>> await limiter.acquire("eastmoney")
+    """
+
+    def __init__(self, limiter: RateLimiter | None = None) -> None:
+        """
+        Initialize the async rate limiter.
+
+        Args:
+            limiter: Sync limiter holding the limits (defaults to the
+                global ``rate_limiter``).
+        """
+        self._limiter = limiter or rate_limiter
+
+    async def acquire(
+        self,
+        source: str,
+        tokens: int = 1,
+        timeout: float | None = None,
+    ) -> bool:
+        """
+        Wait for permission to make a request.
+
+        Args:
+            source: The data source name.
+            tokens: Number of tokens to acquire (usually 1).
+            timeout: Maximum time to wait.
+
+        Returns:
+            True if permission was granted, False if it would take longer
+            than ``timeout``.
+        """
+        wait_time = self._limiter.reserve(source, tokens, timeout)
+        if wait_time is None:
+            logger.warning(f"Rate limit not acquired for {source} (timeout)")
+            return False
+
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+        logger.debug(f"Rate limit acquired for {source}")
+        return True
+
+
 # Global rate limiter instance
 rate_limiter = RateLimiter()
+
+# Global async rate limiter instance
+async_rate_limiter = AsyncRateLimiter(rate_limiter)
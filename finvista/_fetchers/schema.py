@@ -0,0 +1,380 @@
+"""
+Output schemas for FinVista.
+
+This module keeps a registry of column kinds per data type (e.g.
+'cn_stock_daily') and converts fetched DataFrames to it, so a column
+has the same dtype whichever source served the request. The concrete
+date and float dtypes come from ``config.output``:
+
+- date: ``datetime.date`` objects, ``datetime64[ns]`` or day dates
+- datetime: timestamps (left as returned unless dates are datetime64)
+- float: float64 or float32
+- int: int64 (float64 if values are missing)
+
+Columns not in a schema, such as names and codes, are left as they are.
+
+Example:
+    >>> from finvista._fetchers.schema import apply_schema, get_schema
+    >>> get_schema("cn_stock_daily")["volume"]
+    'int'
+    >>> df = apply_schema(df, "cn_stock_daily")
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Mapping
+from typing import Any, Literal
+
+import numpy as np
+import pandas as pd
+
+from finvista._core.config import OutputConfig, config
+from finvista._core.exceptions import ValidationError
+
+logger = logging.getLogger(__name__)
+
+ColumnKind = Literal["date", "datetime", "float", "int"]
+
+_KINDS = ("date", "datetime", "float", "int")
+
+
+def _floats(*columns: str) -> dict[str, ColumnKind]:
+    return dict.fromkeys(columns, "float")
+
+
+_OHLC = _floats("open", "high", "low", "close")
+_KLINE: dict[str, ColumnKind] = {
+    "date": "date",
+    **_OHLC,
+    "volume": "int",
+    **_floats("amount", "amplitude", "change_pct", "change", "turnover"),
+}
+_QUOTE: dict[str, ColumnKind] = {
+    **_floats("price", "change", "change_pct", "open", "high", "low", "pre_close"),
+    "volume": "int",
+    "amount": "float",
+}
+_MONEYFLOW = _floats(
+    "main_net_inflow",
+    "main_net_inflow_pct",
+    "super_large_net_inflow",
+    "large_net_inflow",
+    "medium_net_inflow",
+    "small_net_inflow",
+)
+
+_schemas: dict[str, dict[str, ColumnKind]] = {
+    # Prices
+    "cn_stock_daily": _KLINE,
+    "cn_index_daily": _KLINE,
+    "hk_index_daily": _KLINE,
+    "us_index_daily": _KLINE,
+    "cn_futures_daily": {**_KLINE, "open_interest": "int"},
+    "cn_convertible_daily": _KLINE,
+    "cn_option_daily": _KLINE,
+    "cn_stock_minute": {"datetime": "datetime", **_OHLC, "volume": "int", "amount": "float"},
+    "us_stock_daily": {"date": "date", **_OHLC, "volume": "int", "adj_close": "float"},
+    "forex_rate_history": {"date": "date", **_OHLC},
+    "cn_fund_nav": {"date": "date", **_floats("nav", "acc_nav", "daily_return")},
+    # Quotes and lists
+    "cn_stock_quote": {**_QUOTE, **_floats("turnover", "pe", "pb", "market_cap")},
+    "cn_market_snapshot": {
+        **_QUOTE,
+        **_floats(
+            "amplitude",
+            "turnover",
+            "volume_ratio",
+            "pe",
+            "pb",
+            "market_cap",
+            "float_market_cap",
+        ),
+        "time": "datetime",
+    },
+    "cn_index_quote": _QUOTE,
+    "us_stock_quote": {**_QUOTE, **_floats("market_cap", "pe", "eps", "dividend_yield")},
+    "cn_fund_quote": _floats("nav", "estimated_nav", "estimated_return"),
+    "cn_stock_list": _floats("price", "change_pct"),
+    "cn_fund_list": {},
+    "cn_futures_list": _QUOTE,
+    "cn_convertible_list": _QUOTE,
+    "cn_option_list": _QUOTE,
+    "forex_rate": _floats("rate", "open", "high", "low", "pre_close", "change_pct"),
+    # Financials
+    "cn_income_statement": {
+        "report_date": "date",
+        **_floats(
+            "revenue",
+            "operating_cost",
+            "operating_profit",
+            "total_profit",
+            "net_profit",
+            "net_profit_excl_nr",
+            "eps",
+            "eps_diluted",
+        ),
+    },
+    "cn_balance_sheet": {
+        "report_date": "date",
+        **_floats(
+            "total_assets",
+            "total_liab",
+            "total_equity",
+            "total_current_assets",
+            "total_noncurrent_assets",
+            "total_current_liab",
+            "total_noncurrent_liab",
+            "cash",
+            "accounts_recv",
+            "inventory",
+            "fixed_assets",
+        ),
+    },
+    "cn_cash_flow": {
+        "report_date": "date",
+        **_floats(
+            "operating_cashflow",
+            "investing_cashflow",
+            "financing_cashflow",
+            "net_cash_change",
+            "cash_end",
+        ),
+    },
+    "cn_performance_forecast": {
+        "notice_date": "date",
+        "report_date": "date",
+        **_floats("net_profit_min", "net_profit_max", "change_pct_min", "change_pct_max"),
+    },
+    "cn_dividend_history": {
+        "report_date": "date",
+        "ex_dividend_date": "date",
+        "record_date": "date",
+        "pay_date": "date",
+        **_floats("dividend_per_share", "bonus_shares_ratio"),
+    },
+    # Money flow
+    "cn_stock_moneyflow": {
+        "date": "date",
+        **_MONEYFLOW,
+        **_floats(
+            "small_net_inflow_pct",
+            "medium_net_inflow_pct",
+            "large_net_inflow_pct",
+            "super_large_net_inflow_pct",
+            "close",
+            "change_pct",
+        ),
+    },
+    "cn_stock_moneyflow_realtime": {
+        **_MONEYFLOW,
+        **_floats(
+            "super_large_inflow",
+            "super_large_outflow",
+            "large_inflow",
+            "large_outflow",
+            "medium_inflow",
+            "medium_outflow",
+            "small_inflow",
+            "small_outflow",
+        ),
+    },
+    "cn_industry_moneyflow": {**_floats("price", "change_pct"), **_MONEYFLOW},
+    # Futures positions, dragon tiger list, shareholders
+    "cn_futures_positions": {
+        "date": "date",
+        "rank": "int",
+        "long_volume": "int",
+        "long_change": "int",
+        "short_volume": "int",
+        "short_change": "int",
+    },
+    "cn_lhb_list": {
+        "date": "date",
+        **_floats(
+            "close", "change_pct", "turnover_rate", "buy_amount", "sell_amount", "net_amount"
+        ),
+    },
+    "cn_lhb_detail": {
+        "date": "date",
+        "rank": "int",
+        **_floats("buy_amount", "sell_amount", "net_amount", "buy_pct", "sell_pct"),
+    },
+    "cn_lhb_institution": {
+        "date": "date",
+        **_floats(
+            "close", "change_pct", "institution_buy", "institution_sell", "institution_net"
+        ),
+    },
+    "cn_top_shareholders": {
+        "report_date": "date",
+        "rank": "int",
+        **_floats("shares", "shares_pct", "change", "change_pct"),
+    },
+    "cn_stock_pledge": {
+        "pledge_date": "date",
+        "start_date": "date",
+        "end_date": "date",
+        **_floats("shares", "shares_pct"),
+    },
+    "cn_stock_unlock": {
+        "unlock_date": "date",
+        **_floats("unlock_shares", "unlock_ratio", "unlock_value"),
+    },
+    # Indices and ETFs
+    "cn_index_constituents": _floats("close", "change_pct"),
+    "cn_index_weights": _floats("weight"),
+    "cn_etf_share_change": {
+        "date": "date",
+        **_floats("shares", "shares_change", "shares_change_pct"),
+    },
+    "cn_etf_premium_discount": {"date": "date", **_floats("price", "nav", "premium_rate")},
+    # Macro
+    "cn_macro_gdp": {
+        "date": "date",
+        **_floats(
+            "gdp", "gdp_yoy", "primary_industry", "secondary_industry", "tertiary_industry"
+        ),
+    },
+    "cn_macro_cpi": {
+        "date": "date",
+        **_floats("cpi", "cpi_mom", "cpi_urban", "cpi_rural", "food", "non_food"),
+    },
+    "cn_macro_ppi": {
+        "date": "date",
+        **_floats("ppi", "ppi_mom", "mining", "raw_materials", "processing"),
+    },
+    "cn_macro_pmi": {
+        "date": "date",
+        **_floats("pmi_manufacturing", "pmi_non_manufacturing", "pmi_composite"),
+    },
+    "cn_macro_money_supply": {
+        "date": "date",
+        **_floats("m0", "m0_yoy", "m1", "m1_yoy", "m2", "m2_yoy"),
+    },
+    "cn_macro_social_financing": {
+        "date": "date",
+        **_floats(
+            "total",
+            "total_yoy",
+            "rmb_loans",
+            "foreign_currency_loans",
+            "trust_loans",
+            "corporate_bonds",
+            "equity_financing",
+        ),
+    },
+}
+_lock = threading.Lock()
+
+
+def register_schema(data_type: str, columns: Mapping[str, ColumnKind]) -> None:
+    """
+    Register or replace the output schema of a data type.
+
+    Args:
+        data_type: Data type, e.g. 'cn_stock_daily'.
+        columns: Column name to kind ('date', 'datetime', 'float' or 'int').
+
+    Raises:
+        ValidationError: If a column kind is unknown.
+
+    Example:
+        >>> register_schema("my_factor", {"date": "date", "value": "float"})
+    """
+    for column, kind in columns.items():
+        if kind not in _KINDS:
+            raise ValidationError(
+                f"Invalid kind for column '{column}': {kind}. Must be one of {_KINDS}",
+                param_name="columns",
+                param_value=kind,
+            )
+    with _lock:
+        _schemas[data_type] = dict(columns)
+
+
+def get_schema(data_type: str) -> dict[str, ColumnKind] | None:
+    """
+    Get the output schema of a data type.
+
+    Args:
+        data_type: Data type, e.g. 'cn_stock_daily'.
+
+    Returns:
+        Column name to kind, or None if the data type has no schema.
+    """
+    with _lock:
+        schema = _schemas.get(data_type)
+    return dict(schema) if schema is not None else None
+
+
+def _to_datetime(values: pd.Series, unit: str) -> pd.Series:
+    """Convert dates, strings or timestamps to datetime64 of one unit."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        converted = values
+    else:
+        converted = pd.to_datetime(
+            values.where(values.notna() & (values != "")), format="ISO8601", errors="coerce"
+        )
+    if converted.dtype == f"datetime64[{unit}]":
+        return converted
+    return converted.astype(f"datetime64[{unit}]")
+
+
+def _convert(values: pd.Series, kind: str, output: OutputConfig) -> pd.Series | None:
+    """Convert one column to its kind, or None if it already matches."""
+    if kind in ("date", "datetime"):
+        if output.date_dtype == "object":
+            return None
+        # pandas has no day resolution; day dates use its coarsest one
+        unit = "ns" if output.date_dtype == "datetime64[ns]" else "s"
+        if values.dtype == f"datetime64[{unit}]":
+            return None
+        return _to_datetime(values, unit)
+
+    if kind == "float":
+        if values.dtype == output.float_dtype:
+            return None
+        return pd.to_numeric(values, errors="coerce").astype(output.float_dtype)
+
+    # int
+    if values.dtype == "int64":
+        return None
+    numbers: Any = pd.to_numeric(values, errors="coerce").astype("float64")
+    array = numbers.to_numpy()
+    if np.isfinite(array).all() and (array % 1 == 0).all():
+        return numbers.astype("int64")
+    return None if values.dtype == "float64" else numbers
+
+
+def apply_schema(
+    df: pd.DataFrame,
+    data_type: str,
+    output: OutputConfig | None = None,
+) -> pd.DataFrame:
+    """
+    Convert a DataFrame's columns to the registered schema.
+
+    Columns are converted in place and ``df.attrs`` is kept. Schema
+    columns missing from the frame are skipped.
+
+    Args:
+        df: DataFrame returned by a source.
+        data_type: Data type whose schema to apply.
+        output: Output settings. If None, uses ``config.output``.
+
+    Returns:
+        The converted DataFrame (the same object).
+    """
+    schema = get_schema(data_type)
+    if not schema or not isinstance(df, pd.DataFrame):
+        return df
+
+    output = output or config.output
+    for column, kind in schema.items():
+        if column in df.columns:
+            converted = _convert(df[column], kind, output)
+            if converted is not None:
+                df[column] = converted
+    return df
@@ -0,0 +1,121 @@
+"""
+Shared-memory cache backend for FinVista.
+
+Worker pools (gunicorn, multiprocessing) otherwise keep one private
+``MemoryCache`` copy of the same frames per process. This backend
+stores DataFrames as uncompressed Arrow IPC files in a shared directory
+(``/dev/shm`` on Linux, i.e. RAM) and reads them back through a memory
+map, so every process on the host maps the same pages instead of
+holding its own copy.
+
+Example:
+    >>> from finvista._fetchers.shared_cache import SharedMemoryCache
+    >>> cache = SharedMemoryCache(max_bytes=2 * 1024**3)
+    >>> cache.set("key", df, ttl=3600)
+    >>> cache.get("key")  # memory-mapped, no unpickling
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from finvista._fetchers.disk_cache import _META_KEY, DiskCache, default_cache_dir
+
+# RAM-backed filesystem available on most Linux hosts
+_SHM_ROOT = Path("/dev/shm")
+
+
+def default_shared_dir() -> Path:
+    """
+    Get the default directory for the shared-memory cache.
+
+    Returns:
+        ``/dev/shm/finvista-<uid>`` when ``/dev/shm`` is writable,
+        otherwise ``<default cache dir>/shared``.
+    """
+    if _SHM_ROOT.is_dir() and os.access(_SHM_ROOT, os.W_OK):
+        uid = os.getuid() if hasattr(os, "getuid") else 0
+        return _SHM_ROOT / f"finvista-{uid}"
+    return default_cache_dir() / "shared"
+
+
+class SharedMemoryCache(DiskCache):
+    """
+    Cache backend sharing memory-mapped Arrow data between processes.
+
+    DataFrames are written once as Arrow IPC files and every ``get``
+    memory-maps the file. Numeric columns without missing values are
+    converted to pandas without copying; the resulting arrays are
+    read-only views of the shared pages. Other columns (and non-frame
+    values, which are pickled) are materialized per call as usual.
+
+    Writers replace files atomically, and a replaced or evicted file
+    stays valid for readers that still map it, so processes never see
+    partial data. Expiry, eviction and the size budget work as in
+    ``DiskCache``.
+
+    Attributes:
+        directory: Directory where cache files are stored.
+        max_bytes: Maximum total size of the cache directory in bytes.
+
+    Example:
+        >>> cache = SharedMemoryCache()
+        >>> cache.set("universe", df, ttl=3600)
+        >>> cache.get("universe")  # in any process on the host
+    """
+
+    _frame_suffix = ".arrow"
+    _frame_format = "arrow"
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] | None = None,
+        max_bytes: int = 1024**3,
+    ) -> None:
+        """
+        Initialize the shared-memory cache.
+
+        Args:
+            directory: Cache directory. Defaults to ``default_shared_dir()``.
+            max_bytes: Maximum total size of cached files in bytes.
+        """
+        super().__init__(directory or default_shared_dir(), max_bytes=max_bytes)
+
+    @staticmethod
+    def _dump_frame(
+        f: Any, key: str, df: pd.DataFrame, expire_at: float | None
+    ) -> None:
+        """Write a DataFrame to an open file in the Arrow IPC file format."""
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(df, preserve_index=True)
+        meta = dict(table.schema.metadata or {})
+        meta[_META_KEY] = json.dumps(
+            {"key": key, "expire_at": expire_at, "attrs": df.attrs}, default=str
+        ).encode()
+        table = table.replace_schema_metadata(meta)
+        with pa.ipc.new_file(f, table.schema) as writer:
+            writer.write_table(table)
+
+    @staticmethod
+    def _read_frame(path: Path) -> tuple[pd.DataFrame, float | None]:
+        """Memory-map an Arrow IPC cache file, checking expiry before loading data."""
+        import pyarrow as pa
+
+        reader = pa.ipc.open_file(pa.memory_map(str(path), "r"))
+        meta = json.loads((reader.schema.metadata or {}).get(_META_KEY, b"{}"))
+        expire_at = meta.get("expire_at")
+        if expire_at is not None and time.time() > expire_at:
+            return pd.DataFrame(), expire_at
+
+        # split_blocks avoids consolidating columns into new 2-D blocks,
+        # which would copy the mapped buffers
+        df = reader.read_all().to_pandas(split_blocks=True)
+        df.attrs.update(meta.get("attrs") or {})
+        return df, expire_at
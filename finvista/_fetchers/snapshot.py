@@ -0,0 +1,203 @@
+"""
+Cache warm-up and snapshots for FinVista.
+
+A fresh process starts with an empty memory cache and has to rebuild it
+through slow, rate-limited calls. This module lets one process warm the
+cache from a declared set of calls and dump it to a snapshot file, which
+other processes load in a single read at startup.
+
+Snapshots are pickle files; only load snapshots you created yourself.
+
+Example:
+    >>> import finvista as fv
+    >>> # In a warm-up job (or: finvista cache warm -o /data/cache.snap)
+    >>> fv.warm_cache(fv.default_warm_set(symbols=["000001", "600519"]))
+    >>> fv.save_cache_snapshot("/data/cache.snap")
+    >>> # At service startup
+    >>> fv.load_cache_snapshot("/data/cache.snap")
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import tempfile
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from finvista._fetchers.cache import CacheManager, cache_manager
+
+logger = logging.getLogger(__name__)
+
+# Format version written to snapshot files
+SNAPSHOT_VERSION = 1
+
+
+def save_cache_snapshot(
+    path: str | os.PathLike[str],
+    manager: CacheManager | None = None,
+) -> int:
+    """
+    Dump the in-memory cache to a snapshot file.
+
+    The file is written atomically, so a process loading it concurrently
+    sees either the previous or the new snapshot.
+
+    Args:
+        path: Snapshot file path.
+        manager: Cache manager to dump (defaults to the global one).
+
+    Returns:
+        Number of entries written.
+
+    Example:
+        >>> import finvista as fv
+        >>> fv.save_cache_snapshot("/data/cache.snap")
+        1250
+    """
+    manager = manager or cache_manager
+    entries = manager.export_entries()
+    payload = {
+        "version": SNAPSHOT_VERSION,
+        "created": time.time(),
+        "entries": entries,
+    }
+
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, target)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+    logger.info(f"Saved {len(entries)} cache entries to {target}")
+    return len(entries)
+
+
+def read_cache_snapshot(path: str | os.PathLike[str]) -> dict[str, Any]:
+    """
+    Read a snapshot file.
+
+    Args:
+        path: Snapshot file path.
+
+    Returns:
+        Dictionary with 'version', 'created' and 'entries'.
+
+    Raises:
+        ValueError: If the file is not a supported snapshot.
+    """
+    with open(path, "rb") as f:
+        payload = pickle.load(f)
+    if not isinstance(payload, dict) or payload.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported cache snapshot: {path}")
+    return payload
+
+
+def load_cache_snapshot(
+    path: str | os.PathLike[str],
+    manager: CacheManager | None = None,
+) -> int:
+    """
+    Load a snapshot file into the cache.
+
+    Entries keep their original expiry time; entries that have expired
+    since the snapshot was taken are skipped.
+
+    Args:
+        path: Snapshot file path.
+        manager: Cache manager to fill (defaults to the global one).
+
+    Returns:
+        Number of entries loaded.
+
+    Example:
+        >>> import finvista as fv
+        >>> fv.load_cache_snapshot("/data/cache.snap")
+        1180
+    """
+    manager = manager or cache_manager
+    payload = read_cache_snapshot(path)
+    loaded = manager.import_entries(payload["entries"])
+    logger.info(f"Loaded {loaded} of {len(payload['entries'])} cache entries from {path}")
+    return loaded
+
+
+def default_warm_set(
+    symbols: Sequence[str] | None = None,
+    indices: Sequence[str] = ("000300", "000905"),
+    history_days: int = 365,
+) -> list[Callable[[], Any]]:
+    """
+    Build the default list of warm-up calls for the China market.
+
+    The set covers the full stock list, the constituents of the given
+    indices and daily bars for ``symbols`` over the last
+    ``history_days`` days, which the date-range cache then serves for
+    any narrower range.
+
+    Args:
+        symbols: Stock symbols whose daily bars to load.
+        indices: Index symbols whose constituents to load.
+        history_days: Days of daily history to load per symbol.
+
+    Returns:
+        List of zero-argument callables for ``warm_cache``.
+    """
+    from finvista.markets.china.index import get_cn_index_constituents
+    from finvista.markets.china.stock import get_cn_stock_daily, list_cn_stock_symbols
+
+    start_date = (date.today() - timedelta(days=history_days)).strftime("%Y-%m-%d")
+    calls: list[Callable[[], Any]] = [list_cn_stock_symbols]
+    calls.extend(partial(get_cn_index_constituents, index) for index in indices)
+    calls.extend(
+        partial(get_cn_stock_daily, symbol, start_date=start_date)
+        for symbol in symbols or ()
+    )
+    return calls
+
+
+def warm_cache(
+    calls: Iterable[Callable[[], Any]],
+    max_workers: int = 4,
+) -> dict[str, int]:
+    """
+    Fill the cache by running a set of calls to cached functions.
+
+    Calls run concurrently on a bounded thread pool and go through the
+    usual rate limiting. A failing call is logged and does not stop the
+    others.
+
+    Args:
+        calls: Zero-argument callables, e.g. from ``default_warm_set`` or
+            ``functools.partial(fv.get_cn_fund_nav, "110011")``.
+        max_workers: Maximum number of concurrent calls.
+
+    Returns:
+        Dictionary with the number of 'succeeded' and 'failed' calls.
+    """
+    succeeded = failed = 0
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="finvista-warm"
+    ) as executor:
+        futures = {executor.submit(call): call for call in calls}
+        for future in as_completed(futures):
+            try:
+                future.result()
+                succeeded += 1
+            except Exception as e:
+                failed += 1
+                logger.warning(f"Cache warm-up call {futures[future]} failed: {e}")
+
+    logger.info(f"Cache warm-up finished: {succeeded} succeeded, {failed} failed")
+    return {"succeeded": succeeded, "failed": failed}
@@ -3,7 +3,11 @@ Multi-source data manager for FinVista.
 
 This module provides automatic failover between multiple data sources.
 When a primary source fails, it automatically switches to backup sources
-while tracking health and implementing circuit breaker patterns.
+while tracking health and implementing circuit breaker patterns. Sources
+are tried in static priority order, or, with adaptive routing, fastest
+and most reliable first. Multi-symbol requests of batch data types keep
+the rows a source returned and ask the next source only for the symbols
+that are still missing.
 
 Example:
     >>> from finvista._fetchers.source_manager import source_manager
@@ -14,12 +18,16 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
 import threading
 import time
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Awaitable, Callable, Collection
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, NoReturn
 
 import pandas as pd
 
@@ -27,13 +35,24 @@ from finvista._core.config import config
 from finvista._core.exceptions import (
     AllSourcesFailedError,
     AllSourcesUnavailableError,
+    DataNotFoundError,
+    SymbolNotFoundError,
 )
 from finvista._core.types import SourceStatus
+from finvista._fetchers.cache import cache_manager
 from finvista._fetchers.circuit_breaker import circuit_registry
-from finvista._fetchers.rate_limiter import rate_limiter
+from finvista._fetchers.context import rate_limit_paid, with_config
+from finvista._fetchers.rate_limiter import async_rate_limiter, rate_limiter
+from finvista._fetchers.schema import apply_schema
 
 logger = logging.getLogger(__name__)
 
+# Number of recent response times kept per source for hedging budgets
+RESPONSE_TIME_WINDOW = 100
+
+# Maximum number of threads running hedged requests
+HEDGE_WORKERS = 32
+
 
 @dataclass
 class SourceHealth:
@@ -46,7 +65,11 @@ class SourceHealth:
         success_count: Consecutive success count.
         last_failure_time: Timestamp of last failure.
         last_success_time: Timestamp of last success.
-        avg_response_time: Average response time in seconds.
+        avg_response_time: Average response time in seconds (EWMA of
+            successful requests).
+        error_rate: EWMA of the share of failed requests (0 to 1).
+        response_times: Response times of the most recent successful
+            requests, used for hedging budgets.
         circuit_open_until: When circuit will attempt to close.
     """
 
@@ -56,8 +79,47 @@ class SourceHealth:
     last_failure_time: float | None = None
     last_success_time: float | None = None
     avg_response_time: float = 0.0
+    error_rate: float = 0.0
+    response_times: deque[float] = field(
+        default_factory=lambda: deque(maxlen=RESPONSE_TIME_WINDOW)
+    )
     circuit_open_until: float | None = None
 
+    def routing_score(self, now: float) -> float:
+        """
+        Score a source for adaptive routing (lower is better).
+
+        The score is the EWMA response time plus ``error_rate`` times
+        ``config.failover.error_penalty`` seconds. Sources without
+        requests in the last ``config.failover.routing_window`` seconds
+        score 0, so they are ranked by priority and measured again.
+
+        Args:
+            now: Current time (``time.time()``).
+
+        Returns:
+            Score in seconds.
+        """
+        last_request = max(self.last_success_time or 0.0, self.last_failure_time or 0.0)
+        if now - last_request > config.failover.routing_window:
+            return 0.0
+        return self.avg_response_time + self.error_rate * config.failover.error_penalty
+
+    def hedge_delay(self) -> float:
+        """
+        Get how long to wait for this source before hedging.
+
+        Returns:
+            The ``config.failover.hedge_quantile`` of the recent response
+            times, or ``config.failover.hedge_delay`` while fewer than
+            ``hedge_min_samples`` are known.
+        """
+        failover = config.failover
+        if len(self.response_times) < failover.hedge_min_samples:
+            return failover.hedge_delay
+        ordered = sorted(self.response_times)
+        return ordered[math.ceil(failover.hedge_quantile * len(ordered)) - 1]
+
 
 @dataclass
 class DataSource:
@@ -103,7 +165,9 @@ class SourceManager:
         """Initialize the source manager."""
         self._sources: dict[str, dict[str, DataSource]] = {}
         self._priority_order: dict[str, list[str]] = {}
+        self._batch_params: dict[str, tuple[str, str]] = {}
         self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
 
     def register(
         self,
@@ -196,6 +260,50 @@ class SourceManager:
                 self._sources[data_type][name].enabled = enabled
                 logger.info(f"Source '{name}' for '{data_type}' {'enabled' if enabled else 'disabled'}")
 
+    def register_batch(
+        self,
+        data_type: str,
+        param: str = "symbols",
+        column: str = "symbol",
+    ) -> None:
+        """
+        Mark a data type as a multi-symbol batch.
+
+        Requests of a batch data type are split per symbol during
+        failover: the rows a source returned are kept and only the
+        symbols missing from its result are requested from the next
+        source.
+
+        Args:
+            data_type: Type of data (e.g., 'cn_stock_quote').
+            param: Fetcher parameter holding the list of symbols.
+            column: Result column identifying the symbol of each row.
+
+        Example:
+            >>> manager.register_batch("cn_stock_quote", param="symbols", column="symbol")
+        """
+        with self._lock:
+            self._batch_params[data_type] = (param, column)
+
+    def _batch_symbols(
+        self, data_type: str, kwargs: dict[str, Any]
+    ) -> tuple[str, str, list[str]] | None:
+        """Get (param, column, symbols) if a request can be split per symbol."""
+        with self._lock:
+            batch = self._batch_params.get(data_type)
+        if batch is None:
+            return None
+        symbols = kwargs.get(batch[0])
+        if not isinstance(symbols, (list, tuple)) or len(symbols) < 2:
+            return None
+        return batch[0], batch[1], list(symbols)
+
+    def _enabled_sources(self, data_type: str) -> set[str]:
+        """Get the names of the registered, enabled sources for a data type."""
+        with self._lock:
+            sources = self._sources.get(data_type, {})
+            return {name for name, source in sources.items() if source.enabled}
+
     def get_available_sources(self, data_type: str) -> list[DataSource]:
         """
         Get list of available sources for a data type.
@@ -204,11 +312,16 @@ class SourceManager:
         - Registered and enabled
         - Not in circuit-open state
 
+        With the 'adaptive' routing policy (``fv.set_source_routing``)
+        they are sorted by ``SourceHealth.routing_score`` in steps of
+        ``config.failover.routing_tolerance`` seconds, keeping priority
+        order within a step.
+
         Args:
             data_type: Type of data to fetch.
 
         Returns:
-            List of available DataSource objects in priority order.
+            List of available DataSource objects in the order to try them.
         """
         with self._lock:
             if data_type not in self._sources:
@@ -227,6 +340,12 @@ class SourceManager:
                 else:
                     logger.debug(f"Source '{name}' for '{data_type}' skipped (circuit open)")
 
+            if config.get_source_routing(data_type) == "adaptive" and len(available) > 1:
+                now = time.time()
+                step = config.failover.routing_tolerance
+                # sorted() is stable, so equal steps keep priority order
+                available.sort(key=lambda source: int(source.health.routing_score(now) / step))
+
             return available
 
     def fetch_with_fallback(
@@ -238,7 +357,18 @@ class SourceManager:
         Fetch data with automatic failover to backup sources.
 
         This method tries each available source in priority order,
-        automatically falling back to the next source if one fails.
+        automatically falling back to the next source if one fails. With
+        hedging enabled for the data type (``fv.set_source_hedging``), a
+        source that is slower than usual is raced against the next one.
+
+        For batch data types (see ``register_batch``) a multi-symbol
+        request that a source answers only partly is not retried as a
+        whole: the next source is asked only for the missing symbols.
+
+        When every source reports that the data does not exist
+        (DataNotFoundError or SymbolNotFoundError), the outcome is
+        remembered for ``config.cache.negative_ttl`` seconds and later
+        identical queries fail immediately without network requests.
 
         Args:
             data_type: Type of data to fetch.
@@ -260,6 +390,21 @@ class SourceManager:
             ... )
             >>> print(f"Fetched from: {source}")
         """
+        not_found = cache_manager.get_not_found(data_type, kwargs)
+        if not_found is not None:
+            logger.debug(f"Known empty result for '{data_type}': {kwargs}")
+            error_cls = (
+                SymbolNotFoundError
+                if not_found["error"] == "SymbolNotFoundError"
+                else DataNotFoundError
+            )
+            raise AllSourcesFailedError(
+                f"All sources failed for data type: {data_type}",
+                data_type=data_type,
+                last_error=error_cls(not_found["message"]),
+                attempted_sources=not_found["attempted_sources"],
+            )
+
         available_sources = self.get_available_sources(data_type)
 
         if not available_sources:
@@ -268,50 +413,240 @@ class SourceManager:
                 data_type=data_type,
             )
 
-        last_error: Exception | None = None
-        attempted_sources: list[str] = []
+        batch = self._batch_symbols(data_type, kwargs)
+        if batch is not None:
+            return self._fetch_split(data_type, available_sources, kwargs, *batch)
+        return self._fetch(data_type, available_sources, kwargs)
+
+    def _fetch(
+        self,
+        data_type: str,
+        sources: list[DataSource],
+        kwargs: dict[str, Any],
+    ) -> tuple[pd.DataFrame, str]:
+        """
+        Fetch from the first source that succeeds, hedging if enabled.
 
-        for source in available_sources:
-            attempted_sources.append(source.name)
-            breaker = circuit_registry.get(data_type, source.name)
+        Args:
+            data_type: Type of data to fetch.
+            sources: Available sources in the order to try them.
+            kwargs: Parameters passed to the fetchers.
+
+        Returns:
+            Tuple of (DataFrame, source_name).
 
+        Raises:
+            AllSourcesFailedError: When all sources fail.
+        """
+        if config.get_source_hedging(data_type) and len(sources) > 1:
+            return self._fetch_hedged(data_type, sources, kwargs)
+
+        errors: dict[str, Exception] = {}
+        for source in sources:
             try:
-                # Acquire rate limit
+                data, elapsed = self._call_source(data_type, source, kwargs)
+            except Exception as e:
+                logger.warning(f"Source '{source.name}' failed: {e}, trying next...")
+                errors[source.name] = e
+                continue
+            return _finish(data, data_type, source.name, elapsed), source.name
+
+        _raise_all_failed(data_type, kwargs, errors, self._enabled_sources(data_type))
+
+    def _fetch_split(
+        self,
+        data_type: str,
+        sources: list[DataSource],
+        kwargs: dict[str, Any],
+        param: str,
+        column: str,
+        symbols: list[str],
+    ) -> tuple[pd.DataFrame, str]:
+        """
+        Fetch a multi-symbol request, splitting it per symbol on failover.
+
+        The first source that succeeds is asked for all symbols. Symbols
+        missing from its result are requested from the sources after it,
+        and so on until every symbol is found or no source is left. The
+        partial results are combined in the order of ``symbols``.
+
+        Args:
+            data_type: Type of data to fetch.
+            sources: Available sources in the order to try them.
+            kwargs: Parameters passed to the fetchers.
+            param: Fetcher parameter holding the symbols.
+            column: Result column identifying the symbol of each row.
+            symbols: Requested symbols.
+
+        Returns:
+            Tuple of (DataFrame, source_name) where source_name is the
+            source that served the first part.
+
+        Raises:
+            AllSourcesFailedError: When no source returns any data.
+        """
+        parts: list[pd.DataFrame] = []
+        missing = symbols
+        while True:
+            try:
+                data, name = self._fetch(data_type, sources, {**kwargs, param: missing})
+            except AllSourcesFailedError as e:
+                if not parts:
+                    raise
+                logger.warning(f"No source returned {len(missing)} '{data_type}' symbols: {e}")
+                break
+            parts.append(data)
+            missing = _missing_symbols(data, column, missing)
+            sources = _sources_after(sources, name)
+            if not missing or not sources:
+                break
+            logger.info(
+                f"'{name}' returned {len(symbols) - len(missing)} of {len(symbols)} "
+                f"'{data_type}' symbols, requesting {len(missing)} from the next source"
+            )
+
+        return _combine(parts, data_type, column, symbols, missing), parts[0].attrs["source"]
+
+    def _call_source(
+        self,
+        data_type: str,
+        source: DataSource,
+        kwargs: dict[str, Any],
+        rate_limited: bool = False,
+    ) -> tuple[pd.DataFrame, float]:
+        """
+        Fetch from one source, recording the outcome in its health.
+
+        Args:
+            data_type: Type of data to fetch.
+            source: Source to call.
+            kwargs: Parameters passed to the fetcher.
+            rate_limited: Whether a rate limit token was already taken.
+
+        Returns:
+            Tuple of (data, elapsed seconds).
+        """
+        breaker = circuit_registry.get(data_type, source.name)
+        try:
+            # Acquire rate limit
+            if not rate_limited:
                 rate_limiter.acquire(source.name)
 
-                # Fetch data
-                start_time = time.time()
+            # Fetch data
+            start_time = time.time()
+            with rate_limit_paid(source.name):
                 data = source.fetcher(**kwargs)
-                elapsed = time.time() - start_time
+            elapsed = time.time() - start_time
+        except Exception as e:
+            # Record failure
+            breaker.record_failure(e)
+            self._update_health(data_type, source.name, success=False, error=e)
+            raise
+
+        # Record success
+        breaker.record_success(response_time=elapsed)
+        self._update_health(data_type, source.name, success=True, response_time=elapsed)
+        logger.debug(f"Successfully fetched from '{source.name}' in {elapsed:.2f}s")
+        return data, elapsed
+
+    def _fetch_hedged(
+        self,
+        data_type: str,
+        sources: list[DataSource],
+        kwargs: dict[str, Any],
+    ) -> tuple[pd.DataFrame, str]:
+        """
+        Fetch with hedging: race the next source when one is slow.
 
-                # Record success
-                breaker.record_success(response_time=elapsed)
-                self._update_health(data_type, source.name, success=True, response_time=elapsed)
+        Sources run on a shared thread pool. When none has answered
+        within the last started source's ``hedge_delay``, the next source
+        is started as well, if its rate limiter has a token free. A
+        failure starts the next source at once when nothing else is in
+        flight. The first result wins; requests still running are left
+        to finish and their results are discarded.
 
-                logger.debug(f"Successfully fetched from '{source.name}' in {elapsed:.2f}s")
+        Args:
+            data_type: Type of data to fetch.
+            sources: Available sources in the order to try them.
+            kwargs: Parameters passed to the fetchers.
 
-                # Add source metadata to DataFrame
-                if isinstance(data, pd.DataFrame):
-                    data.attrs["source"] = source.name
-                    data.attrs["fetch_time"] = elapsed
+        Returns:
+            Tuple of (DataFrame, source_name).
 
-                return data, source.name
+        Raises:
+            AllSourcesFailedError: When all sources fail.
+        """
+        executor = self._hedge_executor()
+        # Worker threads do not see this thread's config overrides
+        local_config = getattr(config._local, "config", None)
+        remaining = list(sources)
+        pending: dict[Future[tuple[pd.DataFrame, float]], DataSource] = {}
+        errors: dict[str, Exception] = {}
+        deadline: float | None = None
+
+        def start(source: DataSource, hedge: bool) -> None:
+            nonlocal deadline
+            if hedge:
+                circuit_registry.get(data_type, source.name).record_hedge()
+                logger.debug(f"Hedging '{data_type}' request with '{source.name}'")
+            future = executor.submit(
+                with_config, local_config, self._call_source, data_type, source, kwargs, hedge
+            )
+            pending[future] = source
+            deadline = time.monotonic() + self._hedge_delay(source)
+
+        while remaining or pending:
+            if not pending:
+                # Nothing in flight: fail over to the next source
+                start(remaining.pop(0), hedge=False)
+
+            timeout = None
+            if remaining and deadline is not None:
+                timeout = max(0.0, deadline - time.monotonic())
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            if not done:
+                # The sources in flight are slow; hedge with the next one
+                # that can be called without waiting for its rate limit
+                deadline = None
+                for i, source in enumerate(remaining):
+                    if rate_limiter.reserve(source.name, timeout=0) is not None:
+                        start(remaining.pop(i), hedge=True)
+                        break
+                continue
 
-            except Exception as e:
-                # Record failure
-                breaker.record_failure(e)
-                self._update_health(data_type, source.name, success=False, error=e)
+            for future in done:
+                source = pending.pop(future)
+                try:
+                    data, elapsed = future.result()
+                except Exception as e:
+                    logger.warning(f"Source '{source.name}' failed: {e}")
+                    errors[source.name] = e
+                    continue
 
-                logger.warning(f"Source '{source.name}' failed: {e}, trying next...")
-                last_error = e
-                continue
+                for loser, loser_source in pending.items():
+                    breaker = circuit_registry.get(data_type, loser_source.name)
+                    if loser.cancel():
+                        breaker.record_discarded()
+                    else:
+                        loser.add_done_callback(lambda _f, b=breaker: b.record_discarded())
+                return _finish(data, data_type, source.name, elapsed), source.name
+
+        _raise_all_failed(data_type, kwargs, errors, self._enabled_sources(data_type))
 
-        raise AllSourcesFailedError(
-            f"All sources failed for data type: {data_type}",
-            data_type=data_type,
-            last_error=last_error,
-            attempted_sources=attempted_sources,
-        )
+    def _hedge_delay(self, source: DataSource) -> float:
+        """Get how long to wait for a source before hedging."""
+        with self._lock:
+            return source.health.hedge_delay()
+
+    def _hedge_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool for hedged requests, creating it on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=HEDGE_WORKERS, thread_name_prefix="finvista-hedge"
+                )
+            return self._executor
 
     def _update_health(
         self,
@@ -329,15 +664,23 @@ class SourceManager:
             health = self._sources[data_type][source_name].health
             now = time.time()
 
+            # Exponential moving averages of response time and error rate
+            alpha = 0.2
+            health.error_rate = alpha * (not success) + (1 - alpha) * health.error_rate
+
             if success:
+                if health.last_success_time is None:
+                    # Start from the first sample rather than from zero
+                    health.avg_response_time = response_time
+                else:
+                    health.avg_response_time = (
+                        alpha * response_time + (1 - alpha) * health.avg_response_time
+                    )
+                health.response_times.append(response_time)
                 health.success_count += 1
                 health.failure_count = 0
                 health.last_success_time = now
                 health.status = SourceStatus.HEALTHY
-
-                # Update average response time (exponential moving average)
-                alpha = 0.2
-                health.avg_response_time = alpha * response_time + (1 - alpha) * health.avg_response_time
             else:
                 health.failure_count += 1
                 health.success_count = 0
@@ -367,6 +710,7 @@ class SourceManager:
                 health = self._sources[data_type][source_name].health
                 health.status = SourceStatus.HEALTHY
                 health.failure_count = 0
+                health.error_rate = 0.0
                 health.circuit_open_until = None
 
         logger.info(f"Circuit reset for '{source_name}' ({data_type})")
@@ -396,6 +740,7 @@ class SourceManager:
                         "failure_count": health.failure_count,
                         "success_count": health.success_count,
                         "avg_response_time": round(health.avg_response_time, 3),
+                        "error_rate": round(health.error_rate, 3),
                         "last_success_time": health.last_success_time,
                         "last_failure_time": health.last_failure_time,
                         "circuit_state": breaker_status["state"],
@@ -436,5 +781,458 @@ class SourceManager:
         logger.info(f"Priority updated for '{data_type}': {sources}")
 
 
+class AsyncSourceManager:
+    """
+    Asyncio counterpart of ``SourceManager``.
+
+    Async fetchers are registered per data type and source name, while
+    source order, enabled state, circuit breakers and health come from
+    the wrapped sync manager. ``set_priority``, ``fv.reset_source_circuit``
+    and ``fv.get_source_health`` therefore apply to both, and failures
+    seen by async fetches open the same circuits as sync ones. Sources
+    without an async fetcher are skipped.
+
+    Example:
+        >>> manager = AsyncSourceManager(source_manager)
+        >>> manager.register("cn_stock_daily", "eastmoney", afetch_eastmoney)
+        >>> df, source = await manager.fetch_with_fallback("cn_stock_daily", symbol="000001")
+    """
+
+    def __init__(self, manager: SourceManager) -> None:
+        """
+        Initialize the async source manager.
+
+        Args:
+            manager: Sync manager providing priority, circuits and health.
+        """
+        self._manager = manager
+        self._fetchers: dict[str, dict[str, Callable[..., Awaitable[pd.DataFrame]]]] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        data_type: str,
+        name: str,
+        fetcher: Callable[..., Awaitable[pd.DataFrame]],
+    ) -> None:
+        """
+        Register an async fetcher for a data source.
+
+        The source must also be registered with the sync manager, which
+        decides its priority.
+
+        Args:
+            data_type: Type of data (e.g., 'cn_stock_daily').
+            name: Name of the source, as registered with the sync manager.
+            fetcher: Coroutine function to fetch data.
+        """
+        with self._lock:
+            self._fetchers.setdefault(data_type, {})[name] = fetcher
+        logger.info(f"Registered async source '{name}' for '{data_type}'")
+
+    def get_sources(self, data_type: str) -> list[str]:
+        """
+        Get the names of sources with an async fetcher for a data type.
+
+        Args:
+            data_type: Type of data.
+
+        Returns:
+            List of source names in priority order.
+        """
+        with self._lock:
+            fetchers = self._fetchers.get(data_type, {})
+            return [n for n in self._manager.get_sources(data_type) if n in fetchers]
+
+    async def fetch_with_fallback(
+        self,
+        data_type: str,
+        **kwargs: Any,
+    ) -> tuple[pd.DataFrame, str]:
+        """
+        Fetch data with automatic failover to backup sources.
+
+        Behaves like ``SourceManager.fetch_with_fallback``, including the
+        negative cache, but awaits the async fetchers and rate limiter.
+
+        Args:
+            data_type: Type of data to fetch.
+            **kwargs: Parameters passed to the fetcher function.
+
+        Returns:
+            Tuple of (DataFrame, source_name).
+
+        Raises:
+            AllSourcesUnavailableError: When no sources are available.
+            AllSourcesFailedError: When all sources fail.
+        """
+        not_found = cache_manager.get_not_found(data_type, kwargs)
+        if not_found is not None:
+            logger.debug(f"Known empty result for '{data_type}': {kwargs}")
+            error_cls = (
+                SymbolNotFoundError
+                if not_found["error"] == "SymbolNotFoundError"
+                else DataNotFoundError
+            )
+            raise AllSourcesFailedError(
+                f"All sources failed for data type: {data_type}",
+                data_type=data_type,
+                last_error=error_cls(not_found["message"]),
+                attempted_sources=not_found["attempted_sources"],
+            )
+
+        with self._lock:
+            fetchers = dict(self._fetchers.get(data_type, {}))
+        available_sources = [
+            source
+            for source in self._manager.get_available_sources(data_type)
+            if source.name in fetchers
+        ]
+
+        if not available_sources:
+            raise AllSourcesUnavailableError(
+                f"No available sources for data type: {data_type}",
+                data_type=data_type,
+            )
+
+        batch = self._manager._batch_symbols(data_type, kwargs)
+        if batch is not None:
+            return await self._fetch_split(data_type, available_sources, fetchers, kwargs, *batch)
+        return await self._fetch(data_type, available_sources, fetchers, kwargs)
+
+    async def _fetch(
+        self,
+        data_type: str,
+        sources: list[DataSource],
+        fetchers: dict[str, Callable[..., Awaitable[pd.DataFrame]]],
+        kwargs: dict[str, Any],
+    ) -> tuple[pd.DataFrame, str]:
+        """
+        Fetch from the first source that succeeds, hedging if enabled.
+
+        Args:
+            data_type: Type of data to fetch.
+            sources: Available sources in the order to try them.
+            fetchers: Async fetchers by source name.
+            kwargs: Parameters passed to the fetchers.
+
+        Returns:
+            Tuple of (DataFrame, source_name).
+
+        Raises:
+            AllSourcesFailedError: When all sources fail.
+        """
+        if config.get_source_hedging(data_type) and len(sources) > 1:
+            return await self._fetch_hedged(data_type, sources, fetchers, kwargs)
+
+        errors: dict[str, Exception] = {}
+        for source in sources:
+            try:
+                data, elapsed = await self._call_source(
+                    data_type, source.name, fetchers[source.name], kwargs
+                )
+            except Exception as e:
+                logger.warning(f"Source '{source.name}' failed: {e}, trying next...")
+                errors[source.name] = e
+                continue
+            return _finish(data, data_type, source.name, elapsed), source.name
+
+        enabled = self._manager._enabled_sources(data_type) & fetchers.keys()
+        _raise_all_failed(data_type, kwargs, errors, enabled)
+
+    async def _fetch_split(
+        self,
+        data_type: str,
+        sources: list[DataSource],
+        fetchers: dict[str, Callable[..., Awaitable[pd.DataFrame]]],
+        kwargs: dict[str, Any],
+        param: str,
+        column: str,
+        symbols: list[str],
+    ) -> tuple[pd.DataFrame, str]:
+        """
+        Fetch a multi-symbol request, splitting it per symbol on failover.
+
+        Async counterpart of ``SourceManager._fetch_split``.
+
+        Args:
+            data_type: Type of data to fetch.
+            sources: Available sources in the order to try them.
+            fetchers: Async fetchers by source name.
+            kwargs: Parameters passed to the fetchers.
+            param: Fetcher parameter holding the symbols.
+            column: Result column identifying the symbol of each row.
+            symbols: Requested symbols.
+
+        Returns:
+            Tuple of (DataFrame, source_name).
+
+        Raises:
+            AllSourcesFailedError: When no source returns any data.
+        """
+        parts: list[pd.DataFrame] = []
+        missing = symbols
+        while True:
+            try:
+                data, name = await self._fetch(
+                    data_type, sources, fetchers, {**kwargs, param: missing}
+                )
+            except AllSourcesFailedError as e:
+                if not parts:
+                    raise
+                logger.warning(f"No source returned {len(missing)} '{data_type}' symbols: {e}")
+                break
+            parts.append(data)
+            missing = _missing_symbols(data, column, missing)
+            sources = _sources_after(sources, name)
+            if not missing or not sources:
+                break
+            logger.info(
+                f"'{name}' returned {len(symbols) - len(missing)} of {len(symbols)} "
+                f"'{data_type}' symbols, requesting {len(missing)} from the next source"
+            )
+
+        return _combine(parts, data_type, column, symbols, missing), parts[0].attrs["source"]
+
+    async def _call_source(
+        self,
+        data_type: str,
+        name: str,
+        fetcher: Callable[..., Awaitable[pd.DataFrame]],
+        kwargs: dict[str, Any],
+        rate_limited: bool = False,
+    ) -> tuple[pd.DataFrame, float]:
+        """
+        Fetch from one source, recording the outcome in its health.
+
+        A request cancelled because another source answered first is
+        recorded as discarded rather than as a failure.
+
+        Args:
+            data_type: Type of data to fetch.
+            name: Name of the source.
+            fetcher: The source's async fetcher.
+            kwargs: Parameters passed to the fetcher.
+            rate_limited: Whether a rate limit token was already taken.
+
+        Returns:
+            Tuple of (data, elapsed seconds).
+        """
+        breaker = circuit_registry.get(data_type, name)
+        try:
+            # Acquire rate limit
+            if not rate_limited:
+                await async_rate_limiter.acquire(name)
+
+            # Fetch data
+            start_time = time.time()
+            with rate_limit_paid(name):
+                data = await fetcher(**kwargs)
+            elapsed = time.time() - start_time
+        except asyncio.CancelledError:
+            breaker.record_discarded()
+            raise
+        except Exception as e:
+            # Record failure
+            breaker.record_failure(e)
+            self._manager._update_health(data_type, name, success=False, error=e)
+            raise
+
+        # Record success
+        breaker.record_success(response_time=elapsed)
+        self._manager._update_health(data_type, name, success=True, response_time=elapsed)
+        logger.debug(f"Successfully fetched from '{name}' in {elapsed:.2f}s")
+        return data, elapsed
+
+    async def _fetch_hedged(
+        self,
+        data_type: str,
+        sources: list[DataSource],
+        fetchers: dict[str, Callable[..., Awaitable[pd.DataFrame]]],
+        kwargs: dict[str, Any],
+    ) -> tuple[pd.DataFrame, str]:
+        """
+        Fetch with hedging: race the next source when one is slow.
+
+        Async counterpart of ``SourceManager._fetch_hedged``; requests
+        that lose the race are cancelled.
+
+        Args:
+            data_type: Type of data to fetch.
+            sources: Available sources in the order to try them.
+            fetchers: Async fetchers by source name.
+            kwargs: Parameters passed to the fetchers.
+
+        Returns:
+            Tuple of (DataFrame, source_name).
+
+        Raises:
+            AllSourcesFailedError: When all sources fail.
+        """
+        remaining = list(sources)
+        pending: dict[asyncio.Task[tuple[pd.DataFrame, float]], DataSource] = {}
+        errors: dict[str, Exception] = {}
+        deadline: float | None = None
+
+        def start(source: DataSource, hedge: bool) -> None:
+            nonlocal deadline
+            if hedge:
+                circuit_registry.get(data_type, source.name).record_hedge()
+                logger.debug(f"Hedging '{data_type}' request with '{source.name}'")
+            task = asyncio.ensure_future(
+                self._call_source(data_type, source.name, fetchers[source.name], kwargs, hedge)
+            )
+            pending[task] = source
+            deadline = time.monotonic() + self._manager._hedge_delay(source)
+
+        try:
+            while remaining or pending:
+                if not pending:
+                    # Nothing in flight: fail over to the next source
+                    start(remaining.pop(0), hedge=False)
+
+                timeout = None
+                if remaining and deadline is not None:
+                    timeout = max(0.0, deadline - time.monotonic())
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    # Hedge with the next source that has a rate limit token
+                    deadline = None
+                    for i, source in enumerate(remaining):
+                        if rate_limiter.reserve(source.name, timeout=0) is not None:
+                            start(remaining.pop(i), hedge=True)
+                            break
+                    continue
+
+                for task in done:
+                    source = pending.pop(task)
+                    try:
+                        data, elapsed = task.result()
+                    except Exception as e:
+                        logger.warning(f"Source '{source.name}' failed: {e}")
+                        errors[source.name] = e
+                        continue
+                    return _finish(data, data_type, source.name, elapsed), source.name
+        finally:
+            # Cancel requests that lost the race (or outlived the caller)
+            for task in pending:
+                task.cancel()
+
+        enabled = self._manager._enabled_sources(data_type) & fetchers.keys()
+        _raise_all_failed(data_type, kwargs, errors, enabled)
+
+
+def _finish(data: Any, data_type: str, source_name: str, elapsed: float) -> Any:
+    """Convert fetched data to the output schema and add source metadata."""
+    if isinstance(data, pd.DataFrame):
+        data = apply_schema(data, data_type)
+        data.attrs["source"] = source_name
+        data.attrs["fetch_time"] = elapsed
+    return data
+
+
+def _missing_symbols(data: Any, column: str, symbols: list[str]) -> list[str]:
+    """Get the requested symbols without rows in a result, in request order."""
+    if not isinstance(data, pd.DataFrame) or column not in data.columns:
+        return []
+    found = set(data[column])
+    return [symbol for symbol in symbols if symbol not in found]
+
+
+def _sources_after(sources: list[DataSource], name: str) -> list[DataSource]:
+    """Get the sources ordered after the named one."""
+    names = [source.name for source in sources]
+    return sources[names.index(name) + 1 :]
+
+
+def _combine(
+    parts: list[pd.DataFrame],
+    data_type: str,
+    column: str,
+    symbols: list[str],
+    missing: list[str],
+) -> pd.DataFrame:
+    """
+    Combine the partial results of a split request.
+
+    Rows are sorted into the order of the requested symbols. Besides
+    ``source`` and ``fetch_time`` of the first part, ``df.attrs`` gets
+    ``sources`` (rows served per source) and ``missing_symbols`` when
+    the request was split or came back incomplete.
+
+    Args:
+        parts: Results in the order they were fetched.
+        data_type: Type of data fetched.
+        column: Column identifying the symbol of each row.
+        symbols: Requested symbols.
+        missing: Symbols no source returned.
+
+    Returns:
+        The combined DataFrame.
+    """
+    first = parts[0]
+    if len(parts) == 1 and not missing:
+        return first
+
+    attrs = dict(first.attrs)
+    attrs["sources"] = {part.attrs["source"]: len(part) for part in parts}
+    attrs["fetch_time"] = sum(part.attrs.get("fetch_time", 0.0) for part in parts)
+    attrs["missing_symbols"] = missing
+    if len(parts) == 1:
+        first.attrs = attrs
+        return first
+
+    df = pd.concat(parts, ignore_index=True)
+    order = df[column].map({symbol: i for i, symbol in enumerate(symbols)})
+    df = df.iloc[order.fillna(len(symbols)).argsort(kind="stable")].reset_index(drop=True)
+    df = apply_schema(df, data_type)
+    df.attrs = attrs
+    return df
+
+
+def _raise_all_failed(
+    data_type: str,
+    kwargs: dict[str, Any],
+    errors: dict[str, Exception],
+    sources: Collection[str],
+) -> NoReturn:
+    """
+    Raise AllSourcesFailedError for a request no source could serve.
+
+    When every source that could serve the request reported that the
+    data does not exist, the outcome is stored in the negative cache
+    first. Sources skipped because their circuit was open (or left out
+    of a split request) were never asked, so their absence from
+    ``errors`` keeps the request out of the negative cache.
+
+    Args:
+        data_type: Type of data requested.
+        kwargs: Parameters of the request.
+        errors: Error raised by each attempted source, in attempt order.
+        sources: Names of all enabled sources for the data type.
+    """
+    attempted_sources = list(errors)
+    last_error = next(reversed(errors.values()), None)
+    all_not_found = all(
+        isinstance(e, (DataNotFoundError, SymbolNotFoundError)) for e in errors.values()
+    )
+    all_asked = set(sources) <= set(errors)
+    if all_not_found and all_asked and last_error is not None:
+        cache_manager.set_not_found(data_type, kwargs, last_error, attempted_sources)
+
+    raise AllSourcesFailedError(
+        f"All sources failed for data type: {data_type}",
+        data_type=data_type,
+        last_error=last_error,
+        attempted_sources=attempted_sources,
+    )
+
+
 # Global source manager instance
 source_manager = SourceManager()
+
+# Global async source manager instance
+async_source_manager = AsyncSourceManager(source_manager)
@@ -0,0 +1,250 @@
+"""
+Tiered cache backend for FinVista.
+
+A tiered cache chains several backends, typically a fast in-process
+memory cache (L1) in front of a persistent disk or shared-memory cache
+(L2). Lookups go through the tiers in order and hits in a lower tier are
+promoted into the tiers above. Writes to lower tiers happen on a
+background thread (write-behind), so callers never wait for Parquet or
+Arrow encoding.
+
+Example:
+    >>> from finvista._fetchers.cache import MemoryCache
+    >>> from finvista._fetchers.disk_cache import DiskCache
+    >>> from finvista._fetchers.tiered_cache import TieredCache
+    >>> cache = TieredCache([MemoryCache(), DiskCache()])
+    >>> cache.set("key", df, ttl=86400)
+    >>> cache.get("key")
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from finvista._core.types import CacheBackend
+
+logger = logging.getLogger(__name__)
+
+
+class TieredCache:
+    """
+    Chain of cache backends with promotion and write-behind.
+
+    Values are always written to the first tier synchronously. They are
+    written to the lower tiers only if their TTL is at least
+    ``spill_min_ttl`` seconds (or unlimited), so short-lived entries
+    such as 10-second quotes stay memory-only while history spills to
+    disk. Lower-tier writes and deletes are queued on a single
+    background thread and applied in order.
+
+    While a key has a queued operation, lookups only consult the first
+    tier, so a pending delete can never be undone by promoting an old
+    copy from disk.
+
+    Attributes:
+        tiers: Backends from fastest to slowest.
+        spill_min_ttl: Minimum TTL in seconds for values written to
+            the lower tiers.
+        write_behind: Whether lower tiers are written asynchronously.
+
+    Example:
+        >>> cache = TieredCache([MemoryCache(), DiskCache()], spill_min_ttl=300)
+        >>> cache.set("quote", quote_df, ttl=10)      # memory only
+        >>> cache.set("daily", daily_df, ttl=86400)   # memory and disk
+    """
+
+    def __init__(
+        self,
+        tiers: Sequence[CacheBackend],
+        spill_min_ttl: int = 300,
+        write_behind: bool = True,
+        max_pending: int = 256,
+    ) -> None:
+        """
+        Initialize the tiered cache.
+
+        Args:
+            tiers: Backends from fastest to slowest (at least one).
+            spill_min_ttl: Minimum TTL in seconds for lower-tier writes.
+            write_behind: Write lower tiers on a background thread.
+            max_pending: Maximum queued lower-tier operations; beyond
+                this, writes are applied synchronously to bound memory.
+
+        Raises:
+            ValueError: If no tiers are given.
+        """
+        if not tiers:
+            raise ValueError("TieredCache needs at least one tier")
+        self.tiers = list(tiers)
+        self.spill_min_ttl = spill_min_ttl
+        self.write_behind = write_behind
+        self._max_pending = max_pending
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        # key -> number of queued lower-tier operations
+        self._dirty: dict[str, int] = {}
+        self._pending = 0
+        self._clearing = 0
+        self._promotions = 0
+
+    def get(self, key: str) -> Any | None:
+        """
+        Retrieve a value, promoting lower-tier hits into upper tiers.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached value, or None if not found in any tier.
+        """
+        with self._lock:
+            first_tier_only = self._clearing > 0 or key in self._dirty
+        tiers = self.tiers[:1] if first_tier_only else self.tiers
+
+        for level, tier in enumerate(tiers):
+            entry = self._get_entry(tier, key)
+            if entry is None:
+                continue
+            value, expire_at = entry
+            if level:
+                self._promote(key, value, expire_at, level)
+            return value
+        return None
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """
+        Store a value in the first tier and, if long-lived, the lower tiers.
+
+        Args:
+            key: The cache key.
+            value: The value to cache.
+            ttl: Time-to-live in seconds (None for no expiration).
+        """
+        self.tiers[0].set(key, value, ttl)
+        if len(self.tiers) == 1:
+            return
+        if not ttl or ttl >= self.spill_min_ttl:
+            self._submit(key, lambda tier: tier.set(key, value, ttl))
+        else:
+            # Drop any older long-lived copy so it can't be promoted later
+            self._submit(key, lambda tier: tier.delete(key))
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a value from all tiers.
+
+        Args:
+            key: The cache key.
+        """
+        self.tiers[0].delete(key)
+        if len(self.tiers) > 1:
+            self._submit(key, lambda tier: tier.delete(key))
+
+    def clear(self) -> None:
+        """Clear all tiers."""
+        self.tiers[0].clear()
+        if len(self.tiers) > 1:
+            self._submit(None, lambda tier: tier.clear())
+
+    def flush(self) -> None:
+        """Block until all queued lower-tier operations have been applied."""
+        executor = self._executor
+        if executor is not None:
+            executor.submit(lambda: None).result()
+
+    def __contains__(self, key: str) -> bool:
+        """Check if a key exists in any tier and is not expired."""
+        return self.get(key) is not None
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with the statistics of each tier, the number of
+            queued lower-tier operations and the number of promotions.
+        """
+        with self._lock:
+            pending = self._pending
+            promotions = self._promotions
+        return {
+            "tiers": [
+                tier.stats() if hasattr(tier, "stats") else {} for tier in self.tiers
+            ],
+            "pending_writes": pending,
+            "promotions": promotions,
+            "spill_min_ttl": self.spill_min_ttl,
+        }
+
+    @staticmethod
+    def _get_entry(tier: CacheBackend, key: str) -> tuple[Any, float | None] | None:
+        """Look up a value and its expiry time in one tier."""
+        get_entry = getattr(tier, "get_entry", None)
+        if get_entry is not None:
+            return get_entry(key)  # type: ignore[no-any-return]
+        value = tier.get(key)
+        return None if value is None else (value, None)
+
+    def _promote(self, key: str, value: Any, expire_at: float | None, level: int) -> None:
+        """Copy a lower-tier hit into the tiers above it, keeping its expiry."""
+        ttl = None if expire_at is None else max(1, math.ceil(expire_at - time.time()))
+        for tier in self.tiers[:level]:
+            tier.set(key, value, ttl)
+        with self._lock:
+            self._promotions += 1
+        logger.debug(f"Cache promoted to L1: {key}")
+
+    def _submit(self, key: str | None, op: Callable[[CacheBackend], None]) -> None:
+        """
+        Apply an operation to the lower tiers, in the background if possible.
+
+        Args:
+            key: Affected key (None for operations on all keys).
+            op: Operation applied to each lower tier.
+        """
+        with self._lock:
+            asynchronous = self.write_behind and self._pending < self._max_pending
+            if asynchronous:
+                self._pending += 1
+                if key is None:
+                    self._clearing += 1
+                else:
+                    self._dirty[key] = self._dirty.get(key, 0) + 1
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="finvista-cache-write"
+                    )
+                executor = self._executor
+
+        if not asynchronous:
+            self._apply(op)
+            return
+
+        def run() -> None:
+            try:
+                self._apply(op)
+            finally:
+                with self._lock:
+                    self._pending -= 1
+                    if key is None:
+                        self._clearing -= 1
+                    else:
+                        remaining = self._dirty.pop(key, 1) - 1
+                        if remaining:
+                            self._dirty[key] = remaining
+
+        executor.submit(run)
+
+    def _apply(self, op: Callable[[CacheBackend], None]) -> None:
+        """Apply an operation to each lower tier, logging failures."""
+        for tier in self.tiers[1:]:
+            try:
+                op(tier)
+            except Exception as e:
+                logger.warning(f"Cache write-behind to {type(tier).__name__} failed: {e}")
@@ -0,0 +1,182 @@
+"""
+Market-session-aware cache TTLs for FinVista.
+
+Fixed TTLs such as ``@cached(ttl=60)`` ignore the trading calendar:
+daily bars fetched after the close cannot change until the next open,
+yet they are refetched every minute overnight and all weekend. The
+``SessionTTL`` policy in this module computes the TTL from the trading
+sessions of a market instead.
+
+Example:
+    >>> from finvista._fetchers.cache import cached
+    >>> from finvista._fetchers.ttl import SessionTTL
+    >>> @cached(ttl=SessionTTL("cn"))
+    ... def get_daily(symbol: str) -> pd.DataFrame:
+    ...     return fetch_from_api(symbol)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from finvista._core.exceptions import ConfigError
+
+
+@dataclass(frozen=True)
+class MarketSessions:
+    """
+    Regular trading sessions of a market.
+
+    Exchange holidays are not modelled; on a holiday the TTL expires at
+    the (skipped) opening time and is simply recomputed, which costs one
+    extra fetch but never serves outdated data.
+
+    Attributes:
+        timezone: IANA timezone name of the exchange.
+        sessions: Trading sessions as (open, close) local times.
+        weekdays: Trading weekdays (Monday=0).
+    """
+
+    timezone: str
+    sessions: tuple[tuple[time, time], ...]
+    weekdays: tuple[int, ...] = (0, 1, 2, 3, 4)
+
+    def is_open(self, now: datetime, close_delay: float = 0.0) -> bool:
+        """
+        Check whether the market is in a trading session.
+
+        Args:
+            now: Timezone-aware current time.
+            close_delay: Seconds after each close still treated as open,
+                to allow late corrections of the final bars.
+
+        Returns:
+            True if ``now`` falls inside a session.
+        """
+        local = now.astimezone(ZoneInfo(self.timezone))
+        if local.weekday() not in self.weekdays:
+            return False
+        for start, end in self.sessions:
+            open_at = datetime.combine(local.date(), start, local.tzinfo)
+            close_at = datetime.combine(local.date(), end, local.tzinfo)
+            if open_at <= local < close_at + timedelta(seconds=close_delay):
+                return True
+        return False
+
+    def next_open(self, now: datetime) -> datetime:
+        """
+        Get the start of the next trading session.
+
+        Args:
+            now: Timezone-aware current time.
+
+        Returns:
+            Timezone-aware datetime of the next session start.
+        """
+        tz = ZoneInfo(self.timezone)
+        local = now.astimezone(tz)
+        for offset in range(8):
+            day = local.date() + timedelta(days=offset)
+            if day.weekday() not in self.weekdays:
+                continue
+            for start, _ in self.sessions:
+                open_at = datetime.combine(day, start, tz)
+                if open_at > local:
+                    return open_at
+        raise ConfigError(f"Market {self.timezone} has no trading sessions")
+
+
+# Regular trading sessions by market code
+MARKET_SESSIONS: dict[str, MarketSessions] = {
+    "cn": MarketSessions(
+        timezone="Asia/Shanghai",
+        sessions=((time(9, 30), time(11, 30)), (time(13, 0), time(15, 0))),
+    ),
+    "hk": MarketSessions(
+        timezone="Asia/Hong_Kong",
+        sessions=((time(9, 30), time(12, 0)), (time(13, 0), time(16, 0))),
+    ),
+    "us": MarketSessions(
+        timezone="America/New_York",
+        sessions=((time(9, 30), time(16, 0)),),
+    ),
+}
+
+
+class SessionTTL:
+    """
+    TTL policy that expires cached data at the next session boundary.
+
+    While the market is trading (or within ``close_delay`` of a close)
+    the short ``intraday_ttl`` is used. Otherwise the data cannot change
+    before the next session opens, so it is cached until then. Instances
+    are callables returning the TTL in seconds and can be passed as the
+    ``ttl`` of the ``cached`` decorator.
+
+    Attributes:
+        market: Market code ('cn', 'hk' or 'us').
+        intraday_ttl: TTL in seconds while the market is trading.
+        close_delay: Seconds after a close during which data may still
+            be corrected and ``intraday_ttl`` applies.
+        max_ttl: Optional upper bound on the TTL in seconds.
+
+    Example:
+        >>> ttl = SessionTTL("cn", intraday_ttl=60)
+        >>> ttl()  # on a Saturday: seconds until Monday 09:30 CST
+    """
+
+    def __init__(
+        self,
+        market: str = "cn",
+        intraday_ttl: int = 60,
+        close_delay: int = 600,
+        max_ttl: int | None = None,
+    ) -> None:
+        """
+        Initialize the TTL policy.
+
+        Args:
+            market: Market code ('cn', 'hk' or 'us').
+            intraday_ttl: TTL in seconds while the market is trading.
+            close_delay: Seconds after a close still treated as trading.
+            max_ttl: Optional upper bound on the TTL in seconds.
+
+        Raises:
+            ConfigError: If the market is unknown.
+        """
+        if market not in MARKET_SESSIONS:
+            raise ConfigError(
+                f"Unknown market for SessionTTL: {market}. "
+                f"Must be one of {sorted(MARKET_SESSIONS)}"
+            )
+        self.market = market
+        self.intraday_ttl = intraday_ttl
+        self.close_delay = close_delay
+        self.max_ttl = max_ttl
+
+    def __call__(self, now: datetime | None = None) -> int:
+        """
+        Compute the TTL for data fetched at ``now``.
+
+        Args:
+            now: Timezone-aware time (defaults to the current time).
+
+        Returns:
+            TTL in seconds.
+        """
+        sessions = MARKET_SESSIONS[self.market]
+        now = now or datetime.now().astimezone()
+
+        if sessions.is_open(now, close_delay=self.close_delay):
+            ttl = self.intraday_ttl
+        else:
+            ttl = max(self.intraday_ttl, int((sessions.next_open(now) - now).total_seconds()))
+
+        if self.max_ttl is not None:
+            ttl = min(ttl, self.max_ttl)
+        return ttl
+
+    def __repr__(self) -> str:
+        return f"SessionTTL(market={self.market!r}, intraday_ttl={self.intraday_ttl})"
@@ -0,0 +1,58 @@
+"""
+Asyncio API for FinVista.
+
+Awaitable versions of the most used data functions, built on
+``httpx.AsyncClient``. Requests wait for rate limits with
+``asyncio.sleep`` and share pooled connections, so an asyncio service
+can fan out thousands of fetches without a thread per request.
+
+Caching, failover, circuit breakers, rate limits and source priority
+are shared with the sync API and configured the same way.
+
+Example:
+    >>> import asyncio
+    >>> from finvista import aio
+    >>>
+    >>> async def main():
+    ...     frames = await asyncio.gather(
+    ...         *(aio.get_cn_stock_daily(s, start_date="2024-01-01") for s in symbols),
+    ...         return_exceptions=True,
+    ...     )
+    ...     await aio.aclose()
+    ...     return frames
+    >>>
+    >>> frames = asyncio.run(main())
+"""
+
+from finvista._fetchers.async_http_client import async_http_client
+from finvista.aio.china import (
+    get_cn_fund_nav,
+    get_cn_index_daily,
+    get_cn_stock_daily,
+    get_cn_stock_quote,
+)
+from finvista.aio.us import get_us_stock_daily, get_us_stock_quote
+
+
+async def aclose() -> None:
+    """
+    Close the pooled HTTP connections of the async API.
+
+    Call this before the event loop shuts down, e.g. at the end of the
+    coroutine passed to ``asyncio.run``.
+    """
+    await async_http_client.aclose()
+
+
+__all__ = [
+    # China
+    "get_cn_stock_daily",
+    "get_cn_stock_quote",
+    "get_cn_index_daily",
+    "get_cn_fund_nav",
+    # US
+    "get_us_stock_daily",
+    "get_us_stock_quote",
+    # Lifecycle
+    "aclose",
+]
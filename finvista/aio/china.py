@@ -0,0 +1,290 @@
+"""
+Asyncio China market data functions.
+
+Awaitable versions of the most used China market functions. They take
+the same arguments, validate them the same way and return the same
+DataFrames as their counterparts in ``finvista.markets.china``.
+
+Example:
+    >>> import asyncio
+    >>> from finvista import aio
+    >>> async def main():
+    ...     return await asyncio.gather(
+    ...         *(aio.get_cn_stock_daily(s, start_date="2024-01-01") for s in symbols)
+    ...     )
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from finvista._core.exceptions import ValidationError
+from finvista._core.types import AdjustType, DateLike, FrameBackend
+from finvista._fetchers.adapters.registry import register_async_sources
+from finvista._fetchers.cache import acached
+from finvista._fetchers.frames import frame_output
+from finvista._fetchers.schema import apply_schema
+from finvista._fetchers.source_manager import async_source_manager
+from finvista._fetchers.ttl import SessionTTL
+from finvista.markets.china import fund as _fund
+from finvista.markets.china import index as _index
+from finvista.markets.china import stock as _stock
+
+
+@frame_output
+@acached(ttl=SessionTTL("cn"))
+async def get_cn_stock_daily(
+    symbol: str,
+    start_date: DateLike | None = None,
+    end_date: DateLike | None = None,
+    adjust: AdjustType = "none",
+    source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
+) -> pd.DataFrame:
+    """
+    Get daily historical data for a China A-share stock.
+
+    Async version of ``finvista.get_cn_stock_daily``.
+
+    Args:
+        symbol: Stock symbol (e.g., "000001" for Ping An Bank).
+        start_date: Start date (YYYY-MM-DD format or date object).
+        end_date: End date (YYYY-MM-DD format or date object).
+        adjust: Price adjustment type ("none", "qfq" or "hfq").
+        source: Specific data source to use. If None, uses automatic
+               failover between available sources.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
+
+    Returns:
+        DataFrame with daily OHLCV data.
+
+    Raises:
+        ValidationError: If the symbol or adjust type is invalid.
+        DateRangeError: If the date range is invalid.
+        AllSourcesFailedError: If all data sources fail.
+
+    Example:
+        >>> from finvista import aio
+        >>> df = await aio.get_cn_stock_daily("000001", start_date="2024-01-01")
+    """
+    symbol = _stock._validate_symbol(symbol)
+    start_date_str, end_date_str = _stock._validate_date_range(start_date, end_date)
+
+    if adjust not in ("none", "qfq", "hfq"):
+        raise ValidationError(
+            f"Invalid adjust type: {adjust}. Must be 'none', 'qfq', or 'hfq'.",
+            param_name="adjust",
+            param_value=adjust,
+        )
+
+    register_async_sources()
+
+    if source:
+        from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
+
+        adapters = {"eastmoney": eastmoney_adapter}
+        if source not in adapters:
+            raise ValidationError(f"Unknown source: {source}", param_name="source")
+
+        df = await adapters[source].afetch_stock_daily(
+            symbol=symbol,
+            start_date=start_date_str,
+            end_date=end_date_str,
+            adjust=adjust,
+        )
+        df = apply_schema(df, "cn_stock_daily")
+        df.attrs["source"] = source
+    else:
+        df, _ = await async_source_manager.fetch_with_fallback(
+            data_type="cn_stock_daily",
+            symbol=symbol,
+            start_date=start_date_str,
+            end_date=end_date_str,
+            adjust=adjust,
+        )
+
+    return df
+
+
+@frame_output
+@acached(ttl=10, stale_ttl=20)
+async def get_cn_stock_quote(
+    symbol: str | list[str],
+    source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
+) -> pd.DataFrame:
+    """
+    Get real-time quotes for China A-share stocks.
+
+    Async version of ``finvista.get_cn_stock_quote``.
+
+    Args:
+        symbol: Single symbol or list of symbols.
+        source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
+
+    Returns:
+        DataFrame with real-time quote data.
+
+    Example:
+        >>> from finvista import aio
+        >>> df = await aio.get_cn_stock_quote(["000001", "600519"])
+    """
+    if isinstance(symbol, str):
+        symbols = [_stock._validate_symbol(symbol)]
+    else:
+        symbols = [_stock._validate_symbol(s) for s in symbol]
+
+    register_async_sources()
+
+    if source:
+        from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
+
+        df = await eastmoney_adapter.afetch_stock_quote(symbols)
+        df = apply_schema(df, "cn_stock_quote")
+        df.attrs["source"] = source
+    else:
+        df, _ = await async_source_manager.fetch_with_fallback(
+            data_type="cn_stock_quote",
+            symbols=symbols,
+        )
+
+    return df
+
+
+@frame_output
+@acached(ttl=SessionTTL("cn"))
+async def get_cn_index_daily(
+    symbol: str,
+    start_date: DateLike | None = None,
+    end_date: DateLike | None = None,
+    source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
+) -> pd.DataFrame:
+    """
+    Get daily historical data for a China market index.
+
+    Async version of ``finvista.get_cn_index_daily``.
+
+    Args:
+        symbol: Index symbol (e.g., "000300" for CSI 300).
+        start_date: Start date (YYYY-MM-DD format or date object).
+        end_date: End date (YYYY-MM-DD format or date object).
+        source: Specific data source to use. If None, uses automatic
+               failover between available sources.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
+
+    Returns:
+        DataFrame with daily index data.
+
+    Raises:
+        ValidationError: If the symbol format is invalid.
+        DateRangeError: If the date range is invalid.
+        AllSourcesFailedError: If all data sources fail.
+
+    Example:
+        >>> from finvista import aio
+        >>> df = await aio.get_cn_index_daily("000300", start_date="2024-01-01")
+    """
+    symbol = _index._validate_index_symbol(symbol)
+    start_date_str, end_date_str = _index._validate_date_range(start_date, end_date)
+
+    register_async_sources()
+
+    if source:
+        from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
+
+        adapters = {"eastmoney": eastmoney_adapter}
+        if source not in adapters:
+            raise ValidationError(f"Unknown source: {source}", param_name="source")
+
+        df = await adapters[source].afetch_index_daily(
+            symbol=symbol,
+            start_date=start_date_str,
+            end_date=end_date_str,
+        )
+        df = apply_schema(df, "cn_index_daily")
+        df.attrs["source"] = source
+    else:
+        df, _ = await async_source_manager.fetch_with_fallback(
+            data_type="cn_index_daily",
+            symbol=symbol,
+            start_date=start_date_str,
+            end_date=end_date_str,
+        )
+
+    return df
+
+
+@frame_output
+@acached(ttl=60)
+async def get_cn_fund_nav(
+    symbol: str,
+    start_date: DateLike | None = None,
+    end_date: DateLike | None = None,
+    source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
+) -> pd.DataFrame:
+    """
+    Get NAV (net asset value) history for a China fund.
+
+    Async version of ``finvista.get_cn_fund_nav``.
+
+    Args:
+        symbol: Fund symbol (e.g., "110011").
+        start_date: Start date (YYYY-MM-DD format or date object).
+        end_date: End date (YYYY-MM-DD format or date object).
+        source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
+
+    Returns:
+        DataFrame with columns: date, nav, acc_nav, daily_return.
+
+    Raises:
+        ValidationError: If the symbol format is invalid.
+        AllSourcesFailedError: If all data sources fail.
+
+    Example:
+        >>> from finvista import aio
+        >>> df = await aio.get_cn_fund_nav("110011", start_date="2024-01-01")
+    """
+    symbol = _fund._validate_fund_symbol(symbol)
+    start_date_str, end_date_str = _fund._validate_date_range(start_date, end_date)
+
+    register_async_sources()
+
+    if source:
+        from finvista._fetchers.adapters.tiantian import tiantian_adapter
+
+        adapters = {"tiantian": tiantian_adapter}
+        if source not in adapters:
+            raise ValidationError(f"Unknown source: {source}", param_name="source")
+
+        df = await adapters[source].afetch_fund_nav(
+            symbol=symbol,
+            start_date=start_date_str,
+            end_date=end_date_str,
+        )
+        df = apply_schema(df, "cn_fund_nav")
+        df.attrs["source"] = source
+    else:
+        df, _ = await async_source_manager.fetch_with_fallback(
+            data_type="cn_fund_nav",
+            symbol=symbol,
+            start_date=start_date_str,
+            end_date=end_date_str,
+        )
+
+    return df
@@ -0,0 +1,140 @@
+"""
+Asyncio US market data functions.
+
+Awaitable versions of the US stock functions in ``finvista.markets.us``,
+with the same arguments, validation and results.
+
+Example:
+    >>> from finvista import aio
+    >>> df = await aio.get_us_stock_daily("AAPL", start_date="2024-01-01")
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from finvista._core.exceptions import ValidationError
+from finvista._core.types import DateLike, FrameBackend
+from finvista._fetchers.adapters.registry import register_async_sources
+from finvista._fetchers.cache import acached
+from finvista._fetchers.frames import frame_output
+from finvista._fetchers.schema import apply_schema
+from finvista._fetchers.source_manager import async_source_manager
+from finvista._fetchers.ttl import SessionTTL
+from finvista.markets.us import stock as _stock
+
+
+@frame_output
+@acached(ttl=SessionTTL("us"))
+async def get_us_stock_daily(
+    symbol: str,
+    start_date: DateLike | None = None,
+    end_date: DateLike | None = None,
+    source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
+) -> pd.DataFrame:
+    """
+    Get daily historical data for a US stock.
+
+    Async version of ``finvista.get_us_stock_daily``.
+
+    Args:
+        symbol: Stock symbol (e.g., "AAPL", "MSFT", "GOOGL").
+        start_date: Start date (YYYY-MM-DD format or date object).
+        end_date: End date (YYYY-MM-DD format or date object).
+        source: Specific data source to use. If None, uses automatic
+               failover between available sources.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
+
+    Returns:
+        DataFrame with daily OHLCV data and adjusted close.
+
+    Raises:
+        ValidationError: If the symbol format is invalid.
+        DateRangeError: If the date range is invalid.
+        AllSourcesFailedError: If all data sources fail.
+
+    Example:
+        >>> from finvista import aio
+        >>> df = await aio.get_us_stock_daily("AAPL", start_date="2024-01-01")
+    """
+    symbol = _stock._validate_symbol(symbol)
+    start_date_str, end_date_str = _stock._validate_date_range(start_date, end_date)
+
+    register_async_sources()
+
+    if source:
+        from finvista._fetchers.adapters.yahoo import yahoo_adapter
+
+        adapters = {"yahoo": yahoo_adapter}
+        if source not in adapters:
+            raise ValidationError(f"Unknown source: {source}", param_name="source")
+
+        df = await adapters[source].afetch_stock_daily(
+            symbol=symbol,
+            start_date=start_date_str,
+            end_date=end_date_str,
+        )
+        df = apply_schema(df, "us_stock_daily")
+        df.attrs["source"] = source
+    else:
+        df, _ = await async_source_manager.fetch_with_fallback(
+            data_type="us_stock_daily",
+            symbol=symbol,
+            start_date=start_date_str,
+            end_date=end_date_str,
+        )
+
+    return df
+
+
+@frame_output
+@acached(ttl=10)
+async def get_us_stock_quote(
+    symbol: str | list[str],
+    source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
+) -> pd.DataFrame:
+    """
+    Get real-time quotes for US stocks.
+
+    Async version of ``finvista.get_us_stock_quote``.
+
+    Args:
+        symbol: Single symbol or list of symbols.
+        source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
+
+    Returns:
+        DataFrame with real-time quote data.
+
+    Example:
+        >>> from finvista import aio
+        >>> df = await aio.get_us_stock_quote(["AAPL", "MSFT"])
+    """
+    if isinstance(symbol, str):
+        symbols = [_stock._validate_symbol(symbol)]
+    else:
+        symbols = [_stock._validate_symbol(s) for s in symbol]
+
+    register_async_sources()
+
+    if source:
+        from finvista._fetchers.adapters.yahoo import yahoo_adapter
+
+        df = await yahoo_adapter.afetch_stock_quote(symbols)
+        df = apply_schema(df, "us_stock_quote")
+        df.attrs["source"] = source
+    else:
+        df, _ = await async_source_manager.fetch_with_fallback(
+            data_type="us_stock_quote",
+            symbols=symbols,
+        )
+
+    return df
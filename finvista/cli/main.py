@@ -6,6 +6,8 @@ Usage:
     finvista history <symbol> [--start=<date>] [--end=<date>] [--format=<fmt>]
     finvista search <keyword> [--market=<market>]
     finvista health
+    finvista cache warm --output=<path> [--symbols=<symbols>...]
+    finvista cache info <path>
     finvista version
 
 Examples:
@@ -14,6 +16,7 @@ Examples:
     finvista history 000001 --start 2024-01-01 --format csv
     finvista search 银行
     finvista health
+    finvista cache warm -o cache.snap --symbols 000001 600519
 """
 
 from __future__ import annotations
@@ -120,6 +123,54 @@ def create_parser() -> argparse.ArgumentParser:
         help="Show data source health status",
     )
 
+    # Cache command
+    cache_parser = subparsers.add_parser(
+        "cache",
+        help="Warm up and inspect cache snapshots",
+    )
+    cache_subparsers = cache_parser.add_subparsers(dest="cache_command")
+    warm_parser = cache_subparsers.add_parser(
+        "warm",
+        help="Fill the cache from the default warm set and save a snapshot",
+    )
+    warm_parser.add_argument(
+        "--output", "-o",
+        required=True,
+        help="Snapshot file path",
+    )
+    warm_parser.add_argument(
+        "--symbols", "-s",
+        nargs="*",
+        default=[],
+        help="Stock symbols whose daily history to load",
+    )
+    warm_parser.add_argument(
+        "--indices", "-i",
+        nargs="*",
+        default=["000300", "000905"],
+        help="Index symbols whose constituents to load",
+    )
+    warm_parser.add_argument(
+        "--days", "-d",
+        type=int,
+        default=365,
+        help="Days of daily history to load per symbol",
+    )
+    warm_parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=4,
+        help="Maximum number of concurrent requests",
+    )
+    info_parser = cache_subparsers.add_parser(
+        "info",
+        help="Show the contents of a snapshot",
+    )
+    info_parser.add_argument(
+        "path",
+        help="Snapshot file path",
+    )
+
     # Macro command
     macro_parser = subparsers.add_parser(
         "macro",
@@ -251,6 +302,51 @@ def cmd_health(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_cache(args: argparse.Namespace) -> int:
+    """Handle the cache command."""
+    import time
+
+    import finvista as fv
+    from finvista._fetchers.cache import estimate_size
+    from finvista._fetchers.snapshot import read_cache_snapshot
+
+    try:
+        if args.cache_command == "warm":
+            result = fv.warm_cache(
+                fv.default_warm_set(
+                    symbols=args.symbols,
+                    indices=args.indices,
+                    history_days=args.days,
+                ),
+                max_workers=args.workers,
+            )
+            saved = fv.save_cache_snapshot(args.output)
+            print(
+                f"Warm-up: {result['succeeded']} succeeded, {result['failed']} failed. "
+                f"Saved {saved} entries to {args.output}"
+            )
+            return 0 if result["failed"] == 0 else 1
+
+        if args.cache_command == "info":
+            payload = read_cache_snapshot(args.path)
+            entries = payload["entries"]
+            now = time.time()
+            expired = sum(1 for _, _, expire_at in entries if expire_at and expire_at <= now)
+            size = sum(estimate_size(value) for _, value, _ in entries)
+            created = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(payload["created"]))
+            print(f"Snapshot: {args.path}")
+            print(f"Created:  {created}")
+            print(f"Entries:  {len(entries)} ({expired} expired)")
+            print(f"Size:     {size / 1024**2:.1f} MB (in memory)")
+            return 0
+
+        print("Usage: finvista cache {warm,info} ...", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
 def cmd_macro(args: argparse.Namespace) -> int:
     """Handle the macro command."""
     import finvista as fv
@@ -303,6 +399,8 @@ def main(argv: list[str] | None = None) -> int:
         return cmd_search(args)
     elif args.command == "health":
         return cmd_health(args)
+    elif args.command == "cache":
+        return cmd_cache(args)
     elif args.command == "macro":
         return cmd_macro(args)
     else:
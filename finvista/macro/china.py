@@ -18,8 +18,11 @@ from typing import Any, Literal
 import pandas as pd
 
 from finvista._core.exceptions import DataNotFoundError
+from finvista._core.types import FrameBackend
 from finvista._fetchers.adapters.base import BaseAdapter
 from finvista._fetchers.cache import cached
+from finvista._fetchers.frames import frame_output
+from finvista._fetchers.schema import apply_schema
 
 logger = logging.getLogger(__name__)
 
@@ -78,19 +81,19 @@ class ChinaMacroAdapter(BaseAdapter):
         if not data.get("result") or not data["result"].get("data"):
             raise DataNotFoundError("No GDP data found")
 
-        records = []
-        for item in data["result"]["data"]:
-            records.append({
-                "date": item.get("REPORT_DATE", "")[:10],
-                "gdp": item.get("GDP"),  # GDP in billions
-                "gdp_yoy": item.get("GDP_SAME"),  # YoY growth %
-                "primary_industry": item.get("FIRST_INDUSTRY"),
-                "secondary_industry": item.get("SECOND_INDUSTRY"),
-                "tertiary_industry": item.get("THIRD_INDUSTRY"),
-            })
-
-        df = pd.DataFrame(records)
-        df["date"] = pd.to_datetime(df["date"]).dt.date
+        columns = {
+            "date": "REPORT_DATE",
+            "gdp": "GDP",  # GDP in billions
+            "gdp_yoy": "GDP_SAME",  # YoY growth %
+            "primary_industry": "FIRST_INDUSTRY",
+            "secondary_industry": "SECOND_INDUSTRY",
+            "tertiary_industry": "THIRD_INDUSTRY",
+        }
+        df = self._build_frame(
+            data["result"]["data"],
+            columns,
+            dtypes=dict.fromkeys(columns, "float64") | {"date": "date"},
+        )
 
         return df.sort_values("date").reset_index(drop=True)
 
@@ -121,20 +124,20 @@ class ChinaMacroAdapter(BaseAdapter):
         if not data.get("result") or not data["result"].get("data"):
             raise DataNotFoundError("No CPI data found")
 
-        records = []
-        for item in data["result"]["data"]:
-            records.append({
-                "date": item.get("REPORT_DATE", "")[:10],
-                "cpi": item.get("NATIONAL_SAME"),  # YoY %
-                "cpi_mom": item.get("NATIONAL_BASE"),  # MoM %
-                "cpi_urban": item.get("CITY_SAME"),
-                "cpi_rural": item.get("RURAL_SAME"),
-                "food": item.get("FOOD_SAME"),
-                "non_food": item.get("NOT_FOOD_SAME"),
-            })
-
-        df = pd.DataFrame(records)
-        df["date"] = pd.to_datetime(df["date"]).dt.date
+        columns = {
+            "date": "REPORT_DATE",
+            "cpi": "NATIONAL_SAME",  # YoY %
+            "cpi_mom": "NATIONAL_BASE",  # MoM %
+            "cpi_urban": "CITY_SAME",
+            "cpi_rural": "RURAL_SAME",
+            "food": "FOOD_SAME",
+            "non_food": "NOT_FOOD_SAME",
+        }
+        df = self._build_frame(
+            data["result"]["data"],
+            columns,
+            dtypes=dict.fromkeys(columns, "float64") | {"date": "date"},
+        )
 
         return df.sort_values("date").reset_index(drop=True)
 
@@ -165,19 +168,19 @@ class ChinaMacroAdapter(BaseAdapter):
         if not data.get("result") or not data["result"].get("data"):
             raise DataNotFoundError("No PPI data found")
 
-        records = []
-        for item in data["result"]["data"]:
-            records.append({
-                "date": item.get("REPORT_DATE", "")[:10],
-                "ppi": item.get("BASE"),  # YoY %
-                "ppi_mom": item.get("BASE_SAME"),  # MoM %
-                "mining": item.get("CYJY_BASE"),
-                "raw_materials": item.get("YLGY_BASE"),
-                "processing": item.get("JGGY_BASE"),
-            })
-
-        df = pd.DataFrame(records)
-        df["date"] = pd.to_datetime(df["date"]).dt.date
+        columns = {
+            "date": "REPORT_DATE",
+            "ppi": "BASE",  # YoY %
+            "ppi_mom": "BASE_SAME",  # MoM %
+            "mining": "CYJY_BASE",
+            "raw_materials": "YLGY_BASE",
+            "processing": "JGGY_BASE",
+        }
+        df = self._build_frame(
+            data["result"]["data"],
+            columns,
+            dtypes=dict.fromkeys(columns, "float64") | {"date": "date"},
+        )
 
         return df.sort_values("date").reset_index(drop=True)
 
@@ -208,17 +211,17 @@ class ChinaMacroAdapter(BaseAdapter):
         if not data.get("result") or not data["result"].get("data"):
             raise DataNotFoundError("No PMI data found")
 
-        records = []
-        for item in data["result"]["data"]:
-            records.append({
-                "date": item.get("REPORT_DATE", "")[:10],
-                "pmi_manufacturing": item.get("MAKE_INDEX"),
-                "pmi_non_manufacturing": item.get("NMAKE_INDEX"),
-                "pmi_composite": item.get("COMPOSITE_INDEX"),
-            })
-
-        df = pd.DataFrame(records)
-        df["date"] = pd.to_datetime(df["date"]).dt.date
+        columns = {
+            "date": "REPORT_DATE",
+            "pmi_manufacturing": "MAKE_INDEX",
+            "pmi_non_manufacturing": "NMAKE_INDEX",
+            "pmi_composite": "COMPOSITE_INDEX",
+        }
+        df = self._build_frame(
+            data["result"]["data"],
+            columns,
+            dtypes=dict.fromkeys(columns, "float64") | {"date": "date"},
+        )
 
         return df.sort_values("date").reset_index(drop=True)
 
@@ -249,20 +252,20 @@ class ChinaMacroAdapter(BaseAdapter):
         if not data.get("result") or not data["result"].get("data"):
             raise DataNotFoundError("No money supply data found")
 
-        records = []
-        for item in data["result"]["data"]:
-            records.append({
-                "date": item.get("REPORT_DATE", "")[:10],
-                "m0": item.get("BASIC_CURRENCY"),  # M0 in billions
-                "m0_yoy": item.get("BASIC_CURRENCY_SAME"),  # YoY %
-                "m1": item.get("CURRENCY"),  # M1 in billions
-                "m1_yoy": item.get("CURRENCY_SAME"),  # YoY %
-                "m2": item.get("CURRENCY_QUASI"),  # M2 in billions
-                "m2_yoy": item.get("CURRENCY_QUASI_SAME"),  # YoY %
-            })
-
-        df = pd.DataFrame(records)
-        df["date"] = pd.to_datetime(df["date"]).dt.date
+        columns = {
+            "date": "REPORT_DATE",
+            "m0": "BASIC_CURRENCY",  # M0 in billions
+            "m0_yoy": "BASIC_CURRENCY_SAME",  # YoY %
+            "m1": "CURRENCY",  # M1 in billions
+            "m1_yoy": "CURRENCY_SAME",  # YoY %
+            "m2": "CURRENCY_QUASI",  # M2 in billions
+            "m2_yoy": "CURRENCY_QUASI_SAME",  # YoY %
+        }
+        df = self._build_frame(
+            data["result"]["data"],
+            columns,
+            dtypes=dict.fromkeys(columns, "float64") | {"date": "date"},
+        )
 
         return df.sort_values("date").reset_index(drop=True)
 
@@ -293,21 +296,21 @@ class ChinaMacroAdapter(BaseAdapter):
         if not data.get("result") or not data["result"].get("data"):
             raise DataNotFoundError("No social financing data found")
 
-        records = []
-        for item in data["result"]["data"]:
-            records.append({
-                "date": item.get("REPORT_DATE", "")[:10],
-                "total": item.get("TOTAL_FINANCE"),  # Total in billions
-                "total_yoy": item.get("TOTAL_FINANCE_SAME"),  # YoY growth
-                "rmb_loans": item.get("RMB_LOAN"),
-                "foreign_currency_loans": item.get("FOREIGN_LOAN"),
-                "trust_loans": item.get("TRUST_LOAN"),
-                "corporate_bonds": item.get("ENTERPRISE_BINDTO"),
-                "equity_financing": item.get("CAPITAL_MARKET"),
-            })
-
-        df = pd.DataFrame(records)
-        df["date"] = pd.to_datetime(df["date"]).dt.date
+        columns = {
+            "date": "REPORT_DATE",
+            "total": "TOTAL_FINANCE",  # Total in billions
+            "total_yoy": "TOTAL_FINANCE_SAME",  # YoY growth
+            "rmb_loans": "RMB_LOAN",
+            "foreign_currency_loans": "FOREIGN_LOAN",
+            "trust_loans": "TRUST_LOAN",
+            "corporate_bonds": "ENTERPRISE_BINDTO",
+            "equity_financing": "CAPITAL_MARKET",
+        }
+        df = self._build_frame(
+            data["result"]["data"],
+            columns,
+            dtypes=dict.fromkeys(columns, "float64") | {"date": "date"},
+        )
 
         return df.sort_values("date").reset_index(drop=True)
 
@@ -321,15 +324,21 @@ china_macro_adapter = ChinaMacroAdapter()
 # =============================================================================
 
 
+@frame_output
 @cached(ttl=3600)
 def get_cn_macro_gdp(
     frequency: Literal["quarterly", "annual"] = "quarterly",
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get China GDP (Gross Domestic Product) data.
 
     Args:
         frequency: Data frequency ('quarterly' or 'annual').
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -345,14 +354,20 @@ def get_cn_macro_gdp(
         >>> df = fv.get_cn_macro_gdp()
         >>> print(df.tail())
     """
-    return china_macro_adapter.fetch_gdp(frequency=frequency)
+    return apply_schema(china_macro_adapter.fetch_gdp(frequency=frequency), "cn_macro_gdp")
 
 
+@frame_output
 @cached(ttl=3600)
-def get_cn_macro_cpi() -> pd.DataFrame:
+def get_cn_macro_cpi(*, output: FrameBackend | None = None) -> pd.DataFrame:
     """
     Get China CPI (Consumer Price Index) data.
 
+    Args:
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
+
     Returns:
         DataFrame with columns:
         - date: Report date
@@ -368,14 +383,20 @@ def get_cn_macro_cpi() -> pd.DataFrame:
         >>> df = fv.get_cn_macro_cpi()
         >>> print(df.tail())
     """
-    return china_macro_adapter.fetch_cpi()
+    return apply_schema(china_macro_adapter.fetch_cpi(), "cn_macro_cpi")
 
 
+@frame_output
 @cached(ttl=3600)
-def get_cn_macro_ppi() -> pd.DataFrame:
+def get_cn_macro_ppi(*, output: FrameBackend | None = None) -> pd.DataFrame:
     """
     Get China PPI (Producer Price Index) data.
 
+    Args:
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
+
     Returns:
         DataFrame with columns:
         - date: Report date
@@ -390,14 +411,20 @@ def get_cn_macro_ppi() -> pd.DataFrame:
         >>> df = fv.get_cn_macro_ppi()
         >>> print(df.tail())
     """
-    return china_macro_adapter.fetch_ppi()
+    return apply_schema(china_macro_adapter.fetch_ppi(), "cn_macro_ppi")
 
 
+@frame_output
 @cached(ttl=3600)
-def get_cn_macro_pmi() -> pd.DataFrame:
+def get_cn_macro_pmi(*, output: FrameBackend | None = None) -> pd.DataFrame:
     """
     Get China PMI (Purchasing Managers' Index) data.
 
+    Args:
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
+
     Returns:
         DataFrame with columns:
         - date: Report date
@@ -410,14 +437,20 @@ def get_cn_macro_pmi() -> pd.DataFrame:
         >>> df = fv.get_cn_macro_pmi()
         >>> print(df.tail())
     """
-    return china_macro_adapter.fetch_pmi()
+    return apply_schema(china_macro_adapter.fetch_pmi(), "cn_macro_pmi")
 
 
+@frame_output
 @cached(ttl=3600)
-def get_cn_macro_money_supply() -> pd.DataFrame:
+def get_cn_macro_money_supply(*, output: FrameBackend | None = None) -> pd.DataFrame:
     """
     Get China money supply (M0, M1, M2) data.
 
+    Args:
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
+
     Returns:
         DataFrame with columns:
         - date: Report date
@@ -433,14 +466,23 @@ def get_cn_macro_money_supply() -> pd.DataFrame:
         >>> df = fv.get_cn_macro_money_supply()
         >>> print(df.tail())
     """
-    return china_macro_adapter.fetch_money_supply()
+    return apply_schema(china_macro_adapter.fetch_money_supply(), "cn_macro_money_supply")
 
 
+@frame_output
 @cached(ttl=3600)
-def get_cn_macro_social_financing() -> pd.DataFrame:
+def get_cn_macro_social_financing(
+    *,
+    output: FrameBackend | None = None,
+) -> pd.DataFrame:
     """
     Get China social financing (社会融资规模) data.
 
+    Args:
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
+
     Returns:
         DataFrame with columns:
         - date: Report date
@@ -457,4 +499,4 @@ def get_cn_macro_social_financing() -> pd.DataFrame:
         >>> df = fv.get_cn_macro_social_financing()
         >>> print(df.tail())
     """
-    return china_macro_adapter.fetch_social_financing()
+    return apply_schema(china_macro_adapter.fetch_social_financing(), "cn_macro_social_financing")
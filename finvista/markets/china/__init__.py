@@ -31,6 +31,7 @@ from finvista.markets.china.financial import (
 from finvista.markets.china.fund import (
     get_cn_fund_info,
     get_cn_fund_nav,
+    get_cn_fund_nav_batch,
     get_cn_fund_quote,
     list_cn_fund_symbols,
     search_cn_fund,
@@ -43,6 +44,7 @@ from finvista.markets.china.futures import (
 from finvista.markets.china.index import (
     get_cn_index_constituents,
     get_cn_index_daily,
+    get_cn_index_daily_batch,
     get_cn_index_quote,
     get_cn_index_weights,
     list_cn_major_indices,
@@ -76,7 +78,9 @@ from finvista.markets.china.shareholder import (
     get_cn_top_shareholders,
 )
 from finvista.markets.china.stock import (
+    get_cn_market_snapshot,
     get_cn_stock_daily,
+    get_cn_stock_daily_batch,
     get_cn_stock_quote,
     list_cn_stock_symbols,
     search_cn_stock,
@@ -90,17 +94,21 @@ from finvista.markets.china.valuation import (
 __all__ = [
     # Stock
     "get_cn_stock_daily",
+    "get_cn_stock_daily_batch",
     "get_cn_stock_quote",
+    "get_cn_market_snapshot",
     "list_cn_stock_symbols",
     "search_cn_stock",
     # Index
     "get_cn_index_daily",
+    "get_cn_index_daily_batch",
     "get_cn_index_quote",
     "list_cn_major_indices",
     "get_cn_index_constituents",
     "get_cn_index_weights",
     # Fund
     "get_cn_fund_nav",
+    "get_cn_fund_nav_batch",
     "get_cn_fund_quote",
     "list_cn_fund_symbols",
     "search_cn_fund",
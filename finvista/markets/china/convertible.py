@@ -17,20 +17,28 @@ from typing import Any
 import pandas as pd
 
 from finvista._core.exceptions import ValidationError
-from finvista._core.types import DateLike
+from finvista._core.types import DateLike, FrameBackend
 from finvista._fetchers.cache import cached
+from finvista._fetchers.frames import frame_output
+from finvista._fetchers.schema import apply_schema
 from finvista._fetchers.source_manager import source_manager
 
 
+@frame_output
 @cached(ttl=300)
 def list_cn_convertible_symbols(
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get list of all convertible bonds.
 
     Args:
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -58,6 +66,7 @@ def list_cn_convertible_symbols(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_convertible_list()
+        df = apply_schema(df, "cn_convertible_list")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -67,12 +76,15 @@ def list_cn_convertible_symbols(
     return df
 
 
+@frame_output
 @cached(ttl=60)
 def get_cn_convertible_daily(
     symbol: str,
     start_date: DateLike | None = None,
     end_date: DateLike | None = None,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get daily convertible bond data.
@@ -82,6 +94,9 @@ def get_cn_convertible_daily(
         start_date: Start date (YYYY-MM-DD format or date object).
         end_date: End date (YYYY-MM-DD format or date object).
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -113,6 +128,7 @@ def get_cn_convertible_daily(
             start_date=start_date,
             end_date=end_date,
         )
+        df = apply_schema(df, "cn_convertible_daily")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -15,7 +15,10 @@ from __future__ import annotations
 import pandas as pd
 
 from finvista._core.exceptions import ValidationError
+from finvista._core.types import FrameBackend
 from finvista._fetchers.cache import cached
+from finvista._fetchers.frames import frame_output
+from finvista._fetchers.schema import apply_schema
 from finvista._fetchers.source_manager import source_manager
 
 
@@ -39,11 +42,14 @@ def _validate_symbol(symbol: str) -> str:
     return symbol
 
 
+@frame_output
 @cached(ttl=300)
 def get_cn_etf_share_change(
     symbol: str,
     days: int = 30,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get ETF share change data.
@@ -52,6 +58,9 @@ def get_cn_etf_share_change(
         symbol: ETF symbol (e.g., "510050" for 50ETF).
         days: Number of days of data.
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -76,6 +85,7 @@ def get_cn_etf_share_change(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_etf_share_change(symbol=symbol, days=days)
+        df = apply_schema(df, "cn_etf_share_change")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -87,10 +97,13 @@ def get_cn_etf_share_change(
     return df
 
 
+@frame_output
 @cached(ttl=300)
 def get_cn_etf_premium_discount(
     symbol: str,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get ETF premium/discount data.
@@ -98,6 +111,9 @@ def get_cn_etf_premium_discount(
     Args:
         symbol: ETF symbol (e.g., "510050" for 50ETF).
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -122,6 +138,7 @@ def get_cn_etf_premium_discount(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_etf_premium_discount(symbol=symbol)
+        df = apply_schema(df, "cn_etf_premium_discount")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
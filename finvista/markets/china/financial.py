@@ -19,8 +19,10 @@ from typing import Literal
 import pandas as pd
 
 from finvista._core.exceptions import ValidationError
-from finvista._core.types import DateLike
+from finvista._core.types import DateLike, FrameBackend
 from finvista._fetchers.cache import cached
+from finvista._fetchers.frames import frame_output
+from finvista._fetchers.schema import apply_schema
 from finvista._fetchers.source_manager import source_manager
 
 
@@ -44,11 +46,14 @@ def _validate_symbol(symbol: str) -> str:
     return symbol
 
 
+@frame_output
 @cached(ttl=3600)
 def get_cn_income_statement(
     symbol: str,
     period: Literal["yearly", "quarterly"] = "yearly",
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get income statement data for a China A-share stock.
@@ -57,6 +62,9 @@ def get_cn_income_statement(
         symbol: Stock symbol (e.g., "000001" for Ping An Bank).
         period: Report period ('yearly' or 'quarterly').
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -85,6 +93,7 @@ def get_cn_income_statement(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_income_statement(symbol=symbol, period=period)
+        df = apply_schema(df, "cn_income_statement")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -96,11 +105,14 @@ def get_cn_income_statement(
     return df
 
 
+@frame_output
 @cached(ttl=3600)
 def get_cn_balance_sheet(
     symbol: str,
     period: Literal["yearly", "quarterly"] = "yearly",
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get balance sheet data for a China A-share stock.
@@ -109,6 +121,9 @@ def get_cn_balance_sheet(
         symbol: Stock symbol (e.g., "000001" for Ping An Bank).
         period: Report period ('yearly' or 'quarterly').
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -140,6 +155,7 @@ def get_cn_balance_sheet(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_balance_sheet(symbol=symbol, period=period)
+        df = apply_schema(df, "cn_balance_sheet")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -151,11 +167,14 @@ def get_cn_balance_sheet(
     return df
 
 
+@frame_output
 @cached(ttl=3600)
 def get_cn_cash_flow(
     symbol: str,
     period: Literal["yearly", "quarterly"] = "yearly",
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get cash flow statement data for a China A-share stock.
@@ -164,6 +183,9 @@ def get_cn_cash_flow(
         symbol: Stock symbol (e.g., "000001" for Ping An Bank).
         period: Report period ('yearly' or 'quarterly').
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -189,6 +211,7 @@ def get_cn_cash_flow(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_cash_flow(symbol=symbol, period=period)
+        df = apply_schema(df, "cn_cash_flow")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -200,10 +223,13 @@ def get_cn_cash_flow(
     return df
 
 
+@frame_output
 @cached(ttl=300)
 def get_cn_performance_forecast(
     date: DateLike | None = None,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get performance forecast data for China A-share stocks.
@@ -211,6 +237,9 @@ def get_cn_performance_forecast(
     Args:
         date: Date to filter (YYYY-MM-DD). If None, returns latest forecasts.
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -245,6 +274,7 @@ def get_cn_performance_forecast(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_performance_forecast(date=date_str)
+        df = apply_schema(df, "cn_performance_forecast")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -255,10 +285,13 @@ def get_cn_performance_forecast(
     return df
 
 
+@frame_output
 @cached(ttl=3600)
 def get_cn_dividend_history(
     symbol: str,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get dividend history for a China A-share stock.
@@ -266,6 +299,9 @@ def get_cn_dividend_history(
     Args:
         symbol: Stock symbol (e.g., "000001" for Ping An Bank).
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -293,6 +329,7 @@ def get_cn_dividend_history(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_dividend_history(symbol=symbol)
+        df = apply_schema(df, "cn_dividend_history")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -12,14 +12,25 @@ Example:
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import date, datetime
 from typing import Any, Literal
 
 import pandas as pd
 
 from finvista._core.exceptions import ValidationError
-from finvista._core.types import DateLike
+from finvista._core.types import DateLike, FrameBackend
+from finvista._fetchers.batch import (
+    DEFAULT_BATCH_WORKERS,
+    BatchOutput,
+    BatchResult,
+    fetch_batch,
+)
 from finvista._fetchers.cache import cached
+from finvista._fetchers.frames import frame_output
+from finvista._fetchers.panel import Panel
+from finvista._fetchers.range_cache import range_cached
+from finvista._fetchers.schema import apply_schema
 from finvista._fetchers.source_manager import source_manager
 
 # Fund types
@@ -96,12 +107,16 @@ def _validate_date_range(
     return start_str, end_str
 
 
+@frame_output
 @cached(ttl=60)
+@range_cached(market="cn")
 def get_cn_fund_nav(
     symbol: str,
     start_date: DateLike | None = None,
     end_date: DateLike | None = None,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get NAV (Net Asset Value) history for a China fund.
@@ -111,6 +126,9 @@ def get_cn_fund_nav(
         start_date: Start date (YYYY-MM-DD format or date object).
         end_date: End date (YYYY-MM-DD format or date object).
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -154,6 +172,7 @@ def get_cn_fund_nav(
             start_date=start_date_str,
             end_date=end_date_str,
         )
+        df = apply_schema(df, "cn_fund_nav")
         df.attrs["source"] = source
     else:
         df, used_source = source_manager.fetch_with_fallback(
@@ -166,10 +185,52 @@ def get_cn_fund_nav(
     return df
 
 
+def get_cn_fund_nav_batch(
+    symbols: Iterable[str],
+    start_date: DateLike | None = None,
+    end_date: DateLike | None = None,
+    max_workers: int = DEFAULT_BATCH_WORKERS,
+    output: BatchOutput = "long",
+) -> pd.DataFrame | BatchResult | Panel:
+    """
+    Get NAV history for many China funds.
+
+    Calls ``get_cn_fund_nav`` for each symbol on a bounded thread pool.
+    A failing symbol does not abort the batch.
+
+    Args:
+        symbols: Fund symbols.
+        start_date: Start date (YYYY-MM-DD format or date object).
+        end_date: End date (YYYY-MM-DD format or date object).
+        max_workers: Maximum number of concurrent fetches.
+        output: "long" for one DataFrame with a 'symbol' column (errors in
+               ``df.attrs["errors"]``), "dict" for a BatchResult or
+               "panel" for a date x symbol Panel.
+
+    Returns:
+        Long-format DataFrame, BatchResult or Panel, depending on ``output``.
+
+    Example:
+        >>> import finvista as fv
+        >>> df = fv.get_cn_fund_nav_batch(["110011", "161725"], start_date="2024-01-01")
+    """
+    return fetch_batch(
+        get_cn_fund_nav,
+        symbols,
+        max_workers=max_workers,
+        output=output,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+
+@frame_output
 @cached(ttl=10)
 def get_cn_fund_quote(
     symbol: str | list[str],
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get real-time NAV estimates for China funds.
@@ -180,6 +241,9 @@ def get_cn_fund_quote(
     Args:
         symbol: Single symbol or list of symbols.
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -210,6 +274,7 @@ def get_cn_fund_quote(
         from finvista._fetchers.adapters.tiantian import tiantian_adapter
 
         df = tiantian_adapter.fetch_fund_quote(symbols)
+        df = apply_schema(df, "cn_fund_quote")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -220,10 +285,13 @@ def get_cn_fund_quote(
     return df
 
 
-@cached(ttl=3600)
+@frame_output
+@cached(ttl=3600, stale_ttl=3600)
 def list_cn_fund_symbols(
     fund_type: Literal["all", "stock", "mixed", "bond", "index", "qdii", "money", "etf"] = "all",
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get list of all China fund symbols.
@@ -239,6 +307,9 @@ def list_cn_fund_symbols(
             - "money": Money market funds (货币型)
             - "etf": ETF funds
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with fund information:
@@ -263,6 +334,7 @@ def list_cn_fund_symbols(
         from finvista._fetchers.adapters.tiantian import tiantian_adapter
 
         df = tiantian_adapter.fetch_fund_list(fund_type=fund_type)
+        df = apply_schema(df, "cn_fund_list")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -273,9 +345,12 @@ def list_cn_fund_symbols(
     return df
 
 
+@frame_output
 def search_cn_fund(
     keyword: str,
     limit: int = 20,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Search for funds by keyword.
@@ -283,6 +358,9 @@ def search_cn_fund(
     Args:
         keyword: Search keyword (symbol, name, or pinyin abbreviation).
         limit: Maximum number of results to return.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with matching funds.
@@ -296,7 +374,7 @@ def search_cn_fund(
         raise ValidationError("Keyword cannot be empty", param_name="keyword")
 
     # Get all funds and filter
-    df = list_cn_fund_symbols()
+    df = list_cn_fund_symbols(output="pandas")
 
     if len(df) == 0:
         return df
@@ -18,15 +18,21 @@ from typing import Literal
 import pandas as pd
 
 from finvista._core.exceptions import ValidationError
-from finvista._core.types import DateLike
+from finvista._core.types import DateLike, FrameBackend
 from finvista._fetchers.cache import cached
+from finvista._fetchers.frames import frame_output
+from finvista._fetchers.range_cache import range_cached
+from finvista._fetchers.schema import apply_schema
 from finvista._fetchers.source_manager import source_manager
 
 
+@frame_output
 @cached(ttl=300)
 def list_cn_futures_symbols(
     exchange: Literal["all", "SHFE", "DCE", "CZCE", "CFFEX", "INE"] = "all",
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get list of all futures contracts.
@@ -40,6 +46,9 @@ def list_cn_futures_symbols(
             - "CFFEX": China Financial Futures Exchange (中国金融期货交易所)
             - "INE": Shanghai International Energy Exchange (上海国际能源交易中心)
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -72,6 +81,7 @@ def list_cn_futures_symbols(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_futures_list(exchange=exchange)
+        df = apply_schema(df, "cn_futures_list")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -82,12 +92,16 @@ def list_cn_futures_symbols(
     return df
 
 
+@frame_output
 @cached(ttl=60)
+@range_cached(market="cn")
 def get_cn_futures_daily(
     symbol: str,
     start_date: DateLike | None = None,
     end_date: DateLike | None = None,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get daily futures data.
@@ -97,6 +111,9 @@ def get_cn_futures_daily(
         start_date: Start date (YYYY-MM-DD format or date object).
         end_date: End date (YYYY-MM-DD format or date object).
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -129,6 +146,7 @@ def get_cn_futures_daily(
             start_date=start_date,
             end_date=end_date,
         )
+        df = apply_schema(df, "cn_futures_daily")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -141,11 +159,14 @@ def get_cn_futures_daily(
     return df
 
 
+@frame_output
 @cached(ttl=300)
 def get_cn_futures_positions(
     symbol: str,
     date: DateLike | None = None,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get futures position ranking data.
@@ -154,6 +175,9 @@ def get_cn_futures_positions(
         symbol: Futures contract base symbol (e.g., "IF", "AU").
         date: Date to query (YYYY-MM-DD).
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -189,6 +213,7 @@ def get_cn_futures_positions(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_futures_positions(symbol=symbol, date=date_str)
+        df = apply_schema(df, "cn_futures_positions")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
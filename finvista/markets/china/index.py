@@ -12,14 +12,26 @@ Example:
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import date, datetime
 
 import pandas as pd
 
 from finvista._core.exceptions import DateRangeError, ValidationError
-from finvista._core.types import DateLike
+from finvista._core.types import DateLike, FrameBackend
+from finvista._fetchers.batch import (
+    DEFAULT_BATCH_WORKERS,
+    BatchOutput,
+    BatchResult,
+    fetch_batch,
+)
 from finvista._fetchers.cache import cached
+from finvista._fetchers.frames import frame_output
+from finvista._fetchers.panel import Panel
+from finvista._fetchers.range_cache import range_cached
+from finvista._fetchers.schema import apply_schema
 from finvista._fetchers.source_manager import source_manager
+from finvista._fetchers.ttl import SessionTTL
 
 # Common China indices
 MAJOR_INDICES = {
@@ -112,12 +124,16 @@ def _validate_date_range(
     return start_str, end_str
 
 
-@cached(ttl=60)
+@frame_output
+@cached(ttl=SessionTTL("cn"))
+@range_cached(market="cn")
 def get_cn_index_daily(
     symbol: str,
     start_date: DateLike | None = None,
     end_date: DateLike | None = None,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get daily historical data for a China market index.
@@ -136,6 +152,9 @@ def get_cn_index_daily(
                  Defaults to today.
         source: Specific data source to use. If None, uses automatic
                failover between available sources.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -187,6 +206,7 @@ def get_cn_index_daily(
             start_date=start_date_str,
             end_date=end_date_str,
         )
+        df = apply_schema(df, "cn_index_daily")
         df.attrs["source"] = source
     else:
         # Use source manager with failover
@@ -200,10 +220,52 @@ def get_cn_index_daily(
     return df
 
 
+def get_cn_index_daily_batch(
+    symbols: Iterable[str],
+    start_date: DateLike | None = None,
+    end_date: DateLike | None = None,
+    max_workers: int = DEFAULT_BATCH_WORKERS,
+    output: BatchOutput = "long",
+) -> pd.DataFrame | BatchResult | Panel:
+    """
+    Get daily historical data for many China market indices.
+
+    Calls ``get_cn_index_daily`` for each symbol on a bounded thread pool.
+    A failing symbol does not abort the batch.
+
+    Args:
+        symbols: Index symbols.
+        start_date: Start date (YYYY-MM-DD format or date object).
+        end_date: End date (YYYY-MM-DD format or date object).
+        max_workers: Maximum number of concurrent fetches.
+        output: "long" for one DataFrame with a 'symbol' column (errors in
+               ``df.attrs["errors"]``), "dict" for a BatchResult or
+               "panel" for a date x symbol Panel.
+
+    Returns:
+        Long-format DataFrame, BatchResult or Panel, depending on ``output``.
+
+    Example:
+        >>> import finvista as fv
+        >>> df = fv.get_cn_index_daily_batch(["000300", "000905"], start_date="2024-01-01")
+    """
+    return fetch_batch(
+        get_cn_index_daily,
+        symbols,
+        max_workers=max_workers,
+        output=output,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+
+@frame_output
 @cached(ttl=10)
 def get_cn_index_quote(
     symbol: str | list[str],
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get real-time quotes for China market indices.
@@ -211,6 +273,9 @@ def get_cn_index_quote(
     Args:
         symbol: Single symbol or list of symbols.
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with real-time index data including:
@@ -242,6 +307,7 @@ def get_cn_index_quote(
         from finvista._fetchers.adapters.sina import sina_adapter
 
         df = sina_adapter.fetch_index_quote(symbols)
+        df = apply_schema(df, "cn_index_quote")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -252,10 +318,16 @@ def get_cn_index_quote(
     return df
 
 
-def list_cn_major_indices() -> pd.DataFrame:
+@frame_output
+def list_cn_major_indices(*, output: FrameBackend | None = None) -> pd.DataFrame:
     """
     Get list of major China market indices.
 
+    Args:
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
+
     Returns:
         DataFrame with index information:
         - symbol: Index symbol
@@ -279,10 +351,13 @@ def list_cn_major_indices() -> pd.DataFrame:
     return pd.DataFrame(records)
 
 
+@frame_output
 @cached(ttl=3600)
 def get_cn_index_constituents(
     symbol: str,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get index constituent stocks.
@@ -290,6 +365,9 @@ def get_cn_index_constituents(
     Args:
         symbol: Index symbol (e.g., "000300" for CSI 300).
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -314,6 +392,7 @@ def get_cn_index_constituents(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_index_constituents(symbol=symbol)
+        df = apply_schema(df, "cn_index_constituents")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -324,10 +403,13 @@ def get_cn_index_constituents(
     return df
 
 
+@frame_output
 @cached(ttl=3600)
 def get_cn_index_weights(
     symbol: str,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get index constituent weights.
@@ -335,6 +417,9 @@ def get_cn_index_weights(
     Args:
         symbol: Index symbol (e.g., "000300" for CSI 300).
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -358,6 +443,7 @@ def get_cn_index_weights(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_index_weights(symbol=symbol)
+        df = apply_schema(df, "cn_index_weights")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
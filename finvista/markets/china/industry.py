@@ -14,10 +14,16 @@ from __future__ import annotations
 
 import pandas as pd
 
+from finvista._core.types import FrameBackend
+from finvista._fetchers.frames import frame_output
 
+
+@frame_output
 def get_sw_index_daily(
     symbol: str = "801030",
     period: str = "day",
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get Shenwan industry index historical data.
@@ -28,6 +34,9 @@ def get_sw_index_daily(
             - "day": Daily data (default)
             - "week": Weekly data
             - "month": Monthly data
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns: 代码, 日期, 收盘, 开盘, 最高, 最低, 成交量, 成交额
@@ -42,7 +51,12 @@ def get_sw_index_daily(
     return shenwan_adapter.fetch_index_hist(symbol=symbol, period=period)
 
 
-def get_sw_index_realtime(symbol: str = "一级行业") -> pd.DataFrame:
+@frame_output
+def get_sw_index_realtime(
+    symbol: str = "一级行业",
+    *,
+    output: FrameBackend | None = None,
+) -> pd.DataFrame:
     """
     Get Shenwan industry index realtime data.
 
@@ -52,6 +66,9 @@ def get_sw_index_realtime(symbol: str = "一级行业") -> pd.DataFrame:
             - "一级行业": Level 1 industries (default)
             - "二级行业": Level 2 industries
             - "风格指数": Style indices
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns: 指数代码, 指数名称, 昨收盘, 今开盘, 最新价,
@@ -67,10 +84,13 @@ def get_sw_index_realtime(symbol: str = "一级行业") -> pd.DataFrame:
     return shenwan_adapter.fetch_index_realtime(symbol=symbol)
 
 
+@frame_output
 def get_sw_index_analysis(
     symbol: str = "一级行业",
     start_date: str = "20240101",
     end_date: str = "20240115",
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get Shenwan industry index daily analysis data.
@@ -85,6 +105,9 @@ def get_sw_index_analysis(
             - "风格指数": Style indices
         start_date: Start date in YYYYMMDD format.
         end_date: End date in YYYYMMDD format.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns: 指数代码, 指数名称, 发布日期, 收盘指数,
@@ -17,8 +17,10 @@ from datetime import datetime
 import pandas as pd
 
 from finvista._core.exceptions import ValidationError
-from finvista._core.types import DateLike
+from finvista._core.types import DateLike, FrameBackend
 from finvista._fetchers.cache import cached
+from finvista._fetchers.frames import frame_output
+from finvista._fetchers.schema import apply_schema
 from finvista._fetchers.source_manager import source_manager
 
 
@@ -42,10 +44,13 @@ def _validate_symbol(symbol: str) -> str:
     return symbol
 
 
+@frame_output
 @cached(ttl=300)
 def get_cn_lhb_list(
     date: DateLike | None = None,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get dragon tiger list data.
@@ -53,6 +58,9 @@ def get_cn_lhb_list(
     Args:
         date: Date to query (YYYY-MM-DD). If None, returns latest data.
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -91,6 +99,7 @@ def get_cn_lhb_list(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_lhb_list(date=date_str)
+        df = apply_schema(df, "cn_lhb_list")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -101,11 +110,14 @@ def get_cn_lhb_list(
     return df
 
 
+@frame_output
 @cached(ttl=300)
 def get_cn_lhb_detail(
     symbol: str,
     date: str,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get dragon tiger list trading details.
@@ -114,6 +126,9 @@ def get_cn_lhb_detail(
         symbol: Stock symbol.
         date: Trading date (YYYY-MM-DD).
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -142,6 +157,7 @@ def get_cn_lhb_detail(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_lhb_detail(symbol=symbol, date=date)
+        df = apply_schema(df, "cn_lhb_detail")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -153,10 +169,13 @@ def get_cn_lhb_detail(
     return df
 
 
+@frame_output
 @cached(ttl=300)
 def get_cn_lhb_institution(
     date: DateLike | None = None,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get institution trading data from dragon tiger list.
@@ -164,6 +183,9 @@ def get_cn_lhb_institution(
     Args:
         date: Date to query (YYYY-MM-DD). If None, returns recent data.
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -197,6 +219,7 @@ def get_cn_lhb_institution(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_lhb_institution(date=date_str)
+        df = apply_schema(df, "cn_lhb_institution")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
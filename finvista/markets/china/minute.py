@@ -17,8 +17,12 @@ from typing import Literal
 import pandas as pd
 
 from finvista._core.exceptions import ValidationError
+from finvista._core.types import FrameBackend
 from finvista._fetchers.cache import cached
+from finvista._fetchers.frames import frame_output
+from finvista._fetchers.schema import apply_schema
 from finvista._fetchers.source_manager import source_manager
+from finvista._fetchers.ttl import SessionTTL
 
 
 def _validate_symbol(symbol: str) -> str:
@@ -41,12 +45,15 @@ def _validate_symbol(symbol: str) -> str:
     return symbol
 
 
-@cached(ttl=60)
+@frame_output
+@cached(ttl=SessionTTL("cn"))
 def get_cn_stock_minute(
     symbol: str,
     period: Literal["1", "5", "15", "30", "60"] = "5",
     days: int = 5,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get minute-level stock data for a China A-share stock.
@@ -56,6 +63,9 @@ def get_cn_stock_minute(
         period: Minute interval ('1', '5', '15', '30', '60').
         days: Number of days of data to fetch.
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -93,6 +103,7 @@ def get_cn_stock_minute(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_stock_minute(symbol=symbol, period=period, days=days)
+        df = apply_schema(df, "cn_stock_minute")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -15,8 +15,10 @@ from __future__ import annotations
 import pandas as pd
 
 from finvista._core.exceptions import ValidationError
-from finvista._core.types import DateLike
+from finvista._core.types import DateLike, FrameBackend
 from finvista._fetchers.cache import cached
+from finvista._fetchers.frames import frame_output
+from finvista._fetchers.schema import apply_schema
 from finvista._fetchers.source_manager import source_manager
 
 
@@ -40,11 +42,14 @@ def _validate_symbol(symbol: str) -> str:
     return symbol
 
 
+@frame_output
 @cached(ttl=60)
 def get_cn_stock_moneyflow(
     symbol: str,
     days: int = 30,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get historical money flow data for a China A-share stock.
@@ -53,6 +58,9 @@ def get_cn_stock_moneyflow(
         symbol: Stock symbol (e.g., "000001" for Ping An Bank).
         days: Number of days of data to fetch.
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -81,6 +89,7 @@ def get_cn_stock_moneyflow(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_stock_moneyflow(symbol=symbol, days=days)
+        df = apply_schema(df, "cn_stock_moneyflow")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -92,10 +101,13 @@ def get_cn_stock_moneyflow(
     return df
 
 
+@frame_output
 @cached(ttl=10)
 def get_cn_stock_moneyflow_realtime(
     symbol: str,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get real-time money flow data for a China A-share stock.
@@ -103,6 +115,9 @@ def get_cn_stock_moneyflow_realtime(
     Args:
         symbol: Stock symbol (e.g., "000001" for Ping An Bank).
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -137,6 +152,7 @@ def get_cn_stock_moneyflow_realtime(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_stock_moneyflow_realtime(symbol=symbol)
+        df = apply_schema(df, "cn_stock_moneyflow_realtime")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -147,10 +163,13 @@ def get_cn_stock_moneyflow_realtime(
     return df
 
 
+@frame_output
 @cached(ttl=60)
 def get_cn_industry_moneyflow(
     date: DateLike | None = None,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get industry money flow data.
@@ -158,6 +177,9 @@ def get_cn_industry_moneyflow(
     Args:
         date: Date to filter (not used, always returns latest).
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -185,6 +207,7 @@ def get_cn_industry_moneyflow(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_industry_moneyflow()
+        df = apply_schema(df, "cn_industry_moneyflow")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -15,15 +15,20 @@ from __future__ import annotations
 import pandas as pd
 
 from finvista._core.exceptions import ValidationError
-from finvista._core.types import DateLike
+from finvista._core.types import DateLike, FrameBackend
 from finvista._fetchers.cache import cached
+from finvista._fetchers.frames import frame_output
+from finvista._fetchers.schema import apply_schema
 from finvista._fetchers.source_manager import source_manager
 
 
+@frame_output
 @cached(ttl=60)
 def list_cn_option_contracts(
     underlying: str = "510050",
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get list of option contracts.
@@ -31,6 +36,9 @@ def list_cn_option_contracts(
     Args:
         underlying: Underlying asset code (e.g., "510050" for 50ETF).
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -58,6 +66,7 @@ def list_cn_option_contracts(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_option_list(underlying=underlying)
+        df = apply_schema(df, "cn_option_list")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -68,10 +77,13 @@ def list_cn_option_contracts(
     return df
 
 
+@frame_output
 @cached(ttl=10)
 def get_cn_option_quote(
     symbol: str,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get real-time option quote.
@@ -79,6 +91,9 @@ def get_cn_option_quote(
     Args:
         symbol: Option contract symbol.
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with real-time quote data.
@@ -103,12 +118,15 @@ def get_cn_option_quote(
     return df
 
 
+@frame_output
 @cached(ttl=60)
 def get_cn_option_daily(
     symbol: str,
     start_date: DateLike | None = None,
     end_date: DateLike | None = None,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get daily option data.
@@ -118,6 +136,9 @@ def get_cn_option_daily(
         start_date: Start date (YYYY-MM-DD format or date object).
         end_date: End date (YYYY-MM-DD format or date object).
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -149,6 +170,7 @@ def get_cn_option_daily(
             start_date=start_date,
             end_date=end_date,
         )
+        df = apply_schema(df, "cn_option_daily")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
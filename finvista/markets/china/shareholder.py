@@ -17,8 +17,10 @@ from datetime import datetime
 import pandas as pd
 
 from finvista._core.exceptions import ValidationError
-from finvista._core.types import DateLike
+from finvista._core.types import DateLike, FrameBackend
 from finvista._fetchers.cache import cached
+from finvista._fetchers.frames import frame_output
+from finvista._fetchers.schema import apply_schema
 from finvista._fetchers.source_manager import source_manager
 
 
@@ -42,11 +44,14 @@ def _validate_symbol(symbol: str) -> str:
     return symbol
 
 
+@frame_output
 @cached(ttl=3600)
 def get_cn_top_shareholders(
     symbol: str,
     period: DateLike | None = None,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get top 10 shareholders data.
@@ -55,6 +60,9 @@ def get_cn_top_shareholders(
         symbol: Stock symbol (e.g., "000001").
         period: Report period (YYYY-MM-DD). If None, returns all periods.
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -89,6 +97,7 @@ def get_cn_top_shareholders(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_top_shareholders(symbol=symbol, period=period_str)
+        df = apply_schema(df, "cn_top_shareholders")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -100,10 +109,13 @@ def get_cn_top_shareholders(
     return df
 
 
+@frame_output
 @cached(ttl=3600)
 def get_cn_stock_pledge(
     symbol: str,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get stock pledge data.
@@ -111,6 +123,9 @@ def get_cn_stock_pledge(
     Args:
         symbol: Stock symbol (e.g., "000001").
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -138,6 +153,7 @@ def get_cn_stock_pledge(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_stock_pledge(symbol=symbol)
+        df = apply_schema(df, "cn_stock_pledge")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -148,11 +164,14 @@ def get_cn_stock_pledge(
     return df
 
 
+@frame_output
 @cached(ttl=3600)
 def get_cn_stock_unlock_schedule(
     start_date: str,
     end_date: str,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get stock unlock schedule.
@@ -161,6 +180,9 @@ def get_cn_stock_unlock_schedule(
         start_date: Start date (YYYY-MM-DD).
         end_date: End date (YYYY-MM-DD).
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -188,6 +210,7 @@ def get_cn_stock_unlock_schedule(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_stock_unlock(start_date=start_date, end_date=end_date)
+        df = apply_schema(df, "cn_stock_unlock")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
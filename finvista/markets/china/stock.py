@@ -12,6 +12,7 @@ Example:
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import date, datetime
 from typing import Literal
 
@@ -21,9 +22,20 @@ from finvista._core.exceptions import (
     DateRangeError,
     ValidationError,
 )
-from finvista._core.types import AdjustType, DateLike
+from finvista._core.types import AdjustType, DateLike, FrameBackend
+from finvista._fetchers.batch import (
+    DEFAULT_BATCH_WORKERS,
+    BatchOutput,
+    BatchResult,
+    fetch_batch,
+)
 from finvista._fetchers.cache import cached
+from finvista._fetchers.frames import frame_output
+from finvista._fetchers.panel import Panel
+from finvista._fetchers.range_cache import range_cached
+from finvista._fetchers.schema import apply_schema
 from finvista._fetchers.source_manager import source_manager
+from finvista._fetchers.ttl import SessionTTL
 
 
 def _validate_symbol(symbol: str) -> str:
@@ -103,13 +115,17 @@ def _validate_date_range(
     return start_str, end_str
 
 
-@cached(ttl=60)
+@frame_output
+@cached(ttl=SessionTTL("cn"))
+@range_cached(market="cn")
 def get_cn_stock_daily(
     symbol: str,
     start_date: DateLike | None = None,
     end_date: DateLike | None = None,
     adjust: AdjustType = "none",
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get daily historical data for a China A-share stock.
@@ -126,6 +142,9 @@ def get_cn_stock_daily(
                - "hfq": Backward adjusted (后复权)
         source: Specific data source to use. If None, uses automatic
                failover between available sources.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -194,6 +213,7 @@ def get_cn_stock_daily(
             end_date=end_date_str,
             adjust=adjust,
         )
+        df = apply_schema(df, "cn_stock_daily")
         df.attrs["source"] = source
     else:
         # Use source manager with failover
@@ -208,10 +228,66 @@ def get_cn_stock_daily(
     return df
 
 
-@cached(ttl=10)
+def get_cn_stock_daily_batch(
+    symbols: Iterable[str],
+    start_date: DateLike | None = None,
+    end_date: DateLike | None = None,
+    adjust: AdjustType = "none",
+    max_workers: int = DEFAULT_BATCH_WORKERS,
+    output: BatchOutput = "long",
+) -> pd.DataFrame | BatchResult | Panel:
+    """
+    Get daily historical data for many China A-share stocks.
+
+    Calls ``get_cn_stock_daily`` for each symbol on a bounded thread pool.
+    Requests still go through the cache, failover and per-source rate
+    limits. A failing symbol does not abort the batch.
+
+    Args:
+        symbols: Stock symbols.
+        start_date: Start date (YYYY-MM-DD format or date object).
+        end_date: End date (YYYY-MM-DD format or date object).
+        adjust: Price adjustment type ("none", "qfq" or "hfq").
+        max_workers: Maximum number of concurrent fetches.
+        output: Result format:
+               - "long": One DataFrame with a leading 'symbol' column;
+                 failed symbols are listed in ``df.attrs["errors"]``
+               - "dict": BatchResult mapping symbols to DataFrames, with
+                 failures in ``result.errors``
+               - "panel": Panel of date x symbol matrices per field,
+                 e.g. ``panel.close``
+
+    Returns:
+        Long-format DataFrame, BatchResult or Panel, depending on ``output``.
+
+    Raises:
+        ValidationError: If ``max_workers`` or ``output`` is invalid.
+
+    Example:
+        >>> import finvista as fv
+        >>> df = fv.get_cn_stock_daily_batch(["000001", "600519"], start_date="2024-01-01")
+        >>> df.groupby("symbol")["close"].last()
+        >>> df.attrs["errors"]
+        {}
+    """
+    return fetch_batch(
+        get_cn_stock_daily,
+        symbols,
+        max_workers=max_workers,
+        output=output,
+        start_date=start_date,
+        end_date=end_date,
+        adjust=adjust,
+    )
+
+
+@frame_output
+@cached(ttl=10, stale_ttl=20)
 def get_cn_stock_quote(
     symbol: str | list[str],
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get real-time quotes for China A-share stocks.
@@ -219,6 +295,9 @@ def get_cn_stock_quote(
     Args:
         symbol: Single symbol or list of symbols.
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with real-time quote data including:
@@ -254,6 +333,7 @@ def get_cn_stock_quote(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_stock_quote(symbols)
+        df = apply_schema(df, "cn_stock_quote")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -264,10 +344,103 @@ def get_cn_stock_quote(
     return df
 
 
-@cached(ttl=3600)
+_SNAPSHOT_MARKETS = ("all", "sh", "sz", "main", "gem", "star")
+
+
+@frame_output
+@cached(ttl=3)
+def get_cn_market_snapshot(
+    market: Literal["all", "sh", "sz", "main", "gem", "star"] = "all",
+    source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
+) -> pd.DataFrame:
+    """
+    Get real-time quotes for every stock of an A-share board.
+
+    The board is read from East Money's listing in a single request
+    (parallel pages if the server caps the page size), which is far
+    cheaper than ``get_cn_stock_quote`` with every symbol. Results
+    are cached for 3 seconds, so the snapshot can be polled.
+
+    Args:
+        market: Market filter:
+               - "all": All markets
+               - "sh": Shanghai Stock Exchange
+               - "sz": Shenzhen Stock Exchange
+               - "main": Main board (Shanghai + Shenzhen)
+               - "gem": ChiNext (创业板)
+               - "star": STAR Market (科创板)
+        source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
+
+    Returns:
+        DataFrame sorted by symbol with columns:
+        - symbol: Stock symbol
+        - name: Stock name
+        - market: Market (sh/sz)
+        - price: Current price
+        - change: Price change
+        - change_pct: Price change percentage
+        - open: Opening price
+        - high: Highest price
+        - low: Lowest price
+        - pre_close: Previous close price
+        - volume: Trading volume (shares)
+        - amount: Trading amount
+        - amplitude: Amplitude percentage
+        - turnover: Turnover rate percentage
+        - volume_ratio: Volume ratio
+        - pe: Dynamic P/E ratio
+        - pb: P/B ratio
+        - market_cap: Total market value
+        - float_market_cap: Market value of tradable shares
+        - time: Time of the last quote update (Beijing time)
+
+    Raises:
+        ValidationError: If market is invalid.
+
+    Example:
+        >>> import finvista as fv
+        >>> df = fv.get_cn_market_snapshot()
+        >>> df.nlargest(10, "change_pct")[["symbol", "name", "change_pct"]]
+    """
+    if market not in _SNAPSHOT_MARKETS:
+        raise ValidationError(
+            f"Invalid market: {market}. Must be one of {_SNAPSHOT_MARKETS}",
+            param_name="market",
+            param_value=market,
+        )
+
+    # Ensure sources are registered
+    from finvista._fetchers.adapters.registry import register_all_sources
+
+    register_all_sources()
+
+    if source:
+        from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
+
+        df = eastmoney_adapter.fetch_market_snapshot(market=market)
+        df = apply_schema(df, "cn_market_snapshot")
+        df.attrs["source"] = source
+    else:
+        df, _ = source_manager.fetch_with_fallback(
+            data_type="cn_market_snapshot",
+            market=market,
+        )
+
+    return df
+
+
+@frame_output
+@cached(ttl=3600, stale_ttl=3600)
 def list_cn_stock_symbols(
     market: Literal["all", "sh", "sz", "main", "gem", "star"] = "all",
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get list of all China A-share stock symbols.
@@ -281,6 +454,9 @@ def list_cn_stock_symbols(
                - "gem": ChiNext (创业板)
                - "star": STAR Market (科创板)
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with stock information:
@@ -303,6 +479,7 @@ def list_cn_stock_symbols(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_stock_list(market=market)
+        df = apply_schema(df, "cn_stock_list")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -313,9 +490,12 @@ def list_cn_stock_symbols(
     return df
 
 
+@frame_output
 def search_cn_stock(
     keyword: str,
     limit: int = 20,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Search for stocks by keyword.
@@ -323,6 +503,9 @@ def search_cn_stock(
     Args:
         keyword: Search keyword (symbol, name, or pinyin abbreviation).
         limit: Maximum number of results to return.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with matching stocks.
@@ -336,7 +519,7 @@ def search_cn_stock(
         raise ValidationError("Keyword cannot be empty", param_name="keyword")
 
     # Get all stocks and filter
-    df = list_cn_stock_symbols()
+    df = list_cn_stock_symbols(output="pandas")
 
     if len(df) == 0:
         return df
@@ -14,10 +14,16 @@ from __future__ import annotations
 
 import pandas as pd
 
+from finvista._core.types import FrameBackend
+from finvista._fetchers.frames import frame_output
 
+
+@frame_output
 def get_index_pe(
     symbol: str = "000300",
     indicator: str = "pe_ttm",
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get index PE (Price-to-Earnings) historical data.
@@ -33,6 +39,9 @@ def get_index_pe(
             - "pe_ttm": PE TTM (default)
             - "pe_ttm_nonfinancial": PE TTM excluding financials
             - "pe_lyr": PE LYR
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns: date, pe, index, quantile
@@ -52,7 +61,12 @@ def get_index_pe(
     return legulegu_adapter.fetch_index_pe(symbol=symbol)
 
 
-def get_index_pb(symbol: str = "000300") -> pd.DataFrame:
+@frame_output
+def get_index_pb(
+    symbol: str = "000300",
+    *,
+    output: FrameBackend | None = None,
+) -> pd.DataFrame:
     """
     Get index PB (Price-to-Book) historical data.
 
@@ -63,6 +77,9 @@ def get_index_pb(symbol: str = "000300") -> pd.DataFrame:
             - "000905": CSI 500 (中证500)
             - "000852": CSI 1000 (中证1000)
             - "399006": ChiNext (创业板指)
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns: date, pb, index, quantile
@@ -80,13 +97,19 @@ def get_index_pb(symbol: str = "000300") -> pd.DataFrame:
     return legulegu_adapter.fetch_index_pb(symbol=symbol)
 
 
-def get_all_a_pb() -> pd.DataFrame:
+@frame_output
+def get_all_a_pb(*, output: FrameBackend | None = None) -> pd.DataFrame:
     """
     Get all A-share market PB (Price-to-Book) historical data.
 
     This provides the overall PB level of the entire A-share market,
     useful for assessing market valuation.
 
+    Args:
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
+
     Returns:
         DataFrame with columns: date, pb, index
 
@@ -15,16 +15,21 @@ from __future__ import annotations
 import pandas as pd
 
 from finvista._core.exceptions import ValidationError
-from finvista._core.types import DateLike
+from finvista._core.types import DateLike, FrameBackend
 from finvista._fetchers.cache import cached
+from finvista._fetchers.frames import frame_output
+from finvista._fetchers.schema import apply_schema
 from finvista._fetchers.source_manager import source_manager
 
 
+@frame_output
 @cached(ttl=60)
 def get_exchange_rate(
     base: str = "USD",
     target: str = "CNY",
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get current exchange rate.
@@ -33,6 +38,9 @@ def get_exchange_rate(
         base: Base currency code (e.g., "USD", "EUR", "GBP", "JPY", "HKD").
         target: Target currency code (currently only "CNY" is supported).
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -61,6 +69,7 @@ def get_exchange_rate(
         from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
         df = eastmoney_adapter.fetch_exchange_rate(base=base, target=target)
+        df = apply_schema(df, "forex_rate")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -72,6 +81,7 @@ def get_exchange_rate(
     return df
 
 
+@frame_output
 @cached(ttl=300)
 def get_exchange_rate_history(
     base: str,
@@ -79,6 +89,8 @@ def get_exchange_rate_history(
     start_date: DateLike | None = None,
     end_date: DateLike | None = None,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get historical exchange rate data.
@@ -89,6 +101,9 @@ def get_exchange_rate_history(
         start_date: Start date (YYYY-MM-DD format or date object).
         end_date: End date (YYYY-MM-DD format or date object).
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -121,6 +136,7 @@ def get_exchange_rate_history(
             start_date=start_date,
             end_date=end_date,
         )
+        df = apply_schema(df, "forex_rate_history")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -12,13 +12,18 @@ from __future__ import annotations
 
 import pandas as pd
 
-from finvista._core.types import DateLike
+from finvista._core.types import DateLike, FrameBackend
+from finvista._fetchers.frames import frame_output
+from finvista._fetchers.schema import apply_schema
 
 
+@frame_output
 def get_hk_index_daily(
     symbol: str = "HSI",
     start_date: DateLike | None = None,
     end_date: DateLike | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get Hong Kong index historical data.
@@ -30,6 +35,9 @@ def get_hk_index_daily(
             - "HSCEI": Hang Seng China Enterprises Index (恒生国企指数)
         start_date: Start date (YYYY-MM-DD format or date object).
         end_date: End date (YYYY-MM-DD format or date object).
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns: date, open, high, low, close, volume, amount
@@ -44,8 +52,9 @@ def get_hk_index_daily(
     """
     from finvista._fetchers.adapters.eastmoney import eastmoney_adapter
 
-    return eastmoney_adapter.fetch_hk_index_daily(
+    df = eastmoney_adapter.fetch_hk_index_daily(
         symbol=symbol,
         start_date=start_date,
         end_date=end_date,
     )
+    return apply_schema(df, "hk_index_daily")
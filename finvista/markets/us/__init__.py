@@ -10,6 +10,7 @@ This module provides access to US financial market data including:
 from finvista.markets.us.index import get_us_index_daily
 from finvista.markets.us.stock import (
     get_us_stock_daily,
+    get_us_stock_daily_batch,
     get_us_stock_info,
     get_us_stock_quote,
     search_us_stock,
@@ -17,6 +18,7 @@ from finvista.markets.us.stock import (
 
 __all__ = [
     "get_us_stock_daily",
+    "get_us_stock_daily_batch",
     "get_us_stock_quote",
     "get_us_stock_info",
     "search_us_stock",
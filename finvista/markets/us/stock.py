@@ -12,15 +12,27 @@ Example:
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import date, datetime
 from typing import Any
 
 import pandas as pd
 
 from finvista._core.exceptions import DateRangeError, ValidationError
-from finvista._core.types import DateLike
+from finvista._core.types import DateLike, FrameBackend
+from finvista._fetchers.batch import (
+    DEFAULT_BATCH_WORKERS,
+    BatchOutput,
+    BatchResult,
+    fetch_batch,
+)
 from finvista._fetchers.cache import cached
+from finvista._fetchers.frames import frame_output
+from finvista._fetchers.panel import Panel
+from finvista._fetchers.range_cache import range_cached
+from finvista._fetchers.schema import apply_schema
 from finvista._fetchers.source_manager import source_manager
+from finvista._fetchers.ttl import SessionTTL
 
 
 def _validate_symbol(symbol: str) -> str:
@@ -97,12 +109,16 @@ def _validate_date_range(
     return start_str, end_str
 
 
-@cached(ttl=60)
+@frame_output
+@cached(ttl=SessionTTL("us"))
+@range_cached(market="us")
 def get_us_stock_daily(
     symbol: str,
     start_date: DateLike | None = None,
     end_date: DateLike | None = None,
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get daily historical data for a US stock.
@@ -115,6 +131,9 @@ def get_us_stock_daily(
                  Defaults to today.
         source: Specific data source to use. If None, uses automatic
                failover between available sources.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with columns:
@@ -165,6 +184,7 @@ def get_us_stock_daily(
             start_date=start_date_str,
             end_date=end_date_str,
         )
+        df = apply_schema(df, "us_stock_daily")
         df.attrs["source"] = source
     else:
         df, used_source = source_manager.fetch_with_fallback(
@@ -177,10 +197,52 @@ def get_us_stock_daily(
     return df
 
 
+def get_us_stock_daily_batch(
+    symbols: Iterable[str],
+    start_date: DateLike | None = None,
+    end_date: DateLike | None = None,
+    max_workers: int = DEFAULT_BATCH_WORKERS,
+    output: BatchOutput = "long",
+) -> pd.DataFrame | BatchResult | Panel:
+    """
+    Get daily historical data for many US stocks.
+
+    Calls ``get_us_stock_daily`` for each symbol on a bounded thread pool.
+    A failing symbol does not abort the batch.
+
+    Args:
+        symbols: Stock symbols.
+        start_date: Start date (YYYY-MM-DD format or date object).
+        end_date: End date (YYYY-MM-DD format or date object).
+        max_workers: Maximum number of concurrent fetches.
+        output: "long" for one DataFrame with a 'symbol' column (errors in
+               ``df.attrs["errors"]``), "dict" for a BatchResult or
+               "panel" for a date x symbol Panel.
+
+    Returns:
+        Long-format DataFrame, BatchResult or Panel, depending on ``output``.
+
+    Example:
+        >>> import finvista as fv
+        >>> df = fv.get_us_stock_daily_batch(["AAPL", "MSFT"], start_date="2024-01-01")
+    """
+    return fetch_batch(
+        get_us_stock_daily,
+        symbols,
+        max_workers=max_workers,
+        output=output,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+
+@frame_output
 @cached(ttl=10)
 def get_us_stock_quote(
     symbol: str | list[str],
     source: str | None = None,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Get real-time quotes for US stocks.
@@ -188,6 +250,9 @@ def get_us_stock_quote(
     Args:
         symbol: Single symbol or list of symbols.
         source: Specific data source to use.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with real-time quote data including:
@@ -225,6 +290,7 @@ def get_us_stock_quote(
         from finvista._fetchers.adapters.yahoo import yahoo_adapter
 
         df = yahoo_adapter.fetch_stock_quote(symbols)
+        df = apply_schema(df, "us_stock_quote")
         df.attrs["source"] = source
     else:
         df, _ = source_manager.fetch_with_fallback(
@@ -275,9 +341,12 @@ def get_us_stock_info(
     return yahoo_adapter.fetch_stock_info(symbol)
 
 
+@frame_output
 def search_us_stock(
     keyword: str,
     limit: int = 10,
+    *,
+    output: FrameBackend | None = None,
 ) -> pd.DataFrame:
     """
     Search for US stocks by keyword.
@@ -285,6 +354,9 @@ def search_us_stock(
     Args:
         keyword: Search keyword (symbol, company name).
         limit: Maximum number of results to return.
+        output: Frame type to return ("pandas", "pandas-arrow", "pyarrow"
+            or "polars"). If None, uses the backend set with
+            ``set_output_schema``.
 
     Returns:
         DataFrame with matching stocks:
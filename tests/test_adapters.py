@@ -0,0 +1,332 @@
+"""
+Tests for FinVista data adapters (offline parsing).
+
+Run with: pytest tests/test_adapters.py -v
+"""
+
+import asyncio
+import threading
+import time
+from datetime import date
+
+import pandas as pd
+import pytest
+
+import finvista as fv
+from finvista._fetchers.adapters.base import BaseAdapter
+from finvista._fetchers.adapters.eastmoney import EastMoneyAdapter
+from finvista._fetchers.adapters.sina import SinaAdapter
+from finvista._fetchers.chunking import afetch_chunked, fetch_chunked, split_chunks
+from finvista._fetchers.context import rate_limit_paid
+from finvista._fetchers.rate_limiter import rate_limiter
+
+KLINES = [
+    "2024-01-02,9.39,9.21,9.42,9.21,1158366,1075742252.45,2.24,-1.92,-0.18,0.60",
+    "2024-01-03,9.19,9.20,9.22,9.14,733610,673673613.98,-,-0.11,-0.01,-",
+]
+
+
+class TestEastMoneyKlines:
+    """Test the shared East Money kline parser."""
+
+    def test_daily_columns(self):
+        """Daily rows become typed columns with '-' as NaN."""
+        df = EastMoneyAdapter._parse_klines(KLINES, EastMoneyAdapter.KLINE_COLUMNS)
+        assert list(df.columns) == list(EastMoneyAdapter.KLINE_COLUMNS)
+        assert df["date"].tolist() == [date(2024, 1, 2), date(2024, 1, 3)]
+        assert df["volume"].dtype == "int64"
+        assert df["close"].tolist() == [9.21, 9.20]
+        assert df["change_pct"].tolist() == [-1.92, -0.11]
+        assert pd.isna(df["amplitude"].iloc[1])
+        assert pd.isna(df["turnover"].iloc[1])
+
+    def test_minute_datetimes(self):
+        """A 'datetime' first column is parsed to datetime64."""
+        klines = [k.replace("2024-01-02", "2024-01-02 09:31") for k in KLINES[:1]]
+        df = EastMoneyAdapter._parse_klines(
+            klines, ("datetime", *EastMoneyAdapter.KLINE_COLUMNS[1:7])
+        )
+        assert pd.api.types.is_datetime64_dtype(df["datetime"])
+        assert df["datetime"].iloc[0] == pd.Timestamp("2024-01-02 09:31")
+
+    def test_short_rows_and_missing_volume(self):
+        """Missing trailing fields are NaN; volume stays float if incomplete."""
+        klines = [KLINES[0], "2024-01-03,9.19,9.20,9.22,9.14,-,1.0"]
+        df = EastMoneyAdapter._parse_klines(klines, EastMoneyAdapter.KLINE_COLUMNS)
+        assert len(df) == 2
+        assert pd.isna(df["turnover"].iloc[1])
+        assert df["volume"].dtype == "float64"
+        assert pd.isna(df["volume"].iloc[1])
+
+    def test_all_rows_short(self):
+        """Columns missing from every row are added as NaN."""
+        klines = ["2024-01-02,9.39,9.21,9.42,9.21,1158366,1075742252.45"]
+        df = EastMoneyAdapter._parse_klines(klines, EastMoneyAdapter.KLINE_COLUMNS)
+        assert list(df.columns) == list(EastMoneyAdapter.KLINE_COLUMNS)
+        assert df["volume"].tolist() == [1158366]
+        assert df["turnover"].isna().all()
+
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [
+            ("fetch_stock_daily", ("000001", "2024-01-01", "2024-01-31")),
+            ("fetch_index_daily", ("000300", "2024-01-01", "2024-01-31")),
+            ("fetch_futures_daily", ("IF2403", "2024-01-01", "2024-01-31")),
+            ("fetch_convertible_daily", ("113050", "2024-01-01", "2024-01-31")),
+            ("fetch_option_daily", ("10004000", "2024-01-01", "2024-01-31")),
+        ],
+    )
+    def test_fetch_methods_share_parser(self, monkeypatch, method, args):
+        """Kline endpoints return OHLCV frames from the shared parser."""
+        adapter = EastMoneyAdapter()
+
+        def get_json(url, params=None, **kwargs):
+            return {"data": {"klines": KLINES}}
+
+        monkeypatch.setattr(adapter, "_get_json", get_json)
+        df = getattr(adapter, method)(*args)
+        assert list(df.columns[:7]) == list(EastMoneyAdapter.KLINE_COLUMNS[:7])
+        assert df["open"].tolist() == [9.39, 9.19]
+
+
+class TestBuildFrame:
+    """Test the shared column-wise DataFrame builder."""
+
+    def test_mapping_rows(self):
+        """JSON records are read by key with explicit dtypes."""
+        rows = [
+            {"code": "600000", "price": 10.5, "vol": 100, "day": "2024-01-02 00:00:00"},
+            {"code": "600001", "price": "-", "vol": 200, "day": "2024-01-03 00:00:00"},
+        ]
+        df = BaseAdapter._build_frame(
+            rows,
+            {"symbol": "code", "date": "day", "price": "price", "volume": "vol"},
+            dtypes={"date": "date", "price": "float64", "volume": "int64"},
+        )
+        assert list(df.columns) == ["symbol", "date", "price", "volume"]
+        assert df["date"].tolist() == [date(2024, 1, 2), date(2024, 1, 3)]
+        assert df["price"].dtype == "float64"
+        assert pd.isna(df["price"].iloc[1])
+        assert df["volume"].dtype == "int64"
+
+    def test_sequence_rows(self):
+        """Split rows are read by position; short rows give missing values."""
+        rows = [["600000", "A", "1.5", "7"], ["600001", "B", ""]]
+        df = BaseAdapter._build_frame(
+            rows,
+            {"symbol": 0, "name": 1, "price": 2, "volume": 3},
+            dtypes={"price": "float64", "volume": "int64", "name": "str"},
+        )
+        assert df["symbol"].tolist() == ["600000", "600001"]
+        assert df["price"].iloc[0] == 1.5
+        assert pd.isna(df["price"].iloc[1])
+        # A missing value keeps an int64 column as float64
+        assert df["volume"].dtype == "float64"
+
+    def test_empty_rows(self):
+        """No rows gives an empty frame with the requested columns."""
+        df = BaseAdapter._build_frame([], {"symbol": "f12", "price": "f2"}, {"price": "float64"})
+        assert df.empty
+        assert list(df.columns) == ["symbol", "price"]
+
+    def test_stock_list(self, monkeypatch):
+        """The East Money stock list scales prices and maps markets."""
+        adapter = EastMoneyAdapter()
+        items = [
+            {"f12": "600000", "f14": "PF Bank", "f13": 1, "f2": 1050, "f3": -25},
+            {"f12": "000001", "f14": "PA Bank", "f13": 0, "f2": "-", "f3": "-"},
+            {"f12": "BK00001", "f14": "Board", "f13": 90, "f2": 0, "f3": 0},
+        ]
+
+        def get_json(url, params=None, **kwargs):
+            return {"data": {"diff": items}}
+
+        monkeypatch.setattr(adapter, "_get_json", get_json)
+        df = adapter.fetch_stock_list()
+        assert df["symbol"].tolist() == ["600000", "000001"]
+        assert df["market"].tolist() == ["sh", "sz"]
+        assert df["price"].iloc[0] == 10.5
+        assert df["change_pct"].iloc[0] == -0.25
+        assert pd.isna(df["price"].iloc[1])
+
+
+def _ulist(symbols: list[str]) -> dict:
+    """Build a ulist response quoting every requested symbol."""
+    return {"data": {"diff": [{"f12": s, "f14": s, "f2": 1000} for s in symbols]}}
+
+
+class TestQuoteChunking:
+    """Test splitting long quote requests into concurrent chunks."""
+
+    def test_split_chunks(self):
+        """Chunks keep the symbol order; no limit gives one chunk."""
+        assert split_chunks(["a", "b", "c"], 2) == [["a", "b"], ["c"]]
+        assert split_chunks(["a", "b", "c"], None) == [["a", "b", "c"]]
+
+    def test_eastmoney_snapshot(self, monkeypatch):
+        """5,000 symbols are sent as concurrent ulist requests, in order."""
+        adapter = EastMoneyAdapter()
+        monkeypatch.setattr(adapter, "name", "chunk_eastmoney")
+        symbols = [f"{i:06d}" for i in range(5000)]
+        sizes = []
+        lock = threading.Lock()
+
+        def get_json(url, params=None, **kwargs):
+            chunk = [secid.split(".")[1] for secid in params["secids"].split(",")]
+            with lock:
+                sizes.append(len(chunk))
+            time.sleep(0.2)
+            return _ulist(chunk)
+
+        monkeypatch.setattr(adapter, "_get_json", get_json)
+        start = time.monotonic()
+        df = adapter.fetch_stock_quote(symbols)
+        assert time.monotonic() - start < 2
+        assert sizes == [EastMoneyAdapter.QUOTE_BATCH_SIZE] * 10
+        assert df["symbol"].tolist() == symbols
+        assert df["price"].iloc[0] == 10.0
+
+    def test_failed_chunk_is_skipped(self):
+        """Symbols of a failed chunk are left out; all failing raises."""
+
+        def fetch(chunk: list[str]) -> pd.DataFrame:
+            if "c" in chunk:
+                raise fv.NetworkError("reset")
+            return pd.DataFrame({"symbol": chunk})
+
+        df = fetch_chunked("chunk_fail", fetch, ["a", "b", "c", "d", "e"], batch_size=2)
+        assert df["symbol"].tolist() == ["a", "b", "e"]
+        assert df.attrs["missing_symbols"] == ["c", "d"]
+
+        async def afetch(chunk: list[str]) -> pd.DataFrame:
+            return fetch(chunk)
+
+        df = asyncio.run(afetch_chunked("chunk_fail", afetch, ["a", "b", "c", "d"], batch_size=2))
+        assert df["symbol"].tolist() == ["a", "b"]
+        assert df.attrs["missing_symbols"] == ["c", "d"]
+        with pytest.raises(fv.NetworkError):
+            fetch_chunked("chunk_fail", fetch, ["c", "d", "c"], batch_size=2)
+
+    def test_first_chunk_token(self, monkeypatch):
+        """The first chunk takes a token unless the manager already did."""
+        acquired = []
+        monkeypatch.setattr(rate_limiter, "acquire", lambda source, **_kwargs: acquired.append(source))
+
+        def fetch(chunk: list[str]) -> pd.DataFrame:
+            return pd.DataFrame({"symbol": chunk})
+
+        fetch_chunked("chunk_token", fetch, ["a", "b", "c"], batch_size=1)
+        assert acquired == ["chunk_token"] * 3
+
+        acquired.clear()
+        with rate_limit_paid("chunk_token"):
+            fetch_chunked("chunk_token", fetch, ["a", "b", "c"], batch_size=1)
+        assert acquired == ["chunk_token"] * 2
+
+    def test_async_sina_chunks(self, monkeypatch):
+        """Async quotes are chunked by the adapter's batch size."""
+        adapter = SinaAdapter()
+        monkeypatch.setattr(adapter, "name", "chunk_sina")
+        monkeypatch.setattr(adapter, "QUOTE_BATCH_SIZE", 2)
+        fields = ",".join(["n", "1", "1", "1.1", "1.2", "1", "0", "0", "100", "200"] + ["0"] * 22)
+        urls = []
+
+        async def aget_text(url, **kwargs):
+            urls.append(url)
+            codes = url.split("=")[1].split(",")
+            return "\n".join(f'var hq_str_{c}="{fields}";' for c in codes)
+
+        monkeypatch.setattr(adapter, "_aget_text", aget_text)
+        df = asyncio.run(adapter.afetch_stock_quote(["600000", "000001", "600519"]))
+        assert len(urls) == 2
+        assert df["symbol"].tolist() == ["600000", "000001", "600519"]
+
+
+def _clist_page(page: int, total: int, size: int) -> dict:
+    """Build a clist page of snapshot records sorted by code."""
+    codes = range((page - 1) * size, min(page * size, total))
+    diff = [
+        {
+            "f12": f"{600000 + i}",
+            "f14": f"Stock {i}",
+            "f13": 1,
+            "f2": 10.5,
+            "f3": "-",
+            "f5": 1234,
+            "f124": 1704162600,
+        }
+        for i in codes
+    ]
+    return {"data": {"total": total, "diff": diff}}
+
+
+class TestMarketSnapshot:
+    """Test the paginated East Money market snapshot."""
+
+    def test_pages_are_combined(self, monkeypatch):
+        """Every page is fetched once and rows come back sorted and typed."""
+        adapter = EastMoneyAdapter()
+        monkeypatch.setattr(adapter, "name", "snapshot_eastmoney")
+        pages = []
+
+        def get_json(url, params=None, **kwargs):
+            pages.append(params["pn"])
+            # The server caps the page size below what was requested
+            return _clist_page(params["pn"], total=250, size=40)
+
+        monkeypatch.setattr(adapter, "_get_json", get_json)
+        df = adapter.fetch_market_snapshot()
+        assert sorted(pages) == list(range(1, 8))
+        assert len(df) == 250
+        assert df["symbol"].is_monotonic_increasing
+        assert df["market"].iloc[0] == "sh"
+        assert df["volume"].iloc[0] == 123400
+        assert pd.isna(df["change_pct"].iloc[0])
+        assert df["time"].iloc[0] == pd.Timestamp("2024-01-02 10:30")
+
+    def test_full_board_in_one_request(self, monkeypatch):
+        """A whole board is read in one request when the page size is not capped."""
+        adapter = EastMoneyAdapter()
+        monkeypatch.setattr(adapter, "name", "snapshot_eastmoney")
+        pages = []
+
+        def get_json(url, params=None, **kwargs):
+            pages.append(params["pn"])
+            return _clist_page(params["pn"], total=5400, size=params["pz"])
+
+        monkeypatch.setattr(adapter, "_get_json", get_json)
+        df = adapter.fetch_market_snapshot()
+        assert pages == [1]
+        assert len(df) == 5400
+
+    def test_volume_matches_quote(self, monkeypatch):
+        """Snapshot and quote volumes are both in shares."""
+        adapter = EastMoneyAdapter()
+        monkeypatch.setattr(adapter, "name", "snapshot_eastmoney")
+        monkeypatch.setattr(
+            adapter, "_get_json", lambda *_args, **_kwargs: _clist_page(1, total=1, size=1)
+        )
+        snapshot = adapter.fetch_market_snapshot()
+        quote = adapter.fetch_stock_quote(["600000"])
+        assert quote["volume"].iloc[0] == snapshot["volume"].iloc[0] == 123400
+
+    def test_failed_page_fails(self, monkeypatch):
+        """A snapshot with a page missing is not returned."""
+        adapter = EastMoneyAdapter()
+        monkeypatch.setattr(adapter, "name", "snapshot_eastmoney")
+
+        def get_json(url, params=None, **kwargs):
+            if params["pn"] == 2:
+                raise fv.NetworkError("reset")
+            return _clist_page(params["pn"], total=250, size=100)
+
+        monkeypatch.setattr(adapter, "_get_json", get_json)
+        with pytest.raises(fv.NetworkError):
+            adapter.fetch_market_snapshot()
+
+    def test_empty_listing(self, monkeypatch):
+        """An empty listing raises DataNotFoundError."""
+        adapter = EastMoneyAdapter()
+        monkeypatch.setattr(adapter, "_get_json", lambda *_args, **_kwargs: {"data": None})
+        with pytest.raises(fv.DataNotFoundError):
+            adapter.fetch_market_snapshot()
@@ -0,0 +1,240 @@
+"""
+Tests for the FinVista asyncio API.
+
+Run with: pytest tests/test_aio.py -v
+"""
+
+import asyncio
+
+import httpx
+import pandas as pd
+import pytest
+
+import finvista as fv
+from finvista import aio
+from finvista._fetchers.async_http_client import AsyncHttpClient, async_http_client
+from finvista._fetchers.rate_limiter import AsyncRateLimiter, RateLimiter
+from finvista._fetchers.source_manager import (
+    AsyncSourceManager,
+    SourceManager,
+    source_manager,
+)
+
+KLINES = [
+    "2024-01-02,9.39,9.21,9.42,9.21,1158366,1075742252.45,2.24,-1.92,-0.18,0.60",
+    "2024-01-03,9.19,9.20,9.22,9.14,733610,673673613.98,0.87,-0.11,-0.01,0.38",
+]
+
+
+@pytest.fixture
+def no_retry_delay():
+    """Retry failed requests immediately."""
+    delay = fv.config.http.retry_delay
+    fv.config.http.retry_delay = 0
+    yield
+    fv.config.http.retry_delay = delay
+
+
+@pytest.fixture
+def mock_http():
+    """Route the global async client through a mock transport."""
+    requests: list[httpx.Request] = []
+    responses: dict[str, httpx.Response] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses.get(request.url.path, httpx.Response(404))
+
+    negative_ttl = fv.config.cache.negative_ttl
+    async_http_client._transport = httpx.MockTransport(handler)
+    async_http_client.reset_client()
+    fv.config.cache.ttl = 300
+    fv.config.cache.negative_ttl = 0
+    yield requests, responses
+    async_http_client._transport = None
+    async_http_client.reset_client()
+    fv.config.cache.negative_ttl = negative_ttl
+
+
+class TestAsyncHttpClient:
+    """Test error mapping and retries of the async HTTP client."""
+
+    @staticmethod
+    def _client(*responses: httpx.Response) -> tuple[AsyncHttpClient, list[int]]:
+        calls: list[int] = []
+        queue = list(responses)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(1)
+            return queue.pop(0)
+
+        return AsyncHttpClient(transport=httpx.MockTransport(handler)), calls
+
+    def test_get_json(self):
+        """JSON responses are parsed."""
+        client, _ = self._client(httpx.Response(200, json={"ok": 1}))
+        assert asyncio.run(client.get_json("https://example.com/a")) == {"ok": 1}
+
+    def test_error_mapping(self):
+        """HTTP errors map to the same exceptions as the sync client."""
+        client, _ = self._client(httpx.Response(429, headers={"Retry-After": "3"}))
+        with pytest.raises(fv.RateLimitError):
+            asyncio.run(client.get("https://example.com/a"))
+
+        client, _ = self._client(httpx.Response(404))
+        with pytest.raises(fv.APIError):
+            asyncio.run(client.get("https://example.com/a"))
+
+    def test_retries_server_errors(self, no_retry_delay):
+        """5xx responses are retried before succeeding."""
+        client, calls = self._client(
+            httpx.Response(503), httpx.Response(502), httpx.Response(200, text="ok")
+        )
+        assert asyncio.run(client.get_text("https://example.com/a")) == "ok"
+        assert len(calls) == 3
+
+    def test_connection_error(self, no_retry_delay):
+        """Transport errors become NetworkError after the retries."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        client = AsyncHttpClient(transport=httpx.MockTransport(handler))
+        with pytest.raises(fv.NetworkError):
+            asyncio.run(client.get("https://example.com/a"))
+
+
+class TestAsyncRateLimiter:
+    """Test the asyncio rate limiter."""
+
+    def test_shares_budget_with_sync_limiter(self):
+        """Async acquisitions draw from the sync limiter's bucket."""
+        limiter = RateLimiter()
+        limiter.set_limit("src", requests_per_second=100, burst_size=2)
+        alimiter = AsyncRateLimiter(limiter)
+
+        async def acquire_three() -> None:
+            for _ in range(3):
+                assert await alimiter.acquire("src")
+
+        asyncio.run(acquire_three())
+        assert limiter.get_available("src") < 1
+
+    def test_timeout(self):
+        """A wait longer than the timeout is refused without reserving."""
+        limiter = RateLimiter()
+        limiter.set_limit("src", requests_per_second=0.1, burst_size=1)
+        alimiter = AsyncRateLimiter(limiter)
+
+        async def acquire_two() -> list[bool]:
+            return [await alimiter.acquire("src", timeout=0.5) for _ in range(2)]
+
+        assert asyncio.run(acquire_two()) == [True, False]
+
+
+class TestAsyncSourceManager:
+    """Test async failover over the sync manager's sources."""
+
+    def test_fallback_and_shared_health(self):
+        """A failing source falls back to the next one and updates health."""
+        manager = SourceManager()
+        manager.register("aio_test", "first", pd.DataFrame, priority=0)
+        manager.register("aio_test", "second", pd.DataFrame, priority=1)
+        manager.register("aio_test", "sync_only", pd.DataFrame, priority=2)
+        amanager = AsyncSourceManager(manager)
+
+        async def fail(**kwargs):
+            raise fv.NetworkError("down")
+
+        async def succeed(**kwargs):
+            return pd.DataFrame({"x": [kwargs["symbol"]]})
+
+        amanager.register("aio_test", "first", fail)
+        amanager.register("aio_test", "second", succeed)
+        assert amanager.get_sources("aio_test") == ["first", "second"]
+
+        df, source = asyncio.run(amanager.fetch_with_fallback("aio_test", symbol="A"))
+        assert source == "second"
+        assert df.attrs["source"] == "second"
+        health = manager.get_health_report()["aio_test"]
+        assert health["first"]["failure_count"] == 1
+        assert health["second"]["success_count"] == 1
+
+    def test_all_sources_failed(self):
+        """All failures raise AllSourcesFailedError."""
+        manager = SourceManager()
+        manager.register("aio_fail", "only", pd.DataFrame)
+        amanager = AsyncSourceManager(manager)
+
+        async def fail(**kwargs):
+            raise fv.NetworkError("down")
+
+        amanager.register("aio_fail", "only", fail)
+        with pytest.raises(fv.AllSourcesFailedError):
+            asyncio.run(amanager.fetch_with_fallback("aio_fail", symbol="A"))
+
+
+class TestAioFunctions:
+    """Test the public async functions end to end over a mock transport."""
+
+    def test_stock_daily(self, mock_http):
+        """Daily bars are parsed like the sync API and cached."""
+        requests, responses = mock_http
+        responses["/api/qt/stock/kline/get"] = httpx.Response(
+            200, json={"data": {"klines": KLINES}}
+        )
+
+        async def fetch_twice():
+            first = await aio.get_cn_stock_daily("000651", start_date="2024-01-01")
+            second = await aio.get_cn_stock_daily("000651", start_date="2024-01-01")
+            return first, second
+
+        first, second = asyncio.run(fetch_twice())
+        assert list(first["close"]) == [9.21, 9.20]
+        assert first.attrs["source"] == "eastmoney"
+        pd.testing.assert_frame_equal(first, second)
+        assert len(requests) == 1
+        assert requests[0].url.params["secid"] == "0.000651"
+
+    def test_concurrent_calls_coalesce(self, mock_http):
+        """Concurrent identical calls share one request."""
+        requests, responses = mock_http
+        responses["/api/qt/stock/kline/get"] = httpx.Response(
+            200, json={"data": {"klines": KLINES}}
+        )
+
+        async def fan_out():
+            return await asyncio.gather(
+                *(aio.get_cn_index_daily("000016", start_date="2024-01-01") for _ in range(20))
+            )
+
+        frames = asyncio.run(fan_out())
+        assert len(frames) == 20
+        assert len(requests) == 1
+
+    def test_quote_failover(self, mock_http):
+        """Quotes fall back to the next source in priority order."""
+        requests, responses = mock_http
+        responses["/api/qt/ulist/get"] = httpx.Response(
+            200,
+            json={"data": {"diff": [{"f12": "600036", "f14": "招商银行", "f2": 3200}]}},
+        )
+
+        priority = fv.config.get_source_priority("cn_stock_quote")
+        source_manager.set_priority("cn_stock_quote", ["sina", "eastmoney"])
+        try:
+            df = asyncio.run(aio.get_cn_stock_quote("600036"))
+        finally:
+            source_manager.set_priority("cn_stock_quote", priority)
+            fv.reset_source_circuit("cn_stock_quote", "sina")
+
+        assert df.attrs["source"] == "eastmoney"
+        assert df["price"].iloc[0] == 32.0
+        assert [r.url.host for r in requests] == ["hq.sinajs.cn", "push2.eastmoney.com"]
+
+    def test_validation(self):
+        """Arguments are validated before any request."""
+        with pytest.raises(fv.ValidationError):
+            asyncio.run(aio.get_cn_stock_daily("123"))
+        with pytest.raises(fv.ValidationError):
+            asyncio.run(aio.get_cn_stock_daily("000001", adjust="bad"))
@@ -23,6 +23,7 @@ class TestImport:
         # China Stock Functions
         assert callable(fv.get_cn_stock_daily)
         assert callable(fv.get_cn_stock_quote)
+        assert callable(fv.get_cn_market_snapshot)
         assert callable(fv.list_cn_stock_symbols)
         assert callable(fv.search_cn_stock)
 
@@ -245,6 +246,11 @@ class TestValidation:
         with pytest.raises(ValidationError):
             fv.get_cn_stock_daily("000001", adjust="invalid")
 
+    def test_invalid_snapshot_market(self):
+        """Test invalid market snapshot filter."""
+        with pytest.raises(ValidationError):
+            fv.get_cn_market_snapshot(market="hk")
+
 
 class TestMajorIndices:
     """Test major indices listing."""
@@ -286,6 +292,14 @@ class TestIntegration:
         assert "symbol" in df.columns
         assert "price" in df.columns
 
+    @pytest.mark.integration
+    def test_get_market_snapshot(self):
+        """Test fetching the full-market snapshot."""
+        df = fv.get_cn_market_snapshot()
+        assert len(df) > 1000
+        assert df["symbol"].is_unique
+        assert df["price"].dtype == "float64"
+
     @pytest.mark.integration
     def test_search_stock(self):
         """Test searching for stocks."""
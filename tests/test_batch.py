@@ -0,0 +1,171 @@
+"""
+Tests for FinVista batch fetching.
+
+Run with: pytest tests/test_batch.py -v
+"""
+
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import finvista as fv
+from finvista._fetchers.batch import BatchResult, fetch_batch
+from finvista._fetchers.panel import build_panel
+from finvista._fetchers.source_manager import source_manager
+
+
+def _daily(symbol: str, **kwargs) -> pd.DataFrame:
+    if symbol == "bad":
+        raise fv.DataNotFoundError(f"No data found for {symbol}")
+    df = pd.DataFrame({"date": ["2024-01-02", "2024-01-03"], "close": [1.0, 2.0]})
+    df.attrs["source"] = "fake"
+    return df
+
+
+class TestFetchBatch:
+    """Test the generic batch runner."""
+
+    def test_dict_output_keeps_order_and_errors(self):
+        """Frames follow the requested order and failures are collected."""
+        result = fetch_batch(_daily, ["b", "bad", "a", "b"], output="dict")
+        assert isinstance(result, BatchResult)
+        assert list(result) == ["b", "a"]
+        assert list(result.errors) == ["bad"]
+        assert isinstance(result.errors["bad"], fv.DataNotFoundError)
+
+    def test_long_output(self):
+        """The long frame has a leading symbol column and error attrs."""
+        df = fetch_batch(_daily, ["x", "bad", "y"])
+        assert list(df.columns) == ["symbol", "date", "close"]
+        assert list(df["symbol"]) == ["x", "x", "y", "y"]
+        assert df.attrs["errors"] == {"bad": "[DATA_NOT_FOUND] No data found for bad"}
+        assert df.attrs["sources"] == {"x": "fake", "y": "fake"}
+
+    def test_all_failed_long_output(self):
+        """A batch where everything fails still returns a frame."""
+        df = fetch_batch(_daily, ["bad"])
+        assert df.empty
+        assert "bad" in df.attrs["errors"]
+
+    def test_bounded_concurrency(self):
+        """No more than max_workers calls run at once."""
+        lock = threading.Lock()
+        running = peak = 0
+
+        def slow(symbol: str) -> pd.DataFrame:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return pd.DataFrame({"v": [1]})
+
+        result = fetch_batch(slow, [str(i) for i in range(20)], max_workers=3, output="dict")
+        assert len(result) == 20
+        assert 1 < peak <= 3
+
+    def test_config_overrides_reach_workers(self):
+        """Calls in worker threads see the caller's config.context()."""
+        timeouts = []
+
+        def fetch(symbol: str) -> pd.DataFrame:
+            timeouts.append(fv.config.http.timeout)
+            return pd.DataFrame({"v": [1]})
+
+        fv.config.cache.ttl = 300
+        with fv.config.context(http={"timeout": 7}):
+            fetch_batch(fetch, ["a", "b", "c"], max_workers=3, output="dict")
+        assert timeouts == [7, 7, 7]
+
+    def test_invalid_arguments(self):
+        """Bad output or worker counts are rejected up front."""
+        with pytest.raises(fv.ValidationError):
+            fetch_batch(_daily, ["a"], output="wide")
+        with pytest.raises(fv.ValidationError):
+            fetch_batch(_daily, ["a"], max_workers=0)
+
+
+class TestMarketBatchFunctions:
+    """Test the public batch functions."""
+
+    def test_cn_stock_daily_batch(self, monkeypatch):
+        """Each symbol goes through get_cn_stock_daily; invalid ones fail alone."""
+        calls = []
+
+        def fake_fetch(data_type, **kwargs):
+            calls.append(kwargs["symbol"])
+            df = pd.DataFrame(
+                {"date": pd.to_datetime(["2024-01-02"]).date, "close": [float(len(calls))]}
+            )
+            return df, "fake"
+
+        monkeypatch.setattr(source_manager, "fetch_with_fallback", fake_fetch)
+        fv.config.cache.ttl = 300
+
+        df = fv.get_cn_stock_daily_batch(
+            ["300750", "BADSYM", "688981"], start_date="2024-01-01", end_date="2024-01-05"
+        )
+        assert sorted(calls) == ["300750", "688981"]
+        assert list(df["symbol"].unique()) == ["300750", "688981"]
+        assert list(df.attrs["errors"]) == ["BADSYM"]
+
+
+class TestPanel:
+    """Test the wide panel output."""
+
+    @staticmethod
+    def _frames() -> dict[str, pd.DataFrame]:
+        dates = pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-04"]).date
+        return {
+            "A": pd.DataFrame({"date": dates, "close": [1.0, 2.0, 3.0], "volume": [10, 20, 30]}),
+            "B": pd.DataFrame({"date": dates[1:], "close": [5.0, 6.0], "volume": [50, 60]}),
+        }
+
+    def test_aligned_on_shared_dates(self):
+        """Symbols are aligned on the union of dates with NaN gaps."""
+        panel = build_panel(self._frames())
+        assert panel.shape == (2, 3, 2)
+        assert panel.fields == ["close", "volume"]
+        assert list(panel.symbols) == ["A", "B"]
+        assert panel.dates[0] == pd.Timestamp("2024-01-02")
+        close = panel.close
+        assert list(close["A"]) == [1.0, 2.0, 3.0]
+        assert pd.isna(close["B"].iloc[0])
+        assert list(close["B"].iloc[1:]) == [5.0, 6.0]
+
+    def test_accessors_are_views(self):
+        """Field frames and arrays share the panel's memory."""
+        panel = build_panel(self._frames())
+        values = panel.to_numpy()
+        assert values.shape == (2, 3, 2)
+        assert np.shares_memory(panel.to_numpy("volume"), values)
+        assert np.shares_memory(panel["close"].to_numpy(), values)
+        assert np.shares_memory(panel.volume.to_numpy(), values)
+
+    def test_field_selection_and_frame(self):
+        """Fields can be chosen, and to_frame gives MultiIndex columns."""
+        panel = build_panel(self._frames(), fields=["volume"])
+        assert "volume" in panel and "close" not in panel
+        with pytest.raises(AttributeError):
+            panel.close  # noqa: B018
+        wide = panel.to_frame()
+        assert list(wide.columns) == [("volume", "A"), ("volume", "B")]
+        assert wide[("volume", "B")].iloc[2] == 60
+
+    def test_batch_panel_output(self):
+        """fetch_batch can return a panel carrying the errors."""
+        panel = fetch_batch(_daily, ["x", "bad", "y"], output="panel")
+        assert list(panel.symbols) == ["x", "y"]
+        assert list(panel.errors) == ["bad"]
+        assert panel.close.shape == (2, 2)
+
+    def test_empty(self):
+        """A panel of nothing is still well formed."""
+        panel = fetch_batch(_daily, ["bad"], output="panel")
+        assert panel.shape == (0, 0, 0)
+        assert "bad" in panel.errors
@@ -0,0 +1,998 @@
+"""
+Tests for the FinVista cache layer.
+
+Run with: pytest tests/test_cache.py -v
+"""
+
+import time
+
+import pandas as pd
+import pytest
+
+from finvista._fetchers.disk_cache import DiskCache
+
+
+def _sample_frame(rows: int = 5) -> pd.DataFrame:
+    df = pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=rows).date,
+            "close": [float(i) for i in range(rows)],
+            "volume": list(range(rows)),
+        }
+    )
+    df.attrs["source"] = "eastmoney"
+    return df
+
+
+def _stats_name(func) -> str:
+    """Name a cached function is reported under in the cache statistics."""
+    return f"{func.__module__}.{func.__qualname__}"
+
+
+class TestDiskCache:
+    """Test the persistent disk cache backend."""
+
+    def test_dataframe_roundtrip(self, tmp_path):
+        """DataFrames survive a roundtrip with attrs preserved."""
+        cache = DiskCache(tmp_path)
+        df = _sample_frame()
+        cache.set("k", df, ttl=60)
+
+        # A new instance (e.g. another process) sees the same data
+        result = DiskCache(tmp_path).get("k")
+        pd.testing.assert_frame_equal(result, df)
+        assert result.attrs["source"] == "eastmoney"
+
+    def test_non_dataframe_values(self, tmp_path):
+        """Plain Python values are stored too."""
+        cache = DiskCache(tmp_path)
+        cache.set("k", {"rate": 7.1}, ttl=60)
+        assert cache.get("k") == {"rate": 7.1}
+
+    def test_ttl_expiry(self, tmp_path):
+        """Expired entries are treated as misses and removed."""
+        cache = DiskCache(tmp_path)
+        cache.set("k", _sample_frame(), ttl=1)
+        assert "k" in cache
+        time.sleep(1.1)
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_size_budget_evicts_lru(self, tmp_path):
+        """Least recently used files are evicted when over budget."""
+        probe = DiskCache(tmp_path / "probe")
+        probe.set("probe", _sample_frame(200))
+        entry_size = probe.stats()["bytes"]
+
+        cache = DiskCache(tmp_path / "cache", max_bytes=int(entry_size * 2.5))
+        cache.set("a", _sample_frame(200))
+        cache.set("b", _sample_frame(200))
+        cache._last_scan = 0.0  # force a rescan on the next write
+        assert cache.get("a") is not None  # "a" becomes most recently used
+        time.sleep(0.01)
+        cache.set("c", _sample_frame(200))
+
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.get("b") is None
+
+    def test_delete_and_clear(self, tmp_path):
+        """Entries can be deleted individually or all at once."""
+        cache = DiskCache(tmp_path)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.delete("a")
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_corrupted_file_is_a_miss(self, tmp_path):
+        """A truncated file is treated as a miss rather than an error."""
+        cache = DiskCache(tmp_path)
+        cache.set("k", _sample_frame())
+        path = cache._path_for("k", ".parquet")
+        path.write_bytes(b"garbage")
+        assert cache.get("k") is None
+
+
+class TestSharedMemoryCache:
+    """Test the memory-mapped shared cache backend."""
+
+    def test_dataframe_roundtrip_across_instances(self, tmp_path):
+        """Frames written by one instance are readable by another."""
+        pytest.importorskip("pyarrow")
+        from finvista._fetchers.shared_cache import SharedMemoryCache
+
+        df = _sample_frame()
+        SharedMemoryCache(tmp_path).set("k", df, ttl=60)
+
+        result = SharedMemoryCache(tmp_path).get("k")
+        pd.testing.assert_frame_equal(result, df, check_dtype=False)
+        assert result.attrs["source"] == "eastmoney"
+        assert SharedMemoryCache(tmp_path).stats()["format"] == "arrow"
+
+    def test_numeric_columns_are_not_copied(self, tmp_path):
+        """Numeric columns are read-only views of the mapped file."""
+        pytest.importorskip("pyarrow")
+        from finvista._fetchers.shared_cache import SharedMemoryCache
+
+        cache = SharedMemoryCache(tmp_path)
+        cache.set("k", _sample_frame(1000), ttl=60)
+        values = cache.get("k")["close"].to_numpy()
+        assert not values.flags.owndata
+        assert not values.flags.writeable
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        """Expiry is checked from metadata before mapping the data."""
+        from finvista._fetchers.shared_cache import SharedMemoryCache
+
+        cache = SharedMemoryCache(tmp_path)
+        cache.set("k", _sample_frame(), ttl=60)
+        cache.set("old", _sample_frame(), ttl=1)
+        time.sleep(1.1)
+        assert cache.get("old") is None
+        assert cache.get("k") is not None
+
+
+@pytest.fixture
+def disk_backend(tmp_path):
+    import finvista as fv
+
+    fv.set_cache(enabled=True, ttl=300, backend="disk", disk_dir=str(tmp_path))
+    yield tmp_path
+    fv.config.set(cache={"backend": "memory", "disk_dir": None})
+
+
+class TestCacheManagerBackends:
+    """Test backend selection in CacheManager."""
+
+    def test_disk_backend_selected(self, disk_backend):
+        """The disk backend is used when configured."""
+        from finvista._fetchers.cache import cache_manager
+
+        assert isinstance(cache_manager.backend, DiskCache)
+        cache_manager.set("k", _sample_frame(), ttl=60)
+        assert cache_manager.get("k") is not None
+        assert len(cache_manager.backend) == 1
+
+    def test_shared_backend_selected(self, disk_backend):
+        """The shared backend reuses the disk directory settings."""
+        import finvista as fv
+        from finvista._fetchers.cache import cache_manager
+        from finvista._fetchers.shared_cache import SharedMemoryCache
+
+        fv.set_cache(backend="shared")
+        backend = cache_manager.backend
+        assert isinstance(backend, SharedMemoryCache)
+        assert backend.directory == disk_backend
+
+
+class TestRangeCache:
+    """Test the incremental date-range cache."""
+
+    @staticmethod
+    def _make_source(calls, close_offset=0.0):
+        """Build a fake daily-bar function that records requested ranges."""
+
+        def get_daily(symbol, start_date=None, end_date=None):
+            calls.append((start_date, end_date))
+            dates = pd.bdate_range(start_date or "2023-12-01", end_date)
+            df = pd.DataFrame(
+                {
+                    "date": dates.date,
+                    "close": [d.day + close_offset for d in dates],
+                }
+            )
+            df.attrs["source"] = "fake"
+            return df
+
+        return get_daily
+
+    @pytest.fixture
+    def range_cache(self):
+        from finvista._fetchers.cache import CacheManager
+        from finvista._fetchers.range_cache import RangeCache
+
+        return RangeCache(CacheManager())
+
+    def test_only_missing_edges_are_fetched(self, range_cache):
+        """Extending a cached window fetches just the new edges."""
+        calls = []
+        get_daily = range_cache.cached()(self._make_source(calls))
+
+        first = get_daily("000001", "2024-01-01", "2024-06-28")
+        second = get_daily("000001", "2024-01-01", "2024-07-05")
+        third = get_daily("000001", "2023-12-15", "2024-07-05")
+
+        assert calls == [
+            ("2024-01-01", "2024-06-28"),
+            # The last cached bar is re-requested to detect rewrites
+            ("2024-06-28", "2024-07-05"),
+            ("2023-12-15", "2023-12-31"),
+        ]
+        assert first["date"].iloc[-1].isoformat() == "2024-06-28"
+        assert second["date"].iloc[-1].isoformat() == "2024-07-05"
+        assert third["date"].iloc[0].isoformat() == "2023-12-15"
+        assert third["date"].is_monotonic_increasing
+        assert not third["date"].duplicated().any()
+        assert third.attrs["source"] == "fake"
+        assert "_cached_range" not in third.attrs
+
+    def test_sub_range_is_served_locally(self, range_cache):
+        """A range inside the cached coverage needs no fetch."""
+        calls = []
+        get_daily = range_cache.cached()(self._make_source(calls))
+
+        get_daily("000001", "2024-01-01", "2024-06-28")
+        df = get_daily("000001", "2024-03-01", "2024-03-31")
+
+        assert len(calls) == 1
+        assert df["date"].iloc[0].isoformat() == "2024-03-01"
+        assert df["date"].iloc[-1].isoformat() == "2024-03-29"
+
+    def test_series_are_keyed_by_other_arguments(self, range_cache):
+        """Different symbols use independent series."""
+        calls = []
+        get_daily = range_cache.cached()(self._make_source(calls))
+
+        get_daily("000001", "2024-01-01", "2024-01-31")
+        get_daily("600519", "2024-01-01", "2024-01-31")
+        assert len(calls) == 2
+
+    def test_rewritten_history_triggers_full_refetch(self, range_cache):
+        """A changed overlap bar (e.g. new adjustment) refetches everything."""
+        calls = []
+        source = {"fn": self._make_source(calls)}
+
+        @range_cache.cached()
+        def get_daily(symbol, start_date=None, end_date=None):
+            return source["fn"](symbol, start_date, end_date)
+
+        get_daily("000001", "2024-01-01", "2024-06-28")
+        source["fn"] = self._make_source(calls, close_offset=0.5)
+        df = get_daily("000001", "2024-01-01", "2024-07-05")
+
+        assert calls[-1] == ("2024-01-01", "2024-07-05")
+        assert df["close"].iloc[0] == 1.5
+
+    def test_open_start_is_not_cached_as_full_history(self, range_cache):
+        """A source's default history does not mark earlier dates as covered."""
+        calls = []
+
+        @range_cache.cached()
+        def get_daily(symbol, start_date=None, end_date=None):
+            # Like Yahoo: an open start returns only the last year
+            calls.append((start_date, end_date))
+            dates = pd.bdate_range(start_date or "2024-01-01", end_date or "2024-12-31")
+            return pd.DataFrame({"date": dates.date, "close": 1.0})
+
+        get_daily("AAPL")
+        df = get_daily("AAPL", "2020-01-01", "2020-12-31")
+        assert calls[-1] == ("2020-01-01", "2020-12-31")
+        assert len(df) > 0
+
+    def test_edges_from_other_sources_are_not_merged(self, range_cache):
+        """An edge served by a backup source replaces the cached series."""
+        calls = []
+        source = {"fn": self._make_source(calls)}
+
+        @range_cache.cached()
+        def get_daily(symbol, start_date=None, end_date=None):
+            df = source["fn"](symbol, start_date, end_date)
+            df.attrs["source"] = source["name"]
+            return df
+
+        source["name"] = "eastmoney"
+        get_daily("000001", "2024-01-01", "2024-06-28")
+        source["name"] = "tencent"
+        df = get_daily("000001", "2024-01-01", "2024-07-05")
+
+        assert calls[-1] == ("2024-01-01", "2024-07-05")
+        assert df.attrs["source"] == "tencent"
+        calls.clear()
+        get_daily("000001", "2024-02-01", "2024-07-05")
+        assert calls == []
+
+
+    def test_open_session_day_is_not_covered(self, range_cache, monkeypatch):
+        """Today is the market's date: a US bar still trading is refetched."""
+        import sys
+        from datetime import datetime, timezone
+
+        # The package re-exports a range_cache instance under the module's name
+        range_cache_module = sys.modules["finvista._fetchers.range_cache"]
+
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                # 13:00 in New York (session open), already Jan 10 in Shanghai
+                return datetime(2024, 1, 9, 18, 0, tzinfo=timezone.utc).astimezone(tz)
+
+        monkeypatch.setattr(range_cache_module, "datetime", FrozenDatetime)
+        calls = []
+        get_us_daily = range_cache.cached(market="us")(self._make_source(calls))
+        get_cn_daily = range_cache.cached(market="cn")(self._make_source(calls))
+
+        get_us_daily("AAPL", "2024-01-02")
+        get_us_daily("AAPL", "2024-01-02")
+        assert calls == [("2024-01-02", "2024-01-09"), ("2024-01-08", "2024-01-09")]
+
+        calls.clear()
+        get_cn_daily("000001", "2024-01-02", "2024-01-09")
+        get_cn_daily("000001", "2024-01-02", "2024-01-09")
+        assert calls == [("2024-01-02", "2024-01-09")]
+
+    def test_unknown_market(self, range_cache):
+        """An unknown market is rejected when decorating."""
+        import finvista as fv
+
+        with pytest.raises(fv.ConfigError):
+            range_cache.cached(market="xx")
+
+class TestSingleFlight:
+    """Test request coalescing in the cached decorator."""
+
+    def test_concurrent_calls_share_one_fetch(self):
+        """Concurrent identical calls run the function once."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        from finvista._fetchers.cache import CacheManager
+
+        manager = CacheManager()
+        calls = []
+        release = threading.Event()
+
+        @manager.cached(ttl=60)
+        def get_quote(symbol):
+            calls.append(symbol)
+            release.wait(5)
+            return {"symbol": symbol}
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(get_quote, "600519") for _ in range(8)]
+            while manager._flight.in_flight() == 0:
+                time.sleep(0.001)
+            time.sleep(0.05)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert calls == ["600519"]
+        assert all(r == {"symbol": "600519"} for r in results)
+
+    def test_exception_is_shared(self):
+        """Waiting callers receive the leader's exception."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        from finvista._fetchers.cache import SingleFlight
+
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def failing():
+            calls.append(1)
+            release.wait(5)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(flight.do, "k", failing) for _ in range(4)]
+            while flight.in_flight() == 0:
+                time.sleep(0.001)
+            time.sleep(0.05)
+            release.set()
+            for f in futures:
+                with pytest.raises(ValueError):
+                    f.result()
+
+        assert len(calls) == 1
+        assert flight.in_flight() == 0
+
+
+class TestMemoryCache:
+    """Test the byte-budgeted memory cache."""
+
+    def test_byte_budget_evicts_lru(self):
+        """Large entries push out least recently used ones."""
+        from finvista._fetchers.cache import MemoryCache, estimate_size
+
+        entry = estimate_size(_sample_frame(1000))
+        cache = MemoryCache(max_size=100, max_bytes=int(entry * 2.5))
+        cache.set("a", _sample_frame(1000))
+        cache.set("b", _sample_frame(1000))
+        cache.get("a")
+        cache.set("c", _sample_frame(1000))
+
+        assert "a" in cache
+        assert "c" in cache
+        assert "b" not in cache
+        assert cache.bytes <= entry * 2.5
+
+    def test_oversized_entry_not_cached(self):
+        """Values larger than the whole budget are not stored."""
+        from finvista._fetchers.cache import MemoryCache
+
+        cache = MemoryCache(max_bytes=1024)
+        cache.set("big", _sample_frame(10000))
+        assert cache.get("big") is None
+        assert cache.bytes == 0
+
+    def test_stats_report_entry_sizes(self):
+        """stats() includes the estimated size of each entry."""
+        from finvista._fetchers.cache import MemoryCache
+
+        cache = MemoryCache()
+        cache.set("quote", _sample_frame(1), ttl=10)
+        cache.set("history", _sample_frame(5000), ttl=60)
+        stats = cache.stats()
+
+        sizes = {e["key"]: e["bytes"] for e in stats["entries"]}
+        assert sizes["history"] > sizes["quote"]
+        assert stats["bytes"] == sum(sizes.values())
+
+    def test_concurrent_access(self):
+        """Concurrent get/set keep the size accounting consistent."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from finvista._fetchers.cache import MemoryCache
+
+        cache = MemoryCache(max_size=50)
+
+        def worker(i):
+            for j in range(200):
+                cache.set(f"k{(i * j) % 80}", j)
+                cache.get(f"k{j % 80}")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(worker, range(8)))
+
+        stats = cache.stats()
+        assert len(cache) <= 50
+        assert stats["bytes"] == sum(e["bytes"] for e in stats["entries"])
+
+
+class TestStaleWhileRevalidate:
+    """Test stale-while-revalidate caching."""
+
+    def test_stale_value_served_and_refreshed(self):
+        """An expired value is returned at once and refreshed in the background."""
+        from finvista._fetchers.cache import CacheManager
+
+        manager = CacheManager()
+        version = {"n": 0}
+
+        @manager.cached(ttl=1, stale_ttl=5)
+        def list_symbols():
+            version["n"] += 1
+            return version["n"]
+
+        assert list_symbols() == 1
+        time.sleep(1.1)
+        assert list_symbols() == 1  # stale, refresh scheduled
+
+        deadline = time.time() + 2
+        while version["n"] < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        assert list_symbols() == 2
+
+    def test_max_staleness_blocks(self):
+        """Beyond the maximum staleness callers fetch synchronously."""
+        from finvista._fetchers.cache import CacheManager
+
+        manager = CacheManager()
+        version = {"n": 0}
+
+        @manager.cached(ttl=1, stale_ttl=1)
+        def list_symbols():
+            version["n"] += 1
+            return version["n"]
+
+        assert list_symbols() == 1
+        time.sleep(2.1)
+        assert list_symbols() == 2
+
+
+class TestNegativeCache:
+    """Test caching of "not found" outcomes in fetch_with_fallback."""
+
+    @staticmethod
+    def _manager(calls, errors):
+        from finvista._fetchers.source_manager import SourceManager
+
+        manager = SourceManager()
+        for priority, (name, error) in enumerate(errors.items()):
+
+            def fetcher(_name=name, _error=error, **kwargs):
+                calls.append(_name)
+                raise _error
+
+            manager.register("test_negative", name, fetcher, priority=priority)
+        return manager
+
+    def test_not_found_is_remembered(self):
+        """When every source reports no data, later calls skip the network."""
+        import finvista as fv
+
+        calls = []
+        manager = self._manager(
+            calls,
+            {
+                "neg_a": fv.DataNotFoundError("No data found for symbol 000000"),
+                "neg_b": fv.SymbolNotFoundError("Unknown symbol", symbol="000000"),
+            },
+        )
+
+        with pytest.raises(fv.AllSourcesFailedError):
+            manager.fetch_with_fallback("test_negative", symbol="000000")
+        assert calls == ["neg_a", "neg_b"]
+
+        with pytest.raises(fv.AllSourcesFailedError) as exc_info:
+            manager.fetch_with_fallback("test_negative", symbol="000000")
+        assert calls == ["neg_a", "neg_b"]
+        assert isinstance(exc_info.value.last_error, fv.SymbolNotFoundError)
+        assert exc_info.value.attempted_sources == ["neg_a", "neg_b"]
+
+    def test_skipped_source_prevents_remembering(self):
+        """A source skipped with an open circuit keeps the outcome uncached."""
+        import finvista as fv
+        from finvista._fetchers.circuit_breaker import circuit_registry
+
+        calls = []
+        manager = self._manager(
+            calls,
+            {
+                "neg_e": fv.DataNotFoundError("No data found for symbol 000003"),
+                "neg_f": fv.DataNotFoundError("No data found for symbol 000003"),
+            },
+        )
+        breaker = circuit_registry.get("test_negative", "neg_f")
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure(fv.NetworkError("timeout"))
+        try:
+            for _ in range(2):
+                with pytest.raises(fv.AllSourcesFailedError):
+                    manager.fetch_with_fallback("test_negative", symbol="000003")
+        finally:
+            circuit_registry.reset("test_negative", "neg_f")
+        assert calls == ["neg_e", "neg_e"]
+
+    def test_network_errors_are_not_remembered(self):
+        """Outcomes that include transient errors are retried."""
+        import finvista as fv
+
+        calls = []
+        manager = self._manager(
+            calls,
+            {
+                "neg_c": fv.DataNotFoundError("No data"),
+                "neg_d": fv.NetworkError("timeout"),
+            },
+        )
+
+        for _ in range(2):
+            with pytest.raises(fv.AllSourcesFailedError):
+                manager.fetch_with_fallback("test_negative", symbol="000002")
+        assert calls == ["neg_c", "neg_d", "neg_c", "neg_d"]
+
+
+class TestSessionTTL:
+    """Test market-session-aware TTLs."""
+
+    @staticmethod
+    def _at(text, tz):
+        from datetime import datetime
+        from zoneinfo import ZoneInfo
+
+        return datetime.fromisoformat(text).replace(tzinfo=ZoneInfo(tz))
+
+    def test_intraday_uses_short_ttl(self):
+        """During a session the intraday TTL applies."""
+        from finvista._fetchers.ttl import SessionTTL
+
+        ttl = SessionTTL("cn", intraday_ttl=60)
+        assert ttl(self._at("2024-07-03 10:00", "Asia/Shanghai")) == 60
+        # Within the grace period after the close
+        assert ttl(self._at("2024-07-03 15:05", "Asia/Shanghai")) == 60
+
+    def test_after_close_until_next_open(self):
+        """After the close, data is cached until the next session opens."""
+        from finvista._fetchers.ttl import SessionTTL
+
+        ttl = SessionTTL("cn")
+        # Wednesday 16:00 -> Thursday 09:30
+        assert ttl(self._at("2024-07-03 16:00", "Asia/Shanghai")) == 17.5 * 3600
+        # Lunch break -> 13:00
+        assert ttl(self._at("2024-07-03 11:45", "Asia/Shanghai")) == 75 * 60
+        # Friday 20:00 -> Monday 09:30
+        assert ttl(self._at("2024-07-05 20:00", "Asia/Shanghai")) == 61.5 * 3600
+
+    def test_us_market_uses_exchange_timezone(self):
+        """US sessions are evaluated in New York time."""
+        from finvista._fetchers.ttl import SessionTTL
+
+        ttl = SessionTTL("us", max_ttl=3600)
+        # 22:00 Beijing time is 10:00 in New York (EDT)
+        assert ttl(self._at("2024-07-03 22:00", "Asia/Shanghai")) == 60
+        assert ttl(self._at("2024-07-06 12:00", "America/New_York")) == 3600
+
+    def test_policy_accepted_by_cached(self):
+        """The cached decorator resolves TTL policies when storing."""
+        from finvista._fetchers.cache import CacheManager
+
+        manager = CacheManager()
+        calls = []
+
+        @manager.cached(ttl=lambda: 3600)
+        def get_daily(symbol):
+            calls.append(symbol)
+            return symbol
+
+        get_daily("000001")
+        get_daily("000001")
+        assert calls == ["000001"]
+        stats = manager.backend.stats()
+        assert stats["entries"][0]["expires_in"] > 3500
+
+
+class TestCacheKeys:
+    """Test canonical cache key generation."""
+
+    def test_equivalent_arguments_share_a_key(self):
+        """Date objects, enums and sets reduce to canonical values."""
+        from datetime import date, datetime
+        from enum import Enum
+
+        from finvista._fetchers.cache import CacheManager
+
+        class Adjust(Enum):
+            QFQ = "qfq"
+
+        make_key = CacheManager()._make_key
+        assert make_key("f", (date(2024, 1, 1),), {}) == make_key("f", ("2024-01-01",), {})
+        assert make_key("f", (datetime(2024, 1, 1),), {}) == make_key("f", ("2024-01-01",), {})
+        assert make_key("f", (), {"adjust": Adjust.QFQ}) == make_key("f", (), {"adjust": "qfq"})
+        assert make_key("f", ({"b", "a"},), {}) == make_key("f", ({"a", "b"},), {})
+        assert make_key("f", (["a", "b"],), {}) == make_key("f", (("a", "b"),), {})
+
+    def test_distinct_arguments_never_collide(self):
+        """Values with similar text representations get different keys."""
+        from finvista._fetchers.cache import CacheManager
+
+        make_key = CacheManager()._make_key
+        variants = [
+            (["600000", "000001"],),
+            (["600000,000001"],),
+            ("600000,000001",),
+            (["600000", "000001", ""],),
+            ([],),
+            ("",),
+            (1,),
+            ("1",),
+            (True,),
+            (None,),
+            ("None",),
+        ]
+        keys = {make_key("f", args, {}) for args in variants}
+        assert len(keys) == len(variants)
+        assert make_key("f", ("x",), {}) != make_key("g", ("x",), {})
+
+    def test_large_objects_are_not_cached(self):
+        """DataFrame arguments bypass the cache instead of being serialized."""
+        from finvista._fetchers.cache import CacheManager
+
+        manager = CacheManager()
+        calls = []
+
+        @manager.cached(ttl=60)
+        def summarize(df):
+            calls.append(1)
+            return len(df)
+
+        df = _sample_frame()
+        assert summarize(df) == 5
+        assert summarize(df) == 5
+        assert len(calls) == 2
+
+
+class TestCopyOnWriteResults:
+    """Test that callers cannot mutate cached results."""
+
+    @staticmethod
+    def _cached_source(manager):
+        @manager.cached(ttl=60)
+        def get_daily(symbol):
+            return _sample_frame()
+
+        return get_daily
+
+    def test_mutating_result_does_not_poison_cache(self):
+        """Column assignment, in-place edits and attrs stay local to the caller."""
+        from finvista._fetchers.cache import CacheManager, _copy_on_write_enabled
+
+        get_daily = self._cached_source(CacheManager())
+
+        first = get_daily("000001")
+        first["ma"] = first["close"].rolling(2).mean()
+        if _copy_on_write_enabled():
+            first.loc[0, "close"] = 99.0
+        else:
+            # Without Copy-on-Write the shared values are read-only
+            with pytest.raises(ValueError):
+                first.loc[0, "close"] = 99.0
+        first.attrs["source"] = "mutated"
+
+        second = get_daily("000001")
+        assert "ma" not in second.columns
+        assert second.loc[0, "close"] == 0.0
+        assert second.attrs["source"] == "eastmoney"
+
+    def test_results_share_memory_with_cache(self):
+        """Under Copy-on-Write, hits are views rather than full copies."""
+        import numpy as np
+
+        from finvista._fetchers.cache import CacheManager, _copy_on_write_enabled
+
+        if not _copy_on_write_enabled():
+            pytest.skip("pandas Copy-on-Write is not enabled")
+
+        get_daily = self._cached_source(CacheManager())
+        first = get_daily("000001")
+        second = get_daily("000001")
+        assert first is not second
+        assert np.shares_memory(first["close"].to_numpy(), second["close"].to_numpy())
+
+
+    def test_results_are_read_only_without_copy_on_write(self, monkeypatch):
+        """Without Copy-on-Write, hits share read-only arrays instead of deep copies."""
+        import numpy as np
+
+        from finvista._fetchers import cache as cache_module
+
+        monkeypatch.setattr(cache_module, "_copy_on_write_enabled", lambda: False)
+        get_daily = self._cached_source(cache_module.CacheManager())
+        first = get_daily("000001")
+        second = get_daily("000001")
+        assert first is not second
+        assert np.shares_memory(first["close"].to_numpy(), second["close"].to_numpy())
+        assert not second["close"].to_numpy().flags.writeable
+        assert not np.shares_memory(first["date"].to_numpy(), second["date"].to_numpy())
+
+        second["ma"] = second["close"].rolling(2).mean()
+        second.attrs["source"] = "mutated"
+        third = get_daily("000001")
+        assert "ma" not in third.columns
+        assert third.attrs["source"] == "eastmoney"
+
+class TestTieredCache:
+    """Test the tiered memory/disk cache."""
+
+    def test_disk_hits_are_promoted(self, tmp_path):
+        """A value only on disk is promoted into memory with its expiry."""
+        from finvista._fetchers.cache import MemoryCache
+        from finvista._fetchers.tiered_cache import TieredCache
+
+        memory, disk = MemoryCache(), DiskCache(tmp_path)
+        disk.set("k", _sample_frame(), ttl=3600)
+        cache = TieredCache([memory, disk])
+
+        pd.testing.assert_frame_equal(cache.get("k"), _sample_frame())
+        value, expire_at = memory.get_entry("k")
+        assert 3500 < expire_at - time.time() <= 3600
+        assert cache.stats()["promotions"] == 1
+
+    def test_write_behind_spills_long_lived_values(self, tmp_path):
+        """Long TTLs are written to disk in the background, short ones are not."""
+        from finvista._fetchers.cache import MemoryCache
+        from finvista._fetchers.tiered_cache import TieredCache
+
+        disk = DiskCache(tmp_path)
+        cache = TieredCache([MemoryCache(), disk], spill_min_ttl=300)
+        cache.set("daily", _sample_frame(), ttl=86400)
+        cache.set("quote", _sample_frame(), ttl=10)
+        cache.flush()
+
+        assert disk.get("daily") is not None
+        assert disk.get("quote") is None
+        assert cache.stats()["pending_writes"] == 0
+
+    def test_delete_is_not_undone_by_promotion(self, tmp_path):
+        """A pending delete hides the lower-tier copy immediately."""
+        from finvista._fetchers.cache import MemoryCache
+        from finvista._fetchers.tiered_cache import TieredCache
+
+        cache = TieredCache([MemoryCache(), DiskCache(tmp_path)])
+        cache.set("k", 1, ttl=3600)
+        cache.flush()
+        cache.delete("k")
+        assert cache.get("k") is None
+        cache.flush()
+        assert cache.get("k") is None
+
+    def test_chained_backend_from_config(self, disk_backend):
+        """'memory+disk' builds a tiered cache over the single backends."""
+        import finvista as fv
+        from finvista._fetchers.cache import MemoryCache, cache_manager
+        from finvista._fetchers.tiered_cache import TieredCache
+
+        fv.set_cache(backend="memory+disk")
+        backend = cache_manager.backend
+        assert isinstance(backend, TieredCache)
+        assert isinstance(backend.tiers[0], MemoryCache)
+        assert isinstance(backend.tiers[1], DiskCache)
+        assert cache_manager.backend is backend
+
+    def test_invalid_chain_rejected(self):
+        """Unknown or repeated tiers are configuration errors."""
+        import finvista as fv
+        from finvista._core.exceptions import ConfigError
+
+        with pytest.raises(ConfigError):
+            fv.set_cache(ttl=300, backend="memory+memory")
+        fv.config.set(cache={"backend": "memory"})
+
+
+class TestCacheMetrics:
+    """Test per-function cache statistics."""
+
+    def test_hits_misses_and_fetch_time(self):
+        """Lookups and fetches are counted per function."""
+        from finvista._fetchers.cache import CacheManager
+
+        manager = CacheManager()
+
+        @manager.cached(ttl=60)
+        def get_cn_fund_nav(symbol):
+            time.sleep(0.01)
+            return _sample_frame()
+
+        get_cn_fund_nav("110011")
+        get_cn_fund_nav("110011")
+        get_cn_fund_nav("110011")
+
+        stats = manager.get_stats()[_stats_name(get_cn_fund_nav)]
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["fetches"] == 1
+        assert stats["hit_ratio"] == pytest.approx(2 / 3, abs=1e-3)
+        assert stats["avg_fetch_time"] >= 0.01
+        assert stats["time_saved"] >= 0.02
+        assert stats["entries"] == 1
+        assert stats["bytes"] > 0
+
+    def test_errors_and_evictions(self):
+        """Failed fetches and memory evictions are attributed to the function."""
+        from finvista._core.config import config
+        from finvista._fetchers.cache import CacheManager
+
+        manager = CacheManager()
+
+        @manager.cached(ttl=60)
+        def get_cn_lhb_list(day):
+            if day == "bad":
+                raise ValueError("boom")
+            return day
+
+        max_size = config.cache.max_size
+        config.cache.max_size = 2
+        try:
+            for day in ("d1", "d2", "d3"):
+                get_cn_lhb_list(day)
+            with pytest.raises(ValueError):
+                get_cn_lhb_list("bad")
+        finally:
+            config.cache.max_size = max_size
+
+        stats = manager.get_stats()[_stats_name(get_cn_lhb_list)]
+        assert stats["evictions"] == 1
+        assert stats["errors"] == 1
+        assert stats["entries"] == 2
+
+    def test_sync_and_async_variants_are_separate(self):
+        """Functions sharing a name in different modules are counted apart."""
+        import asyncio
+
+        from finvista._fetchers.cache import CacheManager
+
+        manager = CacheManager()
+
+        def get_cn_stock_daily(symbol):
+            return _sample_frame()
+
+        async def aget_cn_stock_daily(symbol):
+            return _sample_frame()
+
+        # Same bare name as the sync function, as in finvista.aio
+        aget_cn_stock_daily.__name__ = "get_cn_stock_daily"
+        aget_cn_stock_daily.__module__ = "finvista.aio.china"
+        aget_cn_stock_daily.__qualname__ = "get_cn_stock_daily"
+        sync_daily = manager.cached(ttl=60)(get_cn_stock_daily)
+        async_daily = manager.acached(ttl=60)(aget_cn_stock_daily)
+
+        sync_daily("000001")
+        sync_daily("000001")
+        asyncio.run(async_daily("000001"))
+
+        stats = manager.get_stats()
+        assert stats[_stats_name(sync_daily)]["hits"] == 1
+        assert stats[_stats_name(sync_daily)]["misses"] == 1
+        assert stats["finvista.aio.china.get_cn_stock_daily"]["hits"] == 0
+        assert stats["finvista.aio.china.get_cn_stock_daily"]["misses"] == 1
+
+    def test_public_api(self):
+        """Statistics are exposed at the package level."""
+        import finvista as fv
+
+        fv.reset_cache_stats()
+        assert isinstance(fv.get_cache_stats(), dict)
+
+
+class TestSnapshots:
+    """Test cache warm-up and snapshot/restore."""
+
+    def test_snapshot_roundtrip(self, tmp_path):
+        """A fresh manager serves calls from a loaded snapshot."""
+        from finvista._fetchers.cache import CacheManager
+        from finvista._fetchers.snapshot import load_cache_snapshot, save_cache_snapshot
+
+        calls = []
+
+        def make_source(manager):
+            @manager.cached(ttl=3600)
+            def list_symbols():
+                calls.append(1)
+                return _sample_frame()
+
+            return list_symbols
+
+        source = CacheManager()
+        make_source(source)()
+        path = tmp_path / "cache.snap"
+        assert save_cache_snapshot(path, source) == 1
+
+        fresh = CacheManager()
+        assert load_cache_snapshot(path, fresh) == 1
+        pd.testing.assert_frame_equal(make_source(fresh)(), _sample_frame())
+        assert len(calls) == 1
+
+    def test_expired_entries_are_skipped(self, tmp_path):
+        """Entries that expired since the snapshot was taken are not loaded."""
+        from finvista._fetchers.cache import CacheManager
+        from finvista._fetchers.snapshot import load_cache_snapshot, save_cache_snapshot
+
+        source = CacheManager()
+        source.set("short", 1, ttl=1)
+        source.set("long", 2, ttl=3600)
+        path = tmp_path / "cache.snap"
+        save_cache_snapshot(path, source)
+        time.sleep(1.1)
+
+        fresh = CacheManager()
+        assert load_cache_snapshot(path, fresh) == 1
+        assert fresh.get("long") == 2
+        assert fresh.get("short") is None
+
+    def test_warm_cache_counts_failures(self):
+        """Failing warm-up calls are reported without stopping the rest."""
+        from finvista._fetchers.snapshot import warm_cache
+
+        def fail():
+            raise RuntimeError("rate limited")
+
+        result = warm_cache([lambda: 1, fail, lambda: 2], max_workers=2)
+        assert result == {"succeeded": 2, "failed": 1}
+
+    def test_cli_info(self, tmp_path, capsys):
+        """The CLI summarizes a snapshot file."""
+        from finvista._fetchers.cache import CacheManager
+        from finvista._fetchers.snapshot import save_cache_snapshot
+        from finvista.cli.main import main
+
+        manager = CacheManager()
+        manager.set("k", _sample_frame(), ttl=3600)
+        path = tmp_path / "cache.snap"
+        save_cache_snapshot(path, manager)
+
+        assert main(["cache", "info", str(path)]) == 0
+        assert "Entries:  1 (0 expired)" in capsys.readouterr().out
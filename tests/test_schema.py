@@ -0,0 +1,237 @@
+"""
+Tests for FinVista output schemas and frame backends.
+
+Run with: pytest tests/test_schema.py -v
+"""
+
+import asyncio
+import importlib.util
+import json
+from datetime import date
+
+import pandas as pd
+import pytest
+
+import finvista as fv
+from finvista._core.config import OutputConfig, config
+from finvista._fetchers.batch import fetch_batch
+from finvista._fetchers.cache import cache_manager, cached
+from finvista._fetchers.frames import frame_output, pandas_frames, to_backend
+from finvista._fetchers.schema import apply_schema, get_schema, register_schema
+from finvista._fetchers.source_manager import source_manager
+
+
+@pytest.fixture(autouse=True)
+def restore_output():
+    """Restore the output schema settings after each test."""
+    saved = config.config.output
+    yield
+    config.config.output = saved
+
+
+HAS_POLARS = importlib.util.find_spec("polars") is not None
+
+
+def _daily() -> pd.DataFrame:
+    df = pd.DataFrame(
+        {
+            "date": [date(2024, 1, 2), date(2024, 1, 3)],
+            "open": [1.0, 2.0],
+            "close": ["1.5", "-"],
+            "volume": [100.0, 200.0],
+            "name": ["a", "b"],
+        }
+    )
+    df.attrs["source"] = "fake"
+    return df
+
+
+class TestApplySchema:
+    """Test converting frames to a data type's schema."""
+
+    def test_default_keeps_dates(self):
+        """Dates stay datetime.date; numbers get their schema dtypes."""
+        df = apply_schema(_daily(), "cn_stock_daily", OutputConfig())
+        assert df["date"].tolist() == [date(2024, 1, 2), date(2024, 1, 3)]
+        assert df["volume"].dtype == "int64"
+        assert df["close"].dtype == "float64"
+        assert pd.isna(df["close"].iloc[1])
+        assert df["name"].tolist() == ["a", "b"]
+        assert df.attrs["source"] == "fake"
+
+    def test_datetime64_and_float32(self):
+        """Dates become datetime64[ns] and floats float32."""
+        df = apply_schema(
+            _daily(), "cn_stock_daily", OutputConfig("datetime64[ns]", "float32")
+        )
+        assert df["date"].dtype == "datetime64[ns]"
+        assert df["open"].dtype == "float32"
+        assert df["volume"].dtype == "int64"
+        assert (df["date"] >= "2024-01-03").tolist() == [False, True]
+
+    def test_day_dates_from_strings(self):
+        """Day dates use second resolution; empty strings become NaT."""
+        df = pd.DataFrame({"report_date": ["2024-03-31", ""], "dividend_per_share": [1, None]})
+        df = apply_schema(df, "cn_dividend_history", OutputConfig("datetime64[D]"))
+        assert df["report_date"].dtype == "datetime64[s]"
+        assert pd.isna(df["report_date"].iloc[1])
+
+    def test_int_with_missing_values_stays_float(self):
+        """An int column with gaps is float64 rather than failing."""
+        df = pd.DataFrame({"volume": [1.0, None]})
+        assert apply_schema(df, "cn_stock_daily")["volume"].dtype == "float64"
+
+    def test_unknown_data_type(self):
+        """Frames of data types without a schema are returned unchanged."""
+        df = _daily()
+        assert apply_schema(df, "no_such_type") is df
+        assert df["close"].dtype != "float64"
+
+
+class TestSchemaRegistry:
+    """Test registering schemas and the output settings."""
+
+    def test_register_schema(self):
+        """A registered schema is returned and applied."""
+        register_schema("test_factor", {"date": "date", "value": "float"})
+        assert get_schema("test_factor") == {"date": "date", "value": "float"}
+        df = apply_schema(
+            pd.DataFrame({"date": ["2024-01-02"], "value": ["1.5"]}),
+            "test_factor",
+            OutputConfig("datetime64[ns]"),
+        )
+        assert df["value"].dtype == "float64"
+        assert df["date"].dtype == "datetime64[ns]"
+
+    def test_register_invalid_kind(self):
+        """Unknown column kinds are rejected."""
+        with pytest.raises(fv.ValidationError):
+            register_schema("test_bad", {"value": "decimal"})  # type: ignore[dict-item]
+
+    def test_set_output_schema(self):
+        """Output settings are validated."""
+        fv.set_output_schema(date_dtype="datetime64[D]", float_dtype="float32")
+        assert config.output.date_dtype == "datetime64[D]"
+        with pytest.raises(fv.ConfigError):
+            fv.set_output_schema(float_dtype="float16")
+        assert config.output.float_dtype == "float32"
+
+    def test_cache_key_depends_on_output(self):
+        """Results converted to different dtypes are cached separately."""
+        key = cache_manager._make_key("get_cn_stock_daily", ("000001",), {})
+        fv.set_output_schema(date_dtype="datetime64[ns]")
+        assert cache_manager._make_key("get_cn_stock_daily", ("000001",), {}) != key
+        fv.set_output_schema(date_dtype="object")
+        assert cache_manager._make_key("get_cn_stock_daily", ("000001",), {}) == key
+
+    def test_fetch_with_fallback_applies_schema(self):
+        """The source manager converts results to the data type's schema."""
+        register_schema("test_schema_daily", get_schema("cn_stock_daily") or {})
+        source_manager.register("test_schema_daily", "fake", lambda: _daily())
+        fv.set_output_schema(date_dtype="datetime64[ns]")
+        try:
+            df, source = source_manager.fetch_with_fallback("test_schema_daily")
+        finally:
+            source_manager.unregister("test_schema_daily", "fake")
+        assert source == "fake"
+        assert df["date"].dtype == "datetime64[ns]"
+        assert df["volume"].dtype == "int64"
+        assert df.attrs["source"] == "fake"
+
+
+class TestFrameBackends:
+    """Test converting results to pyarrow, Arrow-backed pandas and polars."""
+
+    def test_pyarrow_table(self):
+        """Tables keep column types and store attrs in the schema metadata."""
+        pa = pytest.importorskip("pyarrow")
+        df = apply_schema(_daily(), "cn_stock_daily")
+        table = to_backend(df, "pyarrow")
+        assert isinstance(table, pa.Table)
+        assert table.schema.field("date").type == pa.date32()
+        assert table.schema.field("volume").type == pa.int64()
+        assert json.loads(table.schema.metadata[b"finvista"]) == {"source": "fake"}
+
+    def test_pandas_arrow(self):
+        """Arrow-backed frames use pd.ArrowDtype columns and keep attrs."""
+        pytest.importorskip("pyarrow")
+        df = to_backend(apply_schema(_daily(), "cn_stock_daily"), "pandas-arrow")
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+        assert df["close"].isna().tolist() == [False, True]
+        assert df.attrs["source"] == "fake"
+
+    @pytest.mark.skipif(not HAS_POLARS, reason="polars is not installed")
+    def test_polars(self):
+        """Polars frames are built from the Arrow table."""
+        import polars as pl
+
+        df = to_backend(_daily(), "polars")
+        assert isinstance(df, pl.DataFrame)
+        assert df.columns == list(_daily().columns)
+
+    @pytest.mark.skipif(HAS_POLARS, reason="polars is installed")
+    def test_polars_missing(self):
+        """Choosing polars without it installed fails with a clear error."""
+        with pytest.raises(ImportError, match="pip install finvista\\[polars\\]"):
+            fv.set_output_schema(backend="polars")
+        assert config.output.backend == "pandas"
+
+    def test_invalid_backend(self):
+        """Unknown backends are rejected."""
+        with pytest.raises(fv.ValidationError):
+            to_backend(_daily(), "numpy")
+        with pytest.raises(fv.ConfigError):
+            fv.set_output_schema(backend="numpy")
+
+    def test_per_call_output(self):
+        """output= converts one call; the cache holds the pandas result."""
+        pa = pytest.importorskip("pyarrow")
+        calls = []
+
+        @frame_output
+        @cached(ttl=60)
+        def fetch(symbol: str, *, output=None) -> pd.DataFrame:
+            calls.append(symbol)
+            return _daily()
+
+        cache_manager.clear()
+        assert isinstance(fetch("frames-1", output="pyarrow"), pa.Table)
+        assert isinstance(fetch("frames-1"), pd.DataFrame)
+        assert calls == ["frames-1"]
+        with pytest.raises(fv.ValidationError):
+            fetch("frames-2", output="numpy")
+        assert calls == ["frames-1"]
+
+    def test_configured_backend(self):
+        """The configured backend applies unless pandas is requested."""
+        pa = pytest.importorskip("pyarrow")
+        fetch = frame_output(lambda: _daily())
+        fv.set_output_schema(backend="pyarrow")
+        assert isinstance(fetch(), pa.Table)
+        assert isinstance(fetch(output="pandas"), pd.DataFrame)
+        with pandas_frames():
+            assert isinstance(fetch(), pd.DataFrame)
+        # The backend does not change what is cached
+        key = cache_manager._make_key("get_cn_stock_daily", ("000001",), {})
+        fv.set_output_schema(backend="pandas")
+        assert cache_manager._make_key("get_cn_stock_daily", ("000001",), {}) == key
+
+    def test_async_output(self):
+        """Coroutine functions are converted after they are awaited."""
+        pa = pytest.importorskip("pyarrow")
+
+        @frame_output
+        async def fetch() -> pd.DataFrame:
+            return _daily()
+
+        assert isinstance(asyncio.run(fetch(output="pyarrow")), pa.Table)
+
+    def test_batch_converts_combined_frame(self):
+        """Batches combine pandas results and convert the long frame."""
+        pa = pytest.importorskip("pyarrow")
+        fetch = frame_output(lambda symbol: _daily().assign(name=symbol))
+        fv.set_output_schema(backend="pyarrow")
+        table = fetch_batch(fetch, ["a", "b"])
+        assert isinstance(table, pa.Table)
+        assert table.num_rows == 4
+        assert table.column_names[0] == "symbol"
@@ -0,0 +1,337 @@
+"""
+Tests for FinVista source routing and failover.
+
+Run with: pytest tests/test_source_manager.py -v
+"""
+
+import asyncio
+import time
+
+import pandas as pd
+import pytest
+
+import finvista as fv
+from finvista._core.config import config
+from finvista._fetchers.circuit_breaker import circuit_registry
+from finvista._fetchers.rate_limiter import rate_limiter
+from finvista._fetchers.source_manager import (
+    AsyncSourceManager,
+    SourceHealth,
+    SourceManager,
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_routing():
+    """Restore routing and hedging settings after each test."""
+    saved = dict(config._source_routing), dict(config._source_hedging)
+    failover = config.config.failover
+    hedge_delay = failover.hedge_delay
+    yield
+    config._source_routing, config._source_hedging = saved
+    failover.routing = "priority"
+    failover.hedge_delay = hedge_delay
+
+
+def _fetcher(name: str):
+    def fetch(**kwargs) -> pd.DataFrame:
+        return pd.DataFrame({"source": [name]})
+
+    return fetch
+
+
+def _manager(data_type: str) -> SourceManager:
+    manager = SourceManager()
+    manager.register(data_type, "eastmoney", _fetcher("eastmoney"), priority=0)
+    manager.register(data_type, "sina", _fetcher("sina"), priority=1)
+    manager.register(data_type, "tencent", _fetcher("tencent"), priority=2)
+    return manager
+
+
+def _order(manager: SourceManager, data_type: str) -> list[str]:
+    return [source.name for source in manager.get_available_sources(data_type)]
+
+
+class TestAdaptiveRouting:
+    """Test ranking sources by EWMA latency and error rate."""
+
+    def test_priority_by_default(self):
+        """Without adaptive routing, latency does not change the order."""
+        manager = _manager("route_default")
+        manager._update_health("route_default", "eastmoney", True, response_time=4.0)
+        assert _order(manager, "route_default") == ["eastmoney", "sina", "tencent"]
+
+    def test_slow_source_moves_back(self):
+        """A degraded primary loses its traffic before its circuit opens."""
+        manager = _manager("route_slow")
+        fv.set_source_routing("route_slow", "adaptive")
+        manager._update_health("route_slow", "eastmoney", True, response_time=0.3)
+        manager._update_health("route_slow", "tencent", True, response_time=0.3)
+        assert _order(manager, "route_slow")[0] == "eastmoney"
+
+        manager._update_health("route_slow", "eastmoney", True, response_time=4.0)
+        assert _order(manager, "route_slow") == ["sina", "tencent", "eastmoney"]
+        df, source = manager.fetch_with_fallback("route_slow")
+        assert source == "sina"
+
+    def test_close_scores_keep_priority(self):
+        """Sources within the tolerance step are ordered by priority."""
+        manager = _manager("route_close")
+        fv.set_source_routing("route_close", "adaptive")
+        manager._update_health("route_close", "eastmoney", True, response_time=0.35)
+        manager._update_health("route_close", "sina", True, response_time=0.05)
+        assert _order(manager, "route_close") == ["eastmoney", "sina", "tencent"]
+
+    def test_errors_penalize(self):
+        """A source that keeps failing ranks behind reliable ones."""
+        manager = _manager("route_errors")
+        config.config.failover.routing = "adaptive"
+        for _ in range(2):
+            manager._update_health(
+                "route_errors", "eastmoney", False, error=fv.NetworkError("reset")
+            )
+        assert _order(manager, "route_errors")[-1] == "eastmoney"
+
+    def test_stale_statistics_expire(self):
+        """Old measurements are ignored so a recovered source is retried."""
+        health = SourceHealth(avg_response_time=4.0, last_success_time=time.time())
+        assert health.routing_score(time.time()) == pytest.approx(4.0)
+        window = config.failover.routing_window
+        assert health.routing_score(time.time() + window + 1) == 0.0
+
+    def test_first_sample_sets_average(self):
+        """The latency average starts from the first measurement."""
+        manager = _manager("route_first")
+        manager._update_health("route_first", "sina", True, response_time=2.0)
+        report = manager.get_health_report()["route_first"]["sina"]
+        assert report["avg_response_time"] == 2.0
+        assert report["error_rate"] == 0.0
+
+    def test_invalid_policy(self):
+        """Unknown routing policies are rejected."""
+        with pytest.raises(fv.ConfigError):
+            fv.set_source_routing("route_bad", "fastest")
+        with pytest.raises(fv.ConfigError):
+            config.set(failover={"routing": "fastest"})
+
+
+def _slow(name: str, seconds: float):
+    def fetch(**kwargs) -> pd.DataFrame:
+        time.sleep(seconds)
+        return pd.DataFrame({"source": [name]})
+
+    return fetch
+
+
+def _failing(**kwargs) -> pd.DataFrame:
+    raise fv.NetworkError("down")
+
+
+def _stats(data_type: str, name: str) -> dict:
+    return circuit_registry.get(data_type, name).get_status()
+
+
+class TestHedging:
+    """Test racing a backup source against a slow one."""
+
+    @pytest.fixture(autouse=True)
+    def short_hedge_delay(self):
+        """Hedge after 50 ms while no response times are known."""
+        config.config.failover.hedge_delay = 0.05
+
+    def test_slow_primary_is_hedged(self):
+        """The backup starts after the budget and its answer is used."""
+        manager = SourceManager()
+        manager.register("hedge_slow", "hedge_a", _slow("a", 0.5), priority=0)
+        manager.register("hedge_slow", "hedge_b", _slow("b", 0.0), priority=1)
+        fv.set_source_hedging("hedge_slow")
+
+        start = time.monotonic()
+        df, source = manager.fetch_with_fallback("hedge_slow")
+        assert time.monotonic() - start < 0.4
+        assert source == "hedge_b"
+        assert df.attrs["source"] == "hedge_b"
+        assert _stats("hedge_slow", "hedge_b")["total_hedges"] == 1
+
+        # The loser still finishes, counts as a success and is discarded
+        time.sleep(0.6)
+        primary = _stats("hedge_slow", "hedge_a")
+        assert primary["total_successes"] == 1
+        assert primary["total_discarded"] == 1
+
+    def test_fast_primary_is_not_hedged(self):
+        """Answers within the budget never start the backup."""
+        manager = SourceManager()
+        manager.register("hedge_fast", "hedge_c", _slow("c", 0.0), priority=0)
+        manager.register("hedge_fast", "hedge_d", _slow("d", 0.0), priority=1)
+        fv.set_source_hedging("hedge_fast")
+        assert manager.fetch_with_fallback("hedge_fast")[1] == "hedge_c"
+        assert _stats("hedge_fast", "hedge_d")["total_successes"] == 0
+
+    def test_failures_fail_over(self):
+        """A failed source is followed at once; all failing raises."""
+        manager = SourceManager()
+        manager.register("hedge_fail", "hedge_e", _failing, priority=0)
+        manager.register("hedge_fail", "hedge_f", _failing, priority=1)
+        fv.set_source_hedging("hedge_fail")
+        with pytest.raises(fv.AllSourcesFailedError) as info:
+            manager.fetch_with_fallback("hedge_fail")
+        assert info.value.attempted_sources == ["hedge_e", "hedge_f"]
+        assert _stats("hedge_fail", "hedge_f")["total_hedges"] == 0
+
+    def test_hedge_needs_rate_limit_token(self):
+        """No hedge is sent while the backup's rate limit is exhausted."""
+        rate_limiter.set_limit("hedge_h", requests_per_second=0.01, burst_size=1)
+        rate_limiter.acquire("hedge_h")
+        manager = SourceManager()
+        manager.register("hedge_limit", "hedge_g", _slow("g", 0.2), priority=0)
+        manager.register("hedge_limit", "hedge_h", _slow("h", 0.0), priority=1)
+        fv.set_source_hedging("hedge_limit")
+        assert manager.fetch_with_fallback("hedge_limit")[1] == "hedge_g"
+        assert _stats("hedge_limit", "hedge_h")["total_hedges"] == 0
+
+    def test_budget_from_response_times(self):
+        """The budget is the 95th percentile once enough samples exist."""
+        health = SourceHealth()
+        assert health.hedge_delay() == config.failover.hedge_delay
+        health.response_times.extend(i / 100 for i in range(1, 101))
+        assert health.hedge_delay() == pytest.approx(0.95)
+
+    def test_async_loser_is_cancelled(self):
+        """Async hedges cancel the slower request."""
+        manager = SourceManager()
+        manager.register("hedge_aio", "hedge_i", pd.DataFrame, priority=0)
+        manager.register("hedge_aio", "hedge_j", pd.DataFrame, priority=1)
+        amanager = AsyncSourceManager(manager)
+
+        async def slow(**kwargs):
+            await asyncio.sleep(5)
+            return pd.DataFrame({"source": ["i"]})
+
+        async def fast(**kwargs):
+            return pd.DataFrame({"source": ["j"]})
+
+        amanager.register("hedge_aio", "hedge_i", slow)
+        amanager.register("hedge_aio", "hedge_j", fast)
+        fv.set_source_hedging("hedge_aio")
+
+        start = time.monotonic()
+        df, source = asyncio.run(amanager.fetch_with_fallback("hedge_aio"))
+        assert time.monotonic() - start < 1
+        assert source == "hedge_j"
+        primary = _stats("hedge_aio", "hedge_i")
+        assert primary["total_discarded"] == 1
+        assert primary["total_failures"] == 0
+
+
+def _quotes(name: str, skip: set[str] | None = None, calls: list | None = None):
+    def fetch(symbols: list[str], **kwargs) -> pd.DataFrame:
+        if calls is not None:
+            calls.append((name, list(symbols)))
+        rows = [s for s in symbols if s not in (skip or set())]
+        if not rows:
+            raise fv.DataNotFoundError(f"No quote data found for symbols: {symbols}")
+        return pd.DataFrame({"symbol": rows, "price": [1.0] * len(rows), "source": name})
+
+    return fetch
+
+
+class TestSplitFailover:
+    """Test sending only missing symbols of a batch to the next source."""
+
+    def test_missing_symbols_go_to_next_source(self):
+        """A short result is completed from the next source, in order."""
+        calls: list = []
+        manager = SourceManager()
+        manager.register("split_short", "a", _quotes("a", {"2", "4"}, calls), priority=0)
+        manager.register("split_short", "b", _quotes("b", calls=calls), priority=1)
+        manager.register_batch("split_short")
+
+        df, source = manager.fetch_with_fallback("split_short", symbols=["1", "2", "3", "4"])
+        assert source == "a"
+        assert calls == [("a", ["1", "2", "3", "4"]), ("b", ["2", "4"])]
+        assert df["symbol"].tolist() == ["1", "2", "3", "4"]
+        assert df["source"].tolist() == ["a", "b", "a", "b"]
+        assert df.attrs["sources"] == {"a": 2, "b": 2}
+        assert df.attrs["missing_symbols"] == []
+
+    def test_failed_source_then_partial(self):
+        """A failed source is skipped; unfound symbols are reported."""
+        calls: list = []
+        manager = SourceManager()
+        manager.register("split_fail", "a", _failing, priority=0)
+        manager.register("split_fail", "b", _quotes("b", {"3"}, calls), priority=1)
+        manager.register("split_fail", "c", _quotes("c", {"3"}, calls), priority=2)
+        manager.register_batch("split_fail")
+
+        df, source = manager.fetch_with_fallback("split_fail", symbols=["1", "2", "3"])
+        assert source == "b"
+        assert calls == [("b", ["1", "2", "3"]), ("c", ["3"])]
+        assert df["symbol"].tolist() == ["1", "2"]
+        assert df.attrs["missing_symbols"] == ["3"]
+
+    def test_unparseable_quote_goes_to_next_source(self, monkeypatch):
+        """A Sina entry whose price does not parse is re-asked from the next source."""
+        from finvista._fetchers.adapters.sina import SinaAdapter
+
+        fields = ["n", "1", "1", "{price}", "1.2", "1", "0", "0", "100", "200"] + ["0"] * 22
+        adapter = SinaAdapter()
+        response = "\n".join(
+            f'var hq_str_{code}="{",".join(fields).format(price=price)}";'
+            for code, price in (("sh600000", "1.1"), ("sz000001", "bad"))
+        )
+        monkeypatch.setattr(adapter, "_get_text", lambda *_args, **_kwargs: response)
+
+        calls: list = []
+        manager = SourceManager()
+        manager.register("split_sina", "sina", adapter.fetch_stock_quote, priority=0)
+        manager.register("split_sina", "b", _quotes("b", calls=calls), priority=1)
+        manager.register_batch("split_sina")
+
+        df, source = manager.fetch_with_fallback("split_sina", symbols=["600000", "000001"])
+        assert source == "sina"
+        assert calls == [("b", ["000001"])]
+        assert df["symbol"].tolist() == ["600000", "000001"]
+        assert df.attrs["sources"] == {"sina": 1, "b": 1}
+
+    def test_complete_result_is_unchanged(self):
+        """Sources are not asked again when nothing is missing."""
+        calls: list = []
+        manager = SourceManager()
+        manager.register("split_full", "a", _quotes("a", calls=calls), priority=0)
+        manager.register("split_full", "b", _quotes("b", calls=calls), priority=1)
+        manager.register_batch("split_full")
+
+        df, _ = manager.fetch_with_fallback("split_full", symbols=["1", "2"])
+        assert calls == [("a", ["1", "2"])]
+        assert "sources" not in df.attrs
+
+    def test_not_batch_without_registration(self):
+        """Other data types keep the short result of the first source."""
+        manager = SourceManager()
+        manager.register("split_off", "a", _quotes("a", {"2"}), priority=0)
+        manager.register("split_off", "b", _quotes("b"), priority=1)
+        df, _ = manager.fetch_with_fallback("split_off", symbols=["1", "2"])
+        assert df["symbol"].tolist() == ["1"]
+
+    def test_async_split(self):
+        """The async manager splits requests the same way."""
+        manager = SourceManager()
+        manager.register("split_aio", "a", pd.DataFrame, priority=0)
+        manager.register("split_aio", "b", pd.DataFrame, priority=1)
+        manager.register_batch("split_aio")
+        amanager = AsyncSourceManager(manager)
+        calls: list = []
+
+        def wrap(fetch):
+            async def afetch(**kwargs):
+                return fetch(**kwargs)
+
+            return afetch
+
+        amanager.register("split_aio", "a", wrap(_quotes("a", {"1"}, calls)))
+        amanager.register("split_aio", "b", wrap(_quotes("b", calls=calls)))
+
+        df, _ = asyncio.run(amanager.fetch_with_fallback("split_aio", symbols=["1", "2"]))
+        assert calls == [("a", ["1", "2"]), ("b", ["1"])]
+        assert df["source"].tolist() == ["b", "a"]